@@ -176,6 +176,15 @@ from .bdf_interface.write_mesh_file import WriteMeshs
 from .bdf_interface.uncross_reference import UnXrefMesh
 from .bdf_interface.verify_validate import verify_bdf, validate_bdf
 from .bdf_interface.stats import get_bdf_stats
+from .bdf_interface.bulk_arrays import (
+    BULK_ARRAY_CARDS, get_card_ids, get_bulk_fields, get_deferred_slots, get_first_cards,
+    add_bulk_cards)
+from .bdf_interface.lazy_cards import get_lazy_slots, add_lazy_cards
+from .bdf_interface.cache import (
+    get_cache_filename, load_bdf_cache, save_bdf_cache, get_file_stats)
+from .bdf_interface.refresh import (
+    get_changed_ifiles, get_bulk_data_lines, remove_cards_by_ifile,
+    get_cards_to_cross_reference, cross_reference_cards)
 
 from .errors import (CrossReferenceError, DuplicateIDsError,
                                   CardParseSyntaxError, UnsupportedCard, DisabledCardError,
@@ -744,7 +753,7 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             'material_ids', 'caero_ids', 'is_long_ids',
             'nnodes', 'npoints', 'ncoords', 'nelements', 'nproperties',
             'nmaterials', 'ncaeros', 'nid_map',
-            'is_bdf_vectorized', 'type_slot_str',
+            'is_bdf_vectorized', 'type_slot_str', 'bulk_arrays',
             #'dmigs', 'dmijs', 'dmiks', 'dmijis', 'dtis', 'dmis',
 
             'point_ids', 'subcases',
@@ -954,11 +963,15 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
     def read_bdf(self, bdf_filename: Optional[str]=None,
                  validate: bool=True,
-                 xref: bool=True,
+                 xref: Union[bool, str]=True,
                  punch: bool=False,
                  read_includes: bool=True,
                  save_file_structure: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 bulk_arrays: bool=False,
+                 nworkers: int=1,
+                 cache_dir: Optional[str]=None,
+                 lazy: bool=False) -> None:
         """
         Read method for the bdf files
 
@@ -968,16 +981,46 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             the input bdf (default=None; popup a dialog)
         validate : bool; default=True
             runs various checks on the BDF
-        xref :  bool; default=True
+        xref :  bool / str; default=True
             should the bdf be cross referenced
+            'lazy' : cross reference the nodes, elements, properties,
+                     materials, loads, and aero cards when they're accessed
+                     (e.g., ``model.elements[eid].pid_ref``) in the same way
+                     as ``safe_cross_reference``; iterating over the cards
+                     (e.g., ``model.elements.values()``) cross references
+                     all of them
         punch : bool; default=False
             indicates whether the file is a punch file
         read_includes : bool; default=True
             indicates whether INCLUDE files should be read
         save_file_structure : bool; default=False
-            enables the ``write_bdfs`` method
+            enables the ``write_bdfs`` and ``refresh`` methods;
+            bulk_arrays, lazy, and nworkers are ignored
         encoding : str; default=None -> system default
             the unicode encoding
+        bulk_arrays : bool; default=False
+            parse the GRID, CQUAD4, CTRIA3, CTETRA, CHEXA, CBAR, and CBUSH
+            cards into arrays (``model.bulk_arrays``), so the card objects
+            are only created when they're accessed (e.g., ``model.nodes[nid]``);
+            this only helps with validate=False and xref=False (or xref='lazy'),
+            because validate=True and xref=True create every card while the
+            deck is read (the arrays are then released)
+        nworkers : int; default=1
+            the number of processes that create the card objects; the cards
+            are split into chunks (at least 1000 cards each) and are added
+            to the model in deck order, so duplicate ids and parsing errors
+            are reported the same way
+        cache_dir : str; default=None
+            the directory to cache the parsed (not cross-referenced) model in;
+            an unchanged deck is loaded from the cache, while a change to the
+            size or modification time of the master file or any INCLUDE file
+            reparses the deck
+        lazy : bool; default=False
+            store the lines of the nodes, elements, properties, materials,
+            masses, and rigid elements, so the card objects are only created
+            when they're accessed (e.g., ``model.properties[pid]``); an
+            error in a card is raised when it's accessed, and validate/xref
+            create all the cards, so use validate=False and xref=False
 
         .. code-block:: python
 
@@ -996,9 +1039,39 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
            etc.
 
         """
+        if save_file_structure and (bulk_arrays or lazy or nworkers > 1):
+            # the bulk/lazy cards don't know what file they're from and
+            # the parallel parsing doesn't track it, which write_bdfs and
+            # refresh require
+            self.log.warning('bulk_arrays=%s, lazy=%s, and nworkers=%s are ignored with '
+                             'save_file_structure=True' % (bulk_arrays, lazy, nworkers))
+            bulk_arrays = False
+            lazy = False
+            nworkers = 1
         self.save_file_structure = save_file_structure
+        self.use_bulk_arrays = bulk_arrays
+        self.nworkers = nworkers
+        self.use_lazy_cards = lazy
         if bdf_filename and not isinstance(bdf_filename, (StringIO, list)):
             check_path(bdf_filename, 'bdf_filename')
+
+        cache_filename = None
+        if cache_dir is not None and bdf_filename and not isinstance(bdf_filename, (StringIO, list)):
+            settings = {
+                'punch': punch, 'read_includes': read_includes,
+                'save_file_structure': save_file_structure, 'encoding': encoding,
+                'bulk_arrays': bulk_arrays, 'lazy': lazy, 'mode': self._nastran_format,
+                'cards_to_read': sorted(self.cards_to_read),
+                'dict_of_vars': self.dict_of_vars if self._is_dynamic_syntax else None,
+            }
+            cache_filename = get_cache_filename(bdf_filename, cache_dir, settings)
+            if load_bdf_cache(self, cache_filename):
+                if validate:
+                    self.validate()
+                self.cross_reference(xref=xref)
+                self._xref = xref
+                return
+
         self._read_bdf_helper(bdf_filename, encoding, punch, read_includes)
         self.log.debug('---starting BDF.read_bdf of %s---' % self.bdf_filename)
         self._parse_primary_file_header(bdf_filename)
@@ -1010,6 +1083,9 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
         out = obj.get_lines(bdf_filename, punch=self.punch, make_ilines=True)
         system_lines, executive_control_lines, case_control_lines, bulk_data_lines, bulk_data_ilines, superelement_lines, superelement_ilines = out
         self._set_pybdf_attributes(obj, save_file_structure)
+        if save_file_structure and isinstance(bdf_filename, str):
+            self._active_file_stats = get_file_stats(self.active_filenames)
+            self._bulk_data_ifiles = set(np.unique(bulk_data_ilines[:, 0]).tolist())
 
         self.system_command_lines = system_lines
         self.executive_control_lines = executive_control_lines
@@ -1033,7 +1109,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             self.is_superelements = True
             self.read_bdf(bdf_filename=bdf_filename, validate=validate, xref=xref, punch=punch,
                           read_includes=read_includes, save_file_structure=save_file_structure,
-                          encoding=encoding)
+                          encoding=encoding, bulk_arrays=bulk_arrays, nworkers=nworkers,
+                          cache_dir=cache_dir, lazy=lazy)
             return
 
         if superelement_lines:
@@ -1041,6 +1118,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         self.pop_parse_errors()
         fill_dmigs(self)
+        if cache_filename is not None:
+            save_bdf_cache(self, cache_filename)
 
         if validate:
             self.validate()
@@ -1050,6 +1129,81 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
         self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
 
+    def refresh(self) -> List[str]:
+        """
+        Rereads the INCLUDE files that changed since ``read_bdf``
+
+        Only the changed INCLUDE files are reread.  Their cards are removed
+        and the new ones are added.  If the model is cross-referenced, only
+        the new cards and the cards that referenced a removed card (e.g.,
+        the CQUAD4s of a PSHELL) are cross-referenced; with xref='lazy', all
+        the cards are cross-referenced again when they're accessed.  The
+        deck is reread if the master file, an INCLUDE file that isn't bulk
+        data, or the INCLUDE cards in a changed file changed.
+
+        Returns
+        -------
+        filenames : List[str]
+            the files that were reread
+
+        .. code-block:: python
+
+           >>> model = read_bdf(bdf_filename, save_file_structure=True)
+           # edit properties.inc
+           >>> model.refresh()
+           ['/path/to/properties.inc']
+
+        .. note:: requires ``read_bdf(..., save_file_structure=True)``,
+                  so the cards know what file they're from
+        """
+        if not self.save_file_structure or not self._active_file_stats:
+            raise RuntimeError('refresh requires read_bdf(bdf_filename, save_file_structure=True)')
+        ifiles = get_changed_ifiles(self)
+        if not ifiles:
+            return []
+
+        xref = self._xref
+        out = None
+        if not self.superelement_models:
+            out = get_bulk_data_lines(self, ifiles)
+        if out is None:
+            bdf_filename = self.bdf_filename
+            bulk_arrays = self.use_bulk_arrays
+            nworkers = self.nworkers
+            lazy = self.use_lazy_cards
+            self.log.debug('rereading %s' % bdf_filename)
+            self.clear_attributes()
+            self.card_count = {}
+            self.reject_count = {}
+            self.reject_cards = []
+            self.read_bdf(bdf_filename, validate=False, xref=xref, punch=self.punch,
+                          read_includes=self.read_includes, save_file_structure=True,
+                          encoding=self._encoding, bulk_arrays=bulk_arrays,
+                          nworkers=nworkers, lazy=lazy)
+            return list(self.active_filenames)
+        bulk_data_lines, bulk_data_ilines = out
+
+        filenames = [self.active_filenames[ifile] for ifile in ifiles]
+        self.log.debug('refreshing %s' % filenames)
+        ifiles_set = set(ifiles)
+        if xref == 'lazy':
+            # the cards are cross-referenced again when they're accessed
+            self.uncross_reference()
+        removed_cards = remove_cards_by_ifile(self, ifiles_set)
+
+        cards_list = self.get_bdf_cards(bulk_data_lines, bulk_data_ilines)[0]
+        self._parse_cards_list(cards_list)
+        self.pop_parse_errors()
+        fill_dmigs(self)
+        self._active_file_stats = get_file_stats(self.active_filenames)
+
+        if xref == 'lazy':
+            self.cross_reference(xref=xref)
+        elif xref:
+            cards = get_cards_to_cross_reference(self, ifiles_set, removed_cards)
+            cross_reference_cards(self, cards)
+        return filenames
+
     def _add_superelements(self, superelement_lines: List[str],
                            superelement_ilines: Any) -> None:  # pragma: no cover
         self.log.warning('_add_superelements should be overwritten')
@@ -3051,6 +3205,76 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
             #raise RuntimeError(card_obj)
             self.reject_cards.append(card_obj)
 
+    def _parse_cards_parallel(self, cards_list: List[Any]) -> Dict[int, Any]:
+        """
+        Creates the card objects with a pool of processes
+
+        Parameters
+        ----------
+        cards_list : List[card_name, comment, card_lines, (ifile, iline)]
+            the cards from ``get_bdf_cards``
+
+        Returns
+        -------
+        parsed_cards : Dict[int, (class_instance, card_lines, card_obj, error)]
+            icard -> the card object from ``parse_cards_chunk``,
+            which is added by ``_add_parsed_card``
+
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from .bdf_interface.parallel_reader import (
+            get_parallel_cards, split_cards, parse_cards_chunk)
+        cards = get_parallel_cards(self, cards_list)
+        chunks = split_cards(cards, self.nworkers)
+        if len(chunks) == 1:
+            return {}
+
+        card_names = {card[1] for card in cards}
+        card_classes = {card_name: self._card_parser[card_name][0] for card_name in card_names}
+        self.log.debug('-------- parsing %i cards with nworkers=%s --------' % (
+            len(cards), self.nworkers))
+        parsed_cards = {}
+        with ProcessPoolExecutor(max_workers=self.nworkers) as executor:
+            futures = [executor.submit(parse_cards_chunk, chunk, card_classes)
+                       for chunk in chunks]
+            for chunk, future in zip(chunks, futures):
+                class_instances, errors = future.result()
+                for i, ((icard, unused_card_name, unused_comment, card_lines),
+                        class_instance) in enumerate(zip(chunk, class_instances)):
+                    card_obj, error = errors.get(i, (None, None))
+                    parsed_cards[icard] = (class_instance, card_lines, card_obj, error)
+        return parsed_cards
+
+    def _add_parsed_card(self, card_name: str, class_instance: Any, card_lines: List[str],
+                         card_obj: Optional[BDFCard], error: Optional[Exception]) -> None:
+        """
+        Adds a card object from ``parse_cards_chunk`` to the BDF object
+        (see ``add_card``)
+        """
+        self.increase_card_count(card_name)
+        if error is not None and card_obj is None:
+            # the card couldn't be split into fields
+            raise error
+
+        add_card_function = self._card_parser[card_name][1]
+        try:
+            if error is not None:
+                raise error
+            add_card_function(class_instance)
+        except (TypeError, SyntaxError, AssertionError, KeyError, ValueError) as exception:
+            if card_obj is None:
+                # the card object was created, but it couldn't be added (e.g., a duplicate)
+                card_obj = BDFCard(wipe_empty_fields(to_fields(card_lines, card_name)),
+                                   has_none=False)
+            print('problem adding %s' % card_obj)
+            if isinstance(exception, TypeError):
+                raise
+            self._iparse_errors += 1
+            var = traceback.format_exception_only(type(exception), exception)
+            self._stored_parse_errors.append((card_name, var))
+            if self._iparse_errors > self._nparse_errors:
+                self.pop_parse_errors()
+
     def get_bdf_stats(self, return_type: str='string') -> Union[str, List[str]]:
         """
         Print statistics for the BDF
@@ -3858,6 +4082,22 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
                                         is_list=False, has_none=False)
 
         else:
+            # card_name -> [card_lines, ...]
+            bulk_cards = defaultdict(list)  # type: Dict[str, List[List[str]]]
+            use_bulk_arrays = self.use_bulk_arrays and not self._is_dynamic_syntax
+            # card_name -> [(comment, card_lines), ...]
+            lazy_cards = defaultdict(list)  # type: Dict[str, List[Tuple[str, List[str]]]]
+            lazy_slots = get_lazy_slots(self, cards_list)
+            # card_name -> [icard, ...]
+            bulk_icards = defaultdict(list)  # type: Dict[str, List[int]]
+            lazy_icards = defaultdict(list)  # type: Dict[str, List[int]]
+            # the other cards in the dictionaries with bulk/lazy cards (e.g., a
+            # CBEAM with bulk CQUAD4s) are added in file order with them
+            # [(icard, card_name, comment, card_lines, ifile, is_list, parsed_card), ...]
+            slot_cards = []  # type: List[Tuple[int, str, str, List[str], int, bool, Any]]
+            deferred_slots = get_deferred_slots(self, cards_list, use_bulk_arrays, lazy_slots)
+            # icard -> (class_instance, card, card_obj, error)
+            parsed_cards = self._parse_cards_parallel(cards_list) if self.nworkers > 1 else {}
             for icard, card in enumerate(cards_list):
                 card_name, comment, card_lines, (ifile, unused_iline) = card
                 #print(unused_iline, card_lines[0])
@@ -3877,16 +4117,106 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
                     _check_replicated_cards(replicated_cards)
                     for replicated_card in replicated_cards:
+                        if self._type_to_slot_map.get(replicated_card[0]) in deferred_slots:
+                            slot_cards.append((icard, replicated_card[0], comment,
+                                               replicated_card, None, True, None))
+                            continue
                         self.add_card(replicated_card, replicated_card[0], comment=comment,
                                       is_list=True, has_none=True)
                     continue
 
-                if self.is_reject(card_name):
+                if use_bulk_arrays and not comment and card_name in BULK_ARRAY_CARDS and (
+                        card_name in self.cards_to_read):
+                    bulk_cards[card_name].append(card_lines)
+                    bulk_icards[card_name].append(icard)
+                elif card_name in lazy_slots:
+                    lazy_cards[card_name].append((comment, card_lines))
+                    lazy_icards[card_name].append(icard)
+                elif self._type_to_slot_map.get(card_name) in deferred_slots and (
+                        not self.is_reject(card_name)):
+                    slot_cards.append((icard, card_name, comment, card_lines, ifile, False,
+                                       parsed_cards.pop(icard, None)))
+                elif icard in parsed_cards:
+                    self._add_parsed_card(card_name, *parsed_cards.pop(icard))
+                elif self.is_reject(card_name):
                     self.reject_card_lines(card_name, card_lines, comment=comment)
                 else:
                     self.add_card(card_lines, card_name, comment=comment, ifile=ifile,
                                   is_list=False, has_none=False)
 
+            if bulk_cards or lazy_cards or slot_cards:
+                self._add_deferred_cards(bulk_cards, bulk_icards, lazy_cards, lazy_icards,
+                                         slot_cards)
+
+    def _add_deferred_cards(self, bulk_cards: Dict[str, List[List[str]]],
+                            bulk_icards: Dict[str, List[int]],
+                            lazy_cards: Dict[str, List[Tuple[str, List[str]]]],
+                            lazy_icards: Dict[str, List[int]],
+                            slot_cards: List[Tuple[int, str, str, List[str], int, bool, Any]],
+                            ) -> None:
+        """
+        Adds the bulk/lazy cards and the other cards in the same dictionaries
+        (e.g., elements) in file order, so the first card with an id is kept
+        and a duplicate is compared to it like the standard reader
+        """
+        bulk_fields = get_bulk_fields(bulk_cards)
+        lazy_ids = {
+            card_name: get_card_ids([card_lines for unused_comment, card_lines in cards],
+                                    card_name)
+            for card_name, cards in lazy_cards.items()}
+
+        # slot -> {key : (ids, icards)}
+        slots_ids = defaultdict(dict)  # type: Dict[str, Dict[Any, Tuple[Any, Any]]]
+        for card_name, (unused_fields, unused_is_valid, ids) in bulk_fields.items():
+            slot = BULK_ARRAY_CARDS[card_name].slot
+            slots_ids[slot][('bulk', card_name)] = (ids, bulk_icards[card_name])
+        for card_name, (ids, unused_is_valid) in lazy_ids.items():
+            slot = self._type_to_slot_map.get(card_name)
+            slots_ids[slot][('lazy', card_name)] = (ids, lazy_icards[card_name])
+
+        # the ids of the other cards; the replicated cards are split into fields
+        slot_irows = defaultdict(list)  # type: Dict[Tuple[str, bool], List[int]]
+        for irow, (unused_icard, card_name, unused_comment, unused_card_lines,
+                   unused_ifile, is_list, unused_parsed_card) in enumerate(slot_cards):
+            slot_irows[(card_name, is_list)].append(irow)
+        for (card_name, is_list), irows in slot_irows.items():
+            if is_list:
+                fields = [str(slot_cards[irow][3][1]).strip() for irow in irows]
+                ids = np.array([int(field) if field.isdigit() else 0 for field in fields],
+                               dtype='int64')
+            else:
+                ids = get_card_ids([slot_cards[irow][3] for irow in irows], card_name)[0]
+            icards = [slot_cards[irow][0] for irow in irows]
+            slot = self._type_to_slot_map.get(card_name)
+            slots_ids[slot][('slot', card_name, is_list)] = (ids, icards)
+
+        is_first = {}
+        for slot_ids in slots_ids.values():
+            is_first.update(get_first_cards(slot_ids))
+
+        # the cards that can't be stored as arrays or indexed by id (e.g., a
+        # duplicate) use add_card
+        cards = list(slot_cards)
+        for card_name, irows in add_bulk_cards(self, bulk_fields, is_first).items():
+            icards = bulk_icards[card_name]
+            cards_lines = bulk_cards[card_name]
+            cards.extend((icards[irow], card_name, '', cards_lines[irow], None, False, None)
+                         for irow in irows)
+        for card_name, irows in add_lazy_cards(self, lazy_cards, lazy_ids, is_first).items():
+            icards = lazy_icards[card_name]
+            comments_cards_lines = lazy_cards[card_name]
+            cards.extend((icards[irow], card_name) + comments_cards_lines[irow] +
+                         (None, False, None) for irow in irows)
+
+        cards.sort(key=lambda card: card[0])
+        for (unused_icard, card_name, comment, card_lines, ifile, is_list,
+             parsed_card) in cards:
+            if parsed_card is not None:
+                self._add_parsed_card(card_name, *parsed_card)
+            else:
+                self.add_card(card_lines, card_name, comment=comment, ifile=ifile,
+                              is_list=is_list, has_none=is_list)
+
     #def _is_case_control_deck(self, line):
         #line_upper = line.upper().strip()
         #if 'CEND' in line.upper():
@@ -4246,7 +4576,8 @@ class BDF_(BDFMethods, GetCard, AddCards, WriteMeshs, UnXrefMesh):
 
 class BDF(BDF_):
     """NASTRAN BDF Reader/Writer/Editor class."""
-    _properties = ['is_bdf_vectorized', 'nid_map', 'wtmass', 'type_slot_str'] + [
+    _properties = ['is_bdf_vectorized', 'nid_map', 'wtmass', 'type_slot_str',
+                   'bulk_arrays'] + [
         'nastran_format', 'is_long_ids', 'sol', 'subcases',
         'nnodes', 'node_ids', 'point_ids', 'npoints',
         'nelements', 'element_ids', 'nproperties', 'property_ids',
@@ -4338,13 +4669,16 @@ def _echo_card(card, card_obj):
         else:
             print(print_card_16(card_obj).rstrip())
 
-def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=True, punch: bool=False,
+def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True,
+             xref: Union[bool, str]=True, punch: bool=False,
              save_file_structure: bool=False,
              skip_cards: Optional[List[str]]=None,
              read_cards: Optional[List[str]]=None,
              encoding: Optional[str]=None,
              log=None,
-             debug: bool=True, mode: str='msc') -> BDF:
+             debug: bool=True, mode: str='msc',
+             bulk_arrays: bool=False, nworkers: int=1,
+             cache_dir: Optional[str]=None, lazy: bool=False) -> BDF:
     # Optional[SimpleLogger]
     """
     Creates the BDF object
@@ -4363,12 +4697,15 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
         settings the logging object has
     validate : bool; default=True
         runs various checks on the BDF
-    xref :  bool; default=True
+    xref :  bool / str; default=True
         should the bdf be cross referenced
+        'lazy' : cross reference the cards when they're accessed
+        (see ``BDF.read_bdf``)
     punch : bool; default=False
         indicates whether the file is a punch file
     save_file_structure : bool; default=False
-        enables the ``write_bdfs`` method
+        enables the ``write_bdfs`` and ``refresh`` methods;
+        bulk_arrays, lazy, and nworkers are ignored
     skip_cards : List[str]; default=None
         None : include all cards
         list of cards to skip
@@ -4380,6 +4717,29 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
     mode : str; default='msc'
         the type of Nastran
         valid_modes = {'msc', 'nx'}
+    bulk_arrays : bool; default=False
+        parse the GRID, CQUAD4, CTRIA3, CTETRA, CHEXA, CBAR, and CBUSH
+        cards into arrays (``model.bulk_arrays``), so the card objects
+        are only created when they're accessed (e.g., ``model.nodes[nid]``);
+        this only helps with validate=False and xref=False (or xref='lazy'),
+        because validate=True and xref=True create every card while the
+        deck is read (the arrays are then released)
+    nworkers : int; default=1
+        the number of processes that create the card objects; the cards
+        are split into chunks (at least 1000 cards each) and are added
+        to the model in deck order, so duplicate ids and parsing errors
+        are reported the same way
+    cache_dir : str; default=None
+        the directory to cache the parsed (not cross-referenced) model in;
+        an unchanged deck is loaded from the cache, while a change to the
+        size or modification time of the master file or any INCLUDE file
+        reparses the deck
+    lazy : bool; default=False
+        store the lines of the nodes, elements, properties, materials,
+        masses, and rigid elements, so the card objects are only created
+        when they're accessed (e.g., ``model.properties[pid]``); an
+        error in a card is raised when it's accessed, and validate/xref
+        create all the cards, so use validate=False and xref=False
 
     Returns
     -------
@@ -4421,7 +4781,8 @@ def read_bdf(bdf_filename: Optional[str]=None, validate: bool=True, xref: bool=T
     model.read_bdf(bdf_filename=bdf_filename, validate=validate,
                    xref=xref, punch=punch, read_includes=True,
                    save_file_structure=save_file_structure,
-                   encoding=encoding)
+                   encoding=encoding, bulk_arrays=bulk_arrays, nworkers=nworkers,
+                   cache_dir=cache_dir, lazy=lazy)
 
     #if 0:
         ### TODO: remove all the extra methods
@@ -26,6 +26,13 @@ class BDFAttributes:
         self.is_nasa95 = False
         self.is_zona = False
         self.save_file_structure = False
+        self.use_bulk_arrays = False
+        self.nworkers = 1
+        self.use_lazy_cards = False
+        # the (path, size, mtime_ns) of the active_filenames for refresh
+        self._active_file_stats = []
+        # the files with bulk data lines, which refresh can reread on their own
+        self._bulk_data_ifiles = set()
         self.is_superelements = False
         self.set_as_msc()
         self.units = []  # type: List[str]
@@ -943,6 +950,19 @@ class BDFAttributes:
         }  # type: Dict[str, List[str]]
         self._type_to_slot_map = self.get_rslot_map()
 
+    @property
+    def bulk_arrays(self) -> Dict[str, Any]:
+        """
+        the GRID, CQUAD4, etc. arrays from ``read_bdf(..., bulk_arrays=True)``;
+        an array is released once all of its cards have been built
+        """
+        bulk_arrays = {}
+        for card_dict in (self.nodes, self.elements):
+            for bulk_array in getattr(card_dict, '_arrays', []):
+                if bulk_array.is_bulk_array:
+                    bulk_arrays[bulk_array.card_name] = bulk_array
+        return bulk_arrays
+
     @property
     def type_slot_str(self) -> str:
         """helper method for printing supported cards"""
@@ -0,0 +1,1010 @@
+"""
+Defines the bulk array reader (``read_bdf(..., bulk_arrays=True)``), which
+parses the highest volume cards (GRID, CQUAD4, CTRIA3, CTETRA, CHEXA, CBAR,
+CBUSH) in batches into numpy arrays instead of creating a BDFCard and a card
+object for each card.
+
+The arrays are stored in ``model.bulk_arrays`` (e.g.,
+``model.bulk_arrays['GRID'].xyz``) and ``model.nodes``/``model.elements``
+become a ``BulkCardDict``, which builds the card object when it's accessed
+(e.g., ``model.nodes[nid]``).  Getting the cards of the dictionary (e.g.,
+``model.nodes.items()`` when cross-referencing, validating, writing) builds
+all the cards, while the ids (e.g., ``model.nodes.keys()``) don't.  Once
+every card of an array has been built, the array is released (and isn't in
+``model.bulk_arrays`` anymore), so the cards aren't stored twice.
+
+The cards are added in file order with the other cards in the dictionary
+(e.g., a CBEAM with bulk CQUAD4s), so a duplicate id is compared to the
+first card in the file like the standard reader.
+
+A card that can't be parsed exactly the same way as ``add_card`` (e.g., it
+has a comment, a thermal field, a PS field, or a value in the Nastran
+1.0-3 format that isn't a float) is added with ``add_card``, so the model
+is the same as the standard reader.
+
+ - get_fields_array(cards_lines, card_name, nfields)
+ - get_card_ids(cards_lines, card_name)
+ - get_bulk_fields(bulk_cards)
+ - get_deferred_slots(model, cards_list, use_bulk_arrays, lazy_slots)
+ - get_first_cards(slot_ids)
+ - add_bulk_cards(model, bulk_fields, is_first=None)
+ - get_bulk_card_dict(model, slot)
+ - BulkCardDict
+
+"""
+from __future__ import annotations
+import re
+from collections.abc import KeysView
+from typing import List, Dict, Tuple, Set, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.bdf.bdf_interface.utils import to_fields
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CTETRA10, CHEXA8, CHEXA20
+from pyNastran.bdf.cards.elements.bars import CBAR
+from pyNastran.bdf.cards.elements.bush import CBUSH
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the largest id that's stored in an int32 array
+MAX_INT32 = np.iinfo('int32').max
+#: csv, tab, large field, and replication cards are split with ``to_fields``
+_SPECIAL_CHARACTERS = re.compile('[,\t*=]')
+SPACE, PLUS, MINUS, DOT, ZERO = (ord(char) for char in ' +-.0')
+POWERS_OF_10 = 10 ** np.arange(19, dtype='int64')
+
+
+class BulkCardArray:
+    """the base class for a card that's stored as arrays"""
+    card_name = ''
+    #: the number of fields (not including the card name)
+    nfields = 8
+    #: the name of the dictionary the cards are stored in
+    slot = 'elements'
+    #: is the array in ``model.bulk_arrays`` (the lazy cards aren't)
+    is_bulk_array = True
+
+    def __init__(self, ids: np.ndarray):
+        #: the node/element ids
+        self.ids = ids
+        self._isort = np.argsort(ids, kind='stable')
+        self._ids_sorted = ids[self._isort]
+        #: has the card object been created
+        self.is_built = np.zeros(len(ids), dtype='bool')
+        #: the number of cards that haven't been created
+        self.nunbuilt = len(ids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def find(self, key: int) -> Optional[int]:
+        """gets the row of an id"""
+        i = np.searchsorted(self._ids_sorted, key)
+        if i < len(self._ids_sorted) and self._ids_sorted[i] == key:
+            return self._isort[i]
+        return None
+
+    def get_types(self) -> Dict[str, np.ndarray]:
+        """gets the card type (e.g., CTETRA) -> ids"""
+        return {self.card_name: self.ids}
+
+    def build(self, irow: int) -> Any:  # pragma: no cover
+        """creates the card object for a row"""
+        raise NotImplementedError(self.card_name)
+
+    def release_row(self, irow: int) -> None:
+        """called once the card of a row is stored, so its data can be dropped"""
+        pass
+
+    def __repr__(self) -> str:
+        return '%s(n=%s)' % (self.__class__.__name__, len(self))
+
+
+class GRIDArray(BulkCardArray):
+    """GRID nid cp x1 x2 x3 cd ps seid"""
+    card_name = 'GRID'
+    slot = 'nodes'
+
+    def __init__(self, nid, cp, xyz, cd, seid):
+        BulkCardArray.__init__(self, nid)
+        self.nid = nid
+        self.cp = cp
+        self.xyz = xyz
+        self.cd = cd
+        self.seid = seid
+
+    @classmethod
+    def parse(cls, fields: np.ndarray) -> Tuple[Any, np.ndarray]:
+        nid, ok = _ints(fields, 1)
+        cp, ok2 = _ints(fields, 2, 0)
+        x1, ok3 = _floats(fields, 3, 0.)
+        x2, ok4 = _floats(fields, 4, 0.)
+        x3, ok5 = _floats(fields, 5, 0.)
+        cd, ok6 = _ints(fields, 6, 0)
+        seid, ok7 = _ints(fields, 8, 0)
+        ok &= ok2 & ok3 & ok4 & ok5 & ok6 & ok7 & _is_blank(fields, 7, 8) & (nid > 0)
+        xyz = np.column_stack([x1, x2, x3])
+        return _filter(cls, ok, nid, cp, xyz, cd, seid), ok
+
+    def build(self, irow: int) -> GRID:
+        return GRID(int(self.nid[irow]), self.xyz[irow, :].tolist(),
+                    cp=int(self.cp[irow]), cd=int(self.cd[irow]), ps='',
+                    seid=int(self.seid[irow]))
+
+
+class ShellArray(BulkCardArray):
+    """
+    CQUAD4 eid pid n1 n2 n3 n4 theta_mcid zoffset
+    CTRIA3 eid pid n1 n2 n3 theta_mcid zoffset
+
+    The theta/mcid field is stored as theta (mcid=-1) or mcid (theta=0.)
+    """
+    nnodes = 4
+
+    def __init__(self, eid, pid, nodes, theta, mcid, zoffset):
+        BulkCardArray.__init__(self, eid)
+        self.eid = eid
+        self.pid = pid
+        self.nodes = nodes
+        self.theta = theta
+        self.mcid = mcid
+        self.zoffset = zoffset
+
+    @classmethod
+    def parse(cls, fields: np.ndarray) -> Tuple[Any, np.ndarray]:
+        nnodes = cls.nnodes
+        eid, ok = _ints(fields, 1)
+        pid, ok2 = _ints(fields, 2, 0)
+        pid = np.where(_is_blank(fields, 2, 3), eid, pid)
+        ok &= ok2 & (eid > 0)
+        nodes = []
+        for ifield in range(3, 3 + nnodes):
+            nid, oki = _ints(fields, ifield)
+            nodes.append(nid)
+            ok &= oki
+        theta, mcid, ok3 = _int_or_floats(fields, 3 + nnodes, 0.)
+        zoffset, ok4 = _floats(fields, 4 + nnodes, 0.)
+        ok &= ok3 & ok4 & _is_blank(fields, 5 + nnodes)
+        return _filter(cls, ok, eid, pid, np.column_stack(nodes), theta, mcid, zoffset), ok
+
+    def build(self, irow: int) -> Any:
+        mcid = int(self.mcid[irow])
+        theta_mcid = float(self.theta[irow]) if mcid == -1 else mcid
+        return self.card_class(int(self.eid[irow]), int(self.pid[irow]),
+                               self.nodes[irow, :].tolist(),
+                               theta_mcid=theta_mcid, zoffset=float(self.zoffset[irow]))
+
+
+class CQUAD4Array(ShellArray):
+    card_name = 'CQUAD4'
+    card_class = CQUAD4
+    nfields = 16
+    nnodes = 4
+
+
+class CTRIA3Array(ShellArray):
+    card_name = 'CTRIA3'
+    card_class = CTRIA3
+    nfields = 16
+    nnodes = 3
+
+
+class SolidArray(BulkCardArray):
+    """
+    CTETRA eid pid n1 ... n4 [n5 ... n10]
+    CHEXA  eid pid n1 ... n8 [n9 ... n20]
+
+    The blank midside nodes are 0
+    """
+    nnodes = 4
+    nnodes_max = 10
+
+    def __init__(self, eid, pid, nodes):
+        BulkCardArray.__init__(self, eid)
+        self.eid = eid
+        self.pid = pid
+        self.nodes = nodes
+        #: is the element a CTETRA10/CHEXA20
+        self.is_midside = nodes[:, self.nnodes:].any(axis=1)
+
+    @classmethod
+    def parse(cls, fields: np.ndarray) -> Tuple[Any, np.ndarray]:
+        eid, ok = _ints(fields, 1)
+        pid, ok2 = _ints(fields, 2)
+        ok &= ok2 & (eid > 0)
+        nodes = []
+        for inode in range(cls.nnodes_max):
+            if inode < cls.nnodes:
+                nid, oki = _ints(fields, 3 + inode)
+            else:
+                # a midside node of 0 is written as blank, so use add_card
+                nid, oki = _ints(fields, 3 + inode, 0)
+                oki &= (nid != 0) | _is_blank(fields, 3 + inode, 3 + inode + 1)
+            nodes.append(nid)
+            ok &= oki
+        ok &= _is_blank(fields, 3 + cls.nnodes_max)
+        return _filter(cls, ok, eid, pid, np.column_stack(nodes)), ok
+
+    def build(self, irow: int) -> Any:
+        eid = int(self.eid[irow])
+        pid = int(self.pid[irow])
+        nodes = self.nodes[irow, :].tolist()
+        if self.is_midside[irow]:
+            nodes = [nid if nid != 0 else None for nid in nodes]
+            return self.card_class_midside(eid, pid, nodes)
+        return self.card_class(eid, pid, nodes[:self.nnodes])
+
+
+class CTETRAArray(SolidArray):
+    card_name = 'CTETRA'
+    card_class = CTETRA4
+    card_class_midside = CTETRA10
+    nfields = 16
+    nnodes = 4
+    nnodes_max = 10
+
+
+class CHEXAArray(SolidArray):
+    card_name = 'CHEXA'
+    card_class = CHEXA8
+    card_class_midside = CHEXA20
+    nfields = 24
+    nnodes = 8
+    nnodes_max = 20
+
+
+class CBARArray(BulkCardArray):
+    """
+    CBAR eid pid ga gb x1/g0 x2 x3
+
+    The orientation is stored as x (g0=0) or g0 (x=nan)
+    """
+    card_name = 'CBAR'
+    nfields = 16
+
+    def __init__(self, eid, pid, nodes, x, g0):
+        BulkCardArray.__init__(self, eid)
+        self.eid = eid
+        self.pid = pid
+        self.nodes = nodes
+        self.x = x
+        self.g0 = g0
+
+    @classmethod
+    def parse(cls, fields: np.ndarray) -> Tuple[Any, np.ndarray]:
+        eid, ok = _ints(fields, 1)
+        pid, ok2 = _ints(fields, 2, 0)
+        pid = np.where(_is_blank(fields, 2, 3), eid, pid)
+        ga, ok3 = _ints(fields, 3)
+        gb, ok4 = _ints(fields, 4)
+        x1, g0, ok5 = _int_or_floats(fields, 5, np.nan)
+        x2, ok6 = _floats(fields, 6, 0.)
+        x3, ok7 = _floats(fields, 7, 0.)
+        is_x = g0 == -1
+        x = np.column_stack([x1, x2, x3])
+        x[~is_x, :] = np.nan
+        g0[is_x] = 0
+
+        # a blank x1/g0 uses the BAROR and a zero length x is an error,
+        # so use add_card
+        ok &= ok2 & ok3 & ok4 & ok5 & (eid > 0) & _is_blank(fields, 8)
+        ok &= np.where(is_x, (ok6 & ok7) & (np.abs(x).sum(axis=1) > 0.), g0 > 0)
+        return _filter(cls, ok, eid, pid, np.column_stack([ga, gb]), x, g0), ok
+
+    def build(self, irow: int) -> CBAR:
+        g0 = int(self.g0[irow])
+        if g0:
+            x = None
+        else:
+            x = self.x[irow, :].copy()
+            g0 = None
+        return CBAR(int(self.eid[irow]), int(self.pid[irow]), self.nodes[irow, :].tolist(),
+                    x, g0, offt='GGG', pa=0, pb=0,
+                    wa=np.zeros(3, dtype='float64'), wb=np.zeros(3, dtype='float64'))
+
+
+class CBUSHArray(BulkCardArray):
+    """
+    CBUSH eid pid ga gb x1/g0 x2 x3 cid
+
+    A blank gb/g0 is 0, a blank x is nan and a blank cid is -1
+    """
+    card_name = 'CBUSH'
+    nfields = 16
+
+    def __init__(self, eid, pid, nodes, x, g0, cid):
+        BulkCardArray.__init__(self, eid)
+        self.eid = eid
+        self.pid = pid
+        self.nodes = nodes
+        self.x = x
+        self.g0 = g0
+        self.cid = cid
+
+    @classmethod
+    def parse(cls, fields: np.ndarray) -> Tuple[Any, np.ndarray]:
+        eid, ok = _ints(fields, 1)
+        pid, ok2 = _ints(fields, 2, 0)
+        pid = np.where(_is_blank(fields, 2, 3), eid, pid)
+        ga, ok3 = _ints(fields, 3)
+        gb, ok4 = _ints(fields, 4, 0)
+        x1, g0, ok5 = _int_or_floats(fields, 5, np.nan)
+        x2, ok6 = _floats(fields, 6, 0.)
+        x3, ok7 = _floats(fields, 7, 0.)
+        cid, ok8 = _ints(fields, 8, -1)
+        ok &= ok2 & ok3 & ok4 & ok5 & ok6 & ok7 & ok8 & (eid > 0) & _is_blank(fields, 9)
+
+        is_blank_gb = _is_blank(fields, 4, 5)
+        is_blank_cid = _is_blank(fields, 8, 9)
+        is_x = (g0 == -1) & ~np.isnan(x1)
+        x = np.column_stack([x1, x2, x3])
+        x[~is_x, :] = np.nan
+        g0[g0 == -1] = 0
+
+        # 0 is used for a blank gb/g0 and -1 for a blank cid, so use add_card
+        # for the explicit values; x=[1., 1., 1.] is an error without a cid
+        ok &= ((gb > 0) | is_blank_gb) & ((cid >= 0) | is_blank_cid)
+        ok &= (g0 > 0) | _is_blank(fields, 5, 6) | is_x
+        ok &= ~is_x | ~is_blank_cid | (x.max(axis=1) != x.min(axis=1))
+        return _filter(cls, ok, eid, pid, np.column_stack([ga, gb]), x, g0, cid), ok
+
+    def build(self, irow: int) -> CBUSH:
+        ga, gb = self.nodes[irow, :].tolist()
+        g0 = int(self.g0[irow])
+        cid = int(self.cid[irow])
+        if g0:
+            x = None
+        elif np.isnan(self.x[irow, 0]):
+            x = [None, None, None]
+        else:
+            x = self.x[irow, :].tolist()
+        return CBUSH(int(self.eid[irow]), int(self.pid[irow]), [ga, gb if gb else None],
+                     x, g0 if g0 else None, cid=cid if cid != -1 else None,
+                     s=0.5, ocid=-1, si=[None, None, None])
+
+
+#: card_name -> array class
+BULK_ARRAY_CARDS = {
+    array_class.card_name: array_class
+    for array_class in [GRIDArray, CQUAD4Array, CTRIA3Array, CTETRAArray, CHEXAArray,
+                        CBARArray, CBUSHArray]
+}
+
+
+def _filter(cls, ok: np.ndarray, ids: np.ndarray, *arrays) -> Optional[BulkCardArray]:
+    """creates the array object with the rows that were parsed"""
+    ok &= (ids <= MAX_INT32)
+    for array in arrays:
+        if array.dtype.kind == 'i':
+            ok &= (np.abs(array) <= MAX_INT32).all(axis=1) if array.ndim == 2 else (
+                np.abs(array) <= MAX_INT32)
+    if not ok.any():
+        return None
+    arrays2 = [
+        array[ok].astype('int32') if array.dtype.kind == 'i' else array[ok]
+        for array in (ids, ) + arrays]
+    return cls(*arrays2)
+
+
+def _is_blank(fields: np.ndarray, ifield: int, jfield: Optional[int]=None) -> np.ndarray:
+    """are the fields from ifield to jfield (or the end of the card) blank"""
+    block = fields[:, ifield-1:jfield-1 if jfield is not None else None, :]
+    return ((block == SPACE) | (block == 0)).all(axis=(1, 2))
+
+
+def _ints(fields: np.ndarray, ifield: int,
+          default: Optional[int]=None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parses an integer field (e.g., 1, -1, +1)
+
+    Parameters
+    ----------
+    fields : (ncards, nfields, nchars) uint8 ndarray
+        the fields of the cards (not including the card name)
+    ifield : int
+        the field number on the card (the eid is field 1)
+    default : int; default=None
+        the value of a blank field; None -> required
+
+    Returns
+    -------
+    values : (ncards, ) int64 ndarray
+        the values
+    is_valid : (ncards, ) bool ndarray
+        was the field parsed
+
+    """
+    chars = fields[:, ifield-1, :]
+    ncards, nchars = chars.shape
+    is_space = (chars == SPACE) | (chars == 0)
+    is_blank = is_space.all(axis=1)
+    is_digit = (chars >= ZERO) & (chars <= ZERO + 9)
+
+    # a sign followed by digits without spaces
+    ifirst = is_space.argmin(axis=1)
+    ilast = nchars - 1 - is_space[:, ::-1].argmin(axis=1)
+    nnonblank = nchars - is_space.sum(axis=1)
+    ndigits = is_digit.sum(axis=1)
+    first = chars[np.arange(ncards), ifirst]
+    has_sign = (first == PLUS) | (first == MINUS)
+    is_valid = (
+        ~is_blank & (ilast - ifirst + 1 == nnonblank) &
+        (ndigits + has_sign == nnonblank) & (ndigits >= 1) & (ndigits <= 18))
+
+    power = np.clip(ilast[:, np.newaxis] - np.arange(nchars), 0, 18)
+    digits = np.where(is_digit, chars - ZERO, 0).astype('int64')
+    values = (digits * POWERS_OF_10[power]).sum(axis=1)
+    values[first == MINUS] *= -1
+    values[~is_valid] = 0
+    if default is not None:
+        values[is_blank] = default
+        is_valid |= is_blank
+    return values, is_valid
+
+
+def _floats(fields: np.ndarray, ifield: int,
+            default: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Parses a float field (e.g., 1.0, 1., 1.0e-3, 1.-3, 1.0D-3)
+
+    Values without a decimal point are parsed by ``add_card``.
+
+    Parameters
+    ----------
+    fields : (ncards, nfields, nchars) uint8 ndarray
+        the fields of the cards (not including the card name)
+    ifield : int
+        the field number on the card (the eid is field 1)
+    default : float
+        the value of a blank field
+
+    Returns
+    -------
+    values : (ncards, ) float64 ndarray
+        the values
+    is_valid : (ncards, ) bool ndarray
+        was the field parsed
+
+    """
+    chars = fields[:, ifield-1, :]
+    nchars = chars.shape[1]
+    is_blank = ((chars == SPACE) | (chars == 0)).all(axis=1)
+    is_valid = (chars == DOT).any(axis=1)
+
+    values = np.full(len(chars), default, dtype='float64')
+    svalues = np.ascontiguousarray(chars[is_valid]).view('S%i' % nchars).ravel()
+    try:
+        values[is_valid] = svalues.astype('float64')
+    except ValueError:
+        # 1.-3, 1.0D-3
+        ivalid = np.where(is_valid)[0]
+        for i, svalue in zip(ivalid, svalues.tolist()):
+            try:
+                values[i] = _to_float(svalue.decode('latin1').strip())
+            except ValueError:
+                is_valid[i] = False
+    is_valid |= is_blank
+    return values, is_valid
+
+
+def _int_or_floats(fields: np.ndarray, ifield: int,
+                   default: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Parses an integer/float field (e.g., theta_mcid, x1/g0)
+
+    Returns
+    -------
+    floats : (ncards, ) float64 ndarray
+        the float values; 0. for an integer value
+    ints : (ncards, ) int64 ndarray
+        the integer values; -1 for a float/blank value
+    is_valid : (ncards, ) bool ndarray
+        was the field parsed; a negative integer isn't valid
+
+    """
+    ints, is_int = _ints(fields, ifield)
+    floats, is_float = _floats(fields, ifield, default)
+    is_int &= ints >= 0
+    ints[~is_int] = -1
+    floats[is_int] = 0.
+    return floats, ints, is_int | is_float
+
+
+def _to_float(svalue: str) -> float:
+    """parses a Nastran float (e.g., 1.0, 1.-3, 1.0D-3); see ``double``"""
+    try:
+        return float(svalue)
+    except ValueError:
+        svalue = svalue.upper()
+        if 'D' in svalue:
+            return float(svalue.replace('D', 'E'))
+        sign = ''
+        if svalue[0] in ('+', '-'):
+            sign = svalue[0]
+            svalue = svalue[1:]
+        if '+' in svalue:
+            svalue = sign + svalue.replace('+', 'E+')
+        elif '-' in svalue:
+            svalue = sign + svalue.replace('-', 'E-')
+        return float(svalue)
+
+
+def get_fields_array(cards_lines: List[List[str]], card_name: str,
+                     nfields: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Splits the cards into fields
+
+    Small field cards without commas/tabs are split as a block,
+    while the other cards use ``to_fields``.
+
+    Parameters
+    ----------
+    cards_lines : List[List[str]]
+        the lines of each card
+    card_name : str
+        the name of the card
+    nfields : int
+        the number of fields (not including the card name)
+
+    Returns
+    -------
+    fields : (ncards, nfields, nchars) uint8 ndarray
+        the characters of each field; nchars is 8 for small field cards
+        and 16 if there are any large field/csv cards
+    is_valid : (ncards, ) bool ndarray
+        was the card split; cards with too many fields or an error aren't
+
+    """
+    ncards = len(cards_lines)
+    is_valid = np.ones(ncards, dtype='bool')
+
+    # nlines -> (irows, lines)
+    small_fields = {}  # type: Dict[int, Tuple[List[int], List[str]]]
+    # irow -> fields
+    other_fields = {}  # type: Dict[int, List[str]]
+    is_special = _SPECIAL_CHARACTERS.search
+    for icard, card_lines in enumerate(cards_lines):
+        nlines = len(card_lines)
+        text = card_lines[0] if nlines == 1 else ''.join(card_lines)
+        if is_special(text) or not text.isascii():
+            try:
+                card_fields = [field.strip() for field in to_fields(card_lines, card_name)[1:]]
+            except Exception:
+                is_valid[icard] = False
+                continue
+            if len(card_fields) > nfields:
+                if any(card_fields[nfields:]):
+                    is_valid[icard] = False
+                    continue
+                card_fields = card_fields[:nfields]
+            if any(len(field) > 16 for field in card_fields) or not ''.join(card_fields).isascii():
+                is_valid[icard] = False
+                continue
+            other_fields[icard] = card_fields
+            continue
+
+        if 8 * nlines > nfields:
+            is_valid[icard] = False
+            continue
+        try:
+            irows, lines = small_fields[nlines]
+        except KeyError:
+            irows, lines = small_fields[nlines] = ([], [])
+        irows.append(icard)
+        if nlines == 1:
+            lines.append(text.rstrip()[8:72].ljust(64))
+        else:
+            lines.append(''.join([line.rstrip()[8:72].ljust(64) for line in card_lines]))
+
+    nchars = 16 if other_fields else 8
+    fields = np.full((ncards, nfields, nchars), SPACE, dtype='uint8')
+    for nlines, (irows, lines) in small_fields.items():
+        block = np.frombuffer(''.join(lines).encode('ascii'), dtype='uint8')
+        fields[irows, :8 * nlines, :8] = block.reshape(len(irows), 8 * nlines, 8)
+    for icard, card_fields in other_fields.items():
+        card_fields = [field.ljust(nchars) for field in card_fields]
+        nfieldsi = len(card_fields)
+        fields[icard, :nfieldsi, :] = np.frombuffer(
+            ''.join(card_fields).encode('ascii'), dtype='uint8').reshape(nfieldsi, nchars)
+    return fields, is_valid
+
+
+def get_card_ids(cards_lines: List[List[str]], card_name: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the id (field 1) of the cards
+
+    Parameters
+    ----------
+    cards_lines : List[List[str]]
+        the lines of each card
+    card_name : str
+        the name of the card
+
+    Returns
+    -------
+    ids : (ncards, ) int64 ndarray
+        the ids
+    is_valid : (ncards, ) bool ndarray
+        is the id a positive integer; the other cards should use ``add_card``
+
+    """
+    ncards = len(cards_lines)
+    ids = np.zeros(ncards, dtype='int64')
+    is_valid = np.zeros(ncards, dtype='bool')
+    for icard, card_lines in enumerate(cards_lines):
+        line0 = card_lines[0]
+        if _SPECIAL_CHARACTERS.search(line0) is None:
+            field = line0[8:16]
+        else:
+            fields = to_fields(card_lines, card_name)
+            field = fields[1] if len(fields) > 1 else ''
+        field = field.strip()
+        if field.isdigit() and field.isascii() and int(field) > 0:
+            ids[icard] = int(field)
+            is_valid[icard] = True
+    return ids, is_valid
+
+
+
+def get_bulk_fields(bulk_cards: Dict[str, List[List[str]]],
+                    ) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Splits the cards into fields and gets the ids
+
+    Parameters
+    ----------
+    bulk_cards : Dict[str, List[List[str]]]
+        card_name -> the lines of each card
+
+    Returns
+    -------
+    bulk_fields : Dict[str, (fields, is_valid, ids)]
+        card_name -> the fields (see ``get_fields_array``) and the ids,
+        which are 0 if field 1 isn't a positive integer
+
+    """
+    bulk_fields = {}
+    for card_name, cards_lines in bulk_cards.items():
+        array_class = BULK_ARRAY_CARDS[card_name]
+        fields, is_valid = get_fields_array(cards_lines, card_name, array_class.nfields)
+        ids, is_id = _ints(fields, 1)
+        ids[~is_id | (ids < 0)] = 0
+
+        # the cards that weren't split (e.g., too many fields) still have an id
+        iinvalid = np.where(~is_valid)[0]
+        if len(iinvalid):
+            ids[iinvalid] = get_card_ids([cards_lines[icard] for icard in iinvalid],
+                                         card_name)[0]
+        bulk_fields[card_name] = (fields, is_valid, ids)
+    return bulk_fields
+
+
+def get_deferred_slots(model: BDF, cards_list: List[Any], use_bulk_arrays: bool,
+                       lazy_slots: Dict[str, str]) -> Set[str]:
+    """
+    Gets the dictionaries (e.g., elements) that have bulk/lazy cards, so
+    the other cards that are stored in them are added in file order with
+    the bulk/lazy cards (see ``get_first_cards``)
+    """
+    card_names = {card[0] for card in cards_list}
+    slots = {model._type_to_slot_map.get(card_name) for card_name in card_names
+             if card_name in lazy_slots}
+    if use_bulk_arrays:
+        slots.update(BULK_ARRAY_CARDS[card_name].slot for card_name in card_names
+                     if card_name in BULK_ARRAY_CARDS and card_name in model.cards_to_read)
+    slots.discard(None)
+    return slots
+
+
+def get_first_cards(slot_ids: Dict[Any, Tuple[np.ndarray, np.ndarray]]) -> Dict[Any, np.ndarray]:
+    """
+    Finds the cards that are the first card with their id in the file, so
+    a duplicate is compared to (and reported against) the same card as the
+    standard reader
+
+    Parameters
+    ----------
+    slot_ids : Dict[key, (ids, icards)]
+        the cards of each type (e.g., ('bulk', 'CQUAD4')) that are stored in
+        one dictionary (e.g., elements), where the id is 0 if it isn't an
+        integer and icard is the index of the card in the file
+
+    Returns
+    -------
+    is_first : Dict[key, (ncards, ) bool ndarray]
+        is the card the first one with its id; a card without an id is first
+
+    """
+    keys = list(slot_ids)
+    ids = np.hstack([slot_ids[key][0] for key in keys]).astype('int64')
+    icards = np.hstack([slot_ids[key][1] for key in keys]).astype('int64')
+    is_first = np.ones(len(ids), dtype='bool')
+
+    iid = np.where(ids > 0)[0]
+    isort = iid[np.lexsort((icards[iid], ids[iid]))]
+    ids_sorted = ids[isort]
+    is_first[isort[1:]] = ids_sorted[1:] != ids_sorted[:-1]
+
+    nids = np.cumsum([len(slot_ids[key][0]) for key in keys])[:-1]
+    return dict(zip(keys, np.split(is_first, nids)))
+
+
+def add_bulk_cards(model: BDF,
+                   bulk_fields: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]],
+                   is_first: Optional[Dict[Any, np.ndarray]]=None) -> Dict[str, np.ndarray]:
+    """
+    Parses the cards into arrays and adds them to the model
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    bulk_fields : Dict[str, (fields, is_valid, ids)]
+        card_name -> the fields of the cards (see ``get_bulk_fields``)
+    is_first : Dict[('bulk', card_name), (ncards, ) bool ndarray]; default=None
+        is the card the first one with its id in the file (see ``get_first_cards``);
+        None -> the cards are first
+
+    Returns
+    -------
+    irows : Dict[str, (n, ) int ndarray]
+        card_name -> the cards that couldn't be parsed into arrays,
+        which should be added with ``add_card``
+
+    """
+    irows = {}
+    for card_name, (fields, is_valid, unused_ids) in bulk_fields.items():
+        array_class = BULK_ARRAY_CARDS[card_name]
+        if card_name in model.bulk_arrays or (card_name == 'CBAR' and model.baror is not None):
+            # only one array per card and the BAROR defaults use add_card
+            irows[card_name] = np.arange(len(fields))
+            continue
+
+        is_valid = is_valid.copy()
+        if is_first is not None:
+            # a duplicate is compared to the first card with add_card
+            is_valid &= is_first[('bulk', card_name)]
+        array, is_parsed = array_class.parse(fields[is_valid])
+        is_valid[np.where(is_valid)[0][~is_parsed]] = False
+
+        card_dict = get_bulk_card_dict(model, array_class.slot)
+
+        if array is not None:
+            # the ids we didn't parse (e.g., duplicates) are filtered,
+            # so rebuild the array
+            ivalid = np.where(is_valid)[0]
+            is_unique = card_dict.get_unique_ids(array.ids)
+            is_valid[ivalid[~is_unique]] = False
+            if not is_unique.all():
+                array, unused_is_parsed = array_class.parse(fields[is_valid])
+
+        if array is not None:
+            card_dict.add_array(array)
+            model.increase_card_count(card_name, len(array))
+            for card_type, ids in array.get_types().items():
+                model._type_to_id_map[card_type].extend(ids.tolist())
+        irows[card_name] = np.where(~is_valid)[0]
+    return irows
+
+
+def get_bulk_card_dict(model: BDF, slot: str) -> BulkCardDict:
+    """gets the dictionary (e.g., model.nodes) as a BulkCardDict"""
+    card_dict = getattr(model, slot)
+    if not isinstance(card_dict, BulkCardDict):
+        card_dict = BulkCardDict(card_dict)
+        setattr(model, slot, card_dict)
+    return card_dict
+
+
+class BulkCardDict(dict):
+    """
+    A dictionary of cards (e.g., model.nodes) that also holds cards that are
+    stored as arrays.  The card object is built when it's accessed.
+
+    ``len``, ``in``, ``[]``, ``get``, ``keys``, ``==``, ``repr`` and
+    iterating over the ids don't build the other cards, while ``values``,
+    ``items`` and ``copy`` build all the cards.  An array is released once
+    all of its cards have been built.
+    """
+    # defaults, so the dictionary works before __init__ is called
+    # (e.g., when it's unpickled)
+    _arrays = []  # type: List[BulkCardArray]
+    _nunbuilt = 0
+
+    def __init__(self, *args, **kwargs):
+        dict.__init__(self, *args, **kwargs)
+        self._arrays = []  # type: List[BulkCardArray]
+        self._nunbuilt = 0
+
+    def add_array(self, array: BulkCardArray) -> None:
+        """adds the cards from a BulkCardArray"""
+        array.nunbuilt = int(len(array) - array.is_built.sum())
+        self._arrays.append(array)
+        self._nunbuilt += array.nunbuilt
+
+    def get_unique_ids(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Finds the ids that aren't duplicated; the first of a series of
+        duplicates within ids is unique
+
+        Returns
+        -------
+        is_unique : (nids, ) bool ndarray
+            is the id new
+
+        """
+        unused_uids, index = np.unique(ids, return_index=True)
+        is_unique = np.zeros(len(ids), dtype='bool')
+        is_unique[index] = True
+
+        existing_ids = [np.array(list(dict.keys(self)), dtype='int64')]
+        existing_ids.extend(array.ids for array in self._arrays)
+        existing_ids = np.hstack(existing_ids)
+        if len(existing_ids):
+            is_unique &= ~np.isin(ids, existing_ids)
+        return is_unique
+
+    def _find(self, key: Any) -> Tuple[Optional[BulkCardArray], Optional[int]]:
+        """finds the unbuilt card"""
+        if self._nunbuilt and isinstance(key, integer_types):
+            for array in self._arrays:
+                irow = array.find(key)
+                if irow is not None and not array.is_built[irow]:
+                    return array, irow
+        return None, None
+
+    def _build(self, key: int, array: BulkCardArray, irow: int) -> Any:
+        """builds a card object and stores it"""
+        obj = array.build(irow)
+        dict.__setitem__(self, key, obj)
+        self._set_built(array, irow)
+        return obj
+
+    def _set_built(self, array: BulkCardArray, irow: int) -> None:
+        """flags the card of a row as built and releases the array once they all are"""
+        array.is_built[irow] = True
+        array.release_row(irow)
+        array.nunbuilt -= 1
+        self._nunbuilt -= 1
+        if not array.nunbuilt:
+            self._arrays = [arrayi for arrayi in self._arrays if arrayi is not array]
+
+    def _peek(self, key: Any) -> Any:
+        """gets a card without storing it, so an unbuilt card stays unbuilt"""
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+        array, irow = self._find(key)
+        if array is None:
+            raise KeyError(key)
+        return array.build(irow)
+
+    def build_all(self) -> None:
+        """builds all the card objects, so it's a standard dictionary"""
+        for array in list(self._arrays):
+            for irow in np.where(~array.is_built)[0]:
+                self._build(int(array.ids[irow]), array, irow)
+        self._arrays = []
+        self._nunbuilt = 0
+
+    def __missing__(self, key: Any) -> Any:
+        array, irow = self._find(key)
+        if array is None:
+            raise KeyError(key)
+        return self._build(key, array, irow)
+
+    def __contains__(self, key: Any) -> bool:
+        return dict.__contains__(self, key) or self._find(key)[0] is not None
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + self._nunbuilt
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        array, irow = self._find(key)
+        if array is not None:
+            # the new card replaces the unbuilt card
+            self._set_built(array, irow)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        array, irow = self._find(key)
+        if array is not None:
+            # the unbuilt card is dropped without building it
+            self._set_built(array, irow)
+            return
+        dict.__delitem__(self, key)
+
+    def _iter_keys(self) -> List[Any]:
+        """gets the ids without building the cards"""
+        keys = list(dict.keys(self))
+        for array in self._arrays:
+            keys.extend(array.ids[~array.is_built].tolist())
+        return keys
+
+    def __iter__(self):
+        # the cards may be built while iterating, so use a copy of the ids
+        return iter(self._iter_keys())
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, dict):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        # the unbuilt cards are compared without storing them
+        for key in self._iter_keys():
+            if key not in other:
+                return False
+            value = other._peek(key) if isinstance(other, BulkCardDict) else other[key]
+            if self._peek(key) != value:
+                return False
+        return True
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        if not self._nunbuilt:
+            return dict.__repr__(self)
+        # the unbuilt cards are summarized instead of built
+        unbuilt = ', '.join('%r: %s' % (array.card_name, array.nunbuilt)
+                            for array in self._arrays)
+        return '%s(%s, unbuilt={%s})' % (self.__class__.__name__, dict.__repr__(self), unbuilt)
+
+    def __reduce__(self):
+        # the built cards and the arrays (with the is_built mask), so the
+        # other cards aren't built to pickle it
+        state = {'_arrays': self._arrays, '_nunbuilt': self._nunbuilt}
+        return (BulkCardDict, (dict(dict.items(self)), ), state)
+
+    def get(self, key: Any, default: Any=None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return KeysView(self)
+
+    def values(self):
+        self.build_all()
+        return dict.values(self)
+
+    def items(self):
+        self.build_all()
+        return dict.items(self)
+
+    def pop(self, key: Any, *args) -> Any:
+        if key in self:
+            self[key]
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        if self._nunbuilt:
+            # only the popped card is built
+            array = self._arrays[-1]
+            irow = np.where(~array.is_built)[0][-1]
+            key = int(array.ids[irow])
+            return key, self.pop(key)
+        return dict.popitem(self)
+
+    def setdefault(self, key: Any, default: Any=None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def copy(self) -> Dict[Any, Any]:
+        self.build_all()
+        return dict(dict.items(self))
+
+    def clear(self) -> None:
+        dict.clear(self)
+        self._arrays = []
+        self._nunbuilt = 0
@@ -0,0 +1,428 @@
+"""
+Defines the bulk writer, which writes the highest volume cards (GRID,
+CQUAD4, CTRIA3, CTETRA, CPENTA, CHEXA, CPYRAM) in blocks instead of calling
+``write_card`` for each card.
+
+The floats of a block are formatted as an array (each unique value is
+formatted once and the common ranges skip the ``print_float_8`` logic),
+the repeated optional fields of the shells (e.g., THETA/MCID, ZOFFS, T1-T4)
+are formatted once per unique set of values, and each block is written
+with one ``write``.  A card that isn't one of these classes (e.g., a
+subclass with its own ``write_card``) or that has unusual fields (e.g., a
+GRID with a PS field) is written with ``write_card``, so the output is
+byte-identical to the standard writer.
+
+ - print_floats_8(values)
+ - print_floats_16(values)
+ - print_floats_double(values)
+ - write_grids_bulk(bdf_file, nodes, size=8, is_double=False)
+ - write_elements_bulk(bdf_file, elements, size=8, is_double=False)
+
+"""
+from __future__ import annotations
+from typing import List, Dict, Tuple, Any, Callable
+
+import numpy as np
+
+from pyNastran.bdf.field_writer_8 import (
+    print_float_8, print_field_8, set_blank_if_default)
+from pyNastran.bdf.field_writer_16 import print_float_16, print_field_16
+from pyNastran.bdf.field_writer_double import print_scientific_double
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import (
+    CTETRA4, CTETRA10, CPENTA6, CHEXA8, CHEXA20, CPYRAM5)
+
+#: the number of cards that are written at once
+NCARDS_PER_WRITE = 10000
+
+# (lower, upper, format, is_leading_zero_removed)
+#   positive: lower <= value < upper
+#   negative: lower < value <= upper
+# the other values (e.g., small, large, nan) use print_float_8/print_float_16
+_BANDS_8 = (
+    [(0.001, 1., '%8.7f', False)] +
+    [(10. ** i, 10. ** (i + 1), '%%8.%if' % (6 - i), False) for i in range(6)] +
+    [(-1., -0.01, '%8.6f', True)] +
+    [(-10. ** (i + 1), -10. ** i, '%%8.%if' % (5 - i), False) for i in range(5)]
+)
+_BANDS_16 = (
+    [(0.001, 1., '%16.15f', False)] +
+    [(10. ** i, 10. ** (i + 1), '%%16.%if' % (14 - i), False) for i in range(14)] +
+    [(-1., -0.01, '%16.14f', True)] +
+    [(-10. ** (i + 1), -10. ** i, '%%16.%if' % (13 - i), False) for i in range(13)]
+)
+
+
+def _print_floats(values: Any, bands: List[Tuple[float, float, str, bool]],
+                  width: str, print_float: Callable[[float], str]) -> List[str]:
+    """formats the floats by range, which is the same as ``print_float``"""
+    values = np.asarray(values, dtype='float64').ravel()
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    fields = np.empty(len(unique_values), dtype='object')
+    is_formatted = np.zeros(len(unique_values), dtype='bool')
+    for lower, upper, fmt, is_leading_zero_removed in bands:
+        if lower < 0.:
+            ivalues = np.where((unique_values > lower) & (unique_values <= upper))[0]
+        else:
+            ivalues = np.where((unique_values >= lower) & (unique_values < upper))[0]
+        if len(ivalues) == 0:
+            continue
+        if is_leading_zero_removed:
+            # -0.123 -> -.123
+            fields[ivalues] = [width % (fmt % value).replace('-0.', '-.').strip(' 0')
+                               for value in unique_values[ivalues].tolist()]
+        else:
+            fields[ivalues] = [width % (fmt % value).strip(' 0')
+                               for value in unique_values[ivalues].tolist()]
+        is_formatted[ivalues] = True
+
+    ivalues = np.where(~is_formatted)[0]
+    fields[ivalues] = [print_float(value) for value in unique_values[ivalues].tolist()]
+    return fields[inverse].tolist()
+
+
+def print_floats_8(values: Any) -> List[str]:
+    """
+    Formats floats in 8-character width syntax
+
+    Parameters
+    ----------
+    values : (n, ...) float ndarray
+        the values to format
+
+    Returns
+    -------
+    fields : List[str]
+        the flattened fields; the same as ``print_float_8``
+
+    """
+    return _print_floats(values, _BANDS_8, '%8s', print_float_8)
+
+
+def print_floats_16(values: Any) -> List[str]:
+    """
+    Formats floats in 16-character width syntax
+
+    Parameters
+    ----------
+    values : (n, ...) float ndarray
+        the values to format
+
+    Returns
+    -------
+    fields : List[str]
+        the flattened fields; the same as ``print_float_16``
+
+    """
+    return _print_floats(values, _BANDS_16, '%16s', print_float_16)
+
+
+def print_floats_double(values: Any) -> List[str]:
+    """
+    Formats floats in 16-character double precision syntax
+
+    Parameters
+    ----------
+    values : (n, ...) float ndarray
+        the values to format
+
+    Returns
+    -------
+    fields : List[str]
+        the flattened fields; the same as ``print_scientific_double``
+
+    """
+    values = np.asarray(values, dtype='float64').ravel()
+    unique_values, inverse = np.unique(values, return_inverse=True)
+    fields = np.array([print_scientific_double(value) for value in unique_values.tolist()],
+                      dtype='object')
+    return fields[inverse].tolist()
+
+
+def _write_blocks(bdf_file: Any, cards: List[Any],
+                  write_block: Callable[[List[Any]], List[str]]) -> None:
+    """writes the cards in blocks of ``NCARDS_PER_WRITE``"""
+    for i0 in range(0, len(cards), NCARDS_PER_WRITE):
+        block = cards[i0:i0 + NCARDS_PER_WRITE]
+        bdf_file.write(''.join(write_block(block)))
+
+
+def write_grids_bulk(bdf_file: Any, nodes: Dict[int, Any],
+                     size: int=8, is_double: bool=False) -> None:
+    """
+    Writes the nodes in a sorted order
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file to write to
+    nodes : Dict[int, GRID]
+        the nodes (e.g., model.nodes)
+    size : int; default=8
+        the field size (8/16)
+    is_double : bool; default=False
+        should the large field format use double precision
+
+    """
+    def write_block(block: List[Any]) -> List[str]:
+        msgs = [''] * len(block)
+        inodes = []
+        nids = []
+        cps = []
+        xyzs = []
+        for inode, (nid, node) in enumerate(block):
+            # a GRID with a comment, CD, PS, or SEID is written with write_card
+            if (type(node) is GRID and node.Cd() == 0 and node.ps == '' and node.seid == 0
+                    and node.comment == ''):
+                inodes.append(inode)
+                nids.append(node.nid)
+                cps.append(node.Cp())
+                xyzs.append(node.xyz)
+            else:
+                msgs[inode] = node.write_card(size, is_double)
+        if not inodes:
+            return msgs
+
+        if size == 8:
+            fields = print_floats_8(xyzs)
+            cp_fields = ['        ' if cp == 0 else '%8s' % cp for cp in cps]
+            for i, inode in enumerate(inodes):
+                msgs[inode] = 'GRID    %8i%8s%s%s%s\n' % (
+                    nids[i], cp_fields[i], fields[3*i], fields[3*i + 1], fields[3*i + 2])
+        else:
+            fields = print_floats_double(xyzs) if is_double else print_floats_16(xyzs)
+            cp_fields = ['                ' if cp == 0 else '%16s' % cp for cp in cps]
+            blank = '                '
+            for i, inode in enumerate(inodes):
+                msgs[inode] = (
+                    'GRID*   %16i%16s%16s%16s\n'
+                    '*       %16s%16s%16s%16s\n' % (
+                        nids[i], cp_fields[i], fields[3*i], fields[3*i + 1], fields[3*i + 2],
+                        blank, blank, blank))
+        return msgs
+
+    _write_blocks(bdf_file, sorted(nodes.items()), write_block)
+
+
+def _get_theta_mcid_repr(theta_mcid: Any) -> Any:
+    """see ``ShellElement._get_theta_mcid_repr``"""
+    if isinstance(theta_mcid, float):
+        theta_mcid = set_blank_if_default(theta_mcid, 0.0)
+    return theta_mcid
+
+
+def _get_ctria3_suffix(key: Tuple[Any, ...], size: int) -> str:
+    """gets the THETA/MCID, ZOFFS, TFLAG, T1-T3 fields of a CTRIA3"""
+    theta_mcid, zoffset, tflag, T1, T2, T3 = key[::2]
+    row2_data = [
+        _get_theta_mcid_repr(theta_mcid),
+        set_blank_if_default(zoffset, 0.0),
+        set_blank_if_default(tflag, 0),
+        set_blank_if_default(T1, 1.0),
+        set_blank_if_default(T2, 1.0),
+        set_blank_if_default(T3, 1.0),
+    ]
+    row2 = [print_field_8(field) for field in row2_data]
+    suffix = ('%8s%8s\n'
+              '                %8s%8s%8s%8s\n' % tuple(row2))
+    return suffix.rstrip() + '\n'
+
+
+def _get_cquad4_suffix(key: Tuple[Any, ...], size: int) -> Tuple[bool, str]:
+    """
+    gets the THETA/MCID, ZOFFS, TFLAG, T1-T4 fields of a CQUAD4
+    and if the card is written in large field format
+    """
+    theta_mcid_raw, theta_mcid, zoffset, tflag, T1, T2, T3, T4 = key[::2]
+    if [theta_mcid_raw, zoffset, tflag, T1, T2, T3, T4] == [0.0, 0.0, 0, 1.0, 1.0, 1.0, 1.0]:
+        return False, '\n'
+
+    row2_data = [
+        _get_theta_mcid_repr(theta_mcid),
+        set_blank_if_default(zoffset, 0.0),
+        set_blank_if_default(tflag, 0),
+        set_blank_if_default(T1, 1.0),
+        set_blank_if_default(T2, 1.0),
+        set_blank_if_default(T3, 1.0),
+        set_blank_if_default(T4, 1.0),
+    ]
+    if size == 8:
+        row2 = [print_field_8(field) for field in row2_data]
+        suffix = ('%8s%8s\n'
+                  '                %8s%8s%8s%8s%8s' % tuple(row2))
+        return False, suffix.rstrip('\n ') + '\n'
+
+    row2 = [print_field_16(field) for field in row2_data]
+    is_stripped = [field.strip() == '' for field in row2]
+    if all(is_stripped[2:]): # tflag, t1234 are blank
+        return True, '%16s%16s\n' % tuple(row2[:2])
+    suffix = ('%16s%16s\n'
+              '*                     %16s%16s%16s\n'
+              '*       %16s%16s\n' % tuple(row2))
+    return True, suffix.rstrip('*\n ') + '\n'
+
+
+def _write_ctria3s(elements: List[Any], size: int) -> List[str]:
+    """writes CTRIA3s; see ``CTRIA3.write_card``"""
+    suffixes = {}
+    msgs = []
+    for elem in elements:
+        theta_mcid = elem.Theta_mcid()
+        key = (theta_mcid, type(theta_mcid), elem.zoffset, type(elem.zoffset),
+               elem.tflag, type(elem.tflag), elem.T1, type(elem.T1),
+               elem.T2, type(elem.T2), elem.T3, type(elem.T3))
+        try:
+            suffix = suffixes[key]
+        except KeyError:
+            suffix = suffixes[key] = _get_ctria3_suffix(key, size)
+        pid = elem.pid if elem.pid_ref is None else elem.pid_ref.pid
+        msgs.append(elem.comment + 'CTRIA3  %8i%8i%8i%8i%8i' % (
+            (elem.eid, pid) + tuple(elem.node_ids)) + suffix)
+    return msgs
+
+
+def _write_cquad4s(elements: List[Any], size: int) -> List[str]:
+    """writes CQUAD4s; see ``CQUAD4.write_card``"""
+    suffixes = {}
+    msgs = []
+    for elem in elements:
+        theta_mcid = elem.Theta_mcid()
+        key = (elem.theta_mcid, type(elem.theta_mcid), theta_mcid, type(theta_mcid),
+               elem.zoffset, type(elem.zoffset), elem.tflag, type(elem.tflag),
+               elem.T1, type(elem.T1), elem.T2, type(elem.T2),
+               elem.T3, type(elem.T3), elem.T4, type(elem.T4))
+        try:
+            is_large, suffix = suffixes[key]
+        except KeyError:
+            is_large, suffix = suffixes[key] = _get_cquad4_suffix(key, size)
+        pid = elem.pid if elem.pid_ref is None else elem.pid_ref.pid
+        data = (elem.eid, pid) + tuple(elem.node_ids)
+        if is_large:
+            msg = ('CQUAD4* %16i%16i%16i%16i\n'
+                   '*       %16i%16i' % data)
+        else:
+            msg = 'CQUAD4  %8i%8i%8i%8i%8i%8i' % data
+        msgs.append(elem.comment + msg + suffix)
+    return msgs
+
+
+def _write_solids(fmt: str, is_rstrip: bool) -> Callable[[List[Any], int], List[str]]:
+    """
+    writes solids with all the nodes (e.g., CTETRA4); see ``CTETRA4.write_card``
+
+    Parameters
+    ----------
+    fmt : str
+        the format string
+    is_rstrip : bool
+        is the card stripped and a newline added
+
+    """
+    def write_solids(elements: List[Any], unused_size: int) -> List[str]:
+        msgs = []
+        for elem in elements:
+            pid = elem.pid if elem.pid_ref is None else elem.pid_ref.pid
+            msg = fmt % ((elem.eid, pid) + tuple(elem.node_ids))
+            if is_rstrip:
+                msg = msg.rstrip() + '\n'
+            msgs.append(elem.comment + msg)
+        return msgs
+    return write_solids
+
+
+def _write_solids_midside(fmt: str, ncorners: int) -> Callable[[List[Any], int], List[str]]:
+    """
+    writes solids with optional midside nodes (e.g., CTETRA10);
+    see ``CTETRA10.write_card``
+
+    Parameters
+    ----------
+    fmt : str
+        the format string
+    ncorners : int
+        the number of corner nodes (the midside nodes may be None)
+
+    """
+    def write_solids(elements: List[Any], unused_size: int) -> List[str]:
+        msgs = []
+        for elem in elements:
+            pid = elem.pid if elem.pid_ref is None else elem.pid_ref.pid
+            nodes = elem.node_ids
+            nodes2 = ['' if node is None else '%8i' % node for node in nodes[ncorners:]]
+            msg = fmt % tuple([elem.eid, pid] + nodes[:ncorners] + nodes2)
+            msgs.append(elem.comment + msg.rstrip() + '\n')
+        return msgs
+    return write_solids
+
+
+#: class -> function(elements, size) that writes the elements
+ELEMENT_WRITERS = {
+    CTRIA3: _write_ctria3s,
+    CQUAD4: _write_cquad4s,
+    CTETRA4: _write_solids('CTETRA  %8i%8i%8i%8i%8i%8i\n', False),
+    CPENTA6: _write_solids('CPENTA  %8i%8i%8i%8i%8i%8i%8i%8i\n', False),
+    CHEXA8: _write_solids('CHEXA   %8i%8i%8i%8i%8i%8i%8i%8i\n'
+                          '        %8i%8i\n', False),
+    CPYRAM5: _write_solids('CPYRAM  %8i%8i%8i%8i%8i%8i%8i', True),
+    CTETRA10: _write_solids_midside('CTETRA  %8i%8i%8i%8i%8i%8i%8s%8s\n'
+                                    '        %8s%8s%8s%8s', 4),
+    CHEXA20: _write_solids_midside('CHEXA   %8i%8i%8i%8i%8i%8i%8i%8i\n'
+                                   '        %8i%8i%8s%8s%8s%8s%8s%8s\n'
+                                   '        %8s%8s%8s%8s%8s%8s', 8),
+}
+
+
+def write_elements_bulk(bdf_file: Any, elements: Dict[int, Any],
+                        size: int=8, is_double: bool=False) -> None:
+    """
+    Writes the elements in a sorted order
+
+    Parameters
+    ----------
+    bdf_file : file
+        the file to write to
+    elements : Dict[int, Element]
+        the elements (e.g., model.elements)
+    size : int; default=8
+        the field size (8/16)
+    is_double : bool; default=False
+        should the large field format use double precision
+
+    """
+    def write_block(block: List[Any]) -> List[str]:
+        msgs = [''] * len(block)
+        class_ielements = {}
+        for ielement, (eid, element) in enumerate(block):
+            element_class = type(element)
+            if element_class in ELEMENT_WRITERS:
+                if element_class in class_ielements:
+                    class_ielements[element_class].append(ielement)
+                else:
+                    class_ielements[element_class] = [ielement]
+                continue
+            msgs[ielement] = _write_card(element, eid, size, is_double)
+
+        for element_class, ielements in class_ielements.items():
+            elements_class = [block[ielement][1] for ielement in ielements]
+            try:
+                msgs_class = ELEMENT_WRITERS[element_class](elements_class, size)
+            except Exception:
+                # a bad card (e.g., a None node); write_card has the error message
+                msgs_class = [_write_card(element, element.eid, size, is_double)
+                              for element in elements_class]
+            for ielement, msg in zip(ielements, msgs_class):
+                msgs[ielement] = msg
+        return msgs
+
+    _write_blocks(bdf_file, sorted(elements.items()), write_block)
+
+
+def _write_card(element: Any, eid: int, size: int, is_double: bool) -> str:
+    """writes an element with write_card"""
+    try:
+        return element.write_card(size, is_double)
+    except:
+        print('failed printing element...'
+              'type=%s eid=%s' % (element.type, eid))
+        raise
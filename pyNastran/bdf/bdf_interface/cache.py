@@ -0,0 +1,148 @@
+"""
+Defines the BDF cache (``read_bdf(..., cache_dir='cache')``), which stores
+the parsed (not cross-referenced) model, so an unchanged deck is loaded
+instead of parsed.
+
+The cache file is named by a hash of the master file path and the settings
+that change the parsed model (e.g., punch, encoding, the cards to read).  It
+starts with the path, size, and modification time of the master file and
+every INCLUDE file that was read, followed by the pickled model, so editing,
+touching, or deleting any of the files invalidates the cache.
+
+ - get_cache_filename(bdf_filename, cache_dir, settings)
+ - load_bdf_cache(model, cache_filename)
+ - save_bdf_cache(model, cache_filename)
+
+"""
+from __future__ import annotations
+import os
+import pickle
+import hashlib
+from typing import List, Tuple, Dict, Any, Optional, TYPE_CHECKING
+
+from pyNastran import __version__
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: changes to the cache layout should bump this
+CACHE_VERSION = 1
+
+
+def get_cache_filename(bdf_filename: str, cache_dir: str,
+                       settings: Dict[str, Any]) -> str:
+    """
+    Gets the path to the cache file
+
+    Parameters
+    ----------
+    bdf_filename : str
+        the master bdf file
+    cache_dir : str
+        the directory to store the cache files in
+    settings : Dict[str, Any]
+        the read_bdf settings that change the model
+
+    Returns
+    -------
+    cache_filename : str
+        the path to the cache file
+
+    """
+    abs_bdf_filename = os.path.abspath(bdf_filename)
+    key = repr((CACHE_VERSION, __version__, abs_bdf_filename, sorted(settings.items())))
+    key_hash = hashlib.sha1(key.encode('utf8')).hexdigest()[:16]
+    basename = os.path.basename(abs_bdf_filename)
+    return os.path.join(cache_dir, '%s.%s.pkl' % (basename, key_hash))
+
+
+def get_file_stats(filenames: List[str]) -> List[Tuple[str, Optional[int], Optional[int]]]:
+    """
+    Gets the (path, size, mtime_ns) of the files; (path, None, None) if
+    the file doesn't exist
+    """
+    file_stats = []
+    for filename in filenames:
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            file_stats.append((filename, None, None))
+            continue
+        file_stats.append((filename, stat.st_size, stat.st_mtime_ns))
+    return file_stats
+
+
+def load_bdf_cache(model: BDF, cache_filename: str) -> bool:
+    """
+    Loads the model from the cache file
+
+    Parameters
+    ----------
+    model : BDF
+        the model to load into
+    cache_filename : str
+        the path to the cache file
+
+    Returns
+    -------
+    is_loaded : bool
+        False if the cache file doesn't exist, is out of date, or
+        can't be read; the model is unchanged
+
+    """
+    if not os.path.exists(cache_filename):
+        return False
+
+    log = model.log
+    try:
+        with open(cache_filename, 'rb') as cache_file:
+            file_stats = pickle.load(cache_file)
+            filenames = [filename for filename, unused_size, unused_mtime in file_stats]
+            if file_stats != get_file_stats(filenames):
+                log.debug('the cache %s is out of date' % cache_filename)
+                return False
+            obj = pickle.load(cache_file)
+    except Exception as error:
+        log.warning('the cache %s could not be loaded; %s' % (
+            cache_filename, str(error)))
+        return False
+
+    # the log and card parsers aren't pickled, so keep the current ones
+    model.__dict__.update(obj.__dict__)
+    model.case_control_deck.log = log
+    for super_model in model.superelement_models.values():
+        super_model.log = log
+    log.debug('loaded the cache %s' % cache_filename)
+    return True
+
+
+def save_bdf_cache(model: BDF, cache_filename: str) -> None:
+    """
+    Saves the (not cross-referenced) model to the cache file
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    cache_filename : str
+        the path to the cache file
+
+    """
+    file_stats = get_file_stats(model.active_filenames)
+    cache_dir = os.path.dirname(cache_filename)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # write to a temporary file, so a failed write never leaves a bad cache
+    tmp_filename = cache_filename + '.%i.tmp' % os.getpid()
+    try:
+        with open(tmp_filename, 'wb') as cache_file:
+            pickle.dump(file_stats, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(model, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_filename, cache_filename)
+    except Exception as error:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        model.log.warning('the cache %s could not be saved; %s' % (
+            cache_filename, str(error)))
+        return
+    model.log.debug('saved the cache %s' % cache_filename)
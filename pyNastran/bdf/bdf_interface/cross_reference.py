@@ -70,10 +70,12 @@ around the idea of cross-referencing, so it's recommended that you use it.
 # pylint: disable=R0902,R0904,R0914
 from collections import defaultdict
 import traceback
-from typing import List, Dict, Any
+from typing import List, Dict, Union, Any
 
 from numpy import zeros, argsort, arange, array_equal, array
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.lazy_xref import (
+    lazy_cross_reference, remove_lazy_cross_reference)
 
 class XrefMesh(BDFAttributes):
     """Links up the various cards in the BDF."""
@@ -92,7 +94,7 @@ class XrefMesh(BDFAttributes):
             # elem.check_unique_nodes()
 
     def cross_reference(self,
-                        xref: bool=True,
+                        xref: Union[bool, str]=True,
                         xref_nodes: bool=True,
                         xref_elements: bool=True,
                         xref_nodes_with_elements: bool=False,
@@ -110,8 +112,12 @@ class XrefMesh(BDFAttributes):
 
         Parameters
         ----------
-        xref : bool; default=True
+        xref : bool / str; default=True
            cross references the model
+           'lazy' : cross reference the nodes, elements, properties,
+                    materials, loads, and aero cards when they're accessed
+                    (e.g., ``model.elements[eid]``) in the same way as
+                    ``safe_cross_reference``; the xref_* flags are ignored
         xref_nodes : bool; default=True
            set cross referencing of nodes/coords
         xref_element : bool; default=True
@@ -148,6 +154,10 @@ class XrefMesh(BDFAttributes):
         """
         if not xref:
             return
+        if xref == 'lazy':
+            lazy_cross_reference(self, word=word)
+            return
+        remove_lazy_cross_reference(self)
         self.log.debug("Cross Referencing%s..." % word)
         if xref_nodes:
             self._cross_reference_nodes()
@@ -0,0 +1,301 @@
+"""
+Defines the streaming card reader (``iter_bdf_cards``), which yields the
+bulk data cards of a deck one at a time without building a ``BDF``.
+
+The deck is read line by line and the INCLUDE files are read when they're
+found, so only the lines of the current card are in memory.  This is
+intended for scripts that grep, filter, count or transform large decks.
+
+ - iter_bdf_cards(bdf_filename, card_names=None, punch=False, ...)
+
+"""
+from __future__ import annotations
+import os
+import sys
+from itertools import count
+from typing import List, Dict, Tuple, Iterator, Iterable, Optional, Union, Any
+from io import StringIO
+
+from pyNastran.bdf.bdf_interface.pybdf import (
+    BDFInputPy, _is_begin_bulk, _is_bulk_data_line, _clean_comment)
+from pyNastran.bdf.bdf_interface.utils import (
+    to_fields, _get_card_name, _parse_pynastran_header)
+from pyNastran.bdf.bdf_interface.include_file import get_include_filename
+from pyNastran.bdf.bdf_interface.parallel_reader import SPECIAL_CARDS
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+from pyNastran.bdf.errors import CardParseSyntaxError
+
+#: an (ifile, iline, line) tuple
+FileLine = Tuple[int, int, str]
+
+
+def iter_bdf_cards(bdf_filename: Union[str, StringIO],
+                   card_names: Optional[Iterable[str]]=None,
+                   punch: Optional[bool]=False,
+                   read_includes: bool=True,
+                   encoding: Optional[str]=None,
+                   log: Any=None, debug: Optional[bool]=False,
+                   ) -> Iterator[Tuple[str, List[Optional[str]], str, int, int]]:
+    """
+    Lazily yields the bulk data cards of a BDF without creating a model
+
+    Parameters
+    ----------
+    bdf_filename : str / StringIO
+        the main bdf_filename
+    card_names : List[str]; default=None -> all cards
+        the cards to yield (e.g., ['GRID', 'CQUAD4'])
+    punch : bool / None; default=False
+        None : guess
+        True : no executive/case control decks
+        False : executive/case control decks exist
+    read_includes : bool; default=True
+        should include files be read
+    encoding : str; default=None -> system default
+        the unicode encoding
+    log : logger(); default=None
+        a logger
+    debug : bool / None; default=False
+        used to set the logger if no logger is passed in
+
+    Yields
+    ------
+    card_name : str
+        the name of the card (e.g., 'GRID')
+    fields : List[str / None]
+        the string fields of the card with the blank fields set to
+        None (see ``BDF._process_card``); the card lines for the cards
+        that aren't field based (e.g., DEQATN, replicated cards, and
+        cards with equal signs)
+    comment : str
+        the comment above the card
+    ifile : int
+        the file index (0 is the main file; INCLUDE files are
+        numbered in the order they are found)
+    iline : int
+        the 0-based line index of the first line of the card in ifile
+
+    .. code-block:: python
+
+       >>> for card_name, fields, comment, ifile, iline in iter_bdf_cards(
+       ...         bdf_filename, card_names=['GRID']):
+       ...     nid = int(fields[1])
+
+    .. note:: the cards after ENDDATA and in the superelement/auxmodel
+              bulk data sections (e.g., BEGIN SUPER=2) aren't yielded
+
+    """
+    if encoding is None:
+        encoding = sys.getdefaultencoding()
+    if isinstance(bdf_filename, str):
+        if bdf_filename.lower().endswith('.pch'):
+            punch = True
+        encoding, punch = _get_header_encoding_punch(bdf_filename, encoding, punch)
+
+    if card_names is not None:
+        card_names = {card_name.upper() for card_name in card_names}
+
+    reader = BDFInputPy(read_includes, False, encoding, log=log, debug=debug)
+    lines = _iter_deck_lines(reader, bdf_filename)
+    bulk_data_lines = _iter_bulk_data_lines(lines, punch, reader.log)
+    active_filename = str(bdf_filename)
+    for card_name, comment, card_lines, ifile, iline in _iter_card_lines(bulk_data_lines):
+        if card_names is not None and card_name not in card_names:
+            continue
+        fields = card_lines
+        if card_name not in SPECIAL_CARDS and '=' not in card_name:
+            card_name2 = _get_card_name(card_lines, active_filename)
+            try:
+                fields = wipe_empty_fields(to_fields(card_lines, card_name2))
+            except CardParseSyntaxError:
+                # equal signs (e.g., OUTRCV)
+                pass
+            else:
+                fields[0] = card_name2
+        yield card_name, fields, comment, ifile, iline
+
+
+def _get_header_encoding_punch(bdf_filename: str, encoding: str,
+                               punch: Optional[bool]) -> Tuple[str, Optional[bool]]:
+    """
+    Gets the encoding and punch flag from the main file
+    (see ``BDF._parse_primary_file_header``)
+    """
+    header = _read_pynastran_header(bdf_filename)
+    encoding = header.get('encoding', encoding)
+    if 'punch' in header:
+        punch = header['punch'].lower() in ['true', 't']
+    return encoding, punch
+
+
+def _read_pynastran_header(bdf_filename: str) -> Dict[str, str]:
+    """reads the ``$ pyNastran: key=value`` lines at the top of a file"""
+    header = {}
+    with open(bdf_filename, 'r', errors='ignore') as bdf_file:
+        for line in bdf_file:
+            if not line.startswith('$'):
+                break
+            key, value = _parse_pynastran_header(line)
+            if not key:
+                break
+            header[key] = value
+    return header
+
+
+def _iter_deck_lines(reader: BDFInputPy,
+                     bdf_filename: Union[str, StringIO]) -> Iterator[FileLine]:
+    """
+    Yields the (ifile, iline, line) for each line in the deck, where the
+    INCLUDE files are read in place of the INCLUDE card
+    (see ``BDFInputPy.lines_to_deck_lines``)
+    """
+    ifiles = count(1)
+    if hasattr(bdf_filename, 'read') and hasattr(bdf_filename, 'write'):
+        yield from _iter_file_lines(reader, bdf_filename, 0, ifiles)
+        return
+
+    reader.bdf_filename = bdf_filename
+    # the directory of the 1st BDF (include BDFs are relative to this one)
+    reader.include_dir = os.path.dirname(os.path.abspath(bdf_filename))
+    with reader._open_file(bdf_filename, basename=True) as bdf_file:
+        yield from _iter_file_lines(reader, bdf_file, 0, ifiles)
+
+
+def _iter_file_lines(reader: BDFInputPy, bdf_file: Any, ifile: int,
+                     ifiles: Iterator[int]) -> Iterator[FileLine]:
+    """yields the lines of an open file and the INCLUDE files it references"""
+    lines = enumerate(bdf_file)
+    for iline, line in lines:
+        if line[:7].upper() != 'INCLUDE':
+            yield ifile, iline, line
+            continue
+
+        include_lines = _get_include_lines(line, lines)
+        bdf_filename2 = get_include_filename(include_lines, include_dir=reader.include_dir)
+        reader.include_lines[ifile].append((include_lines, bdf_filename2))
+        if not reader.read_includes:
+            continue
+
+        # the file isn't reread on a UnicodeDecodeError like in
+        # BDFInputPy._update_include, so the header is checked first
+        reader._open_file_checks(bdf_filename2)
+        encoding2 = _read_pynastran_header(bdf_filename2).get('encoding', reader.encoding)
+        ifile2 = next(ifiles)
+        with reader._open_file(bdf_filename2, basename=False, encoding=encoding2) as include_file:
+            yield from _iter_file_lines(reader, include_file, ifile2, ifiles)
+
+
+def _get_include_lines(line: str, lines: Iterator[Tuple[int, str]]) -> List[str]:
+    """
+    Gets the lines of an INCLUDE card, which may span multiple lines
+    (see ``BDFInputPy._get_include_lines``)
+
+    INCLUDE 'Satellite_V02_INCLUDE:Satellite_V02_Panneau_Externe.dat'
+    INCLUDE '../../BULK/COORDS/satellite_V02_Coord.blk'
+    """
+    line = line.rstrip('\r\n\t')
+    line_base = line.split('$')[0]
+    include_lines = [line_base.strip()]
+    if "'" not in line_base:
+        return include_lines
+
+    line_base = line_base[8:].strip()
+    if line_base.startswith("'") and line_base.endswith("'"):
+        return include_lines
+
+    while not line.split('$')[0].endswith("'"):
+        try:
+            unused_iline, line = next(lines)
+        except StopIteration:
+            msg = 'There was an invalid filename found while parsing (index).\n'
+            msg += 'include_lines = %s' % include_lines
+            raise IndexError(msg)
+        line = line.split('$')[0].strip()
+        include_lines.append(line)
+    return include_lines
+
+
+def _iter_bulk_data_lines(lines: Iterator[FileLine], punch: Optional[bool],
+                          log: Any) -> Iterator[FileLine]:
+    """
+    Skips the executive and case control decks and yields the bulk data
+    lines (see ``_lines_to_decks``)
+    """
+    guess_deck_sections = punch is None
+    is_bulk = bool(punch)
+    for ifile, iline, line in lines:
+        uline = line.split('$')[0].upper().strip()
+        if is_bulk:
+            if uline.startswith('BEGIN'):
+                # BEGIN SUPER=2, BEGIN BULK AUXMODEL=2, ...
+                log.warning('skipping the bulk data after %r' % line.rstrip())
+                return
+            yield ifile, iline, line
+            continue
+
+        if uline.startswith('BEGIN') and _is_begin_bulk(uline):
+            is_bulk = True
+        elif guess_deck_sections and _is_bulk_data_line(line):
+            log.warning('skipping directly to bulk data section\n%s' % line)
+            is_bulk = True
+            yield ifile, iline, line
+
+
+def _iter_card_lines(lines: Iterator[FileLine]) -> Iterator[Tuple[str, str, List[str], int, int]]:
+    """
+    Groups the bulk data lines into cards (see ``BDF.get_bdf_cards``)
+
+    Yields
+    ------
+    card_name : str
+        the name of the card
+    comment : str
+        the comment above the card
+    card_lines : List[str]
+        the lines of the card without the comments
+    ifile : int
+        the file index of the first line of the card
+    iline : int
+        the line index of the first line of the card
+
+    """
+    full_comment = ''
+    backup_comment = ''
+    card_lines = []
+    old_card_name = None
+    old_ifile = 0
+    old_iline = 0
+    for ifile, iline, line in lines:
+        line = line.rstrip()
+        comment = ''
+        if '$' in line:
+            line, comment = line.split('$', 1)
+        card_name = line.split(',', 1)[0].split('\t', 1)[0][:8].rstrip().upper()
+        if card_name and card_name[0] not in ['+', '*']:
+            if old_card_name:
+                yield old_card_name, full_comment.rstrip(), card_lines, old_ifile, old_iline
+                card_lines = []
+                full_comment = ''
+            old_ifile = ifile
+            old_iline = iline
+            old_card_name = card_name.rstrip(' *')
+            if old_card_name == 'ENDDATA':
+                return
+
+        comment = _clean_comment(comment)
+        if line.rstrip():
+            card_lines.append(line)
+            if backup_comment:
+                if comment:
+                    full_comment += backup_comment + comment + '\n'
+                else:
+                    full_comment += backup_comment
+                backup_comment = ''
+            elif comment:
+                full_comment += comment + '\n'
+        elif comment:
+            backup_comment += comment + '\n'
+
+    if card_lines:
+        yield (old_card_name, (backup_comment + full_comment).rstrip(), card_lines,
+               old_ifile, old_iline)
@@ -0,0 +1,164 @@
+"""
+Defines the lazy card reader (``read_bdf(..., lazy=True)``), which stores
+the lines of the cards and only creates the card object (e.g., with
+``CQUAD4.add_card``) when it's accessed.
+
+The cards that are stored by id in ``model.nodes``, ``model.elements``,
+``model.properties``, ``model.materials``, ``model.masses``, and
+``model.rigid_elements`` are indexed by the id in field 1.  The dictionary
+becomes a ``BulkCardDict``, so ``len``, ``in``, ``[]`` and ``get`` only
+create the cards that are accessed, while iterating over the dictionary
+(e.g., cross-referencing, validating, writing) creates all the cards.
+
+A card is created when it's accessed, so an error in the card (e.g., a
+float node id) is raised at that point instead of by ``read_bdf``.
+
+ - get_lazy_slots(model, cards_list)
+ - add_lazy_cards(model, lazy_cards, lazy_ids=None, is_first=None)
+ - LazyCardArray
+
+"""
+from __future__ import annotations
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.bdf.bdf_interface.utils import to_fields
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.bdf_interface.bulk_arrays import (
+    BulkCardArray, get_bulk_card_dict, get_card_ids)
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the add method -> the dictionary the cards are stored in by id
+LAZY_SLOTS = {
+    '_add_node_object': 'nodes',
+    '_add_element_object': 'elements',
+    '_add_damper_object': 'elements',
+    '_add_property_object': 'properties',
+    '_add_structural_material_object': 'materials',
+    '_add_mass_object': 'masses',
+    '_add_rigid_element_object': 'rigid_elements',
+}
+
+
+class LazyCardArray(BulkCardArray):
+    """the lines of the cards of one type, which are parsed when accessed"""
+    is_bulk_array = False
+
+    def __init__(self, card_name: str, card_class: Any, slot: str,
+                 ids: np.ndarray, comments: List[str], cards_lines: List[List[str]]):
+        BulkCardArray.__init__(self, ids)
+        self.card_name = card_name
+        self.card_class = card_class
+        self.slot = slot
+        self.comments = comments
+        self.cards_lines = cards_lines
+
+    def get_types(self) -> Dict[str, np.ndarray]:
+        """gets the card type (e.g., CQUAD4) -> ids"""
+        return {getattr(self.card_class, 'type', self.card_name): self.ids}
+
+    def build(self, irow: int) -> Any:
+        """creates the card object for a row (see ``BDF.create_card_object``)"""
+        card = wipe_empty_fields(to_fields(self.cards_lines[irow], self.card_name))
+        card_obj = BDFCard(card, has_none=False)
+        obj = self.card_class.add_card(card_obj, comment=self.comments[irow])
+        return obj
+
+    def release_row(self, irow: int) -> None:
+        """the card is stored, so the lines aren't needed anymore"""
+        self.cards_lines[irow] = None
+        self.comments[irow] = None
+
+    def __repr__(self) -> str:
+        return 'LazyCardArray(card_name=%r, n=%s)' % (self.card_name, len(self))
+
+
+def get_lazy_slots(model: BDF, cards_list: List[Any]) -> Dict[str, str]:
+    """
+    Gets the cards that can be parsed lazily
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    cards_list : List[card_name, comment, card_lines, (ifile, iline)]
+        the cards from ``get_bdf_cards``
+
+    Returns
+    -------
+    lazy_slots : Dict[str, str]
+        card_name -> the dictionary the cards are stored in (e.g., elements)
+
+    """
+    lazy_slots = {}
+    if not model.use_lazy_cards or model._is_dynamic_syntax:
+        return lazy_slots
+    if any(card[0] == 'ECHOON' for card in cards_list):
+        return lazy_slots
+
+    cards_to_read = model.cards_to_read
+    for card_name, (unused_card_class, add_card_function) in model._card_parser.items():
+        slot = LAZY_SLOTS.get(getattr(add_card_function, '__name__', ''))
+        if slot is not None and card_name in cards_to_read:
+            lazy_slots[card_name] = slot
+    return lazy_slots
+
+
+def add_lazy_cards(model: BDF,
+                   lazy_cards: Dict[str, List[Tuple[str, List[str]]]],
+                   lazy_ids: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]]=None,
+                   is_first: Optional[Dict[Any, np.ndarray]]=None) -> Dict[str, np.ndarray]:
+    """
+    Indexes the cards by id and adds them to the model
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    lazy_cards : Dict[str, List[(comment, card_lines)]]
+        card_name -> the comment and lines of each card
+    lazy_ids : Dict[str, (ids, is_valid)]; default=None -> get_card_ids
+        card_name -> the ids of the cards
+    is_first : Dict[('lazy', card_name), (ncards, ) bool ndarray]; default=None
+        is the card the first one with its id in the file (see ``get_first_cards``);
+        None -> the cards are first
+
+    Returns
+    -------
+    irows : Dict[str, (n, ) int ndarray]
+        card_name -> the cards that can't be indexed (e.g., a duplicate
+        id), which should be added with ``add_card``
+
+    """
+    irows = {}
+    for card_name, comments_cards_lines in lazy_cards.items():
+        comments = [comment for comment, unused_card_lines in comments_cards_lines]
+        cards_lines = [card_lines for unused_comment, card_lines in comments_cards_lines]
+        if lazy_ids is None:
+            ids, is_valid = get_card_ids(cards_lines, card_name)
+        else:
+            ids, is_valid = lazy_ids[card_name]
+            is_valid = is_valid.copy()
+        if is_first is not None:
+            is_valid &= is_first[('lazy', card_name)]
+        card_class, add_card_function = model._card_parser[card_name]
+        slot = LAZY_SLOTS[add_card_function.__name__]
+        card_dict = get_bulk_card_dict(model, slot)
+
+        ivalid = np.where(is_valid)[0]
+        is_unique = card_dict.get_unique_ids(ids[ivalid])
+        is_valid[ivalid[~is_unique]] = False
+        ivalid = ivalid[is_unique]
+        if len(ivalid):
+            array = LazyCardArray(card_name, card_class, slot, ids[ivalid],
+                                  [comments[icard] for icard in ivalid],
+                                  [cards_lines[icard] for icard in ivalid])
+            card_dict.add_array(array)
+            model.increase_card_count(card_name, len(array))
+            for card_type, type_ids in array.get_types().items():
+                model._type_to_id_map[card_type].extend(type_ids.tolist())
+        irows[card_name] = np.where(~is_valid)[0]
+    return irows
@@ -0,0 +1,290 @@
+"""
+Defines the lazy cross-referencing (``read_bdf(..., xref='lazy')``), which
+cross-references a card when it's accessed instead of cross-referencing the
+entire model.
+
+The dictionaries that store the cards by id (e.g., ``model.nodes``,
+``model.elements``, ``model.properties``, ``model.materials``,
+``model.loads``, ``model.caeros``) become a ``LazyXrefDict``, so
+``model.elements[eid]`` cross-references the element before it's returned.
+The element gets its nodes and property from the model, so they are
+cross-referenced as well (e.g., ``elem.pid_ref.mid_ref`` is set).  Iterating
+over the cards (e.g., ``model.elements.values()``) cross-references all
+of them.
+
+The cards are cross-referenced the same way as ``safe_cross_reference``, so
+a missing property of an element is logged, while a bad node or property
+raises an error when it's accessed.  The cards that aren't stored by id
+(e.g., SPC sets, ASETs, DESVARs) are cross-referenced right away.
+
+ - lazy_cross_reference(model)
+ - remove_lazy_cross_reference(model)
+ - LazyXrefDict
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import Set, Callable, Optional, Any, TYPE_CHECKING
+
+from pyNastran.bdf.bdf_interface.bulk_arrays import BulkCardDict
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the errors that are stored by ``model._store_xref_error``
+XREF_ERRORS = (SyntaxError, RuntimeError, AssertionError, KeyError, ValueError)
+
+
+def _xref_coord(model: BDF, coord: Any, unused_word: Optional[str]) -> None:
+    """links the coordinate system to its nodes/coordinate system and sets it up"""
+    coord.cross_reference(model)
+    coord.setup()
+
+
+def _xref_node(model: BDF, node: Any, unused_word: Optional[str]) -> None:
+    """links the node to its coordinate systems (see ``_cross_reference_nodes``)"""
+    node.cross_reference(model, model.grdset)
+
+
+def _xref_point(model: BDF, point: Any, unused_word: Optional[str]) -> None:
+    """links the POINT to its coordinate system"""
+    point.cross_reference(model)
+
+
+def _xref_store_error(model: BDF, card: Any, unused_word: Optional[str]) -> None:
+    """
+    links a property/material and stores the error
+    (see ``_cross_reference_properties``)
+    """
+    try:
+        card.cross_reference(model)
+    except XREF_ERRORS as error:
+        model._store_xref_error(error, card)
+        model.pop_xref_errors()
+
+
+def _safe_xref(model: BDF, card: Any, word: Optional[str]) -> None:
+    """
+    links a card and logs the missing references
+    (see ``_safe_cross_reference_elements``)
+    """
+    xref_errors = defaultdict(list)
+    if hasattr(card, 'safe_cross_reference'):
+        card.safe_cross_reference(model, xref_errors)
+    else:
+        card.cross_reference(model)
+    model._show_safe_xref_errors(word, xref_errors)
+
+
+def _safe_xref_no_errors(model: BDF, card: Any, unused_word: Optional[str]) -> None:
+    """links a card that has a ``safe_cross_reference(model)`` method (e.g., AELIST)"""
+    card.safe_cross_reference(model)
+
+
+#: slot -> (the function that cross-references a card, the safe xref word)
+LAZY_XREF_SLOTS = {
+    # nodes
+    'coords': (_xref_coord, None),
+    'nodes': (_xref_node, None),
+    'points': (_xref_point, None),
+
+    # elements
+    'elements': (_safe_xref, 'elements'),
+    'masses': (_xref_store_error, None),
+    'rigid_elements': (_safe_xref, 'elements'),
+
+    # properties/materials
+    'properties': (_xref_store_error, None),
+    'properties_mass': (_xref_store_error, None),
+    'materials': (_xref_store_error, None),
+    'creep_materials': (_xref_store_error, None),
+    'MATS1': (_xref_store_error, None),
+    'MATS3': (_xref_store_error, None),
+    'MATS8': (_xref_store_error, None),
+    'MATT1': (_xref_store_error, None),
+    'MATT2': (_xref_store_error, None),
+    'MATT3': (_xref_store_error, None),
+    'MATT4': (_xref_store_error, None),
+    'MATT5': (_xref_store_error, None),
+    'MATT8': (_xref_store_error, None),
+    'MATT9': (_xref_store_error, None),
+
+    # loads
+    'load_combinations': (_safe_xref, 'loads'),
+    'loads': (_safe_xref, 'loads'),
+    'dloads': (_safe_xref, 'loads'),
+    'dload_entries': (_safe_xref, 'loads'),
+    'dareas': (_safe_xref, 'loads'),
+    'dphases': (_safe_xref, 'loads'),
+    'tics': (_safe_xref, 'loads'),
+
+    # aero
+    'caeros': (_safe_xref, 'caeros'),
+    'paeros': (_safe_xref, 'paeros'),
+    'csschds': (_safe_xref, 'csschds'),
+    'splines': (_safe_xref, 'splines'),
+    'aesurf': (_safe_xref, 'aesurf'),
+    'trims': (_safe_xref_no_errors, None),
+    'aecomps': (_safe_xref_no_errors, None),
+    'aelists': (_safe_xref_no_errors, None),
+    'aeparams': (_safe_xref_no_errors, None),
+    'aesurfs': (_safe_xref_no_errors, None),
+    'flutters': (_safe_xref_no_errors, None),
+}
+
+
+def lazy_cross_reference(model: BDF, word: str='') -> None:
+    """
+    Sets up the model so the cards stored by id are cross-referenced when
+    they're accessed; the other cards are cross-referenced now
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    word : str; default=''
+        model flag
+
+    """
+    model.log.debug('Lazy Cross Referencing%s...' % word)
+    for slot, (xref_card, xref_word) in LAZY_XREF_SLOTS.items():
+        card_dict = getattr(model, slot, None)
+        if not isinstance(card_dict, dict) or isinstance(card_dict, LazyXrefDict):
+            continue
+        lazy_dict = LazyXrefDict(model, xref_card, xref_word)
+        lazy_dict.update_from(card_dict)
+        setattr(model, slot, lazy_dict)
+
+    # the aero cards that aren't stored by id (see _safe_cross_reference_aero)
+    model.zona.safe_cross_reference()
+    xref_errors = defaultdict(list)
+    for monitor_point in model.monitor_points:
+        monitor_point.safe_cross_reference(model, xref_errors)
+    model._show_safe_xref_errors('monitor_points', xref_errors)
+    if model.aero:
+        xref_errors = defaultdict(list)
+        model.aero.safe_cross_reference(model, xref_errors)
+        model._show_safe_xref_errors('aero', xref_errors)
+    if model.aeros:
+        xref_errors = defaultdict(list)
+        model.aeros.safe_cross_reference(model, xref_errors)
+        model._show_safe_xref_errors('aeros', xref_errors)
+
+    model._safe_cross_reference_constraints()
+    model._cross_reference_sets()
+    model._safe_cross_reference_optimization()
+    model._safe_cross_reference_contact()
+    model._safe_cross_reference_superelements()
+    model.pop_xref_errors()
+
+    for super_id, superelement in sorted(model.superelement_models.items()):
+        lazy_cross_reference(superelement, word=' (Superelement %i)' % super_id)
+
+
+def remove_lazy_cross_reference(model: BDF) -> None:
+    """
+    Replaces the LazyXrefDicts with standard dictionaries, so the cards
+    are no longer cross-referenced when they're accessed (e.g., before
+    ``cross_reference`` or ``uncross_reference``)
+    """
+    for slot in LAZY_XREF_SLOTS:
+        card_dict = getattr(model, slot, None)
+        if isinstance(card_dict, LazyXrefDict):
+            setattr(model, slot, card_dict.to_dict())
+    for superelement in model.superelement_models.values():
+        remove_lazy_cross_reference(superelement)
+
+
+class LazyXrefDict(BulkCardDict):
+    """
+    A dictionary of cards (e.g., model.elements) that cross-references a
+    card the first time it's accessed.  The values may also be a list of
+    cards (e.g., model.loads).
+
+    ``len``, ``in`` and iterating over the keys don't cross-reference the
+    cards, while iterating over the values cross-references all the cards.
+    """
+    def __init__(self, model: BDF, xref_card: Callable[[BDF, Any, Optional[str]], None],
+                 word: Optional[str]=None):
+        BulkCardDict.__init__(self)
+        self._model = model
+        self._xref_card = xref_card
+        self._word = word
+        self._xref_keys: Set[Any] = set()
+
+    def update_from(self, card_dict: dict) -> None:
+        """adds the cards (and the unbuilt cards of a BulkCardDict) without building them"""
+        dict.update(self, dict.items(card_dict))
+        if isinstance(card_dict, BulkCardDict):
+            self._arrays = card_dict._arrays
+            self._nunbuilt = card_dict._nunbuilt
+
+    def to_dict(self) -> dict:
+        """gets the cards as a dictionary (or a BulkCardDict if there are unbuilt cards)"""
+        if not self._nunbuilt:
+            return dict(dict.items(self))
+        card_dict = BulkCardDict(dict.items(self))
+        card_dict._arrays = self._arrays
+        card_dict._nunbuilt = self._nunbuilt
+        return card_dict
+
+    def cross_reference_all(self) -> None:
+        """cross-references all the cards"""
+        self.build_all()
+        for key in list(dict.keys(self)):
+            if key not in self._xref_keys:
+                self[key]
+
+    def __getitem__(self, key: Any) -> Any:
+        if key in self._xref_keys:
+            return dict.__getitem__(self, key)
+
+        value = dict.__getitem__(self, key)
+        # the key is flagged first, so a card that references itself
+        # (e.g., through a node) isn't cross-referenced twice
+        self._xref_keys.add(key)
+        try:
+            if isinstance(value, list):
+                for card in value:
+                    self._xref_card(self._model, card, self._word)
+            else:
+                self._xref_card(self._model, value, self._word)
+        except Exception:
+            self._xref_keys.discard(key)
+            raise
+        return value
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._xref_keys or BulkCardDict.__contains__(self, key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        BulkCardDict.__setitem__(self, key, value)
+        self._xref_keys.discard(key)
+
+    def __delitem__(self, key: Any) -> None:
+        BulkCardDict.__delitem__(self, key)
+        self._xref_keys.discard(key)
+
+    def pop(self, key: Any, *args) -> Any:
+        value = BulkCardDict.pop(self, key, *args)
+        self._xref_keys.discard(key)
+        return value
+
+    def values(self):
+        self.cross_reference_all()
+        return dict.values(self)
+
+    def items(self):
+        self.cross_reference_all()
+        return dict.items(self)
+
+    def popitem(self):
+        self.cross_reference_all()
+        return dict.popitem(self)
+
+    def copy(self):
+        self.cross_reference_all()
+        return dict(dict.items(self))
+
+    def clear(self) -> None:
+        BulkCardDict.clear(self)
+        self._xref_keys = set()
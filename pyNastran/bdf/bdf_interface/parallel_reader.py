@@ -0,0 +1,160 @@
+"""
+Defines the parallel BDF parser (``read_bdf(..., nworkers=4)``), which
+creates the card objects with a pool of processes.
+
+The cards that are parsed by ``card_class.add_card`` (e.g., not the cards
+that depend on the BAROR/BEAMOR) are split into contiguous chunks.  Each
+worker converts its cards into fields and creates the card objects.  The
+parent then adds the card objects to the model in deck order, so duplicate
+ids and parsing errors are reported the same way as the serial reader.
+
+ - get_parallel_cards(model, cards_list)
+ - split_cards(cards, nworkers)
+ - parse_cards_chunk(cards, card_classes)
+
+"""
+from __future__ import annotations
+import pickle
+import traceback
+from typing import List, Dict, Tuple, Any, TYPE_CHECKING
+
+from pyNastran.bdf.bdf_interface.utils import to_fields
+from pyNastran.bdf.bdf_interface.bdf_card import BDFCard
+from pyNastran.bdf.bdf_interface.bulk_arrays import BULK_ARRAY_CARDS
+from pyNastran.bdf.bdf_interface.lazy_cards import get_lazy_slots
+from pyNastran.bdf.cards.utils import wipe_empty_fields
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the fewest cards that are sent to a worker
+MIN_CARDS_PER_CHUNK = 1000
+
+#: the chunks per worker, so a slow chunk doesn't stall the pool
+NCHUNKS_PER_WORKER = 4
+
+#: the errors that the serial reader stores (see ``BDF._add_card_helper``)
+PARSE_ERRORS = (SyntaxError, AssertionError, KeyError, ValueError)
+
+#: cards with special parsing (see ``BDF.create_card_object``)
+SPECIAL_CARDS = {'DEQATN', 'PBRSECT', 'PBMSECT', 'GMCURV', 'GMSURF', 'OUTPUT', 'ADAPT'}
+
+
+def get_parallel_cards(model: BDF, cards_list: List[Any]) -> List[Tuple[int, str, str, List[str]]]:
+    """
+    Gets the cards that can be parsed by a worker
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    cards_list : List[card_name, comment, card_lines, (ifile, iline)]
+        the cards from ``get_bdf_cards``
+
+    Returns
+    -------
+    cards : List[(icard, card_name, comment, card_lines)]
+        the cards to parse in parallel
+
+    """
+    cards = []
+    card_names = {card[0] for card in cards_list}
+    if 'ECHOON' in card_names or model._is_dynamic_syntax:
+        return cards
+
+    use_bulk_arrays = model.use_bulk_arrays
+    lazy_slots = get_lazy_slots(model, cards_list)
+    cards_to_read = model.cards_to_read
+    card_parser = model._card_parser
+    for icard, (card_name, comment, card_lines, unused_ifile_iline) in enumerate(cards_list):
+        if (card_name is None or '=' in card_name or card_name not in cards_to_read or
+                card_name not in card_parser or card_name in SPECIAL_CARDS or
+                (use_bulk_arrays and card_name in BULK_ARRAY_CARDS) or
+                card_name in lazy_slots):
+            continue
+        card_class = card_parser[card_name][0]
+        if '<locals>' in card_class.__qualname__:
+            # e.g., the Crash class can't be pickled
+            continue
+        cards.append((icard, card_name, comment, card_lines))
+    return cards
+
+
+def split_cards(cards: List[Any], nworkers: int) -> List[List[Any]]:
+    """
+    Splits the cards into contiguous chunks with at least
+    MIN_CARDS_PER_CHUNK cards
+
+    Parameters
+    ----------
+    cards : List[(icard, card_name, comment, card_lines)]
+        the cards to parse
+    nworkers : int
+        the number of processes
+
+    Returns
+    -------
+    chunks : List[List[(icard, card_name, comment, card_lines)]]
+        the cards for each worker; a single chunk should be read serially
+
+    """
+    ncards = len(cards)
+    nchunks = min(nworkers * NCHUNKS_PER_WORKER, ncards // MIN_CARDS_PER_CHUNK)
+    if nchunks <= 1:
+        return [cards]
+    ncards_chunk = -(-ncards // nchunks)
+    return [cards[i0:i0 + ncards_chunk] for i0 in range(0, ncards, ncards_chunk)]
+
+
+def parse_cards_chunk(cards: List[Tuple[int, str, str, List[str]]],
+                      card_classes: Dict[str, Any]) -> Tuple[List[Any], Dict[int, Any]]:
+    """
+    Creates the card objects for a chunk (see ``BDF.create_card_object``)
+
+    Parameters
+    ----------
+    cards : List[(icard, card_name, comment, card_lines)]
+        the cards to parse
+    card_classes : Dict[str, class]
+        card_name -> card class
+
+    Returns
+    -------
+    class_instances : List[GRID, CQUAD4, ...]
+        the card objects; None if there's an error
+    errors : Dict[int, (card_obj, error)]
+        the index of the card in the chunk -> the error from add_card,
+        which is reraised by the parent;
+        card_obj is None if the card couldn't be split into fields
+
+    """
+    class_instances = []
+    errors = {}
+    for i, (unused_icard, card_name, comment, card_lines) in enumerate(cards):
+        class_instance = None
+        try:
+            card = wipe_empty_fields(to_fields(card_lines, card_name))
+            card_obj = BDFCard(card, has_none=False)
+        except Exception as exception:
+            errors[i] = (None, _get_picklable_exception(exception))
+        else:
+            try:
+                class_instance = card_classes[card_name].add_card(card_obj, comment=comment)
+            except Exception as exception:
+                errors[i] = (card_obj, _get_picklable_exception(exception))
+        class_instances.append(class_instance)
+    return class_instances, errors
+
+
+def _get_picklable_exception(exception: Exception) -> Exception:
+    """the parent reraises the exception, so it has to survive pickling"""
+    try:
+        pickle.loads(pickle.dumps(exception))
+    except Exception:
+        msg = ''.join(traceback.format_exception_only(type(exception), exception))
+        exception_class = RuntimeError
+        for error_class in PARSE_ERRORS + (TypeError, ):
+            if isinstance(exception, error_class):
+                exception_class = error_class
+                break
+        exception = exception_class(msg)
+    return exception
@@ -0,0 +1,323 @@
+"""
+Defines the helpers for ``BDF.refresh``, which rereads the INCLUDE files
+that changed since ``read_bdf(..., save_file_structure=True)``.
+
+Every card has an ``ifile`` (the index into ``model.active_filenames``), so
+only the changed files are reread, the cards of a changed file are removed,
+and the new ones are added.  If the model is cross-referenced, only the new
+cards and the cards that referenced a removed card are cross-referenced.
+
+ - get_changed_ifiles(model)
+ - get_bulk_data_lines(model, ifiles)
+ - remove_cards_by_ifile(model, ifiles)
+ - get_cards_to_cross_reference(model, ifiles, removed_cards)
+ - cross_reference_cards(model, cards)
+
+"""
+from __future__ import annotations
+import os
+from collections import defaultdict
+from typing import List, Set, Tuple, Optional, Any, TYPE_CHECKING
+
+import numpy as np
+from pyNastran.nptyping import NDArrayN2int
+from pyNastran.utils import _filename
+from pyNastran.bdf.bdf_interface.cache import get_file_stats
+from pyNastran.bdf.bdf_interface.lazy_xref import XREF_ERRORS
+from pyNastran.bdf.bdf_interface.include_file import get_include_filename
+from pyNastran.bdf.bdf_interface.iter_cards import _get_include_lines, _read_pynastran_header
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+
+def get_changed_ifiles(model: BDF) -> List[int]:
+    """
+    Gets the files whose size or modification time changed since
+    they were read
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+
+    Returns
+    -------
+    ifiles : List[int]
+        the index of the files in ``model.active_filenames``
+
+    """
+    file_stats_old = model._active_file_stats
+    file_stats = get_file_stats(model.active_filenames)
+    ifiles = [ifile for ifile, (stats_old, stats) in enumerate(zip(file_stats_old, file_stats))
+              if stats_old != stats]
+    return ifiles
+
+
+def get_bulk_data_lines(model: BDF, ifiles: List[int]) -> Optional[
+        Tuple[List[str], NDArrayN2int]]:
+    """
+    Reads the bulk data lines of the changed files without the rest of
+    the deck
+
+    The INCLUDE cards of a changed file are skipped, so the files they
+    reference (which are refreshed on their own) aren't reread.
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    ifiles : List[int]
+        the index of the files in ``model.active_filenames``
+
+    Returns
+    -------
+    bulk_data_lines : List[str]
+        the bulk data lines of the files
+    bulk_data_ilines : (nlines, 2) int ndarray
+        the [ifile, iline] pair for each line
+    None :
+        a file isn't only bulk data (e.g., it has a BEGIN SUPER or ENDDATA)
+        or its INCLUDE cards changed, so the deck has to be reread
+
+    """
+    bulk_data_lines = []
+    bulk_data_ilines = []
+    for ifile in ifiles:
+        if ifile not in model._bulk_data_ifiles or (ifile == 0 and not model.punch):
+            # the master file has the executive/case control decks
+            return None
+        bdf_filename = model.active_filenames[ifile]
+        if not os.path.isfile(_filename(bdf_filename)):
+            return None
+
+        encoding = _read_pynastran_header(bdf_filename).get('encoding', model._encoding)
+        include_filenames = []
+        with open(_filename(bdf_filename), 'r', encoding=encoding) as bdf_file:
+            lines = enumerate(bdf_file)
+            for iline, line in lines:
+                if line[:7].upper() == 'INCLUDE':
+                    include_lines = _get_include_lines(line, lines)
+                    include_filenames.append(
+                        get_include_filename(include_lines, include_dir=model.include_dir))
+                    continue
+                uline = line.split('$')[0].upper().strip()
+                if uline.startswith(('BEGIN', 'CEND', 'ENDDATA')):
+                    return None
+                bulk_data_lines.append(line.rstrip())
+                bulk_data_ilines.append((ifile, iline))
+
+        if include_filenames != model.include_filenames.get(ifile, []):
+            # the files would be numbered differently
+            return None
+    return bulk_data_lines, np.array(bulk_data_ilines, dtype='int32').reshape(-1, 2)
+
+
+def _iter_slots(model: BDF):
+    """yields the (slot_name, slot) pairs in cross-reference order"""
+    slot_names = []
+    for slot_name in model._slot_to_type_map:
+        if slot_name not in slot_names and hasattr(model, slot_name):
+            slot_names.append(slot_name)
+    for slot_name in slot_names:
+        yield slot_name, getattr(model, slot_name)
+
+
+def _iter_cards(model: BDF):
+    """yields the (slot_name, card) pairs in cross-reference order"""
+    for slot_name, slot in _iter_slots(model):
+        if isinstance(slot, dict):
+            for value in slot.values():
+                if isinstance(value, list):
+                    for card in value:
+                        yield slot_name, card
+                else:
+                    yield slot_name, value
+        elif isinstance(slot, list):
+            for card in slot:
+                yield slot_name, card
+        elif slot is not None:
+            yield slot_name, slot
+
+
+def remove_cards_by_ifile(model: BDF, ifiles: Set[int]) -> List[Tuple[str, Any]]:
+    """
+    Removes the cards that were read from the files
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    ifiles : Set[int]
+        the index of the files in ``model.active_filenames``
+
+    Returns
+    -------
+    removed_cards : List[(slot_name, card)]
+        the cards that were removed
+
+    """
+    removed_cards = []
+    # card_type -> the ids that were removed from the _type_to_id_map
+    removed_ids = defaultdict(set)
+    for slot_name, slot in _iter_slots(model):
+        if isinstance(slot, dict):
+            for key, value in list(slot.items()):
+                if isinstance(value, list):
+                    cards = [card for card in value if getattr(card, 'ifile', None) in ifiles]
+                    if not cards:
+                        continue
+                    card_ids = {id(card) for card in cards}
+                    value = [card for card in value if id(card) not in card_ids]
+                    if value:
+                        slot[key] = value
+                    else:
+                        del slot[key]
+                    card_types = {card.type for card in value}
+                    for card in cards:
+                        if card.type not in card_types:
+                            removed_ids[card.type].add(key)
+                    removed_cards.extend((slot_name, card) for card in cards)
+                elif getattr(value, 'ifile', None) in ifiles:
+                    del slot[key]
+                    removed_ids[value.type].add(key)
+                    removed_cards.append((slot_name, value))
+        elif isinstance(slot, list):
+            cards = [card for card in slot if getattr(card, 'ifile', None) in ifiles]
+            if cards:
+                card_ids = {id(card) for card in cards}
+                slot[:] = [card for card in slot if id(card) not in card_ids]
+                removed_cards.extend((slot_name, card) for card in cards)
+        elif getattr(slot, 'ifile', None) in ifiles:
+            setattr(model, slot_name, None)
+            removed_cards.append((slot_name, slot))
+
+    for card_type, ids in removed_ids.items():
+        type_ids = model._type_to_id_map.get(card_type)
+        if type_ids is not None:
+            model._type_to_id_map[card_type] = [idi for idi in type_ids if idi not in ids]
+
+    card_count = model.card_count
+    for unused_slot_name, card in removed_cards:
+        card_type = card.type
+        if card_type in card_count:
+            card_count[card_type] -= 1
+            if card_count[card_type] <= 0:
+                del card_count[card_type]
+    return removed_cards
+
+
+def _get_ref_values(card: Any) -> List[Any]:
+    """gets the cross-referenced objects (e.g., nodes_ref) of a card"""
+    names = list(getattr(card, '__dict__', {}))
+    for cls in type(card).__mro__:
+        names.extend(getattr(cls, '__slots__', ()))
+    ref_values = []
+    for name in names:
+        if not name.endswith('_ref'):
+            continue
+        _add_ref_values(getattr(card, name, None), ref_values)
+    return ref_values
+
+
+def _add_ref_values(value: Any, ref_values: List[Any]) -> None:
+    """
+    adds the cross-referenced objects, which may be nested lists
+    (e.g., LOAD.load_ids_ref is a List[List[card]])
+    """
+    if isinstance(value, (list, tuple)):
+        for valuei in value:
+            _add_ref_values(valuei, ref_values)
+    elif value is not None:
+        ref_values.append(value)
+
+
+def get_cards_to_cross_reference(model: BDF, ifiles: Set[int],
+                                 removed_cards: List[Tuple[str, Any]]) -> List[Tuple[str, Any]]:
+    """
+    Gets the cards that were read from the files and the cards that
+    reference a removed card (e.g., the CQUAD4s of a PSHELL)
+
+    A coordinate system that references a moved coordinate system or GRID
+    (e.g., the rid of a CORD2R) is also cross-referenced, so it's set up
+    again.
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    ifiles : Set[int]
+        the index of the files in ``model.active_filenames``
+    removed_cards : List[(slot_name, card)]
+        the cards that were removed
+
+    Returns
+    -------
+    cards : List[(slot_name, card)]
+        the cards to cross-reference
+
+    """
+    removed_ids = {id(card) for unused_slot_name, card in removed_cards}
+    cards = []
+    card_ids = set()
+    for slot_name, card in _iter_cards(model):
+        if getattr(card, 'ifile', None) in ifiles:
+            cards.append((slot_name, card))
+            card_ids.add(id(card))
+        elif any(id(value) in removed_ids for value in _get_ref_values(card)):
+            cards.append((slot_name, card))
+            card_ids.add(id(card))
+
+    # the coordinate systems that depend on a moved coordinate system/GRID
+    moved_ids = removed_ids.union(id(card) for slot_name, card in cards
+                                  if slot_name in ('coords', 'nodes'))
+    coords = [coord for coord in model.coords.values() if id(coord) not in card_ids]
+    while coords:
+        coords_moved = [coord for coord in coords if any(
+            id(value) in moved_ids or id(getattr(value, 'cp_ref', None)) in moved_ids
+            for value in _get_ref_values(coord))]
+        if not coords_moved:
+            break
+        for coord in coords_moved:
+            cards.append(('coords', coord))
+            moved_ids.add(id(coord))
+        coords = [coord for coord in coords if id(coord) not in moved_ids]
+    return cards
+
+
+def cross_reference_cards(model: BDF, cards: List[Tuple[str, Any]]) -> None:
+    """
+    Cross-references a subset of the cards
+
+    Parameters
+    ----------
+    model : BDF
+        the model
+    cards : List[(slot_name, card)]
+        the cards to cross-reference in cross-reference order (e.g., the
+        CAEROx cards before the SPLINEx cards); ``uncross_reference`` is
+        called on the cards that are already cross-referenced
+
+    """
+    grdset = model.grdset
+    for unused_slot_name, card in cards:
+        if not hasattr(card, 'cross_reference'):
+            continue
+        if _get_ref_values(card):
+            card.uncross_reference()
+        try:
+            if card.type == 'GRID':
+                card.cross_reference(model, grdset)
+            else:
+                card.cross_reference(model)
+        except XREF_ERRORS as error:
+            model._store_xref_error(error, card)
+
+    # the coordinate systems are set up once the GRIDs they reference are
+    # cross-referenced (see _cross_reference_coordinates)
+    coords = [card for slot_name, card in cards if slot_name == 'coords']
+    for coord in coords:
+        if coord.type in ('CORD1R', 'CORD1C', 'CORD1S'):
+            coord.is_resolved = False
+    for coord in coords:
+        coord.setup()
+    model.pop_xref_errors()
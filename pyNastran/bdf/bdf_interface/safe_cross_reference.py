@@ -10,6 +10,7 @@ from typing import Tuple, List, Any
 import numpy as np
 from numpy import zeros, argsort, arange, array_equal
 from pyNastran.bdf.bdf_interface.cross_reference import XrefMesh
+from pyNastran.bdf.bdf_interface.lazy_xref import remove_lazy_cross_reference
 
 
 class SafeXrefMesh(XrefMesh):
@@ -50,6 +51,7 @@ class SafeXrefMesh(XrefMesh):
         """
         if not xref:
             return
+        remove_lazy_cross_reference(self)
         self.log.debug("Safe Cross Referencing%s..." % word)
         if xref_nodes:
             self._cross_reference_nodes()
@@ -132,6 +132,7 @@ def get_bdf_stats(model: BDF, return_type: str='string',
         'superelement_models', 'wtmass', 'echo', 'force_echo_off',
         'read_includes', 'reject_cards', 'reject_count', 'punch',
         'include_dir', 'include_filenames', 'save_file_structure',
+        'use_bulk_arrays', 'bulk_arrays', 'nworkers', 'use_lazy_cards',
         'rsolmap_to_str', 'nastran_format', 'nid_map', 'bdf_filename',
         'initial_superelement_models',
         'is_zona', 'is_nasa95', 'type_slot_str', 'dict_of_vars', 'code_block',
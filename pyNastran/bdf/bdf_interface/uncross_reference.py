@@ -1,6 +1,7 @@
 """Unlinks up the various cards in the BDF."""
 from typing import List, Dict, Any
 from pyNastran.bdf.bdf_interface.safe_cross_reference import SafeXrefMesh
+from pyNastran.bdf.bdf_interface.lazy_xref import remove_lazy_cross_reference
 
 class UnXrefMesh(SafeXrefMesh):
     """
@@ -15,6 +16,7 @@ class UnXrefMesh(SafeXrefMesh):
     def uncross_reference(self, word: str='') -> None:
         """uncross references the model"""
         self.log.debug("Uncross Referencing%s..." % word)
+        remove_lazy_cross_reference(self)
         self._uncross_reference_nodes()
         self._uncross_reference_coords()
         self._uncross_reference_elements()
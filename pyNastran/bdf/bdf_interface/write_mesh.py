@@ -12,6 +12,7 @@ from typing import List, Dict, Union, Optional, Tuple, Any, cast
 from pyNastran.bdf.field_writer_8 import print_card_8
 from pyNastran.bdf.field_writer_16 import print_card_16
 from pyNastran.bdf.bdf_interface.attributes import BDFAttributes
+from pyNastran.bdf.bdf_interface.bulk_writer import write_grids_bulk, write_elements_bulk
 from pyNastran.bdf.cards.nodes import write_xpoints
 
 
@@ -244,13 +245,7 @@ class WriteMesh(BDFAttributes):
                 for (eid, element) in sorted(self.elements.items()):
                     bdf_file.write(element.write_card_16(is_double))
             else:
-                for (eid, element) in sorted(self.elements.items()):
-                    try:
-                        bdf_file.write(element.write_card(size, is_double))
-                    except:
-                        print('failed printing element...'
-                              'type=%s eid=%s' % (element.type, eid))
-                        raise
+                write_elements_bulk(bdf_file, self.elements, size, is_double)
         if self.ao_element_flags:
             for (eid, element) in sorted(self.ao_element_flags.items()):
                 bdf_file.write(element.write_card(size, is_double))
@@ -815,7 +810,10 @@ class WriteMesh(BDFAttributes):
             bdf_file.write('$NODES\n')
             if self.grdset:
                 bdf_file.write(self.grdset.write_card(size))
-            _write_dict(bdf_file, self.nodes, size, is_double, is_long_ids)
+            if is_long_ids:
+                _write_dict(bdf_file, self.nodes, size, is_double, is_long_ids)
+            else:
+                write_grids_bulk(bdf_file, self.nodes, size, is_double)
 
     #def _write_nodes_associated(self, bdf_file, size=8, is_double=False):
         #"""
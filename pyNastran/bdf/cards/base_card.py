@@ -39,7 +39,15 @@ class BaseCard:
      - comment
      - update_field(self, n, value)
 
+    The common cards (e.g., GRID, CQUAD4) define ``__slots__`` instead of
+    having a ``__dict__`` to reduce the memory use of large models, so the
+    base classes (e.g., Element, ShellElement) define them as well.
+
     """
+    #: ifile is the index of the file the card was read from
+    #: (see ``read_bdf(..., save_file_structure=True)``)
+    __slots__ = ('_comment', 'ifile')
+
     def __init__(self) -> None:
         pass
         #ABC.__init__(self)
@@ -330,6 +338,8 @@ class BaseCard:
 
 class Property(BaseCard):
     """Base Property Class"""
+    __slots__ = ()
+
     def __init__(self) -> None:
         """dummy init"""
         pass
@@ -375,6 +385,8 @@ class Property(BaseCard):
 
 class Material(BaseCard):
     """Base Material Class"""
+    __slots__ = ()
+
     def __init__(self) -> None:
         """dummy init"""
         BaseCard.__init__(self)
@@ -410,6 +422,7 @@ class Material(BaseCard):
 
 class Element(BaseCard):
     """defines the Element class"""
+    __slots__ = ()
     pid = 0  # CONM2, rigid
 
     def __init__(self) -> None:
@@ -568,7 +581,7 @@ def _node_ids(card, nodes=None, allow_empty_nodes: bool=False, msg: str='') -> A
     try:
         if not nodes:
             nodes = card.nodes
-            assert nodes is not None, card.__dict__
+            assert nodes is not None, '%s %s has no nodes' % (card.type, getattr(card, 'eid', ''))
 
         if allow_empty_nodes:
             nodes2 = []
@@ -30,6 +30,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class LineElement(Element):  # CBAR, CBEAM, CBEAM3, CBEND
+    __slots__ = ()
+
     def __init__(self):
         Element.__init__(self)
         self.pid_ref = None  # type: Optional[Any]
@@ -377,6 +379,8 @@ class CBAR(LineElement):
 
     """
     type = 'CBAR'
+    __slots__ = ('eid', 'pid', 'ga', 'gb', 'x', 'g0', 'offt', 'pa', 'pb', 'wa', 'wb',
+                 'g0_vector', 'pid_ref', 'ga_ref', 'gb_ref', 'g0_ref')
     _field_map = {
         1: 'eid', 2:'pid', 3:'ga', 4:'gb',
         8:'offt', 9:'pa', 10:'pb',
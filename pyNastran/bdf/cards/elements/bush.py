@@ -25,6 +25,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class BushElement(Element):
+    __slots__ = ()
+
     def __init__(self):
         self.cid = None
         Element.__init__(self)
@@ -74,6 +76,8 @@ class CBUSH(BushElement):
     +-------+-----+------+----+----+-------+----+----+-----+
     """
     type = 'CBUSH'
+    __slots__ = ('eid', 'pid', 'nodes', 'ga', 'gb', 'x', 'g0', 'cid', 's', 'ocid', 'si',
+                 'pid_ref', 'nodes_ref', 'ga_ref', 'gb_ref', 'g0_ref', 'cid_ref', 'ocid_ref')
     _field_map = {
         1: 'eid', 2:'pid', 3:'ga', 4:'gb', 8:'cid', 9:'s', 10:'ocid'
     }
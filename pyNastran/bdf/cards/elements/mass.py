@@ -33,6 +33,8 @@ def is_positive_semi_definite(A, tol=1e-8):
     return np.all(vals > -tol), vals
 
 class PointMassElement(Element):
+    __slots__ = ()
+
     def __init__(self):
         Element.__init__(self)
 
@@ -1133,6 +1135,7 @@ class CONM2(PointMassElement):
 
     """
     type = 'CONM2'
+    __slots__ = ('eid', 'nid', 'mass', 'cid', 'X', 'I', 'nid_ref', 'cid_ref')
     _field_map = {
         1: 'eid', 2:'nid', 3:'cid', 4:'mass',
     }
@@ -15,6 +15,7 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class RodElement(Element):  # CROD, CONROD, CTUBE
+    __slots__ = ()
 
     def __init__(self):
         Element.__init__(self)
@@ -46,6 +47,7 @@ class CROD(RodElement):
     +------+-----+-----+----+----+
     """
     type = 'CROD'
+    __slots__ = ('eid', 'pid', 'nodes', 'pid_ref', 'nodes_ref')
     _field_map = {
         1: 'eid', 2:'pid',
     }
@@ -510,6 +512,7 @@ class CONROD(RodElement):
     +--------+-----+-----+----+-----+---+---+---+-----+
     """
     type = 'CONROD'
+    __slots__ = ('eid', 'mid', 'nodes', 'A', 'j', 'c', 'nsm', 'mid_ref', 'nodes_ref')
     pid = -10 # 10 is the element type per DMAP
     _field_map = {
         1: 'eid', 4:'mid', 5:'A', 6:'j', 7:'c', 8:'nsm',
@@ -129,6 +129,7 @@ def _normal4(n1, n2, n3, n4, card):
 
 class ShellElement(Element):
     type = 'ShellElement'
+    __slots__ = ()
 
     def __init__(self):
         Element.__init__(self)
@@ -251,6 +252,8 @@ class ShellElement(Element):
 
 
 class TriShell(ShellElement):
+    __slots__ = ()
+
     def __init__(self):
         ShellElement.__init__(self)
         self.nodes_ref = None  # type: Optional[List[Any]]
@@ -446,6 +449,8 @@ class CTRIA3(TriShell):
 
     """
     type = 'CTRIA3'
+    __slots__ = ('eid', 'pid', 'nodes', 'theta_mcid', 'zoffset', 'tflag', 'T1', 'T2',
+                 'T3', 'pid_ref', 'nodes_ref', 'theta_mcid_ref')
     _field_map = {
         1: 'eid', 2:'pid', 6:'theta_mcid', 7:'zoffset', 10:'tflag',
         11:'T1', 12:'T2', 13:'T3'}
@@ -995,6 +1000,8 @@ class CTRIA6(TriShell):
 
     """
     type = 'CTRIA6'
+    __slots__ = ('eid', 'pid', 'nodes', 'theta_mcid', 'zoffset', 'tflag', 'T1', 'T2',
+                 'T3', 'pid_ref', 'nodes_ref', 'theta_mcid_ref')
     def __init__(self, eid, pid, nids, theta_mcid=0., zoffset=0., tflag=0,
                  T1=None, T2=None, T3=None, comment=''):
         """
@@ -1637,6 +1644,8 @@ class CTRIAR(TriShell):
 
 
 class QuadShell(ShellElement):
+    __slots__ = ()
+
     def __init__(self):
         ShellElement.__init__(self)
         self.nodes_ref = None  # type: Optional[List[Any]]
@@ -2138,6 +2147,8 @@ class CQUAD4(QuadShell):
 
     """
     type = 'CQUAD4'
+    __slots__ = ('eid', 'pid', 'nodes', 'theta_mcid', 'zoffset', 'tflag', 'T1', 'T2',
+                 'T3', 'T4', 'pid_ref', 'nodes_ref', 'theta_mcid_ref')
     cp_name_map = {
         'T1' : 'T1',
         'T2' : 'T2',
@@ -4448,6 +4459,8 @@ class CQUAD8(QuadShell):
 
     """
     type = 'CQUAD8'
+    __slots__ = ('eid', 'pid', 'nodes', 'theta_mcid', 'zoffset', 'tflag', 'T1', 'T2',
+                 'T3', 'T4', 'pid_ref', 'nodes_ref', 'theta_mcid_ref')
     def __init__(self, eid, pid, nids, theta_mcid=0., zoffset=0.,
                  tflag=0, T1=None, T2=None, T3=None, T4=None,
                  comment=''):
@@ -97,6 +97,7 @@ nnodes_map = {
     'CHEXA' : (8, 20),
 }
 class SolidElement(Element):
+    __slots__ = ()
     _field_map = {1: 'nid', 2:'pid'}
     _properties = ['faces']
 
@@ -222,6 +223,7 @@ class CHEXA8(SolidElement):
     +-------+-----+-----+----+----+----+----+----+----+
     """
     type = 'CHEXA'
+    __slots__ = ('eid', 'pid', 'nodes', 'pid_ref', 'nodes_ref')
     def write_card(self, size: int=8, is_double: bool=False) -> str:
         data = [self.eid, self.Pid()] + self.node_ids
         msg = ('CHEXA   %8i%8i%8i%8i%8i%8i%8i%8i\n'
@@ -535,6 +537,7 @@ class CHEXA20(SolidElement):
     +-------+-----+-----+-----+-----+-----+-----+-----+-----+
     """
     type = 'CHEXA'
+    __slots__ = ('eid', 'pid', 'nodes', 'pid_ref', 'nodes_ref')
     def write_card(self, size: int=8, is_double: bool=False) -> str:
         nodes = self.node_ids
         nodes2 = ['' if node is None else '%8i' % node for node in nodes[8:]]
@@ -846,6 +849,7 @@ class CPENTA6(SolidElement):
       C = (c1-c2)/2
     """
     type = 'CPENTA'
+    __slots__ = ('eid', 'pid', 'nodes', 'pid_ref', 'nodes_ref')
     def write_card(self, size: int=8, is_double: bool=False) -> str:
         nodes = self.node_ids
         data = [self.eid, self.Pid()] + nodes
@@ -1276,6 +1280,7 @@ class CPENTA15(SolidElement):
     +---------+-----+-----+----+-----+-----+-----+-----+-----+
     """
     type = 'CPENTA'
+    __slots__ = ('eid', 'pid', 'nodes', 'pid_ref', 'nodes_ref')
     def __init__(self, eid, pid, nids, comment=''):
         """
         Creates a CPENTA15
@@ -1514,6 +1519,7 @@ class CPYRAM5(SolidElement):
     +--------+-----+-----+-----+-----+-----+-----+-----+
     """
     type = 'CPYRAM'
+    __slots__ = ('eid', 'pid', 'nodes', 'pid_ref', 'nodes_ref')
     def __init__(self, eid, pid, nids, comment=''):
         SolidElement.__init__(self)
 
@@ -1706,6 +1712,7 @@ class CPYRAM13(SolidElement):
     +--------+-----+-----+-----+-----+-----+-----+-----+-----+
     """
     type = 'CPYRAM'
+    __slots__ = ('eid', 'pid', 'nodes', 'pid_ref', 'nodes_ref')
     def __init__(self, eid, pid, nids, comment=''):
         SolidElement.__init__(self)
 
@@ -1919,6 +1926,7 @@ class CTETRA4(SolidElement):
     +--------+-----+-----+----+----+----+----+
     """
     type = 'CTETRA'
+    __slots__ = ('eid', 'pid', 'nodes', 'pid_ref', 'nodes_ref')
     @property
     def faces(self):
         """
@@ -2214,6 +2222,7 @@ class CTETRA10(SolidElement):
     +--------+-----+-----+-----+-----+-----+----+-----+-----+
     """
     type = 'CTETRA'
+    __slots__ = ('eid', 'pid', 'nodes', 'pid_ref', 'nodes_ref')
     def write_card(self, size: int=8, is_double: bool=False) -> str:
         nodes = self.node_ids
         nodes2 = ['' if node is None else '%8i' % node for node in nodes[4:]]
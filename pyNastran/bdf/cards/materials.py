@@ -50,6 +50,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 class IsotropicMaterial(Material):
     """Isotropic Material Class"""
+    __slots__ = ()
+
     def __init__(self):
         Material.__init__(self)
 
@@ -370,6 +372,8 @@ class MAT1(IsotropicMaterial):
 
     """
     type = 'MAT1'
+    __slots__ = ('mid', 'e', 'g', 'nu', 'rho', 'a', 'tref', 'ge', 'St', 'Sc', 'Ss',
+                 'mcsid', 'mats1_ref', 'matt1_ref')
     _field_map = {
         1: 'mid', 2:'e', 3:'g', 4:'nu', 5: 'rho', 6:'a', 7:'tref', 8:'ge',
         9: 'St', 10:'Sc', 11:'Ss', 12:'mcsid',
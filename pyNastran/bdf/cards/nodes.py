@@ -1011,6 +1011,8 @@ class GRID(BaseCard):
 
     """
     type = 'GRID'
+    __slots__ = ('nid', 'xyz', 'cp', 'cd', 'ps', 'seid', 'cp_ref', 'cd_ref', 'ps_ref',
+                 'seid_ref', 'elements_ref')
 
     #: allows the get_field method and update_field methods to be used
     _field_map = {1: 'nid', 2:'cp', 6:'cd', 7:'ps', 8:'seid'}
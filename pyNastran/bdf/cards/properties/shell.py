@@ -2004,6 +2004,8 @@ class PSHELL(Property):
     +--------+-------+------+--------+------+----------+------+------+---------+
     """
     type = 'PSHELL'
+    __slots__ = ('pid', 'mid1', 'mid2', 'mid3', 'mid4', 't', 'twelveIt3', 'tst', 'nsm',
+                 'z1', 'z2', 'mid1_ref', 'mid2_ref', 'mid3_ref', 'mid4_ref')
     _field_map = {
         1: 'pid', 2:'mid1', 3:'t', 4:'mid2', 5:'twelveIt3', 6:'mid3',
         7: 'tst', 8:'nsm',
@@ -1,7 +1,11 @@
+import copy
+import pickle
 import unittest
+from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.cards.collpase_card import collapse_thru_by
 from pyNastran.bdf.bdf_interface.subcase_utils import expand_thru_case_control
 from pyNastran.bdf.cards.expand_card import expand_thru, expand_thru_by
+from pyNastran.bdf.test.benchmark_memory import CARD_MAKERS, get_card_footprints
 
 
 class TestBaseCard(unittest.TestCase):
@@ -151,5 +155,47 @@ class TestBaseCard(unittest.TestCase):
         self.assertEqual(collapse_thru_by(data), expected, collapse_thru_by(data))
 
 
+    def test_slots(self):
+        """tests the cards with __slots__ don't have a __dict__"""
+        footprints = get_card_footprints(ncards=10)
+        for card_type, footprint in footprints.items():
+            assert footprint['bytes_per_card'] > 0., (card_type, footprint)
+            assert footprint['has_dict'] is False, (card_type, footprint)
+
+        model = BDF(debug=None)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.])
+        model.add_grid(4, [0., 1., 0.])
+        cquad4 = model.add_cquad4(10, 100, [1, 2, 3, 4], comment='cquad4')
+        model.add_pshell(100, mid1=1000, t=0.1)
+        model.add_mat1(1000, 3.0e7, None, 0.3)
+        model.cross_reference()
+        with self.assertRaises(AttributeError):
+            cquad4.bad_attribute = 1.0
+
+        cquad4.update_field(2, 100)
+        assert cquad4.get_field(2) == 100
+        assert cquad4.comment == '$cquad4\n', repr(cquad4.comment)
+        cquad4_copy = copy.deepcopy(cquad4)
+        assert cquad4_copy.raw_fields() == cquad4.raw_fields()
+
+        for card_type, make_card in CARD_MAKERS.items():
+            card = make_card(1)
+            card.comment = 'comment'
+            card2 = pickle.loads(pickle.dumps(card))
+            assert card2.write_card() == card.write_card(), card_type
+
+        # the cross-referenced objects are pickled as well
+        cquad4_pickled = pickle.loads(pickle.dumps(cquad4))
+        assert cquad4_pickled.nodes_ref[0].nid == 1
+        assert cquad4_pickled.pid_ref.mid1_ref.mid == 1000
+
+        # the slotted cards have no __dict__, so the error message can't use it
+        cquad4_copy.nodes = None
+        with self.assertRaises(AssertionError):
+            cquad4_copy.node_ids
+
+
 if __name__ == '__main__':   # pragma: no cover
     unittest.main()
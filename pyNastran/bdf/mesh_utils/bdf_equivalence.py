@@ -7,9 +7,16 @@ defines:
                                   remove_collapsed_elements=False,
                                   avoid_collapsed_elements=False,
                                   crash_on_collapse=False, log=None, debug=True)
+    nid_pairs = find_equivalence_pairs(nids, xyz, tol, nodes_per_block=500000,
+                                       workers=-1)
+    nids, nids_kept = get_equivalence_map(nid_pairs)
+    nids, nids_kept = get_equivalence_map_from_file(bdf_filename, tol)
 
 """
-from itertools import combinations
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from itertools import combinations, product
 from typing import List, Tuple, Dict, Union, Optional, Any
 import numpy as np
 from numpy import (array, unique, arange, searchsorted,
@@ -17,12 +24,19 @@ from numpy import (array, unique, arange, searchsorted,
 from numpy.linalg import norm  # type: ignore
 import scipy
 import scipy.spatial
+from cpylog import get_logger2
 
 from pyNastran.nptyping import NDArrayNint, NDArrayN3float
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_interface.iter_cards import iter_bdf_cards
+from pyNastran.bdf.bdf_interface.bulk_arrays import _to_float
 from pyNastran.bdf.mesh_utils.internal_utils import get_bdf_model
 
+#: the neighboring blocks of a block (the block itself isn't included)
+BLOCK_OFFSETS = np.array([offset for offset in product([-1, 0, 1], repeat=3)
+                          if offset != (0, 0, 0)], dtype='int64')
+
 
 def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
                           renumber_nodes: bool=False, neq_max: int=4, xref: bool=True,
@@ -31,7 +45,8 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
                           remove_collapsed_elements: bool=False,
                           avoid_collapsed_elements: bool=False,
                           crash_on_collapse: bool=False,
-                          log=None, debug: bool=True, method: str='new'):
+                          log=None, debug: bool=True, method: str='new',
+                          nodes_per_block: int=500000, workers: int=-1):
     """
     Equivalences nodes; keeps the lower node id; creates two nodes with the same
 
@@ -77,6 +92,13 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
     method: str; default='new'
         'new': doesn't require neq_max; new in v1.3
         'old': use neq_max; used in v1.2
+        'blocked': splits the nodes into blocks that are equivalenced
+                   in parallel and merges chains of nodes (A-B, B-C)
+                   into the lowest node id; for large models
+    nodes_per_block : int; default=500000
+        the approximate number of nodes in a block (method='blocked')
+    workers : int; default=-1
+        the number of threads (-1 is all the cores; method='blocked')
     log : logger(); default=None
         bdf logging
 
@@ -100,10 +122,17 @@ def bdf_equivalence_nodes(bdf_filename: str, bdf_filename_out: str, tol: float,
         bdf_filename, tol, renumber_nodes=renumber_nodes,
         xref=xref, node_set=node_set, log=log, debug=debug)
 
-    nid_pairs = _nodes_xyz_nids_to_nid_pairs(
-        nodes_xyz, nids, tol, log, inew,
-        node_set=node_set, neq_max=neq_max, method=method, debug=debug)
-    _eq_nodes_final(nid_pairs, model, tol, node_set=node_set, debug=debug)
+    if method == 'blocked':
+        nid_pairs = find_equivalence_pairs(
+            nids, nodes_xyz, tol, nodes_per_block=nodes_per_block,
+            workers=workers, log=model.log)
+        nids_removed, nids_kept = get_equivalence_map(nid_pairs)
+        _eq_nodes_final_map(model, nids_removed, nids_kept)
+    else:
+        nid_pairs = _nodes_xyz_nids_to_nid_pairs(
+            nodes_xyz, nids, tol, log, inew,
+            node_set=node_set, neq_max=neq_max, method=method, debug=debug)
+        _eq_nodes_final(nid_pairs, model, tol, node_set=node_set, debug=debug)
 
     if bdf_filename_out is not None:
         model.write_bdf(bdf_filename_out, size=size, is_double=is_double)
@@ -156,7 +185,7 @@ def _eq_nodes_setup(bdf_filename, unused_tol,
 def _get_xyz_cid0(model, nids):
     """gets xyz_cid0"""
     coord_ids = model.coord_ids
-    needs_get_position = (coord_ids == [0])
+    needs_get_position = (coord_ids != [0])
 
     if needs_get_position:
         nodes_xyz = array([model.nodes[nid].get_position()
@@ -331,6 +360,445 @@ def _eq_nodes_final(nid_pairs, model: BDF, tol: float,
         #skip_nodes.append(nid2)
     return
 
+def _eq_nodes_final_map(model: BDF, nids_removed: NDArrayNint,
+                        nids_kept: NDArrayNint) -> None:
+    """apply nodal equivalencing to model from ``get_equivalence_map``"""
+    for nid, nid_kept in zip(nids_removed.tolist(), nids_kept.tolist()):
+        node = model.nodes[nid]
+        node_kept = model.nodes[nid_kept]
+        node.nid = node_kept.nid
+        node.xyz = node_kept.xyz
+        node.cp = node_kept.cp
+        node.cp_ref = node_kept.cp_ref
+        assert node.cd == node_kept.cd
+        assert node.ps == node_kept.ps
+        assert node.seid == node_kept.seid
+
+
+def find_equivalence_pairs(nids: NDArrayNint, xyz: NDArrayN3float, tol: float,
+                           nodes_per_block: int=500000, workers: int=-1,
+                           chunk_size: int=1000000, log=None) -> NDArrayNint:
+    """
+    Finds the pairs of nodes that are within the tolerance
+
+    The nodes are hashed into blocks (voxels) and each block is searched
+    with its own kdtree, so the memory is set by the block size instead of
+    the number of nodes.  The nodes that are within tol of a neighboring
+    block are also added to that block, so the pairs that cross a block
+    boundary are found once.
+
+    Parameters
+    ----------
+    nids : (nnodes, ) int ndarray
+        the node ids
+    xyz : (nnodes, 3) float ndarray
+        the locations of the nodes in the global frame; may be a
+        np.memmap, which is read one chunk/block at a time
+    tol : float
+        the spherical equivalence tolerance
+    nodes_per_block : int; default=500000
+        the approximate number of nodes in a block
+    workers : int; default=-1
+        the number of threads used to search the blocks
+        (-1 is all the cores)
+    chunk_size : int; default=1000000
+        the number of nodes that are hashed at a time
+    log : logger(); default=None
+        a logger
+
+    Returns
+    -------
+    nid_pairs : (npairs, 2) int ndarray
+        the node ids that are within tol (nid1 < nid2)
+
+    """
+    log = get_logger2(log=log, debug=False)
+    nnodes = len(nids)
+    if nnodes < 2:
+        return np.zeros((0, 2), dtype=np.asarray(nids).dtype)
+    tol = float(tol)
+
+    xyz_min, xyz_max = _get_bounds(xyz, chunk_size)
+    block_size = _get_block_size(xyz_max - xyz_min, nnodes, tol, nodes_per_block)
+    nblocks_xyz = np.floor((xyz_max - xyz_min) / block_size).astype('int64') + 1
+    block_ids, inodes, is_owned = _get_block_ids(
+        xyz, xyz_min, block_size, nblocks_xyz, tol, chunk_size)
+
+    isort = np.argsort(block_ids, kind='stable')
+    block_ids = block_ids[isort]
+    inodes = inodes[isort]
+    is_owned = is_owned[isort]
+    del isort
+    unused_block_ids, istart = np.unique(block_ids, return_index=True)
+    del block_ids
+    istop = np.hstack([istart[1:], len(inodes)])
+    blocks = [(i0, i1) for i0, i1 in zip(istart.tolist(), istop.tolist()) if i1 - i0 > 1]
+    log.debug('equivalencing %i nodes in %i blocks (block_size=%g)' % (
+        nnodes, len(blocks), block_size))
+
+    def _find_block_pairs(block: Tuple[int, int]) -> np.ndarray:
+        """finds the pairs in a block as node indices"""
+        i0, i1 = block
+        inode = inodes[i0:i1]
+        kdt = scipy.spatial.cKDTree(np.asarray(xyz[inode], dtype='float64'))
+        pairs = kdt.query_pairs(tol, output_type='ndarray')
+        if len(pairs) == 0:
+            return np.zeros((0, 2), dtype='int64')
+
+        # a pair is kept by the block that owns the lower node
+        ipair = inode[pairs]
+        jlocal = np.where(ipair[:, 0] < ipair[:, 1], pairs[:, 0], pairs[:, 1])
+        ipair.sort(axis=1)
+        return ipair[is_owned[i0:i1][jlocal]]
+
+    if workers == -1:
+        workers = os.cpu_count()
+    if workers > 1 and len(blocks) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            ipairs = list(executor.map(_find_block_pairs, blocks))
+    else:
+        ipairs = [_find_block_pairs(block) for block in blocks]
+
+    if not ipairs:
+        return np.zeros((0, 2), dtype=np.asarray(nids[:1]).dtype)
+    ipairs = np.vstack(ipairs)
+    nid_pairs = np.asarray(nids[ipairs.ravel()]).reshape(ipairs.shape)
+    nid_pairs.sort(axis=1)
+    return nid_pairs
+
+
+def _get_bounds(xyz: NDArrayN3float,
+                chunk_size: int) -> Tuple[NDArrayN3float, NDArrayN3float]:
+    """gets the min/max xyz one chunk at a time"""
+    xyz_min = np.full(3, np.inf)
+    xyz_max = np.full(3, -np.inf)
+    for i0 in range(0, len(xyz), chunk_size):
+        xyzi = xyz[i0:i0 + chunk_size]
+        xyz_min = np.minimum(xyz_min, xyzi.min(axis=0))
+        xyz_max = np.maximum(xyz_max, xyzi.max(axis=0))
+    return xyz_min, xyz_max
+
+
+def _get_block_size(dxyz: NDArrayN3float, nnodes: int, tol: float,
+                    nodes_per_block: int) -> float:
+    """
+    Gets the size of a block, so there are ~nnodes/nodes_per_block
+    blocks (assuming the nodes are evenly distributed)
+
+    A flat model (e.g., a shell panel) has one block through the thickness.
+    The block must be larger than 2*tol, so a node is only added to the
+    neighboring blocks.
+    """
+    nblocks = max(nnodes / nodes_per_block, 1.)
+    min_size = 4. * tol
+    size_lower = min_size
+    size_upper = max(dxyz.max(), min_size) * 1.01
+    if size_upper <= 0.:
+        # all the nodes are at the same location
+        return 1.
+    for unused_i in range(50):
+        size = (size_lower + size_upper) / 2.
+        if np.prod(np.floor(dxyz / size) + 1) > nblocks:
+            size_lower = size
+        else:
+            size_upper = size
+    return max(size_upper, min_size)
+
+
+def _get_block_ids(xyz: NDArrayN3float, xyz_min: NDArrayN3float, block_size: float,
+                   nblocks_xyz: NDArrayNint, tol: float,
+                   chunk_size: int) -> Tuple[NDArrayNint, NDArrayNint, np.ndarray]:
+    """
+    Hashes the nodes into blocks
+
+    Returns
+    -------
+    block_ids : (n, ) int ndarray
+        the block of each entry
+    inodes : (n, ) int ndarray
+        the node index of each entry
+    is_owned : (n, ) bool ndarray
+        is the node in the block (True) or within tol of the block (False)
+
+    """
+    nblocks_max = nblocks_xyz - 1
+    block_ids = []
+    inodes = []
+    is_owned = []
+    for i0 in range(0, len(xyz), chunk_size):
+        xyzi = np.asarray(xyz[i0:i0 + chunk_size], dtype='float64') - xyz_min
+        inode = np.arange(i0, i0 + len(xyzi), dtype='int64')
+        ijk = np.floor(xyzi / block_size).astype('int64')
+        np.minimum(ijk, nblocks_max, out=ijk)
+        block_ids.append(_get_block_id(ijk, nblocks_xyz))
+        inodes.append(inode)
+        is_owned.append(np.ones(len(inode), dtype='bool'))
+
+        # the nodes that are within tol of a neighboring block
+        is_lower = np.floor((xyzi - tol) / block_size).astype('int64') < ijk
+        is_upper = np.minimum(np.floor((xyzi + tol) / block_size).astype('int64'),
+                              nblocks_max) > ijk
+        is_lower[ijk == 0] = False
+        ihalo = np.where((is_lower | is_upper).any(axis=1))[0]
+        if len(ihalo) == 0:
+            continue
+        ijk = ijk[ihalo]
+        is_lower = is_lower[ihalo]
+        is_upper = is_upper[ihalo]
+        for offset in BLOCK_OFFSETS:
+            is_neighbor = np.ones(len(ihalo), dtype='bool')
+            for iaxis, ioffset in enumerate(offset):
+                if ioffset == -1:
+                    is_neighbor &= is_lower[:, iaxis]
+                elif ioffset == 1:
+                    is_neighbor &= is_upper[:, iaxis]
+            if not is_neighbor.any():
+                continue
+            block_ids.append(_get_block_id(ijk[is_neighbor] + offset, nblocks_xyz))
+            inodes.append(inode[ihalo[is_neighbor]])
+            is_owned.append(np.zeros(is_neighbor.sum(), dtype='bool'))
+    return np.hstack(block_ids), np.hstack(inodes), np.hstack(is_owned)
+
+
+def _get_block_id(ijk: NDArrayNint, nblocks_xyz: NDArrayNint) -> NDArrayNint:
+    """gets the block id from the block index in x, y, z"""
+    return (ijk[:, 0] * nblocks_xyz[1] + ijk[:, 1]) * nblocks_xyz[2] + ijk[:, 2]
+
+
+def get_equivalence_map(nid_pairs: NDArrayNint) -> Tuple[NDArrayNint, NDArrayNint]:
+    """
+    Merges the pairs of equivalent nodes into groups with a union-find,
+    so a chain of nodes (A-B, B-C) is kept as the lowest node id even if
+    A and C aren't within the tolerance
+
+    Parameters
+    ----------
+    nid_pairs : (npairs, 2) int ndarray
+        the node ids that are within the tolerance
+        (see ``find_equivalence_pairs``)
+
+    Returns
+    -------
+    nids_removed : (n, ) int ndarray
+        the node ids that are equivalenced (sorted)
+    nids_kept : (n, ) int ndarray
+        the node id that replaces nids_removed
+
+    """
+    nid_pairs = np.asarray(nid_pairs).reshape(-1, 2)
+    if len(nid_pairs) == 0:
+        return nid_pairs[:, 0].copy(), nid_pairs[:, 1].copy()
+
+    # the indices are sorted by node id, so the lowest index is the lowest node id
+    nids, ipairs = np.unique(nid_pairs, return_inverse=True)
+    ipairs = ipairs.reshape(-1, 2)
+    i, j = ipairs[:, 0], ipairs[:, 1]
+    parent = np.arange(len(nids))
+    while True:
+        root_i = parent[i]
+        root_j = parent[j]
+        is_diff = root_i != root_j
+        if not is_diff.any():
+            break
+        # the larger root points to the smaller root
+        np.minimum.at(parent,
+                      np.maximum(root_i[is_diff], root_j[is_diff]),
+                      np.minimum(root_i[is_diff], root_j[is_diff]))
+        # path compression
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    is_removed = parent != np.arange(len(nids))
+    return nids[is_removed], nids[parent[is_removed]]
+
+
+def get_equivalence_map_from_file(bdf_filename: str, tol: float,
+                                  scratch_dirname: Optional[str]=None,
+                                  nodes_per_block: int=500000, workers: int=-1,
+                                  punch: bool=False, encoding: Optional[str]=None,
+                                  log=None, debug: bool=False,
+                                  ) -> Tuple[NDArrayNint, NDArrayNint]:
+    """
+    Gets the node equivalencing of a deck without loading it, so it
+    works on decks that are too large to fit in memory as a BDF
+
+    The GRIDs are streamed from the deck (see ``iter_bdf_cards``) to
+    memory mapped files in scratch_dirname, which are searched one block
+    at a time (see ``find_equivalence_pairs``).
+
+    Parameters
+    ----------
+    bdf_filename : str
+        the BDF to read
+    tol : float
+        the spherical equivalence tolerance
+    scratch_dirname : str; default=None -> the temp directory
+        the directory for the node id/location files
+    nodes_per_block : int; default=500000
+        the approximate number of nodes in a block
+    workers : int; default=-1
+        the number of threads (-1 is all the cores)
+    punch : bool; default=False
+        True : no executive/case control decks
+    encoding : str; default=None -> system default
+        the unicode encoding
+    log : logger(); default=None
+        a logger
+    debug : bool; default=False
+        used to set the logger if no logger is passed in
+
+    Returns
+    -------
+    nids_removed : (n, ) int ndarray
+        the node ids that are equivalenced (sorted)
+    nids_kept : (n, ) int ndarray
+        the node id that replaces nids_removed
+
+    .. code-block:: python
+
+       >>> nids_removed, nids_kept = get_equivalence_map_from_file(bdf_filename, 0.01)
+       >>> nid_map = dict(zip(nids_removed, nids_kept))
+
+    .. note:: replicated (=) GRIDs aren't supported
+
+    """
+    log = get_logger2(log=log, debug=debug)
+    with tempfile.TemporaryDirectory(dir=scratch_dirname) as dirname:
+        nids, xyz = _stream_grids(bdf_filename, dirname, punch=punch,
+                                  encoding=encoding, log=log)
+        nid_pairs = find_equivalence_pairs(
+            nids, xyz, tol, nodes_per_block=nodes_per_block, workers=workers, log=log)
+        # close the memory mapped files before they're deleted
+        del nids, xyz
+    return get_equivalence_map(nid_pairs)
+
+
+def _stream_grids(bdf_filename: str, dirname: str,
+                  punch: bool=False, encoding: Optional[str]=None, log=None,
+                  chunk_size: int=100000) -> Tuple[np.memmap, np.memmap]:
+    """
+    Writes the GRID ids/locations in the global frame to memory mapped
+    files, so only a chunk of the nodes is in memory
+
+    Returns
+    -------
+    nids : (nnodes, ) int64 memmap
+        the node ids
+    xyz : (nnodes, 3) float64 memmap
+        the node locations in the global frame
+
+    """
+    nid_filename = os.path.join(dirname, 'nids.bin')
+    cp_filename = os.path.join(dirname, 'cps.bin')
+    xyz_filename = os.path.join(dirname, 'xyz.bin')
+    coord_model = BDF(log=log)
+    coord_cards = {'CORD1R', 'CORD1C', 'CORD1S', 'CORD2R', 'CORD2C', 'CORD2S'}
+    cord1_cards = []  # type: List[Tuple[str, List[Optional[str]]]]
+
+    nnodes = 0
+    with open(nid_filename, 'wb') as nid_file, open(cp_filename, 'wb') as cp_file, \
+            open(xyz_filename, 'wb') as xyz_file:
+        chunk = []
+        cards = iter_bdf_cards(bdf_filename, card_names=['GRID'] + sorted(coord_cards),
+                               punch=punch, encoding=encoding, log=log)
+        for card_name, fields, unused_comment, unused_ifile, unused_iline in cards:
+            if card_name in coord_cards:
+                if card_name.startswith('CORD1'):
+                    # the GRIDs of a CORD1x may be after it, so it's added
+                    # once every GRID has been streamed
+                    cord1_cards.append((card_name, fields))
+                else:
+                    coord_model.add_card(fields, card_name)
+                continue
+            fields = fields + [None] * (6 - len(fields))
+            cp = fields[2]
+            chunk.append((
+                int(fields[1]), 0 if cp is None else int(cp),
+                0. if fields[3] is None else _to_float(fields[3]),
+                0. if fields[4] is None else _to_float(fields[4]),
+                0. if fields[5] is None else _to_float(fields[5]),
+            ))
+            if len(chunk) == chunk_size:
+                nnodes += _write_grid_chunk(chunk, nid_file, cp_file, xyz_file)
+                chunk = []
+        nnodes += _write_grid_chunk(chunk, nid_file, cp_file, xyz_file)
+
+    if nnodes == 0:
+        raise RuntimeError('there are no GRIDs in %s' % bdf_filename)
+    nids = np.memmap(nid_filename, dtype='int64', mode='r', shape=(nnodes, ))
+    xyz = np.memmap(xyz_filename, dtype='float64', mode='r+', shape=(nnodes, 3))
+    cps = np.memmap(cp_filename, dtype='int32', mode='r', shape=(nnodes, ))
+    if cord1_cards:
+        _add_cord1_cards(coord_model, cord1_cards, nids, cps, xyz, chunk_size)
+    if coord_model.coords.keys() - {0}:
+        coord_model._cross_reference_nodes()
+        coord_model._cross_reference_coordinates()
+        for i0 in range(0, nnodes, chunk_size):
+            cpi = np.asarray(cps[i0:i0 + chunk_size])
+            for cp in np.unique(cpi).tolist():
+                if cp == 0:
+                    continue
+                coord = coord_model.coords[cp]
+                irows = np.where(cpi == cp)[0] + i0
+                xyz[irows] = coord.transform_vector_to_global_array(xyz[irows]) + coord.origin
+        xyz.flush()
+    del cps
+    return nids, xyz
+
+
+def _add_cord1_cards(coord_model: BDF, cord1_cards: List[Tuple[str, List[Optional[str]]]],
+                     nids: np.memmap, cps: np.memmap, xyz: np.memmap,
+                     chunk_size: int) -> None:
+    """
+    Adds the CORD1x cards and the GRIDs that define them (in their
+    local frame) to the coordinate model
+
+    Parameters
+    ----------
+    coord_model : BDF
+        the model with the coordinate systems
+    cord1_cards : List[(card_name, fields)]
+        the CORD1R/CORD1C/CORD1S cards
+    nids / cps / xyz : memmap
+        the streamed GRID ids, output coordinate systems and locations
+    chunk_size : int
+        the number of GRIDs that are searched at a time
+
+    """
+    # a CORD1x card defines 1 or 2 coordinate systems: cid, g1, g2, g3
+    cord1_nids = set()
+    for unused_card_name, fields in cord1_cards:
+        for i in (2, 3, 4, 6, 7, 8):
+            if i < len(fields) and fields[i] not in (None, ''):
+                cord1_nids.add(int(fields[i]))
+    cord1_nids_array = np.array(sorted(cord1_nids), dtype='int64')
+
+    nnodes = len(nids)
+    for i0 in range(0, nnodes, chunk_size):
+        nidsi = np.asarray(nids[i0:i0 + chunk_size])
+        irows = np.where(np.isin(nidsi, cord1_nids_array))[0]
+        for irow in irows.tolist():
+            coord_model.add_grid(int(nidsi[irow]), np.array(xyz[i0 + irow]),
+                                 cp=int(cps[i0 + irow]))
+
+    for card_name, fields in cord1_cards:
+        coord_model.add_card(fields, card_name)
+
+
+def _write_grid_chunk(chunk: List[Tuple[int, int, float, float, float]],
+                      nid_file: Any, cp_file: Any, xyz_file: Any) -> int:
+    """writes the GRID ids/cps/locations to the binary files"""
+    if not chunk:
+        return 0
+    nids, cps, x, y, z = zip(*chunk)
+    np.array(nids, dtype='int64').tofile(nid_file)
+    np.array(cps, dtype='int32').tofile(cp_file)
+    np.column_stack([x, y, z]).astype('float64').tofile(xyz_file)
+    return len(chunk)
+
 def _nodes_xyz_nids_to_nid_pairs(nodes_xyz: NDArrayN3float,
                                  nids: NDArrayNint,
                                  tol: float,
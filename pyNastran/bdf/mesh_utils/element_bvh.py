@@ -0,0 +1,816 @@
+"""
+defines:
+ - bvh = get_element_bvh(model, etypes=None, leaf_size=4, check=True)
+ - clear_element_bvh(model)
+ - ElementBVH
+    - iray, eids, xyz, t = bvh.pierce_all(xyz, directions, tmin=0., tmax=np.inf)
+    - eids, xyz, t = bvh.pierce(xyz, directions, tmin=0., tmax=np.inf, select='min')
+    - eids, xyz, distance = bvh.nearest_element(xyz, max_distance=np.inf)
+    - ibox, eids = bvh.query_box(xyz_min, xyz_max)
+    - iplane, eids = bvh.intersect_plane(origins, normals, tol=0.)
+
+The bounding volume hierarchy (BVH) is built over the element faces, which
+are split into triangles.  The triangles are sorted along a Morton
+(z-order) curve and grouped into leaves of ``leaf_size`` triangles, which
+are the bottom of a complete binary tree of axis aligned bounding boxes.
+
+The queries are vectorized over the points/rays/boxes/planes, so the tree
+is traversed one level at a time for all the queries and the exact tests
+(e.g., ray-triangle) are only done on the triangles in the leaves that
+weren't culled.
+
+The BVH is cached on the model by ``get_element_bvh`` and is rebuilt when
+the nodes move or an element is added/removed.
+
+"""
+from __future__ import annotations
+import weakref
+from typing import Tuple, List, Optional, TYPE_CHECKING
+import numpy as np
+from pyNastran.bdf.mesh_utils.bdf_equivalence import _get_tree
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the corner node indices of the faces of each element type
+FACES = {
+    'CTRIA3': [(0, 1, 2)],
+    'CTRIA6': [(0, 1, 2)],
+    'CTRIAR': [(0, 1, 2)],
+    'CQUAD4': [(0, 1, 2, 3)],
+    'CQUAD8': [(0, 1, 2, 3)],
+    'CQUADR': [(0, 1, 2, 3)],
+    'CQUAD': [(0, 1, 2, 3)],
+    'CSHEAR': [(0, 1, 2, 3)],
+    'CTETRA': [(0, 1, 2), (0, 1, 3), (1, 2, 3), (0, 2, 3)],
+    'CPYRAM': [(0, 1, 2, 3), (0, 1, 4), (1, 2, 4), (2, 3, 4), (0, 3, 4)],
+    'CPENTA': [(0, 1, 2), (3, 4, 5), (0, 1, 4, 3), (1, 2, 5, 4), (0, 2, 5, 3)],
+    'CHEXA': [(0, 1, 2, 3), (4, 5, 6, 7), (0, 1, 5, 4),
+              (1, 2, 6, 5), (2, 3, 7, 6), (0, 3, 7, 4)],
+}
+#: the number of corner nodes of each element type
+NCORNERS = {etype: max(max(face) for face in faces) + 1
+            for etype, faces in FACES.items()}
+
+#: the number of queries that are traversed at once (limits the memory)
+CHUNK_SIZE = 50000
+
+#: model -> {(etypes, leaf_size) : ElementBVH}
+_BVH_CACHE = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+
+
+def get_element_bvh(model: BDF, etypes: Optional[List[str]]=None,
+                    leaf_size: int=4, check: bool=True) -> ElementBVH:
+    """
+    Gets the cached bounding volume hierarchy of the element faces
+
+    Parameters
+    ----------
+    model : BDF()
+        the model
+    etypes : List[str]; default=None -> all the shells and solids
+        the element types to consider (e.g., ['CQUAD4', 'CTRIA3'])
+    leaf_size : int; default=4
+        the number of triangles in a leaf
+    check : bool; default=True
+        checks that the nodes haven't moved and the element ids haven't
+        changed since the BVH was built and rebuilds it if they have;
+        False is faster if you know the model hasn't changed
+
+    Returns
+    -------
+    bvh : ElementBVH
+        the bounding volume hierarchy
+
+    .. note:: changing the nodes of an element isn't checked, so call
+              ``clear_element_bvh(model)`` after changing an element
+
+    """
+    key = (None if etypes is None else tuple(sorted(etypes)), leaf_size)
+    cache = _BVH_CACHE.setdefault(model, {})
+    bvh = cache.get(key)
+    if bvh is not None and (not check or bvh.is_valid(model)):
+        return bvh
+
+    bvh = ElementBVH.from_model(model, etypes=etypes, leaf_size=leaf_size)
+    cache[key] = bvh
+    return bvh
+
+
+def clear_element_bvh(model: BDF) -> None:
+    """removes the cached bounding volume hierarchies of the model"""
+    _BVH_CACHE.pop(model, None)
+
+
+class ElementBVH:
+    """
+    A bounding volume hierarchy of the element faces
+    (see ``get_element_bvh``)
+    """
+    def __init__(self, eids: np.ndarray, tri_ielem: np.ndarray, tri_inode: np.ndarray,
+                 nids: np.ndarray, xyz: np.ndarray, leaf_size: int=4):
+        """
+        Builds the bounding volume hierarchy
+
+        Parameters
+        ----------
+        eids : (nelements, ) int ndarray
+            the sorted element ids
+        tri_ielem : (ntri, ) int ndarray
+            the index of the element of each triangle
+        tri_inode : (ntri, 3) int ndarray
+            the index of the nodes of each triangle
+        nids : (nnodes, ) int ndarray
+            the sorted node ids
+        xyz : (nnodes, 3) float ndarray
+            the node locations in the global frame
+        leaf_size : int; default=4
+            the number of triangles in a leaf
+
+        """
+        assert leaf_size >= 1, leaf_size
+        self.eids = eids
+        self.tri_ielem = tri_ielem
+        self.tri_inode = tri_inode
+        self.nids = nids
+        self.xyz = xyz
+        self.leaf_size = leaf_size
+
+        #: used to check if the model has changed
+        self._model_eids = None  # type: Optional[np.ndarray]
+        self._inode_used = np.unique(tri_inode)
+
+        self.leaf_tris = np.zeros((0, leaf_size), dtype='int32')
+        self.box_min = np.zeros((0, 3), dtype='float64')
+        self.box_max = np.zeros((0, 3), dtype='float64')
+        self.is_empty = np.zeros(0, dtype='bool')
+        self.nlevels = 0
+        self._centroid_tree = None
+        self._build()
+
+    @classmethod
+    def from_model(cls, model: BDF, etypes: Optional[List[str]]=None,
+                   leaf_size: int=4) -> ElementBVH:
+        """
+        Builds a bounding volume hierarchy of the element faces
+
+        Parameters
+        ----------
+        model : BDF()
+            the model
+        etypes : List[str]; default=None -> all the shells and solids
+            the element types to consider (e.g., ['CQUAD4', 'CTRIA3'])
+        leaf_size : int; default=4
+            the number of triangles in a leaf
+
+        """
+        if etypes is None:
+            etypes = list(FACES)
+        for etype in etypes:
+            if etype not in FACES:
+                raise NotImplementedError('etype=%r is not supported; etypes=%s' % (
+                    etype, list(FACES)))
+
+        nids, xyz = _get_nids_xyz(model)
+        eids_by_type = {etype: [] for etype in etypes}
+        nodes_by_type = {etype: [] for etype in etypes}
+        for eid, elem in model.elements.items():
+            etype = elem.type
+            if etype in eids_by_type:
+                eids_by_type[etype].append(eid)
+                nodes_by_type[etype].append(elem.node_ids[:NCORNERS[etype]])
+
+        idtype = nids.dtype
+        eids_list = []
+        tri_ielem_list = []
+        tri_nodes_list = []
+        ielem0 = 0
+        for etype in etypes:
+            eids = eids_by_type[etype]
+            if not eids:
+                continue
+            nelements = len(eids)
+            elem_nodes = np.array(nodes_by_type[etype], dtype=idtype)
+            ielem = np.arange(ielem0, ielem0 + nelements)
+            eids_list.append(np.array(eids, dtype=idtype))
+            for face in FACES[etype]:
+                face_nodes = elem_nodes[:, face]
+                # split the quads into 2 triangles
+                tri_ielem_list.append(ielem)
+                tri_nodes_list.append(face_nodes[:, :3])
+                if len(face) == 4:
+                    tri_ielem_list.append(ielem)
+                    tri_nodes_list.append(face_nodes[:, [0, 2, 3]])
+            ielem0 += nelements
+
+        if eids_list:
+            # sort the elements by id
+            eids = np.hstack(eids_list)
+            isort = np.argsort(eids)
+            eids = eids[isort]
+            ielem_sorted = np.empty(len(eids), dtype='int32')
+            ielem_sorted[isort] = np.arange(len(eids))
+            tri_ielem = ielem_sorted[np.hstack(tri_ielem_list)]
+            tri_nodes = np.vstack(tri_nodes_list)
+        else:
+            eids = np.zeros(0, dtype=idtype)
+            tri_ielem = np.zeros(0, dtype='int32')
+            tri_nodes = np.zeros((0, 3), dtype=idtype)
+
+        missing = np.setdiff1d(tri_nodes.ravel(), nids)
+        if len(missing):
+            raise KeyError('missing nodes=%s' % missing.tolist())
+        tri_inode = np.searchsorted(nids, tri_nodes)
+
+        bvh = ElementBVH(eids, tri_ielem, tri_inode.astype('int32'), nids, xyz,
+                         leaf_size=leaf_size)
+        bvh._model_eids = np.array(list(model.elements.keys()), dtype=idtype)
+        return bvh
+
+    @property
+    def nfaces(self) -> int:
+        """the number of triangles"""
+        return len(self.tri_ielem)
+
+    @property
+    def centroids(self) -> np.ndarray:
+        """the average of the corner nodes of each element"""
+        # the unique (element, node) pairs
+        inodes = np.unique(np.column_stack([
+            np.repeat(self.tri_ielem, 3), self.tri_inode.ravel()]), axis=0)
+        nelements = len(self.eids)
+        centroids = np.zeros((nelements, 3), dtype='float64')
+        np.add.at(centroids, inodes[:, 0], self.xyz[inodes[:, 1]])
+        ncorners = np.bincount(inodes[:, 0], minlength=nelements)
+        return centroids / ncorners[:, np.newaxis]
+
+    def is_valid(self, model: BDF) -> bool:
+        """
+        Checks that the nodes haven't moved and the element ids haven't
+        changed since the BVH was built
+        """
+        model_eids = np.array(list(model.elements.keys()), dtype=self.nids.dtype)
+        if self._model_eids is None or not np.array_equal(model_eids, self._model_eids):
+            return False
+        if len(self._inode_used) == 0:
+            return True
+        nids, xyz = _get_nids_xyz(model)
+        inode = self._inode_used
+        if len(nids) <= inode.max() or not np.array_equal(nids[inode], self.nids[inode]):
+            return False
+        return np.array_equal(xyz[inode], self.xyz[inode])
+
+    def _build(self) -> None:
+        """builds the tree"""
+        ntri = self.nfaces
+        leaf_size = self.leaf_size
+        if ntri == 0:
+            return
+        tri_xyz = self.xyz[self.tri_inode]
+        tri_min = tri_xyz.min(axis=1)
+        tri_max = tri_xyz.max(axis=1)
+
+        # sort the triangles along a Morton curve, so the triangles in a
+        # leaf are close to each other
+        centroids = tri_xyz.mean(axis=1)
+        isort = np.argsort(_morton_code(centroids), kind='stable').astype('int32')
+
+        nleaves = (ntri + leaf_size - 1) // leaf_size
+        nlevels = int(np.ceil(np.log2(nleaves))) if nleaves > 1 else 0
+        nleaves = 2 ** nlevels
+        leaf_tris = np.full(nleaves * leaf_size, -1, dtype='int32')
+        leaf_tris[:ntri] = isort
+        leaf_tris = leaf_tris.reshape(nleaves, leaf_size)
+
+        # the heap layout; node i has children 2*i+1 and 2*i+2 and the
+        # leaves are the last nleaves nodes
+        nnodes = 2 * nleaves - 1
+        box_min = np.full((nnodes, 3), np.inf, dtype='float64')
+        box_max = np.full((nnodes, 3), -np.inf, dtype='float64')
+
+        is_tri = leaf_tris >= 0
+        itri = np.where(is_tri, leaf_tris, 0)
+        leaf_min = np.where(is_tri[:, :, np.newaxis], tri_min[itri], np.inf)
+        leaf_max = np.where(is_tri[:, :, np.newaxis], tri_max[itri], -np.inf)
+        box_min[nleaves-1:] = leaf_min.min(axis=1)
+        box_max[nleaves-1:] = leaf_max.max(axis=1)
+        for level in range(nlevels - 1, -1, -1):
+            inode = np.arange(2 ** level - 1, 2 ** (level + 1) - 1)
+            box_min[inode] = np.minimum(box_min[2 * inode + 1], box_min[2 * inode + 2])
+            box_max[inode] = np.maximum(box_max[2 * inode + 1], box_max[2 * inode + 2])
+
+        self.leaf_tris = leaf_tris
+        self.box_min = box_min
+        self.box_max = box_max
+        # the padding leaves (and their parents) have no triangles
+        self.is_empty = (box_min > box_max).any(axis=1)
+        self.nlevels = nlevels
+
+    def _traverse(self, nqueries: int, box_test, **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the (query, triangle) pairs in the leaves of the boxes that
+        pass the test
+
+        Parameters
+        ----------
+        nqueries : int
+            the number of queries
+        box_test : function
+            box_test(iquery, box_min, box_max, **kwargs) -> is_hit
+            that is vectorized over the (query, box) pairs
+
+        Returns
+        -------
+        iquery : (npairs, ) int ndarray
+            the query index
+        itri : (npairs, ) int ndarray
+            the triangle index
+
+        """
+        if self.nfaces == 0 or nqueries == 0:
+            return np.zeros(0, dtype='int32'), np.zeros(0, dtype='int32')
+
+        iquery = np.arange(nqueries, dtype='int32')
+        inode = np.zeros(nqueries, dtype='int32')
+        for level in range(self.nlevels + 1):
+            is_used = ~self.is_empty[inode]
+            iquery = iquery[is_used]
+            inode = inode[is_used]
+            is_hit = box_test(iquery, self.box_min[inode], self.box_max[inode], **kwargs)
+            iquery = iquery[is_hit]
+            inode = inode[is_hit]
+            if level < self.nlevels:
+                iquery = np.repeat(iquery, 2)
+                inode = 2 * np.repeat(inode, 2) + 1
+                inode[1::2] += 1
+
+        ileaf = inode - (len(self.leaf_tris) - 1)
+        itri = self.leaf_tris[ileaf].ravel()
+        iquery = np.repeat(iquery, self.leaf_size)
+        is_tri = itri >= 0
+        return iquery[is_tri], itri[is_tri]
+
+    def _triangles(self, itri: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """gets the vertices of the triangles"""
+        inode = self.tri_inode[itri]
+        return self.xyz[inode[:, 0]], self.xyz[inode[:, 1]], self.xyz[inode[:, 2]]
+
+    def pierce_all(self, xyz: np.ndarray, directions: np.ndarray,
+                   tmin: float=0., tmax: float=np.inf,
+                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds all the element faces that are pierced by the rays
+        p = xyz + t * direction, where tmin <= t <= tmax
+
+        Parameters
+        ----------
+        xyz : (nrays, 3) float ndarray
+            the start point of the rays
+        directions : (3, ) or (nrays, 3) float ndarray
+            the direction of the rays
+        tmin / tmax : float; default=0. / inf
+            the range of the ray; use tmin=-inf for a line
+
+        Returns
+        -------
+        iray : (npierce, ) int ndarray
+            the ray index; sorted by ray and then t
+        eids : (npierce, ) int ndarray
+            the pierced element
+        xyz_pierce : (npierce, 3) float ndarray
+            the pierce point
+        t : (npierce, ) float ndarray
+            the distance along the ray in units of the direction
+
+        """
+        xyz = np.atleast_2d(np.asarray(xyz, dtype='float64'))
+        directions = np.asarray(directions, dtype='float64')
+        directions = np.broadcast_to(directions, xyz.shape)
+        irays = []
+        itris = []
+        ts = []
+        for i0, i1 in _chunks(len(xyz)):
+            origin = xyz[i0:i1]
+            direction = directions[i0:i1]
+            with np.errstate(divide='ignore'):
+                inv_direction = 1. / direction
+            iray, itri = self._traverse(
+                len(origin), _ray_box_test,
+                origin=origin, inv_direction=inv_direction, tmin=tmin, tmax=tmax)
+            v0, v1, v2 = self._triangles(itri)
+            is_hit, t = _ray_triangle(origin[iray], direction[iray], v0, v1, v2)
+            is_hit &= (t >= tmin) & (t <= tmax)
+            irays.append(iray[is_hit] + i0)
+            itris.append(itri[is_hit])
+            ts.append(t[is_hit])
+
+        iray = np.hstack(irays) if irays else np.zeros(0, dtype='int32')
+        itri = np.hstack(itris) if itris else np.zeros(0, dtype='int32')
+        t = np.hstack(ts) if ts else np.zeros(0, dtype='float64')
+        ielem = self.tri_ielem[itri]
+
+        # a quad is 2 triangles, so the ray can pierce the diagonal twice
+        isort = np.lexsort((t, ielem, iray))
+        iray = iray[isort]
+        ielem = ielem[isort]
+        t = t[isort]
+        is_unique = np.ones(len(iray), dtype='bool')
+        is_unique[1:] = (iray[1:] != iray[:-1]) | (ielem[1:] != ielem[:-1])
+        iray = iray[is_unique]
+        ielem = ielem[is_unique]
+        t = t[is_unique]
+
+        isort = np.lexsort((t, iray))
+        iray = iray[isort]
+        ielem = ielem[isort]
+        t = t[isort]
+        xyz_pierce = xyz[iray] + directions[iray] * t[:, np.newaxis]
+        return iray, self.eids[ielem], xyz_pierce, t
+
+    def pierce(self, xyz: np.ndarray, directions: np.ndarray,
+               tmin: float=0., tmax: float=np.inf,
+               select: str='min') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Pierces the element faces with the rays p = xyz + t * direction,
+        where tmin <= t <= tmax
+
+        Parameters
+        ----------
+        xyz : (nrays, 3) float ndarray
+            the start point of the rays
+        directions : (3, ) or (nrays, 3) float ndarray
+            the direction of the rays
+        tmin / tmax : float; default=0. / inf
+            the range of the ray; use tmin=-inf for a line
+        select : str; default='min'
+            'min' : the first pierce along the ray (the smallest t)
+            'max' : the last pierce along the ray (the largest t)
+
+        Returns
+        -------
+        eids : (nrays, ) int ndarray
+            the pierced element; -1 if the ray doesn't pierce an element
+        xyz_pierce : (nrays, 3) float ndarray
+            the pierce point; nan if the ray doesn't pierce an element
+        t : (nrays, ) float ndarray
+            the distance along the ray in units of the direction;
+            nan if the ray doesn't pierce an element
+
+        """
+        if select not in ['min', 'max']:
+            raise ValueError("select=%r and must be 'min' or 'max'" % select)
+        xyz = np.atleast_2d(np.asarray(xyz, dtype='float64'))
+        nrays = len(xyz)
+        iray, eids_all, xyz_all, t_all = self.pierce_all(
+            xyz, directions, tmin=tmin, tmax=tmax)
+
+        # the pierces are sorted by ray and t
+        if select == 'min':
+            ipierce = np.searchsorted(iray, np.arange(nrays), side='left')
+        else:
+            ipierce = np.searchsorted(iray, np.arange(nrays), side='right') - 1
+        ipierce = np.clip(ipierce, 0, max(len(iray) - 1, 0))
+        is_pierced = np.zeros(nrays, dtype='bool')
+        if len(iray):
+            is_pierced = iray[ipierce] == np.arange(nrays)
+
+        eids = np.full(nrays, -1, dtype=self.eids.dtype)
+        xyz_pierce = np.full((nrays, 3), np.nan, dtype='float64')
+        t = np.full(nrays, np.nan, dtype='float64')
+        ipierce = ipierce[is_pierced]
+        eids[is_pierced] = eids_all[ipierce]
+        xyz_pierce[is_pierced] = xyz_all[ipierce]
+        t[is_pierced] = t_all[ipierce]
+        return eids, xyz_pierce, t
+
+    def nearest_element(self, xyz: np.ndarray, max_distance: float=np.inf,
+                        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Finds the closest element face to the points
+
+        Parameters
+        ----------
+        xyz : (npoints, 3) float ndarray
+            the points
+        max_distance : float; default=inf
+            the max distance to search
+
+        Returns
+        -------
+        eids : (npoints, ) int ndarray
+            the closest element; -1 if there's no element within max_distance
+        xyz_closest : (npoints, 3) float ndarray
+            the closest point on the element; nan if there's no element
+        distance : (npoints, ) float ndarray
+            the distance to the element; inf if there's no element
+
+        """
+        xyz = np.atleast_2d(np.asarray(xyz, dtype='float64'))
+        npoints = len(xyz)
+        eids = np.full(npoints, -1, dtype=self.eids.dtype)
+        xyz_closest = np.full((npoints, 3), np.nan, dtype='float64')
+        distance = np.full(npoints, np.inf, dtype='float64')
+        for i0, i1 in _chunks(npoints):
+            points = xyz[i0:i1]
+            upper_bound = np.full(len(points), max_distance ** 2, dtype='float64')
+            if self.nfaces:
+                upper_bound = np.minimum(self._nearest_centroid_distance2(points), upper_bound)
+            ipoint, itri = self._traverse(
+                len(points), _nearest_box_test,
+                points=points, upper_bound=upper_bound)
+            if len(ipoint) == 0:
+                continue
+            v0, v1, v2 = self._triangles(itri)
+            closest = _closest_point_on_triangle(points[ipoint], v0, v1, v2)
+            dist2 = ((closest - points[ipoint]) ** 2).sum(axis=1)
+            dist2[np.isnan(dist2)] = np.inf
+
+            # the closest triangle of each point
+            isort = np.lexsort((dist2, ipoint))
+            ipoint = ipoint[isort]
+            is_first = np.ones(len(ipoint), dtype='bool')
+            is_first[1:] = ipoint[1:] != ipoint[:-1]
+            ifirst = isort[is_first]
+            ipoint = ipoint[is_first]
+            is_close = dist2[ifirst] <= max_distance ** 2
+            ifirst = ifirst[is_close]
+            ipoint = ipoint[is_close] + i0
+            eids[ipoint] = self.eids[self.tri_ielem[itri[ifirst]]]
+            xyz_closest[ipoint] = closest[ifirst]
+            distance[ipoint] = np.sqrt(dist2[ifirst])
+        return eids, xyz_closest, distance
+
+    def _nearest_centroid_distance2(self, points: np.ndarray) -> np.ndarray:
+        """
+        Gets the squared distance to the triangle with the closest centroid,
+        which is an upper bound on the closest distance
+        """
+        if self._centroid_tree is None:
+            tri_centroids = self.xyz[self.tri_inode].mean(axis=1)
+            msg = 'which is required by ElementBVH.nearest_element'
+            self._centroid_tree = _get_tree(tri_centroids, msg=msg)
+        itri = self._centroid_tree.query(points, k=1)[1]
+        v0, v1, v2 = self._triangles(itri)
+        closest = _closest_point_on_triangle(points, v0, v1, v2)
+        dist2 = ((closest - points) ** 2).sum(axis=1)
+        dist2[np.isnan(dist2)] = np.inf
+        return dist2
+
+    def query_box(self, xyz_min: np.ndarray, xyz_max: np.ndarray,
+                  ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the elements with a face that has a bounding box that
+        overlaps the boxes
+
+        Parameters
+        ----------
+        xyz_min / xyz_max : (3, ) or (nboxes, 3) float ndarray
+            the corners of the boxes
+
+        Returns
+        -------
+        ibox : (n, ) int ndarray
+            the box index; sorted
+        eids : (n, ) int ndarray
+            the element in the box; sorted for each box
+
+        """
+        xyz_min = np.atleast_2d(np.asarray(xyz_min, dtype='float64'))
+        xyz_max = np.atleast_2d(np.asarray(xyz_max, dtype='float64'))
+        assert xyz_min.shape == xyz_max.shape, (xyz_min.shape, xyz_max.shape)
+        iboxes = []
+        ielems = []
+        for i0, i1 in _chunks(len(xyz_min)):
+            query_min = xyz_min[i0:i1]
+            query_max = xyz_max[i0:i1]
+            ibox, itri = self._traverse(
+                len(query_min), _overlap_box_test,
+                query_min=query_min, query_max=query_max)
+            v0, v1, v2 = self._triangles(itri)
+            tri_min = np.minimum(np.minimum(v0, v1), v2)
+            tri_max = np.maximum(np.maximum(v0, v1), v2)
+            is_hit = _overlap_box_test(ibox, tri_min, tri_max, query_min, query_max)
+            iboxes.append(ibox[is_hit] + i0)
+            ielems.append(self.tri_ielem[itri[is_hit]])
+        return self._unique_pairs(iboxes, ielems)
+
+    def intersect_plane(self, origins: np.ndarray, normals: np.ndarray,
+                        tol: float=0.) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the elements with a face that is cut by the planes
+
+        Parameters
+        ----------
+        origins : (3, ) or (nplanes, 3) float ndarray
+            a point on the plane
+        normals : (3, ) or (nplanes, 3) float ndarray
+            the normal of the plane
+        tol : float; default=0.
+            the distance to the plane that is considered to be on the plane
+
+        Returns
+        -------
+        iplane : (n, ) int ndarray
+            the plane index; sorted
+        eids : (n, ) int ndarray
+            the element that is cut; sorted for each plane
+
+        """
+        origins = np.atleast_2d(np.asarray(origins, dtype='float64'))
+        normals = np.asarray(normals, dtype='float64')
+        normals = np.broadcast_to(normals, origins.shape)
+        normals = normals / np.linalg.norm(normals, axis=1)[:, np.newaxis]
+        iplanes = []
+        ielems = []
+        for i0, i1 in _chunks(len(origins)):
+            origin = origins[i0:i1]
+            normal = normals[i0:i1]
+            iplane, itri = self._traverse(
+                len(origin), _plane_box_test, origin=origin, normal=normal, tol=tol)
+            v0, v1, v2 = self._triangles(itri)
+            normali = normal[iplane]
+            origini = origin[iplane]
+            dist = np.column_stack([
+                ((v0 - origini) * normali).sum(axis=1),
+                ((v1 - origini) * normali).sum(axis=1),
+                ((v2 - origini) * normali).sum(axis=1),
+            ])
+            is_hit = (dist.min(axis=1) <= tol) & (dist.max(axis=1) >= -tol)
+            iplanes.append(iplane[is_hit] + i0)
+            ielems.append(self.tri_ielem[itri[is_hit]])
+        return self._unique_pairs(iplanes, ielems)
+
+    def _unique_pairs(self, iqueries: List[np.ndarray],
+                      ielems: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """gets the unique (query, element id) pairs"""
+        if not iqueries:
+            return np.zeros(0, dtype='int32'), np.zeros(0, dtype=self.eids.dtype)
+        iquery = np.hstack(iqueries)
+        eids = self.eids[np.hstack(ielems)]
+        isort = np.lexsort((eids, iquery))
+        iquery = iquery[isort]
+        eids = eids[isort]
+        is_unique = np.ones(len(iquery), dtype='bool')
+        is_unique[1:] = (iquery[1:] != iquery[:-1]) | (eids[1:] != eids[:-1])
+        return iquery[is_unique], eids[is_unique]
+
+    def __repr__(self) -> str:
+        return 'ElementBVH(nelements=%s, nfaces=%s, nlevels=%s, leaf_size=%s)' % (
+            len(self.eids), self.nfaces, self.nlevels, self.leaf_size)
+
+
+def _get_nids_xyz(model: BDF) -> Tuple[np.ndarray, np.ndarray]:
+    """gets the sorted node ids and their xyz in the global frame"""
+    idtype = model._upcast_int_dtype(dtype='int32')
+    if len(model.nodes) == 0:
+        return np.zeros(0, dtype=idtype), np.zeros((0, 3), dtype='float64')
+    out = model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype=idtype)
+    nid_cp_cd, xyz_cid0 = out[:2]
+    return nid_cp_cd[:, 0], xyz_cid0
+
+
+def _chunks(n: int):
+    """splits the queries into chunks"""
+    for i0 in range(0, n, CHUNK_SIZE):
+        yield i0, min(i0 + CHUNK_SIZE, n)
+
+
+def _morton_code(xyz: np.ndarray) -> np.ndarray:
+    """gets the 63-bit Morton code of the points"""
+    xyz_min = xyz.min(axis=0)
+    dxyz = xyz.max(axis=0) - xyz_min
+    dxyz[dxyz == 0.] = 1.
+    nbits = 21
+    ixyz = ((xyz - xyz_min) / dxyz * (2 ** nbits - 1)).astype('uint64')
+
+    code = np.zeros(len(xyz), dtype='uint64')
+    one = np.uint64(1)
+    for ibit in range(nbits):
+        bit = np.uint64(ibit)
+        for idim in range(3):
+            code |= ((ixyz[:, idim] >> bit) & one) << np.uint64(3 * ibit + idim)
+    return code
+
+
+def _ray_box_test(iray: np.ndarray, box_min: np.ndarray, box_max: np.ndarray,
+                  origin: np.ndarray, inv_direction: np.ndarray,
+                  tmin: float, tmax: float) -> np.ndarray:
+    """the slab test of the rays and the boxes"""
+    origini = origin[iray]
+    inv_directioni = inv_direction[iray]
+    with np.errstate(invalid='ignore'):
+        # 0 * inf is nan for a ray that's parallel to and on a slab,
+        # which doesn't limit the ray (fmin/fmax ignore nan)
+        t1 = (box_min - origini) * inv_directioni
+        t2 = (box_max - origini) * inv_directioni
+        tnear = np.fmax.reduce(np.fmin(t1, t2), axis=1)
+        tfar = np.fmin.reduce(np.fmax(t1, t2), axis=1)
+        return (tnear <= tfar) & (tfar >= tmin) & (tnear <= tmax)
+
+
+def _ray_triangle(origin: np.ndarray, direction: np.ndarray,
+                  v0: np.ndarray, v1: np.ndarray, v2: np.ndarray,
+                  ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    vectorized Moller-Trumbore ray-triangle intersection
+    (see ``pierce_shells.triangle_intersection``)
+    """
+    e1 = v1 - v0
+    e2 = v2 - v0
+    pvec = np.cross(direction, e2)
+    det = (e1 * pvec).sum(axis=1)
+
+    # the ray is parallel to the plane
+    is_hit = np.abs(det) >= 1e-8
+    inv_det = 1. / np.where(is_hit, det, 1.)
+    tvec = origin - v0
+    u = (tvec * pvec).sum(axis=1) * inv_det
+    qvec = np.cross(tvec, e1)
+    v = (direction * qvec).sum(axis=1) * inv_det
+    t = (e2 * qvec).sum(axis=1) * inv_det
+    is_hit &= (u >= 0.) & (u <= 1.) & (v >= 0.) & (u + v <= 1.)
+    return is_hit, t
+
+
+def _nearest_box_test(ipoint: np.ndarray, box_min: np.ndarray, box_max: np.ndarray,
+                      points: np.ndarray, upper_bound: np.ndarray) -> np.ndarray:
+    """culls the boxes that are farther than the upper bound of the closest distance"""
+    return _box_distance2(points[ipoint], box_min, box_max) <= upper_bound[ipoint]
+
+
+def _box_distance2(points: np.ndarray, box_min: np.ndarray, box_max: np.ndarray) -> np.ndarray:
+    """the squared distance from the points to the boxes (0 inside the box)"""
+    dxyz = np.maximum(np.maximum(box_min - points, points - box_max), 0.)
+    return (dxyz ** 2).sum(axis=1)
+
+
+def _overlap_box_test(ibox: np.ndarray, box_min: np.ndarray, box_max: np.ndarray,
+                      query_min: np.ndarray, query_max: np.ndarray) -> np.ndarray:
+    """the boxes overlap"""
+    return ((box_min <= query_max[ibox]) & (box_max >= query_min[ibox])).all(axis=1)
+
+
+def _plane_box_test(iplane: np.ndarray, box_min: np.ndarray, box_max: np.ndarray,
+                    origin: np.ndarray, normal: np.ndarray, tol: float) -> np.ndarray:
+    """the plane cuts the box"""
+    normali = normal[iplane]
+    with np.errstate(invalid='ignore'):
+        center = (box_min + box_max) / 2.
+        radius = (np.abs(normali) * (box_max - box_min) / 2.).sum(axis=1)
+        dist = ((center - origin[iplane]) * normali).sum(axis=1)
+        return np.abs(dist) <= radius + tol
+
+
+def _closest_point_on_triangle(p: np.ndarray, a: np.ndarray, b: np.ndarray,
+                               c: np.ndarray) -> np.ndarray:
+    """
+    Gets the closest point on the triangles (a, b, c) to the points p using
+    the Voronoi regions of the triangle (Ericson, Real-Time Collision
+    Detection, 5.1.5)
+    """
+    def dot(x, y):
+        return (x * y).sum(axis=1)
+
+    ab = b - a
+    ac = c - a
+    ap = p - a
+    d1 = dot(ab, ap)
+    d2 = dot(ac, ap)
+    bp = p - b
+    d3 = dot(ab, bp)
+    d4 = dot(ac, bp)
+    cp = p - c
+    d5 = dot(ab, cp)
+    d6 = dot(ac, cp)
+    va = d3 * d6 - d5 * d4
+    vb = d5 * d2 - d1 * d6
+    vc = d1 * d4 - d3 * d2
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # inside the face
+        denom = 1. / (va + vb + vc)
+        v = vb * denom
+        w = vc * denom
+        closest = a + ab * v[:, np.newaxis] + ac * w[:, np.newaxis]
+
+        # the regions are applied from the lowest to the highest priority
+        is_bc = (va <= 0.) & (d4 - d3 >= 0.) & (d5 - d6 >= 0.)
+        w_bc = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        closest[is_bc] = (b + (c - b) * w_bc[:, np.newaxis])[is_bc]
+
+        is_ac = (vb <= 0.) & (d2 >= 0.) & (d6 <= 0.)
+        w_ac = d2 / (d2 - d6)
+        closest[is_ac] = (a + ac * w_ac[:, np.newaxis])[is_ac]
+
+        is_c = (d6 >= 0.) & (d5 <= d6)
+        closest[is_c] = c[is_c]
+
+        is_ab = (vc <= 0.) & (d1 >= 0.) & (d3 <= 0.)
+        v_ab = d1 / (d1 - d3)
+        closest[is_ab] = (a + ab * v_ab[:, np.newaxis])[is_ab]
+
+        is_b = (d3 >= 0.) & (d4 <= d3)
+        closest[is_b] = b[is_b]
+
+        is_a = (d1 <= 0.) & (d2 <= 0.)
+        closest[is_a] = a[is_a]
+    return closest
@@ -4,6 +4,10 @@ Defines:
       find the net force/moment on the model
   - sum_forces_moments_elements
       find the net force/moment on the model for a subset of elements
+  - sum_forces_moments_batch
+      find the net force/moment on the model for many load cases
+  - get_static_force_matrix
+      find the sparse force vector of many subcases
 
 """
 from __future__ import annotations
@@ -12,9 +16,11 @@ from math import radians, sin, cos
 import numpy as np
 from numpy import array, cross, allclose, mean
 from numpy.linalg import norm  # type: ignore
+from scipy.sparse import coo_matrix  # type: ignore
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.utils import get_xyz_cid0_dict, transform_load
 from pyNastran.bdf.cards.loads.static_loads import update_pload4_vector, PLOAD4
+from pyNastran.bdf.mesh_utils.mass_properties_vectorized import get_element_mass_properties
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.nptyping import NDArray3float
     from pyNastran.bdf.bdf import BDF, Subcase
@@ -224,9 +230,8 @@ def _pload1_bar_beam(model, unused_loadcase_id, load, elem, scale, xyz, F, M, p)
     p2 = load.p2 * scale
 
     nodes = elem.node_ids
-    n1, n2 = xyz[nodes[0]], xyz[nodes[1]]
-    n1 += elem.wa
-    n2 += elem.wb
+    n1 = xyz[nodes[0]] + elem.wa
+    n2 = xyz[nodes[1]] + elem.wb
 
     bar_vector = n2 - n1
     L = norm(bar_vector)
@@ -607,6 +612,342 @@ def sum_forces_moments_elements(model: BDF, p0: int, loadcase_id: int,
     return F2, M2
 
 
+def sum_forces_moments_batch(model: BDF, p0: np.ndarray, load_ids: List[int],
+                             cid: int=0,
+                             include_grav: bool=False,
+                             xyz_cid0: Optional[Dict[int, NDArray3float]]=None,
+                             ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Sums applied forces & moments about a reference point p0 for many
+    load cases at once.
+
+    Each unique load card (e.g., a FORCE that is used by 100 LOAD cards)
+    is summed once, so the PLOAD4 face areas/normals/centroids are
+    calculated once per element face from the node locations and the
+    load cases are found by scaling the unique cards.
+
+    Considers:
+      - FORCE, FORCE1, FORCE2
+      - MOMENT, MOMENT1, MOMENT2
+      - PLOAD, PLOAD1, PLOAD2, PLOAD4
+      - GRAV
+      - LOAD
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+        the reference point
+    load_ids : List[int]
+        the LOAD=IDs to analyze
+    cid : int; default=0
+        the coordinate system for the summation
+    include_grav : bool; default=False
+        includes gravity in the summation
+    xyz_cid0 : None / Dict[int] = (3, ) ndarray
+        the nodes in the global coordinate system
+
+    Returns
+    -------
+    forces : NUMPY.NDARRAY shape=(nload_ids, 3)
+        the forces for each load_id
+    moments : NUMPY.NDARRAY shape=(nload_ids, 3)
+        the moments for each load_id
+
+    .. seealso:: ``sum_forces_moments``
+
+    """
+    p = _get_load_summation_point(model, p0, cid=0)
+    xyz = get_xyz_cid0_dict(model, xyz_cid0=xyz_cid0)
+
+    # the unique load cards and how they're used by each load_id
+    cards = []
+    card_map = {}
+    iload_list = []
+    icard_list = []
+    scale_list = []
+    for iload, loadcase_id in enumerate(load_ids):
+        if not isinstance(loadcase_id, integer_types):
+            raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
+        loads, scale_factors, unused_is_grav = model.get_reduced_loads(
+            loadcase_id, skip_scale_factor0=True)
+        for load, scale in zip(loads, scale_factors):
+            icard = card_map.get(id(load))
+            if icard is None:
+                icard = len(cards)
+                card_map[id(load)] = icard
+                cards.append(load)
+            iload_list.append(iload)
+            icard_list.append(icard)
+            scale_list.append(scale)
+
+    forces = np.zeros((len(load_ids), 3), dtype='float64')
+    moments = np.zeros((len(load_ids), 3), dtype='float64')
+    if cards:
+        card_forces, card_moments = _sum_forces_moments_cards(
+            model, cards, xyz, p, include_grav)
+        iloads = np.array(iload_list, dtype='int32')
+        icards = np.array(icard_list, dtype='int32')
+        scales = np.array(scale_list, dtype='float64')[:, np.newaxis]
+        np.add.at(forces, iloads, card_forces[icards] * scales)
+        np.add.at(moments, iloads, card_moments[icards] * scales)
+
+    if cid == 0:
+        return forces, moments
+    cid0 = 0
+    for iload, (force, moment) in enumerate(zip(forces, moments)):
+        forces[iload], moments[iload] = transform_load(force, moment, cid0, cid, model)
+    return forces, moments
+
+def _sum_forces_moments_cards(model: BDF, cards: List, xyz: Dict[int, np.ndarray],
+                              p: np.ndarray,
+                              include_grav: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    helper method for ``sum_forces_moments_batch``
+
+    Gets the force/moment for each load card with a scale factor of 1.0
+    """
+    ncards = len(cards)
+    F = np.zeros((ncards, 3), dtype='float64')
+    M = np.zeros((ncards, 3), dtype='float64')
+    nids = np.array(list(xyz.keys()), dtype='int64')
+    xyz_array = np.array(list(xyz.values()), dtype='float64').reshape(len(nids), 3)
+    isort = np.argsort(nids)
+    nids = nids[isort]
+    xyz_array = xyz_array[isort, :]
+
+    force_icards = []
+    force_nids = []
+    force_vectors = []
+    moment_icards = []
+    moment_vectors = []
+    pload_icards = {3: [], 4: []}
+    pload_nids = {3: [], 4: []}
+    pload4s = []
+    gravity = None
+    unsupported_types = set()
+    for icard, load in enumerate(cards):
+        load_type = load.type
+        if load_type in ['FORCE', 'FORCE1', 'FORCE2']:
+            if load_type == 'FORCE' and load.Cid() != 0:
+                f = load.mag * load.cid_ref.transform_vector_to_global(load.xyz)
+            else:
+                f = load.mag * load.xyz
+            force_icards.append(icard)
+            force_nids.append(load.node_id)
+            force_vectors.append(f)
+        elif load_type in ['MOMENT', 'MOMENT1', 'MOMENT2']:
+            if load_type == 'MOMENT' and load.Cid() != 0:
+                m = load.mag * load.cid_ref.transform_vector_to_global(load.xyz)
+            else:
+                m = load.mag * load.xyz
+            moment_icards.append(icard)
+            moment_vectors.append(m)
+        elif load_type == 'PLOAD':
+            nodes = load.node_ids
+            nnodes = len(nodes)
+            if nnodes not in [3, 4]:
+                msg = 'invalid number of nodes on PLOAD card; nodes=%s' % str(nodes)
+                raise RuntimeError(msg)
+            pload_icards[nnodes].append(icard)
+            pload_nids[nnodes].append(nodes)
+        elif load_type == 'PLOAD1':
+            _pload1_total(model, load.sid, load, 1.0, xyz, F[icard], M[icard], p)
+        elif load_type == 'PLOAD2':
+            for eid in load.element_ids:
+                elem = model.elements[eid]
+                if elem.type in ['CTRIA3', 'CQUAD4', 'CSHEAR', 'CQUADR', 'CTRIAR']:
+                    f = load.pressure * elem.Normal() * elem.Area()
+                    r = elem.Centroid() - p
+                    F[icard] += f
+                    M[icard] += cross(r, f)
+                else:
+                    model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
+                        load.sid, elem.type, load_type))
+        elif load_type == 'PLOAD4':
+            pload4s.append((icard, load))
+        elif load_type == 'GRAV':
+            if include_grav:
+                if gravity is None:
+                    gravity = _get_mass_moment(model, p)
+                mass, mass_moment = gravity
+                g = load.GravityVector()
+                F[icard] += mass * g
+                M[icard] += cross(mass_moment, g)
+        else:
+            # we collect them so we only get one print
+            unsupported_types.add(load_type)
+
+    if force_icards:
+        f = np.array(force_vectors, dtype='float64')
+        r = _get_xyz(nids, xyz_array, force_nids) - p
+        np.add.at(F, force_icards, f)
+        np.add.at(M, force_icards, np.cross(r, f))
+    if moment_icards:
+        np.add.at(M, moment_icards, np.array(moment_vectors, dtype='float64'))
+    for nnodes, icards in pload_icards.items():
+        if not icards:
+            continue
+        pressures = np.array([cards[icard].pressure for icard in icards], dtype='float64')
+        node_xyz = _get_xyz(nids, xyz_array, pload_nids[nnodes])
+        area, centroid, normal = _get_face_area_centroid_normal(node_xyz)
+        f = (pressures * area)[:, np.newaxis] * normal
+        np.add.at(F, icards, f)
+        np.add.at(M, icards, np.cross(centroid - p, f))
+    if pload4s:
+        _pload4_batch(pload4s, xyz, nids, xyz_array, F, M, p)
+
+    for load_type in unsupported_types:
+        model.log.warning('loadtype=%r not supported' % load_type)
+    return F, M
+
+def _pload4_batch(pload4s: List[Tuple[int, PLOAD4]], xyz: Dict[int, np.ndarray],
+                  nids: np.ndarray, xyz_array: np.ndarray,
+                  F: np.ndarray, M: np.ndarray, p: np.ndarray) -> None:
+    """
+    helper method for ``sum_forces_moments_batch``
+
+    The area, centroid, normal of each element face is calculated once,
+    so a face that is loaded by many PLOAD4s isn't recalculated.
+    """
+    face_map = {}
+    nfaces = 0
+    shell_faces = {3: [], 4: []}
+    shell_nids = {3: [], 4: []}
+    solid_faces = []
+    solid_acn = []
+
+    pair_icard = []
+    pair_iload = []
+    pair_iface = []
+    pressures = np.zeros((len(pload4s), 2), dtype='float64')
+    load_dirs = np.zeros((len(pload4s), 3), dtype='float64')
+    is_normal = np.zeros(len(pload4s), dtype='bool')
+    for iload, (icard, load) in enumerate(pload4s):
+        if load.surf_or_line != 'SURF':
+            # LINE loads depend on the element thickness
+            _pload4_total(load.sid, load, 1.0, xyz, F[icard], M[icard], p)
+            continue
+        assert load.line_load_dir == 'NORM', 'line_load_dir = %s' % (load.line_load_dir)
+
+        # None means the direction is the normal of the element face
+        load_dir = update_pload4_vector(load, None, load.Cid())
+        if load_dir is None:
+            is_normal[iload] = True
+        else:
+            load_dirs[iload, :] = load_dir
+        pressures[iload, 0] = _mean_pressure_on_pload4(load.pressures[:3], load, None)
+        pressures[iload, 1] = _mean_pressure_on_pload4(load.pressures[:4], load, None)
+
+        for elem in load.eids_ref:
+            etype = elem.type
+            if etype in ['CTRIA3', 'CTRIA6', 'CTRIAR']:
+                key = elem.eid
+                nface = 3
+            elif etype in ['CQUAD4', 'CQUAD8', 'CQUAD', 'CQUADR', 'CSHEAR']:
+                key = elem.eid
+                nface = 4
+            else:
+                key = (elem.eid, load.G1(), load.G34())
+                nface = None
+
+            iface = face_map.get(key)
+            if iface is None:
+                iface = nfaces
+                face_map[key] = iface
+                nfaces += 1
+                if nface is None:
+                    unused_nodes, area, face_centroid, normal, nface = (
+                        _get_pload4_area_centroid_normal_nface(load.sid, load, elem, xyz))
+                    solid_faces.append(iface)
+                    solid_acn.append((area, face_centroid, normal, nface))
+                else:
+                    shell_faces[nface].append(iface)
+                    shell_nids[nface].append(elem.node_ids[:nface])
+            pair_icard.append(icard)
+            pair_iload.append(iload)
+            pair_iface.append(iface)
+
+    if not pair_icard:
+        return
+
+    # the face geometry
+    areas = np.zeros(nfaces, dtype='float64')
+    centroids = np.zeros((nfaces, 3), dtype='float64')
+    normals = np.zeros((nfaces, 3), dtype='float64')
+    nface_array = np.zeros(nfaces, dtype='int32')
+    for nface, ifaces in shell_faces.items():
+        if not ifaces:
+            continue
+        node_xyz = _get_xyz(nids, xyz_array, shell_nids[nface])
+        areas[ifaces], centroids[ifaces, :], normals[ifaces, :] = (
+            _get_face_area_centroid_normal(node_xyz))
+        nface_array[ifaces] = nface
+    for iface, (area, face_centroid, normal, nface) in zip(solid_faces, solid_acn):
+        areas[iface] = area
+        centroids[iface, :] = face_centroid
+        normals[iface, :] = normal
+        nface_array[iface] = nface
+
+    # the element face loads
+    pair_icard = np.array(pair_icard, dtype='int32')
+    pair_iload = np.array(pair_iload, dtype='int32')
+    pair_iface = np.array(pair_iface, dtype='int32')
+    is_quad = (nface_array[pair_iface] == 4).astype('int32')
+    pressure = pressures[pair_iload, is_quad]
+    load_dir = np.where(is_normal[pair_iload, np.newaxis],
+                        normals[pair_iface, :], load_dirs[pair_iload, :])
+    f = (pressure * areas[pair_iface])[:, np.newaxis] * load_dir
+    r = centroids[pair_iface, :] - p
+    np.add.at(F, pair_icard, f)
+    np.add.at(M, pair_icard, np.cross(r, f))
+
+def _get_face_area_centroid_normal(node_xyz: np.ndarray,
+                                   ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the area, centroid, and normal of triangular/quad faces
+
+    Parameters
+    ----------
+    node_xyz : (nfaces, nnodes, 3) float ndarray
+        the corner nodes of the faces, where nnodes=3/4
+
+    """
+    nnodes = node_xyz.shape[1]
+    if nnodes == 3:
+        n1, n2, n3 = node_xyz[:, 0, :], node_xyz[:, 1, :], node_xyz[:, 2, :]
+        axb = np.cross(n1 - n2, n1 - n3)
+    else:
+        assert nnodes == 4, nnodes
+        n1, n2, n3, n4 = (node_xyz[:, 0, :], node_xyz[:, 1, :],
+                          node_xyz[:, 2, :], node_xyz[:, 3, :])
+        axb = np.cross(n1 - n3, n2 - n4)
+    nunit = np.linalg.norm(axb, axis=1)
+    area = 0.5 * nunit
+    normal = axb / nunit[:, np.newaxis]
+    centroid = node_xyz.mean(axis=1)
+    return area, centroid, normal
+
+def _get_xyz(nids: np.ndarray, xyz_array: np.ndarray, node_ids) -> np.ndarray:
+    """gets the xyz locations for an (n, ) or (n, nnodes) list of node ids"""
+    node_ids = np.array(node_ids, dtype='int64')
+    return xyz_array[_get_index(nids, node_ids, 'nodes')]
+
+def _get_mass_moment(model: BDF, p: np.ndarray) -> Tuple[float, np.ndarray]:
+    """
+    Gets the mass and first moment of mass about p of the elements,
+    so the gravity load is m*g and the moment is (m*r) x g
+    """
+    mass = 0.
+    mass_moment = np.zeros(3, dtype='float64')
+    for unused_eid, elem in model.elements.items():
+        massi = elem.Mass()
+        mass += massi
+        mass_moment += massi * (elem.Centroid() - p)
+    return mass, mass_moment
+
+
 def _bar_eq_pload1(load, elem, xyz, Ldir,
                    n1, n2,
                    x1, x2,
@@ -634,8 +975,9 @@ def _bar_eq_pload1(load, elem, xyz, Ldir,
             force_dir = array([0., 1., 0.])
         elif load.Type == 'FZ' and x1 == x2:
             force_dir = array([0., 0., 1.])
-        F += p1 * force_dir
-        M += cross(r - p, F)
+        fi = p1 * force_dir
+        F += fi
+        M += cross(r - p, fi)
     elif load.Type in ['MX', 'MY', 'MZ']:
         if load.Type == 'MX' and x1 == x2:
             moment_dir = array([1., 0., 0.])
@@ -662,14 +1004,15 @@ def _bar_eq_pload1(load, elem, xyz, Ldir,
             force_dir = k
         #print('    force_dir =', force_dir, load.Type)
         try:
-            F += p1 * force_dir
+            fi = p1 * force_dir
         except FloatingPointError:
             msg = 'eid = %s\n' % elem.eid
             msg += 'i = %s\n' % Ldir
             msg += 'force_dir = %s\n' % force_dir
             msg += 'load = \n%s' % str(load)
             raise FloatingPointError(msg)
-        M += cross(r - p, F)
+        F += fi
+        M += cross(r - p, fi)
         del force_dir
 
     elif load.Type in ['MXE', 'MYE', 'MZE']:
@@ -737,21 +1080,20 @@ def _get_pload4_area_centroid_normal_nface(loadcase_id: int, load: PLOAD4, elem,
         nface = 4
 
     elif etype == 'CTETRA':
-        nodes = None
         face_acn = elem.get_face_area_centroid_normal(load.g1_ref.nid, load.g34_ref.nid)
-        unused_face, area, face_centroid, normal = face_acn
+        face, area, face_centroid, normal = face_acn
+        nodes = _get_face_nodes(elem, face)
         nface = 3
 
     elif etype == 'CHEXA':
-        nodes = None
         face_acn = elem.get_face_area_centroid_normal(load.g34_ref.nid, load.g1_ref.nid)
         # TODO: backwards?
         #face_acn = elem.get_face_area_centroid_normal(load.g1_ref.nid, load.g34_ref.nid)
-        unused_face, area, face_centroid, normal = face_acn
+        face, area, face_centroid, normal = face_acn
+        nodes = _get_face_nodes(elem, face)
         nface = 4
 
     elif etype == 'CPENTA':
-        nodes = None
         g1 = load.g1_ref.nid
         if load.g34 is None:
             face_acn = elem.get_face_area_centroid_normal(g1)
@@ -759,10 +1101,10 @@ def _get_pload4_area_centroid_normal_nface(loadcase_id: int, load: PLOAD4, elem,
         else:
             face_acn = elem.get_face_area_centroid_normal(g1, load.g34_ref.nid)
             nface = 4
-        unused_face, area, face_centroid, normal = face_acn
+        face, area, face_centroid, normal = face_acn
+        nodes = _get_face_nodes(elem, face)
     elif etype == 'CPYRAM':
         #C:\Program Files\Siemens\NX 12.0\NXNASTRAN\nxn12\nast\demo\sslv09c.dat
-        nodes = None
         g1 = load.g1_ref.nid
         g3 = load.g34_ref.nid
         nids = elem.node_ids[:5]
@@ -783,6 +1125,7 @@ def _get_pload4_area_centroid_normal_nface(loadcase_id: int, load: PLOAD4, elem,
             # diagonally opposite to G1. Required for quadrilateral faces of
             # CHEXA, CPYRAM and CPENTA elements only.
             p1, p2, p3, p4, unused_p5 = xyzs
+            nodes = nids[:4]
             v31 = p3 - p1
             v42 = p4 - p2
             normal = np.cross(v31, v42)
@@ -799,6 +1142,7 @@ def _get_pload4_area_centroid_normal_nface(loadcase_id: int, load: PLOAD4, elem,
             p1 = xyzs[in13[0]]
             p3 = xyzs[in13[1]]
             p2 = xyzs[4]  # top node
+            nodes = [nids[in13[0]], nids[4], nids[in13[1]]]
             v21 = p2 - p1 # towards the top
             v31 = p3 - p1 # towards the base
             normal = np.cross(v21, v31)
@@ -825,6 +1169,11 @@ def _get_pload4_area_centroid_normal_nface(loadcase_id: int, load: PLOAD4, elem,
         raise NotImplementedError(msg)
     return nodes, area, face_centroid, normal, nface
 
+def _get_face_nodes(elem, face):
+    """gets the node ids of a solid element face from the face indices"""
+    nids = elem.node_ids
+    return [nids[i] for i in face]
+
 def _pload4_helper(loadcase_id, load, scale, elem, xyz, p):
     """gets the contribution for a single PLOAD4 element"""
     #eid = elem.eid
@@ -1174,3 +1523,444 @@ def _add_force(Fg: np.ndarray, dof_map: Dict[Tuple[int, int], int], model: BDF,
     for dof in range(3):
         irow = dof_map[(nid, dof+offset)]
         Fg[irow] += fglobal[dof]
+
+
+def get_dof_map_arrays(model: BDF) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the (nid, dof) of each row of the static force vector, which is
+    the same order as ``get_static_force_vector_from_subcase_id``
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+
+    Returns
+    -------
+    nid_dof : (ndof, 2) int ndarray
+        the (nid, dof) of each row, where dof=1-6 for a GRID and 0 for
+        an SPOINT
+    ps : (nps, ) int ndarray
+        the rows of the permanent single point constraints (GRID PS field)
+
+    """
+    grid_nids, unused_grid_cd, spoint_nids, ps = _get_grid_spoint_arrays(model)
+    nid_dof = _get_nid_dof(grid_nids, spoint_nids)
+    assert len(nid_dof) > 0
+    return nid_dof, ps
+
+def _get_nid_dof(grid_nids: np.ndarray, spoint_nids: np.ndarray) -> np.ndarray:
+    """gets the (nid, dof) of the GRIDs (dof=1-6) and then the SPOINTs (dof=0)"""
+    ngrid = len(grid_nids)
+    nid_dof = np.zeros((ngrid * 6 + len(spoint_nids), 2), dtype=grid_nids.dtype)
+    nid_dof[:ngrid*6, 0] = np.repeat(grid_nids, 6)
+    nid_dof[:ngrid*6, 1] = np.tile(np.arange(1, 7), ngrid)
+    nid_dof[ngrid*6:, 0] = spoint_nids
+    return nid_dof
+
+def _get_grid_spoint_arrays(model: BDF) -> Tuple[np.ndarray, np.ndarray,
+                                                 np.ndarray, np.ndarray]:
+    """
+    helper method for ``get_dof_map_arrays``
+
+    Gets the GRIDs (in the same order as ``_get_dof_map``), their CD
+    coordinate system, the sorted SPOINTs and the PS rows.
+    """
+    idtype = model._upcast_int_dtype(dtype='int32')
+    grid_nids = []
+    grid_cd = []
+    ps = []
+    for nid, node_ref in model.nodes.items():
+        if node_ref.type != 'GRID':
+            raise NotImplementedError(node_ref)
+        for psi in node_ref.ps:
+            ps.append(len(grid_nids) * 6 + int(psi) - 1)
+        grid_nids.append(nid)
+        grid_cd.append(node_ref.Cd())
+    spoint_nids = sorted(model.spoints.keys())
+    return (np.array(grid_nids, dtype=idtype), np.array(grid_cd, dtype=idtype),
+            np.array(spoint_nids, dtype=idtype), np.array(ps, dtype=idtype))
+
+def get_static_force_matrix(model: BDF, subcase_ids: Optional[List[int]]=None,
+                            fdtype: str='float64'):
+    """
+    Builds the static force vector of many subcases as a sparse matrix
+
+    solves for F in:
+      [K]{x} = {F}
+
+    Parameters
+    ----------
+    model : BDF()
+        a cross-referenced BDF object
+    subcase_ids : List[int]; default=None -> all
+        the subcases to consider
+    fdtype : str; default='float64'
+        the float type of the matrix
+
+    Returns
+    -------
+    Fg : (ndof, nsubcases) scipy.sparse.csc_matrix
+        the force vector of each subcase in the output (CD) coordinate
+        system of the nodes; a subcase without a LOAD is a zero column
+    subcase_ids : (nsubcases, ) int ndarray
+        the subcase of each column
+    nid_dof : (ndof, 2) int ndarray
+        the (nid, dof) of each row (see ``get_dof_map_arrays``) and
+        then the EPOINTs (dof=0)
+
+    Considers:
+      - FORCE, FORCE1, FORCE2
+      - MOMENT, MOMENT1, MOMENT2
+      - SLOAD (an SPOINT or component 1 of a GRID)
+      - PLOAD, PLOAD4 (SURF); the mean pressure is lumped equally to
+        the corner nodes of the face
+      - GRAV; the mass of an element is lumped equally to its nodes and
+        a CONM2 offset creates a moment
+      - LOAD
+
+    The DOF map and each load card are only calculated once, so
+    the columns are found by multiplying the (ndof, ncards) force of
+    the load cards with the (ncards, nsubcases) scale factors.
+
+    """
+    if subcase_ids is None:
+        subcase_ids = [subcase_id for subcase_id in sorted(model.subcases)
+                       if subcase_id > 0]
+    subcase_ids = np.asarray(subcase_ids, dtype='int32')
+
+    grid_nids, grid_cd, spoint_nids, unused_ps = _get_grid_spoint_arrays(model)
+    ndof = len(grid_nids) * 6 + len(spoint_nids) + len(model.epoints)
+
+    # the unique load cards and their scale factors for each subcase
+    cards = []
+    card_map = {}
+    icard_list = []
+    isubcase_list = []
+    scale_list = []
+    for isubcase, subcase_id in enumerate(subcase_ids):
+        subcase = model.subcases[subcase_id]
+        if 'LOAD' not in subcase:
+            continue
+        load_id = subcase['LOAD'][0]
+        loads, scale_factors, unused_is_grav = model.get_reduced_loads(
+            load_id, skip_scale_factor0=True)
+        for load, scale in zip(loads, scale_factors):
+            icard = card_map.get(id(load))
+            if icard is None:
+                icard = len(cards)
+                card_map[id(load)] = icard
+                cards.append(load)
+            icard_list.append(icard)
+            isubcase_list.append(isubcase)
+            scale_list.append(scale)
+
+    nsubcases = len(subcase_ids)
+    ncards = len(cards)
+    rows, icards, values = _get_card_force_vectors(
+        model, cards, grid_nids, grid_cd, spoint_nids)
+    card_forces = coo_matrix((values, (rows, icards)), shape=(ndof, ncards),
+                             dtype=fdtype).tocsr()
+    scales = coo_matrix((scale_list, (icard_list, isubcase_list)),
+                        shape=(ncards, nsubcases), dtype=fdtype).tocsc()
+    Fg = (card_forces @ scales).tocsc()
+    epoint_nids = np.array(sorted(model.epoints), dtype=grid_nids.dtype)
+    nid_dof = _get_nid_dof(grid_nids, np.hstack([spoint_nids, epoint_nids]))
+    return Fg, subcase_ids, nid_dof
+
+def _get_card_force_vectors(model: BDF, cards: List,
+                            grid_nids: np.ndarray, grid_cd: np.ndarray,
+                            spoint_nids: np.ndarray) -> Tuple[np.ndarray, np.ndarray,
+                                                              np.ndarray]:
+    """
+    helper method for ``get_static_force_matrix``
+
+    Gets the (row, icard, value) of the force vector of each load card
+    with a scale factor of 1.0
+    """
+    igrid_sort = np.argsort(grid_nids)
+    grid_nids_sorted = grid_nids[igrid_sort]
+    def get_igrid(nids):
+        """gets the index of the GRIDs in grid_nids"""
+        return igrid_sort[_get_index(grid_nids_sorted, nids, 'GRID')]
+
+    idtype = model._upcast_int_dtype(dtype='int32')
+    if len(model.nodes):
+        out = model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype=idtype)
+        nid_cp_cd, xyz_cid0 = out[:2]
+        all_nids = nid_cp_cd[:, 0]
+    else:
+        all_nids = np.zeros(0, dtype=idtype)
+        xyz_cid0 = np.zeros((0, 3), dtype='float64')
+
+    # the (GRID, icard, dof offset, vector) of the forces/moments in the
+    # basic frame and the ones that are already in the CD frame of the node
+    basic_nids = []
+    basic_icards = []
+    basic_offsets = []
+    basic_vectors = []
+    local_nids = []
+    local_icards = []
+    local_offsets = []
+    local_vectors = []
+
+    spoint_rows = []
+    spoint_icards = []
+    spoint_values = []
+
+    pload_icards = {3: [], 4: []}
+    pload_nids = {3: [], 4: []}
+    pload4s = []
+    gravs = []
+    skipped_load_types = set()
+    for icard, load in enumerate(cards):
+        load_type = load.type
+        if load_type in ['FORCE', 'MOMENT', 'FORCE1', 'MOMENT1', 'FORCE2', 'MOMENT2']:
+            offset = 0 if load_type[0] == 'F' else 3
+            cid = load.Cid() if load_type in ['FORCE', 'MOMENT'] else 0
+            node_ref = load.node_ref
+            if node_ref.Cd() == cid:
+                local_nids.append(load.node_id)
+                local_icards.append(icard)
+                local_offsets.append(offset)
+                local_vectors.append(load.mag * load.xyz)
+            else:
+                basic_nids.append(load.node_id)
+                basic_icards.append(icard)
+                basic_offsets.append(offset)
+                if cid == 0:
+                    basic_vectors.append(load.mag * load.xyz)
+                else:
+                    basic_vectors.append(load.to_global())
+        elif load_type == 'SLOAD':
+            for nid, mag in zip(load.nodes, load.mags):
+                if nid in model.spoints:
+                    spoint_rows.append(nid)
+                    spoint_icards.append(icard)
+                    spoint_values.append(mag)
+                else:
+                    # a GRID is loaded in component 1
+                    local_nids.append(nid)
+                    local_icards.append(icard)
+                    local_offsets.append(0)
+                    local_vectors.append((mag, 0., 0.))
+        elif load_type == 'PLOAD':
+            nodes = load.node_ids
+            nnodes = len(nodes)
+            if nnodes not in [3, 4]:
+                msg = 'invalid number of nodes on PLOAD card; nodes=%s' % str(nodes)
+                raise RuntimeError(msg)
+            pload_icards[nnodes].append(icard)
+            pload_nids[nnodes].append(nodes)
+        elif load_type == 'PLOAD4':
+            if load.surf_or_line == 'SURF':
+                pload4s.append((icard, load))
+            else:
+                skipped_load_types.add('PLOAD4-%s' % load.surf_or_line)
+        elif load_type == 'GRAV':
+            gravs.append((icard, load))
+        else:
+            skipped_load_types.add(load_type)
+
+    # the pressures lumped to the corner nodes
+    for nnodes, icardsi in pload_icards.items():
+        if not icardsi:
+            continue
+        nodes = np.array(pload_nids[nnodes], dtype=idtype)
+        pressures = np.array([cards[icard].pressure for icard in icardsi], dtype='float64')
+        node_xyz = _get_xyz(all_nids, xyz_cid0, nodes)
+        area, unused_centroid, normal = _get_face_area_centroid_normal(node_xyz)
+        f = (pressures * area / nnodes)[:, np.newaxis] * normal
+        basic_nids.append(nodes.ravel())
+        basic_icards.append(np.repeat(icardsi, nnodes))
+        basic_offsets.append(np.zeros(nodes.size, dtype='int32'))
+        basic_vectors.append(np.repeat(f, nnodes, axis=0))
+
+    if pload4s:
+        out = _pload4_nodal_forces(pload4s, all_nids, xyz_cid0, idtype)
+        basic_nids.append(out[0])
+        basic_icards.append(out[1])
+        basic_offsets.append(np.zeros(len(out[0]), dtype='int32'))
+        basic_vectors.append(out[2])
+
+    if gravs:
+        nids, masses, mass_offsets = _get_nodal_mass(model, all_nids, xyz_cid0, idtype)
+        nnodes = len(nids)
+        for icard, load in gravs:
+            # the acceleration in the basic frame
+            accel = load.scale * load.cid_ref.transform_vector_to_global(load.N)
+            basic_nids.append(np.hstack([nids, nids]))
+            basic_icards.append(np.full(nnodes * 2, icard, dtype='int32'))
+            basic_offsets.append(np.hstack([np.zeros(nnodes, dtype='int32'),
+                                            np.full(nnodes, 3, dtype='int32')]))
+            basic_vectors.append(np.vstack([
+                masses[:, np.newaxis] * accel,
+                np.cross(mass_offsets, accel)]))
+
+    if skipped_load_types:
+        skipped_load_types = list(skipped_load_types)
+        skipped_load_types.sort()
+        model.log.warning(f'skipping {skipped_load_types} in Fg')
+
+    rows = []
+    icards = []
+    values = []
+    if basic_nids:
+        igrid = get_igrid(np.hstack(basic_nids))
+        vectors = np.vstack(basic_vectors)
+        cds = grid_cd[igrid]
+        for cd in np.unique(cds):
+            if cd == 0:
+                continue
+            # the force in the output coordinate system of the node
+            # (see ``_force_to_local``)
+            icd = np.where(cds == cd)[0]
+            coord = model.coords[cd]
+            vectors[icd, :] = coord.xyz_to_coord_array(vectors[icd, :] @ coord.beta().T)
+        _append_grid_rows(rows, icards, values, igrid, np.hstack(basic_icards),
+                          np.hstack(basic_offsets), vectors)
+    if local_nids:
+        _append_grid_rows(rows, icards, values, get_igrid(local_nids), local_icards,
+                          local_offsets, np.array(local_vectors, dtype='float64'))
+    if spoint_rows:
+        ispoint = _get_index(spoint_nids, spoint_rows, 'SPOINT')
+        rows.append(len(grid_nids) * 6 + ispoint)
+        icards.append(np.array(spoint_icards, dtype='int32'))
+        values.append(np.array(spoint_values, dtype='float64'))
+
+    if not rows:
+        return (np.zeros(0, dtype='int32'), np.zeros(0, dtype='int32'),
+                np.zeros(0, dtype='float64'))
+    return np.hstack(rows), np.hstack(icards), np.hstack(values)
+
+def _append_grid_rows(rows: List[np.ndarray], icards: List[np.ndarray],
+                      values: List[np.ndarray], igrid: np.ndarray, icard,
+                      offset, vectors: np.ndarray) -> None:
+    """adds the (row, icard, value) of the 3 DOFs of each GRID force/moment"""
+    row0 = igrid * 6 + np.asarray(offset)
+    rows.append((row0[:, np.newaxis] + np.arange(3)).ravel())
+    icards.append(np.repeat(np.asarray(icard, dtype='int32'), 3))
+    values.append(vectors.ravel())
+
+def _get_index(sorted_ids: np.ndarray, ids, word: str) -> np.ndarray:
+    """gets the index of the ids in the sorted ids"""
+    ids = np.asarray(ids)
+    index = np.searchsorted(sorted_ids, ids)
+    index[index == len(sorted_ids)] = 0
+    if len(sorted_ids):
+        is_missing = sorted_ids[index] != ids
+    else:
+        is_missing = np.ones(ids.shape, dtype='bool')
+    if is_missing.any():
+        raise KeyError('missing %s=%s' % (word, np.unique(ids[is_missing]).tolist()))
+    return index
+
+def _pload4_nodal_forces(pload4s: List[Tuple[int, PLOAD4]],
+                         all_nids: np.ndarray, xyz_cid0: np.ndarray,
+                         idtype: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    helper method for ``get_static_force_matrix``
+
+    Gets the (nid, icard, force) of the PLOAD4s, where the mean pressure is
+    lumped equally to the corner nodes of the face
+    """
+    nids = []
+    icards = []
+    forces = []
+    shell_icards = {3: [], 4: []}
+    shell_nids = {3: [], 4: []}
+    shell_pressures = {3: [], 4: []}
+    shell_load_dirs = {3: [], 4: []}
+    for icard, load in pload4s:
+        assert load.line_load_dir == 'NORM', 'line_load_dir = %s' % (load.line_load_dir)
+        load_dir = update_pload4_vector(load, None, load.Cid())
+        for elem in load.eids_ref:
+            etype = elem.type
+            if etype in ['CTRIA3', 'CTRIA6', 'CTRIAR']:
+                nface = 3
+            elif etype in ['CQUAD4', 'CQUAD8', 'CQUAD', 'CQUADR', 'CSHEAR']:
+                nface = 4
+            else:
+                # xyz isn't used for the solid elements
+                nodes, area, unused_centroid, normal, nface = (
+                    _get_pload4_area_centroid_normal_nface(load.sid, load, elem, None))
+                pressure = _mean_pressure_on_pload4(load.pressures[:nface], load, elem)
+                direction = normal if load_dir is None else load_dir
+                nids.extend(nodes)
+                icards.extend([icard] * nface)
+                forces.extend([pressure * area / nface * direction] * nface)
+                continue
+
+            shell_icards[nface].append(icard)
+            shell_nids[nface].append(elem.node_ids[:nface])
+            shell_pressures[nface].append(
+                _mean_pressure_on_pload4(load.pressures[:nface], load, elem))
+            shell_load_dirs[nface].append(
+                (np.nan, np.nan, np.nan) if load_dir is None else load_dir)
+
+    nids = [np.array(nids, dtype=idtype)]
+    icards = [np.array(icards, dtype='int32')]
+    forces = [np.array(forces, dtype='float64').reshape(len(nids[0]), 3)]
+    for nface, icardsi in shell_icards.items():
+        if not icardsi:
+            continue
+        nodes = np.array(shell_nids[nface], dtype=idtype)
+        node_xyz = _get_xyz(all_nids, xyz_cid0, nodes)
+        area, unused_centroid, normal = _get_face_area_centroid_normal(node_xyz)
+        load_dir = np.array(shell_load_dirs[nface], dtype='float64')
+        is_normal = np.isnan(load_dir[:, 0])
+        load_dir[is_normal, :] = normal[is_normal, :]
+        pressures = np.array(shell_pressures[nface], dtype='float64')
+        f = (pressures * area / nface)[:, np.newaxis] * load_dir
+        nids.append(nodes.ravel())
+        icards.append(np.repeat(icardsi, nface))
+        forces.append(np.repeat(f, nface, axis=0))
+    return np.hstack(nids), np.hstack(icards), np.vstack(forces)
+
+def _get_nodal_mass(model: BDF, all_nids: np.ndarray, xyz_cid0: np.ndarray,
+                    idtype: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    helper method for ``get_static_force_matrix``
+
+    Lumps the mass of the elements equally to their GRIDs
+
+    Returns
+    -------
+    nids : (n, ) int ndarray
+        the node of each lumped mass
+    masses : (n, ) float ndarray
+        the lumped mass
+    mass_offsets : (n, 3) float ndarray
+        the first moment of mass about the node (e.g., CONM2 offsets)
+
+    """
+    eids, unused_pids, unused_mids, mass, cg, unused_inertia = (
+        get_element_mass_properties(model))
+
+    nids = []
+    masses = []
+    mass_offsets = []
+    for eid, massi, cgi in zip(eids, mass, cg):
+        if massi == 0.0:
+            continue
+        if eid in model.masses:
+            elem = model.masses[eid]
+        else:
+            elem = model.elements[eid]
+        elem_nids = [nid for nid in elem.node_ids
+                     if nid is not None and nid in model.nodes]
+        nnodes = len(elem_nids)
+        if nnodes == 0:
+            continue
+        if nnodes == 1:
+            # a point mass (e.g., CONM2) with an offset
+            nids.append(elem_nids[0])
+            masses.append(massi)
+            mass_offsets.append(massi * (cgi - _get_xyz(all_nids, xyz_cid0, elem_nids)[0]))
+            continue
+        nids.extend(elem_nids)
+        masses.extend([massi / nnodes] * nnodes)
+        mass_offsets.extend([(0., 0., 0.)] * nnodes)
+
+    return (np.array(nids, dtype=idtype), np.array(masses, dtype='float64'),
+            np.array(mass_offsets, dtype='float64').reshape(len(nids), 3))
@@ -0,0 +1,678 @@
+"""
+Defines a vectorized version of ``mass_properties``.  Instead of calling
+``Mass()`` and ``center_of_mass()`` for every element, the elements are
+grouped by element type and the mass, center of mass and inertia are
+calculated from the node xyz and property arrays.
+
+ - mass, cg, inertia = mass_properties_vectorized(
+       model, element_ids=None, mass_ids=None, reference_point=None,
+       sym_axis=None, scale=None, inertia_reference='cg')
+ - eids, pids, mids, mass, cg, inertia = get_element_mass_properties(
+       model, element_ids=None, mass_ids=None, reference_point=None)
+ - ids, mass, cg, inertia = mass_properties_breakdown_by_id(
+       model, by='pid', element_ids=None, mass_ids=None,
+       reference_point=None, scale=None, inertia_reference='cg')
+
+The results are consistent with ``mass_properties``, so the elements are
+treated as point masses at their center of mass.  The following are
+vectorized:
+
+ - shells: CTRIA3, CTRIA6, CTRIAR, CQUAD4, CQUAD8, CQUADR, CQUAD and CSHEAR
+   with a PSHELL, PCOMP, PCOMPG or PSHEAR
+ - solids: CTETRA, CPENTA, CPYRAM and CHEXA with a PSOLID or PIHEX
+ - lines: CROD, CONROD, CTUBE, CBAR and CBEAM
+ - masses: CONM2
+
+The other elements with mass (e.g., CBEAMs with an offset non-structural
+mass, CMASS1) fall back to ``Mass()`` and ``center_of_mass()``.  Springs
+and dampers don't have mass.  The NSM/NSM1/NSML/NSML1 cards aren't
+considered (see ``mass_properties_nsm``).
+
+"""
+from collections import defaultdict
+import numpy as np
+
+from pyNastran.bdf.mesh_utils.mass_properties import (
+    NO_MASS, transform_inertia, _mass_properties_elements_init,
+    _update_reference_point, _apply_mass_symmetry, _get_cbeam_mass_no_nsm)
+from pyNastran.utils.mathematics import integrate_positive_unit_line
+
+#: the number of corner nodes that are used for the mass
+SHELL_NNODES = {
+    'CTRIA3': 3, 'CTRIA6': 3, 'CTRIAR': 3,
+    'CQUAD4': 4, 'CQUAD8': 4, 'CQUADR': 4, 'CQUAD': 4, 'CSHEAR': 4,
+}
+SOLID_NNODES = {'CTETRA': 4, 'CPENTA': 6, 'CPYRAM': 5, 'CHEXA': 8}
+
+#: the properties that are vectorized for each line element
+LINE_PROPERTIES = {
+    'CROD': {'PROD'},
+    'CTUBE': {'PTUBE'},
+    'CBAR': {'PBAR', 'PBARL'},
+    'CBEAM': {'PBEAM', 'PBEAML', 'PBCOMP', 'PBMSECT'},
+}
+
+
+def mass_properties_vectorized(model, element_ids=None, mass_ids=None,
+                               reference_point=None,
+                               sym_axis=None, scale=None, inertia_reference='cg'):
+    """
+    Calculates mass properties in the global system about the
+    reference point.  This is a vectorized version of ``mass_properties``.
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    element_ids : List[int]; ndarray; default=None -> all
+        the element ids to consider
+    mass_ids : List[int]; ndarray; default=None -> all
+        the mass ids to consider
+    reference_point : (3, ) ndarray; default = <0,0,0>.
+        an array that defines the origin of the frame.
+    sym_axis : str, optional
+        The axis to which the model is symmetric.
+        If AERO cards are used, this can be left blank.
+        allowed_values = 'no', x', 'y', 'z', 'xy', 'yz', 'xz', 'xyz'
+    scale : float, optional
+        The WTMASS scaling value.
+        default=None -> PARAM, WTMASS is used
+        float > 0.0
+    inertia_reference : str; default='cg'
+        'cg' : inertia is taken about the cg
+        'ref' : inertia is about the reference point
+
+    Returns
+    -------
+    mass : float
+        the mass of the model
+    cg : (3, ) float NDARRAY
+        the cg of the model as an array.
+    I : (6, ) float NDARRAY
+        moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz])
+
+    .. seealso:: mass_properties
+
+    """
+    reference_point, is_cg = _update_reference_point(
+        model, reference_point, inertia_reference)
+    unused_eids, unused_pids, unused_mids, massi, cgi, inertiai = get_element_mass_properties(
+        model, element_ids=element_ids, mass_ids=mass_ids,
+        reference_point=reference_point)
+
+    mass = massi.sum()
+    cg = np.zeros(3, dtype='float64')
+    if mass:
+        cg = (massi[:, np.newaxis] * cgi).sum(axis=0) / mass
+    inertia = inertiai.sum(axis=0)
+
+    # only transform if we're calculating the inertia about the cg
+    if is_cg:
+        inertia = transform_inertia(mass, cg, reference_point, cg, inertia)
+    mass, cg, inertia = _apply_mass_symmetry(model, sym_axis, scale, mass, cg, inertia)
+    return mass, cg, inertia
+
+
+def mass_properties_breakdown_by_id(model, by='pid', element_ids=None, mass_ids=None,
+                                    reference_point=None, scale=None,
+                                    inertia_reference='cg'):
+    """
+    Gets the mass properties for each property/material id
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    by : str; default='pid'
+        'pid' : group the elements by property id
+        'mid' : group the elements by material id
+    element_ids : List[int]; ndarray; default=None -> all
+        the element ids to consider
+    mass_ids : List[int]; ndarray; default=None -> all
+        the mass ids to consider
+    reference_point : (3, ) ndarray; default = <0,0,0>.
+        an array that defines the origin of the frame.
+    scale : float, optional
+        The WTMASS scaling value.
+        default=None -> PARAM, WTMASS is used
+    inertia_reference : str; default='cg'
+        'cg' : inertia is taken about the cg of each id
+        'ref' : inertia is about the reference point
+
+    Returns
+    -------
+    ids : (nids, ) int ndarray
+        the sorted property/material ids; 0 is used for the elements
+        without a property/material (e.g., CONM2, CONROD)
+    mass : (nids, ) float ndarray
+        the mass of each id
+    cg : (nids, 3) float ndarray
+        the cg of each id
+    inertia : (nids, 6) float ndarray
+        moment of inertia of each id [Ixx, Iyy, Izz, Ixy, Ixz, Iyz]
+
+    .. note:: the mass of composites is assigned to the material of the
+              first ply
+
+    """
+    if by not in ['pid', 'mid']:
+        raise ValueError("by=%r and must be 'pid' or 'mid'" % by)
+    reference_point, is_cg = _update_reference_point(
+        model, reference_point, inertia_reference)
+    unused_eids, pids, mids, massi, cgi, inertiai = get_element_mass_properties(
+        model, element_ids=element_ids, mass_ids=mass_ids,
+        reference_point=reference_point)
+
+    ids_all = pids if by == 'pid' else mids
+    ids, inverse = np.unique(ids_all, return_inverse=True)
+    nids = len(ids)
+    mass = np.bincount(inverse, weights=massi, minlength=nids)
+    cg = np.zeros((nids, 3), dtype='float64')
+    inertia = np.zeros((nids, 6), dtype='float64')
+    for i in range(3):
+        cg[:, i] = np.bincount(inverse, weights=massi * cgi[:, i], minlength=nids)
+    for i in range(6):
+        inertia[:, i] = np.bincount(inverse, weights=inertiai[:, i], minlength=nids)
+
+    is_mass = mass != 0.
+    cg[is_mass, :] /= mass[is_mass, np.newaxis]
+    if is_cg:
+        inertia = transform_inertia(mass, cg.T, reference_point, cg.T, inertia.T).T
+
+    if scale is None:
+        scale = model.wtmass
+    mass *= scale
+    inertia *= scale
+    return ids, mass, cg, inertia
+
+
+def get_element_mass_properties(model, element_ids=None, mass_ids=None,
+                                reference_point=None):
+    """
+    Gets the mass properties of each element
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    element_ids : List[int]; ndarray; default=None -> all
+        the element ids to consider
+    mass_ids : List[int]; ndarray; default=None -> all
+        the mass ids to consider
+    reference_point : (3, ) ndarray; default = <0,0,0>.
+        the point the inertia is taken about
+
+    Returns
+    -------
+    eids : (n, ) int ndarray
+        the sorted element/mass ids
+    pids : (n, ) int ndarray
+        the property id of each element; 0 for masses and CONRODs
+    mids : (n, ) int ndarray
+        the material id of each element; 0 for masses
+    mass : (n, ) float ndarray
+        the mass of each element (without WTMASS)
+    cg : (n, 3) float ndarray
+        the center of mass of each element
+    inertia : (n, 6) float ndarray
+        the moment of inertia [Ixx, Iyy, Izz, Ixy, Ixz, Iyz] of each
+        element about the reference point
+
+    """
+    reference_point = _update_reference_point(model, reference_point, 'ref')[0]
+    unused_element_ids, elements, unused_mass_ids, masses = _mass_properties_elements_init(
+        model, element_ids, mass_ids)
+
+    idtype = model._upcast_int_dtype(dtype='int32')
+    if len(model.nodes) + len(model.gridb):
+        out = model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype=idtype)
+        nid_cp_cd, xyz_cid0 = out[:2]
+        all_nids = nid_cp_cd[:, 0]
+    else:
+        all_nids = np.zeros(0, dtype=idtype)
+        xyz_cid0 = np.zeros((0, 3), dtype='float64')
+
+    groups = _group_elements(model, elements, masses)
+    # eid, pid, mid, mass, cg, inertia
+    results = []
+    for etype, group in sorted(groups['shell'].items()):
+        results.append(_shell_mass(etype, group, all_nids, xyz_cid0))
+    for etype, group in sorted(groups['solid'].items()):
+        results.append(_solid_mass(etype, group, all_nids, xyz_cid0))
+    for etype, group in sorted(groups['line'].items()):
+        results.append(_line_mass(etype, group, all_nids, xyz_cid0))
+    if groups['conm2']:
+        results.append(_conm2_mass(model, groups['conm2'], all_nids, xyz_cid0))
+    if groups['other']:
+        results.append(_fallback_mass(model, groups['other'], reference_point))
+
+    if not results:
+        return (np.zeros(0, dtype=idtype), np.zeros(0, dtype=idtype),
+                np.zeros(0, dtype=idtype), np.zeros(0, dtype='float64'),
+                np.zeros((0, 3), dtype='float64'), np.zeros((0, 6), dtype='float64'))
+
+    eids = np.hstack([result[0] for result in results]).astype(idtype)
+    pids = np.hstack([result[1] for result in results]).astype(idtype)
+    mids = np.hstack([result[2] for result in results]).astype(idtype)
+    mass = np.hstack([result[3] for result in results])
+    cg = np.vstack([result[4] for result in results])
+    inertia = _point_mass_inertia(mass, cg, reference_point)
+
+    # the elements with a non-structural mass axis have their own inertia
+    irow = 0
+    for result in results:
+        nrows = len(result[0])
+        if len(result) == 6:
+            inertia[irow:irow+nrows, :] = result[5]
+        irow += nrows
+
+    isort = np.argsort(eids, kind='mergesort')
+    return eids[isort], pids[isort], mids[isort], mass[isort], cg[isort, :], inertia[isort, :]
+
+
+def _point_mass_inertia(mass, xyz, reference_point):
+    """gets the inertia of point masses about the reference point"""
+    x, y, z = (xyz - reference_point).T
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    inertia = np.column_stack([
+        mass * (y2 + z2),  # Ixx
+        mass * (x2 + z2),  # Iyy
+        mass * (x2 + y2),  # Izz
+        mass * x * y,      # Ixy
+        mass * x * z,      # Ixz
+        mass * y * z,      # Iyz
+    ])
+    return inertia
+
+
+def _get_node_xyz(all_nids, xyz_cid0, nids, etype):
+    """gets the (nelements, nnodes, 3) xyz for the node ids"""
+    nids = np.asarray(nids)
+    inids = np.searchsorted(all_nids, nids.ravel())
+    is_missing = (inids == len(all_nids))
+    is_missing[~is_missing] = all_nids[inids[~is_missing]] != nids.ravel()[~is_missing]
+    if is_missing.any():
+        missing_nids = np.unique(nids.ravel()[is_missing])
+        raise KeyError('%s nodes=%s are missing' % (etype, missing_nids.tolist()))
+    return xyz_cid0[inids, :].reshape(nids.shape + (3, ))
+
+
+def _get_mid(prop):
+    """gets the material id of a property (the first ply for composites)"""
+    if prop.type in ['PCOMP', 'PCOMPG']:
+        return prop.Mid(0)
+    return prop.Mid()
+
+
+def _group_elements(model, elements, masses):
+    """
+    Sorts the elements and masses by type and gets the property data,
+    which is only calculated once per property
+
+    Returns
+    -------
+    groups : dict[str] = value
+        shell : dict[etype] = dict[str] = list
+            eid, pid, mid, nids, tflag, tscales, t0, rho, nsm
+        solid : dict[etype] = dict[str] = list
+            eid, pid, mid, nids, rho
+        line : dict[etype] = dict[str] = list
+            eid, pid, mid, nids, mass_per_length
+        conm2 : List[CONM2]
+            the CONM2s
+        other : List[Element]
+            the elements that aren't vectorized
+
+    """
+    shells = defaultdict(lambda: defaultdict(list))
+    solids = defaultdict(lambda: defaultdict(list))
+    lines = defaultdict(lambda: defaultdict(list))
+    conm2s = []
+    others = []
+
+    shell_props = {}
+    solid_props = {}
+    line_props = {}
+    for elem in elements:
+        etype = elem.type
+        if etype in NO_MASS:
+            continue
+
+        if etype in SHELL_NNODES:
+            pid = elem.pid
+            if pid not in shell_props:
+                shell_props[pid] = _get_shell_property(elem.pid_ref)
+            prop_data = shell_props[pid]
+            if prop_data is None:
+                others.append(elem)
+                continue
+            mid, t0, rho, nsm, is_pshell = prop_data
+            nnodes = SHELL_NNODES[etype]
+            tscales = elem.get_thickness_scale() if is_pshell else None
+            if tscales is None:
+                tscales = [None] * nnodes
+            group = shells[etype]
+            group['eid'].append(elem.eid)
+            group['pid'].append(pid)
+            group['mid'].append(mid)
+            group['nids'].append(elem.nodes[:nnodes])
+            group['tflag'].append(elem.tflag if is_pshell else 1)
+            group['tscales'].append([np.nan if ti is None else ti for ti in tscales])
+            group['t0'].append(t0)
+            group['rho'].append(rho)
+            group['nsm'].append(nsm)
+
+        elif etype in SOLID_NNODES:
+            pid = elem.pid
+            if pid not in solid_props:
+                prop = elem.pid_ref
+                solid_props[pid] = (
+                    (prop.Mid(), prop.Rho()) if prop.type in ['PSOLID', 'PIHEX'] else None)
+            prop_data = solid_props[pid]
+            if prop_data is None:
+                others.append(elem)
+                continue
+            group = solids[etype]
+            group['eid'].append(elem.eid)
+            group['pid'].append(pid)
+            group['mid'].append(prop_data[0])
+            group['nids'].append(elem.nodes[:SOLID_NNODES[etype]])
+            group['rho'].append(prop_data[1])
+
+        elif etype == 'CONROD':
+            group = lines[etype]
+            group['eid'].append(elem.eid)
+            group['pid'].append(0)
+            group['mid'].append(elem.Mid())
+            group['nids'].append(elem.nodes)
+            group['mass_per_length'].append(elem.Rho() * elem.A + elem.nsm)
+
+        elif etype in LINE_PROPERTIES:
+            pid = elem.pid
+            key = (etype, pid)
+            if key not in line_props:
+                line_props[key] = _get_line_property(etype, elem.pid_ref)
+            prop_data = line_props[key]
+            if prop_data is None:
+                others.append(elem)
+                continue
+            mid, mass_per_length, nsm_per_length, is_nsm_offset = prop_data
+            if mass_per_length is None:
+                # PBMSECT
+                continue
+            if etype == 'CBEAM' and _is_nsm_offset(elem, nsm_per_length, is_nsm_offset):
+                others.append(elem)
+                continue
+            group = lines[etype]
+            group['eid'].append(elem.eid)
+            group['pid'].append(pid)
+            group['mid'].append(mid)
+            group['nids'].append(elem.nodes)
+            group['mass_per_length'].append(mass_per_length)
+        else:
+            others.append(elem)
+
+    for elem in masses:
+        if elem.type == 'CONM2':
+            conm2s.append(elem)
+        elif elem.type not in NO_MASS:
+            others.append(elem)
+
+    groups = {
+        'shell': shells,
+        'solid': solids,
+        'line': lines,
+        'conm2': conm2s,
+        'other': others,
+    }
+    return groups
+
+
+def _get_shell_property(prop):
+    """
+    Gets the mass data for a shell property
+
+    Returns
+    -------
+    prop_data : tuple / None
+        (mid, t0, rho, nsm, is_pshell); None if it's not vectorized
+        The mass/area of a PCOMP, PCOMPG and PSHEAR doesn't depend on the
+        element, so it's stored as the nsm.
+
+    """
+    ptype = prop.type
+    if ptype == 'PSHELL':
+        return prop.Mid(), prop.t, prop.mid_ref.Rho(), prop.nsm, True
+    elif ptype in ['PCOMP', 'PCOMPG']:
+        return _get_mid(prop), 0., 0., prop.get_mass_per_area(), False
+    elif ptype == 'PSHEAR':
+        return prop.Mid(), 0., 0., prop.MassPerArea(), False
+    return None
+
+
+def _get_line_property(etype, prop):
+    """
+    Gets the mass data for a line property (see ``_get_cbeam_mass_no_nsm``)
+
+    Returns
+    -------
+    prop_data : tuple / None
+        (mid, mass_per_length, nsm_per_length, is_nsm_offset);
+        None if it's not vectorized
+        mass_per_length includes the non-structural mass and is None
+        for a PBMSECT, which doesn't have mass
+        is_nsm_offset is True for a PBEAM/PBCOMP with a non-structural
+        mass axis (m1a, m2a, ...)
+
+    """
+    ptype = prop.type
+    if ptype not in LINE_PROPERTIES[etype]:
+        return None
+
+    nsm_per_length = 0.
+    is_nsm_offset = False
+    if ptype == 'PROD':
+        mass_per_length = prop.mid_ref.rho * prop.A + prop.nsm
+    elif ptype in ['PTUBE', 'PBAR', 'PBARL']:
+        mass_per_length = prop.MassPerLength()
+    elif ptype == 'PBEAM':
+        rho = prop.Rho()
+        mass_per_lengths = [area * rho for area in prop.A]
+        nsm_per_length = integrate_positive_unit_line(prop.xxb, prop.nsm)
+        mass_per_length = (
+            integrate_positive_unit_line(prop.xxb, mass_per_lengths) + nsm_per_length)
+        is_nsm_offset = any([prop.m1a, prop.m2a, prop.m1b, prop.m2b])
+    elif ptype == 'PBEAML':
+        # mass_per_length already includes nsm
+        mass_per_length = integrate_positive_unit_line(prop.xxb, prop.get_mass_per_lengths())
+    elif ptype == 'PBCOMP':
+        nsm_per_length = prop.nsm
+        mass_per_length = prop.MassPerLength() + nsm_per_length
+        is_nsm_offset = any([prop.m1, prop.m2])
+    else:
+        assert ptype == 'PBMSECT', ptype
+        mass_per_length = None
+    return prop.Mid(), mass_per_length, nsm_per_length, is_nsm_offset
+
+
+def _is_nsm_offset(elem, nsm_per_length, is_nsm_offset):
+    """
+    Is the non-structural mass of a CBEAM offset from the centroid?
+    If so, the non-structural mass has a different center of mass than
+    the structural mass.
+    """
+    if nsm_per_length == 0.:
+        return False
+    return is_nsm_offset or bool(np.any(elem.wa) or np.any(elem.wb))
+
+
+def _shell_mass(etype, group, all_nids, xyz_cid0):
+    """gets the mass and centroid of CTRIA3s, CQUAD4s, ... (see ``_get_quad_mass``)"""
+    xyz = _get_node_xyz(all_nids, xyz_cid0, group['nids'], etype)
+    nnodes = SHELL_NNODES[etype]
+    if nnodes == 3:
+        p1, p2, p3 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :]
+        area = 0.5 * np.linalg.norm(np.cross(p1 - p2, p1 - p3), axis=1)
+    else:
+        p1, p2, p3, p4 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :], xyz[:, 3, :]
+        area = 0.5 * np.linalg.norm(np.cross(p3 - p1, p4 - p2), axis=1)
+    centroid = xyz.sum(axis=1) / nnodes
+
+    # PSHELL thickness (see ``PSHELL.Thickness``)
+    #   tflag=0: absolute; ti
+    #   tflag=1: relative; ti * t0
+    t0 = np.array(group['t0'], dtype='float64')
+    tflag = np.array(group['tflag'])
+    if not np.all(np.isin(tflag, [0, 1])):
+        raise RuntimeError('%s tflag=%s and must be 0/1' % (etype, np.unique(tflag).tolist()))
+    tscales = np.array(group['tscales'], dtype='float64')
+    tscale = np.where(tflag == 1, t0, 1.)
+    ti = np.where(np.isnan(tscales), t0[:, np.newaxis], tscales * tscale[:, np.newaxis])
+    thickness = ti.sum(axis=1) / nnodes
+
+    rho = np.array(group['rho'], dtype='float64')
+    nsm = np.array(group['nsm'], dtype='float64')
+    mass = (nsm + rho * thickness) * area
+    return group['eid'], group['pid'], group['mid'], mass, centroid
+
+
+def _solid_mass(etype, group, all_nids, xyz_cid0):
+    """gets the mass and centroid of CTETRAs, CHEXAs, ... (see ``CHEXA8.Volume``)"""
+    xyz = _get_node_xyz(all_nids, xyz_cid0, group['nids'], etype)
+    if etype == 'CTETRA':
+        p1, p2, p3, p4 = xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :], xyz[:, 3, :]
+        # signed volume; see volume4
+        volume = -np.einsum('ij,ij->i', p1 - p4, np.cross(p2 - p4, p3 - p4)) / 6.
+        centroid = (p1 + p2 + p3 + p4) / 4.
+    elif etype == 'CPENTA':
+        p1, p2, p3, p4, p5, p6 = [xyz[:, i, :] for i in range(6)]
+        area1 = 0.5 * np.linalg.norm(np.cross(p3 - p1, p2 - p1), axis=1)
+        area2 = 0.5 * np.linalg.norm(np.cross(p6 - p4, p5 - p4), axis=1)
+        c1 = (p1 + p2 + p3) / 3.
+        c2 = (p4 + p5 + p6) / 3.
+        volume = np.abs((area1 + area2) / 2. * np.linalg.norm(c1 - c2, axis=1))
+        centroid = (c1 + c2) / 2.
+    elif etype == 'CPYRAM':
+        p1, p2, p3, p4, p5 = [xyz[:, i, :] for i in range(5)]
+        area1 = 0.5 * np.linalg.norm(np.cross(p3 - p1, p4 - p2), axis=1)
+        c1 = (p1 + p2 + p3 + p4) / 4.
+        volume = np.abs(area1 / 3. * np.linalg.norm(c1 - p5, axis=1))
+        centroid = (c1 + p5) / 2.
+    else:
+        assert etype == 'CHEXA', etype
+        p1, p2, p3, p4, p5, p6, p7, p8 = [xyz[:, i, :] for i in range(8)]
+        area1 = 0.5 * np.linalg.norm(np.cross(p3 - p1, p4 - p2), axis=1)
+        area2 = 0.5 * np.linalg.norm(np.cross(p7 - p5, p8 - p6), axis=1)
+        c1 = (p1 + p2 + p3 + p4) / 4.
+        c2 = (p5 + p6 + p7 + p8) / 4.
+        volume = np.abs((area1 + area2) / 2. * np.linalg.norm(c1 - c2, axis=1))
+        centroid = (c1 + c2) / 2.
+
+    rho = np.array(group['rho'], dtype='float64')
+    mass = rho * volume
+    return group['eid'], group['pid'], group['mid'], mass, centroid
+
+
+def _line_mass(etype, group, all_nids, xyz_cid0):
+    """gets the mass and centroid of CRODs, CBARs, ..."""
+    xyz = _get_node_xyz(all_nids, xyz_cid0, group['nids'], etype)
+    p1 = xyz[:, 0, :]
+    p2 = xyz[:, 1, :]
+    length = np.linalg.norm(p2 - p1, axis=1)
+    centroid = (p1 + p2) / 2.
+    mass_per_length = np.array(group['mass_per_length'], dtype='float64')
+    mass = mass_per_length * length
+    return group['eid'], group['pid'], group['mid'], mass, centroid
+
+
+def _conm2_mass(model, conm2s, all_nids, xyz_cid0):
+    """gets the mass and centroid of the CONM2s (see ``CONM2.Centroid``)"""
+    nconm2 = len(conm2s)
+    eids = np.array([elem.eid for elem in conm2s])
+    nids = np.array([elem.Nid() for elem in conm2s])
+    cids = np.array([elem.Cid() for elem in conm2s])
+    mass = np.array([elem.mass for elem in conm2s], dtype='float64')
+    offset = np.array([elem.X for elem in conm2s], dtype='float64').reshape(nconm2, 3)
+
+    # cid=-1: X is the location of the mass in the basic system
+    centroid = offset.copy()
+    is_offset = cids != -1
+    if is_offset.any():
+        xyz = _get_node_xyz(all_nids, xyz_cid0, nids[is_offset], 'CONM2')
+        dxyz = offset[is_offset, :]
+        for cid in np.unique(cids[is_offset]):
+            if cid == 0:
+                continue
+            # the offset is defined in a local system
+            icid = cids[is_offset] == cid
+            coord = model.coords[cid]
+            dxyz[icid, :] = coord.transform_vector_to_global_array(dxyz[icid, :])
+        centroid[is_offset, :] = xyz + dxyz
+    zero = np.zeros(nconm2, dtype=eids.dtype)
+    return eids, zero, zero, mass, centroid
+
+
+def _fallback_mass(model, elements, reference_point):
+    """
+    Gets the mass properties of the elements that aren't vectorized
+    using ``Mass()`` and ``center_of_mass()`` (see ``_mass_properties``)
+    """
+    eids = []
+    pids = []
+    mids = []
+    mass = []
+    centroid = []
+    inertia = []
+    for elem in elements:
+        if elem.type == 'CBEAM':
+            cgi = np.zeros(3, dtype='float64')
+            inertiai = np.zeros(6, dtype='float64')
+            massi = _get_cbeam_mass_no_nsm(model, elem, 0., cgi, inertiai, reference_point)
+            if massi:
+                cgi /= massi
+        else:
+            try:
+                cgi = elem.center_of_mass()
+            except AttributeError:
+                if elem.type in NO_MASS:
+                    continue
+                model.log.error(elem.rstrip())
+                raise
+
+            try:
+                massi = elem.Mass()
+            except Exception:
+                # PLPLANE
+                if elem.pid_ref.type == 'PSHELL':
+                    raise
+                model.log.warning('could not get the inertia for element/property\n%s%s' % (
+                    elem, elem.pid_ref))
+                continue
+            inertiai = _point_mass_inertia(
+                np.array([massi]), np.array([cgi]), reference_point)[0, :]
+
+        pid_ref = getattr(elem, 'pid_ref', None)
+        eids.append(elem.eid)
+        pids.append(0 if pid_ref is None else pid_ref.pid)
+        mids.append(_get_fallback_mid(elem, pid_ref))
+        mass.append(massi)
+        centroid.append(cgi)
+        inertia.append(inertiai)
+    mass = np.array(mass, dtype='float64')
+    centroid = np.array(centroid, dtype='float64').reshape(len(mass), 3)
+    inertia = np.array(inertia, dtype='float64').reshape(len(mass), 6)
+    return eids, pids, mids, mass, centroid, inertia
+
+
+def _get_fallback_mid(elem, pid_ref):
+    """gets the material id of an element that isn't vectorized; 0 for masses"""
+    if pid_ref is None:
+        mid_ref = getattr(elem, 'mid_ref', None)
+        return 0 if mid_ref is None else mid_ref.mid
+    try:
+        return _get_mid(pid_ref)
+    except AttributeError:
+        # PMASS
+        return 0
@@ -413,10 +413,7 @@ def __mirror_elements(model: BDF, mirror_model: BDF,
                 element2.theta_mcid += cid_offset
         elif etype in solids:
             # what about inverting solids?
-            nodes2 = [node_id + nid_offset if node_id is not None else None
-                     for node_id in nodes1]
             etypes_skipped.add(etype)
-            element2.nodes2 = nodes2
             element2.cross_reference(model)
             vol = element2.Volume()
             assert vol >= 0., vol
@@ -2,11 +2,11 @@
 Defines:
  - pierce_shell_model(bdf_filename, xyz_points, tol=1.0)
 """
-from itertools import count
 from typing import List, Optional
 import numpy as np
 from pyNastran.bdf.bdf import BDF, read_bdf
 from pyNastran.bdf.mesh_utils.bdf_equivalence import _get_tree
+from pyNastran.bdf.mesh_utils.element_bvh import get_element_bvh
 
 
 def quad_intersection(orig, direction, v0, v1, v2, v3):
@@ -109,7 +109,7 @@ def pierce_shell_model(bdf_filename, xyz_points, tol=1.0):
         None : invalid pierce
 
     """
-    xyz_points = np.asarray(xyz_points)
+    xyz_points = np.asarray(xyz_points, dtype='float64')
     assert xyz_points.shape[1] == 3, xyz_points.shape
     xy_points = xyz_points[:, :2].copy()
     assert xy_points.shape[1] == 2, xy_points.shape
@@ -119,115 +119,56 @@ def pierce_shell_model(bdf_filename, xyz_points, tol=1.0):
     else:
         model = read_bdf(bdf_filename)
 
-    eids = []
-    centroids = []
-    etypes_to_skip = [
-        'CHEXA', 'CPENTA', 'CTETRA', 'CPYRAM',
-        'CBUSH', 'CBUSH1D', 'CBUSH2D',
-        'CBEAM', 'CROD', 'CONROD',
-        'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
-        'CDAMP1', 'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5',
-    ]
-    for eid, elem in model.elements.items():
-        if elem.type in ['CQUAD4', 'CTRIA3']:
-            centroid = elem.Centroid()
-        elif elem.type in etypes_to_skip:
-            continue
-        else:
-            print(elem.type)
-            #raise NotImplementedError(elem)
-            continue
-        eids.append(eid)
-        centroids.append(centroid)
-    eids = np.array(eids, dtype='int32')
+    bvh = get_element_bvh(model, etypes=['CQUAD4', 'CTRIA3'])
+    eids = bvh.eids
     assert len(eids) > 0, 'eids=%s\n' % eids
-    centroids_xy = np.array(centroids, dtype='float64')[:, :2]
-
-    #print('centroids:\n%s\n' % str(centroids_xy))
+    centroids_xy = bvh.centroids[:, :2]
     assert centroids_xy.shape[1] == 2, centroids_xy.shape
 
-
+    # only the elements with a centroid that's within tol of the point
+    # (in the xy plane) are considered
     msg = 'which is required by pierce_shell_model'
     kdt = _get_tree(centroids_xy, msg=msg)
-    results = kdt.query_ball_point(xy_points, tol)
-    nresults = len(results)
-    iresults = np.arange(nresults)
-    #print(results)
-    #print(iresults)
+    distance = kdt.query(xy_points, k=1, distance_upper_bound=tol)[0]
+    is_close = np.isfinite(distance)
 
+    # pierce along the entire line (not just the ray), so a pierce
+    # below the point is found
     direction = np.array([0., 0., 1.])
-    ipoints = []
+    ipoint, eids_all, xyz_pierce_all = bvh.pierce_all(
+        xyz_points, direction, tmin=-np.inf)[:3]
+    ielem = np.searchsorted(eids, eids_all)
+    dxy = centroids_xy[ielem] - xy_points[ipoint]
+    is_valid = np.sqrt((dxy ** 2).sum(axis=1)) <= tol
+    ipoint = ipoint[is_valid]
+    eids_all = eids_all[is_valid]
+    xyz_pierce_all = xyz_pierce_all[is_valid]
+
+    # the pierce with the largest z value is the last one for each point
+    ilast = np.searchsorted(ipoint, np.arange(len(xyz_points)), side='right') - 1
+
     eids_pierce = []
     xyz_pierces_max = []
     node_ids = []
-    for i, xyz_point, eidsi in zip(count(), xyz_points, results):
-        model.log.debug('eidsi = [%s]' % ', '.join([str(eidii).rstrip('L') for eidii in eidsi]))
-        if not eidsi:
-            ipoints.append(i)
-            eids_pierce.append(None)
-            xyz_pierces_max.append(None)
-            node_ids.append(None)
+    for i, xyz_point in enumerate(xyz_points):
+        ipierce = ilast[i]
+        if not is_close[i]:
             model.log.warning('skipping %s because it failed tolerancing (tol=%s)' % (xyz_point, tol))
-            continue
-
-        model.log.debug('xyz_point = %s' % xyz_point)
-        eidsi2 = eids[eidsi]
-        eids_newi = []
-        piercesi = []
-        zpiercesi = []
-        for eid in eidsi2:
-            elem = model.elements[eid]
-            if elem.type == 'CQUAD4':
-                v0 = elem.nodes_ref[0].get_position()
-                v1 = elem.nodes_ref[1].get_position()
-                v2 = elem.nodes_ref[2].get_position()
-                v3 = elem.nodes_ref[3].get_position()
-                xyz_pierce = quad_intersection(xyz_point, direction, v0, v1, v2, v3)
-            elif elem.type == 'CTRIA3':
-                v0 = elem.nodes_ref[0].get_position()
-                v1 = elem.nodes_ref[1].get_position()
-                v2 = elem.nodes_ref[2].get_position()
-                xyz_pierce = triangle_intersection(xyz_point, direction, v0, v1, v2)
-            else:
-                raise NotImplementedError(elem)
-
-            if xyz_pierce is None:
-                #model.log.warning('failed to pierce eid=%s' % eid)
-                continue
-
-            zpierce = xyz_pierce[2]
-            model.log.debug('  eid=%s xyz_pierce=%s zpierce=%s' % (eid, xyz_pierce, zpierce))
-            eids_newi.append(eid)
-            piercesi.append(xyz_pierce)
-            zpiercesi.append(zpierce)
-
-        if len(zpiercesi) == 0:
-            ipoints.append(i)
-            eids_pierce.append(None)
-            xyz_pierces_max.append(None)
-            node_ids.append(None)
+        elif ipierce < 0 or ipoint[ipierce] != i:
             model.log.warning('skipping %s because no pierces found (tol=%s)' % (xyz_point, tol))
+        else:
+            eid_max = eids_all[ipierce]
+            eids_pierce.append(eid_max)
+            xyz_pierces_max.append(xyz_pierce_all[ipierce])
+            node_ids.append(model.elements[eid_max].node_ids)
+            model.log.debug('i=%s xyz_point=%s xyz_piercei_max=%s eid_max=%s' % (
+                i, xyz_point, xyz_pierce_all[ipierce], eid_max))
             continue
+        eids_pierce.append(None)
+        xyz_pierces_max.append(None)
+        node_ids.append(None)
 
-        #print('zpiercesi = %s' % zpiercesi)
-        zpiercesi_max = max(zpiercesi)
-        ipierce_max = zpiercesi.index(zpiercesi_max)
-        eid_max = eids_newi[ipierce_max]
-        xyz_piercei_max = piercesi[ipierce_max]
-        model.log.debug('i=%s xyz_point=%s xyz_piercei_max=%s zpiercesi=%s zmax=%s eid_max=%s' % (
-            i, xyz_point, xyz_piercei_max,
-            zpiercesi, zpiercesi_max, eid_max))
-
-        ipoints.append(i)
-        eids_pierce.append(eid_max)
-        xyz_pierces_max.append(xyz_piercei_max)
-        #print(model.elements[eid_max])
-        node_ids.append(model.elements[eid_max].node_ids)
-
-    xyz_pierces_max = np.array(xyz_pierces_max)
-    model.log.debug('ipoints=%s' % ipoints)
     model.log.info('eids_pierce=%s' % eids_pierce)
     model.log.info('xyz_pierces_max:\n%s' % xyz_pierces_max)
     model.log.info('node_ids=%s' % node_ids)
-
     return eids_pierce, xyz_pierces_max, node_ids
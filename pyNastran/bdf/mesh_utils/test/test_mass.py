@@ -5,6 +5,8 @@ import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+from pyNastran.bdf.mesh_utils.mass_properties_vectorized import (
+    mass_properties_vectorized, mass_properties_breakdown_by_id, get_element_mass_properties)
 from pyNastran.utils import object_methods
 
 PKG_PATH = pyNastran.__path__[0]
@@ -163,5 +165,77 @@ class TestMass(unittest.TestCase):
         assert np.allclose(mass, 0.005311658333), 'mass=%s' % mass
         assert np.allclose(mass2, 2.050833333), 'mass2=%s' % mass2
 
+    def test_mass_vectorized(self):
+        """tests the vectorized mass properties against mass_properties"""
+        model = BDF(debug=False, log=None)
+        bdfname = os.path.join(mesh_utils_path, 'test_mass.dat')
+        model.read_bdf(bdfname, xref=False)
+
+        model.add_grid(100, [0., 0., 5.])
+        model.add_grid(101, [2., 0., 5.])
+        model.add_grid(102, [2., 3., 6.])
+        model.add_cord2r(10, [1., 1., 1.], [1., 1., 2.], [2., 1., 1.])
+        model.add_prod(20, 1, 0.5, nsm=0.1)
+        model.add_crod(20, 20, [100, 101])
+        model.add_conrod(21, 1, [101, 102], A=0.2, nsm=0.3)
+        model.add_ptube(22, 1, 0.5, t=0.1, nsm=0.2)
+        model.add_ctube(22, 22, [100, 102])
+        model.add_pbar(23, 1, A=0.3, nsm=0.4)
+        model.add_cbar(23, 23, [100, 102], [0., 0., 1.], None)
+        model.add_pbeam(24, 1, [0.], ['C'], [0.4], [1.], [1.], [0.], [1.], nsm=[0.5],
+                        m1a=0.1, m2a=0.2)
+        model.add_cbeam(24, 24, [100, 101], [0., 0., 1.], None)
+        model.add_pbeaml(25, 1, 'ROD', [0.], [[0.2]], nsm=[0.1])
+        model.add_cbeam(25, 25, [101, 102], [0., 0., 1.], None)
+        model.add_conm2(30, 100, 2.0)
+        model.add_conm2(31, 101, 3.0, cid=-1, X=[1., 2., 3.])
+        model.add_conm2(32, 102, 4.0, cid=10, X=[1., 0.5, 0.25])
+        model.cross_reference()
+
+        for reference_point, inertia_reference in [(None, 'cg'), ([1., 2., 3.], 'ref')]:
+            mass1, cg1, inertia1 = mass_properties(
+                model, reference_point=reference_point, inertia_reference=inertia_reference)
+            mass2, cg2, inertia2 = mass_properties_vectorized(
+                model, reference_point=reference_point, inertia_reference=inertia_reference)
+            assert np.allclose(mass1, mass2), 'mass1=%s mass2=%s' % (mass1, mass2)
+            assert np.allclose(cg1, cg2), 'cg1=%s cg2=%s' % (cg1, cg2)
+            assert np.allclose(inertia1, inertia2), 'I1=%s I2=%s' % (inertia1, inertia2)
+
+        element_ids = [1, 7, 20, 24]
+        mass_ids = [32]
+        mass1, cg1, inertia1 = mass_properties(
+            model, element_ids=element_ids, mass_ids=mass_ids, scale=1.)
+        mass2, cg2, inertia2 = mass_properties_vectorized(
+            model, element_ids=element_ids, mass_ids=mass_ids, scale=1.)
+        assert np.allclose(mass1, mass2), 'mass1=%s mass2=%s' % (mass1, mass2)
+        assert np.allclose(cg1, cg2), 'cg1=%s cg2=%s' % (cg1, cg2)
+        assert np.allclose(inertia1, inertia2), 'I1=%s I2=%s' % (inertia1, inertia2)
+
+        eids, pids, mids, mass, cg, inertia = get_element_mass_properties(model)
+        assert np.array_equal(eids, np.unique(eids)), eids
+        for eid, massi, cgi in zip(eids, mass, cg):
+            elem = model.masses[eid] if eid in model.masses else model.elements[eid]
+            if elem.type == 'CBEAM':
+                continue
+            assert np.allclose(massi, elem.Mass()), 'eid=%s mass=%s' % (eid, massi)
+            assert np.allclose(cgi, elem.center_of_mass()), 'eid=%s cg=%s' % (eid, cgi)
+
+        mass1, cg1, inertia1 = mass_properties_vectorized(model, reference_point=[1., 2., 3.])
+        for by in ['pid', 'mid']:
+            ids, mass, cg, inertia = mass_properties_breakdown_by_id(
+                model, by=by, reference_point=[1., 2., 3.], inertia_reference='ref')
+            assert ids[0] == 0, ids
+            assert np.allclose(mass.sum(), mass1)
+            assert np.allclose((mass[:, np.newaxis] * cg).sum(axis=0) / mass.sum(), cg1)
+
+        ids, mass, cg, inertia = mass_properties_breakdown_by_id(model, by='pid', scale=1.)
+        mass2, cg2, inertia2 = mass_properties_vectorized(model, element_ids=[20], scale=1.)
+        i20 = np.searchsorted(ids, 20)
+        assert np.allclose(mass[i20], mass2)
+        assert np.allclose(cg[i20], cg2)
+        assert np.allclose(inertia[i20], inertia2)
+        with self.assertRaises(ValueError):
+            mass_properties_breakdown_by_id(model, by='eid')
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
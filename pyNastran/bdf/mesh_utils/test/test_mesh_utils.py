@@ -9,12 +9,15 @@ from cpylog import SimpleLogger
 
 import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf
-from pyNastran.bdf.mesh_utils.bdf_equivalence import bdf_equivalence_nodes
+from pyNastran.bdf.mesh_utils.bdf_equivalence import (
+    bdf_equivalence_nodes, find_equivalence_pairs, get_equivalence_map,
+    get_equivalence_map_from_file)
 from pyNastran.bdf.mesh_utils.export_mcids import export_mcids
 from pyNastran.bdf.mesh_utils.split_cbars_by_pin_flag import split_cbars_by_pin_flag
 from pyNastran.bdf.mesh_utils.split_elements import split_line_elements
 from pyNastran.bdf.mesh_utils.pierce_shells import (
     pierce_shell_model) #, quad_intersection, triangle_intersection)
+from pyNastran.bdf.mesh_utils.element_bvh import get_element_bvh, clear_element_bvh
 from pyNastran.bdf.mesh_utils.mirror_mesh import (
     write_bdf_symmetric, bdf_mirror, bdf_mirror_plane)
 from pyNastran.bdf.mesh_utils.mass_properties import (
@@ -784,7 +787,118 @@ class TestMeshUtils(unittest.TestCase):
             [0.4, 0.6, 0.],
             [-1., -1, 0.],
         ]
-        pierce_shell_model(model, xyz_points)
+        eids_pierce, xyz_pierces_max, node_ids = pierce_shell_model(model, xyz_points)
+        assert eids_pierce == [2, None], eids_pierce
+        assert np.allclose(xyz_pierces_max[0], [0.4, 0.6, 1.]), xyz_pierces_max
+        assert xyz_pierces_max[1] is None, xyz_pierces_max
+        assert node_ids == [[5, 6, 7, 8], None], node_ids
+
+    def test_element_bvh_shell(self):
+        """tests the ElementBVH queries on a plate"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        pid = 10
+        p1 = [0., 0., 0.]
+        p2 = [1., 0., 0.]
+        p3 = [1., 1., 0.]
+        p4 = [0., 1., 0.]
+        create_structured_cquad4s(model, pid, p1, p2, p3, p4, 4, 4, nid=1, eid=1)
+        model.add_grid(100, [2., 0., 1.])
+        model.add_grid(101, [3., 0., 1.])
+        model.add_grid(102, [2., 1., 1.])
+        model.add_ctria3(100, pid, [100, 101, 102])
+
+        bvh = get_element_bvh(model, leaf_size=2)
+        assert len(bvh.eids) == 17, bvh
+        assert bvh.nfaces == 33, bvh
+
+        xyz = [
+            [0.1, 0.1, -1.],  # eid=1
+            [0.9, 0.9, 1.],  # eid=16 (behind the ray)
+            [2.1, 0.1, 0.],  # eid=100
+            [5., 5., 0.],  # misses
+        ]
+        eids, xyz_pierce, t = bvh.pierce(xyz, [0., 0., 1.])
+        assert np.array_equal(eids, [1, -1, 100, -1]), eids
+        assert np.allclose(xyz_pierce[0], [0.1, 0.1, 0.]), xyz_pierce
+        assert np.allclose(t[[0, 2]], [1., 1.]), t
+
+        eids, xyz_pierce, t = bvh.pierce(xyz, [0., 0., 1.], tmin=-np.inf, select='max')
+        assert np.array_equal(eids, [1, 16, 100, -1]), eids
+        assert np.allclose(t[:3], [1., -1., 1.]), t
+        assert np.isnan(xyz_pierce[3]).all(), xyz_pierce
+
+        # a ray through the diagonal of a quad pierces it once
+        iray, eids, xyz_pierce, t = bvh.pierce_all(
+            [[0.6, 0.6, 1.]], [[0., 0., -1.]], tmax=0.5)
+        assert len(iray) == 0, iray
+        iray, eids, xyz_pierce, t = bvh.pierce_all([[0.6, 0.6, 1.]], [[0., 0., -1.]])
+        assert np.array_equal(eids, [11]), eids
+
+        eids, xyz_closest, distance = bvh.nearest_element(
+            [[0.1, 0.1, 0.5], [2.1, 0.1, 2.], [5., 0., 0.]], max_distance=2.)
+        assert np.array_equal(eids, [1, 100, -1]), eids
+        assert np.allclose(xyz_closest[:2], [[0.1, 0.1, 0.], [2.1, 0.1, 1.]]), xyz_closest
+        assert np.allclose(distance[:2], [0.5, 1.]), distance
+        assert np.isinf(distance[2]), distance
+
+        ibox, eids = bvh.query_box([[-0.1, -0.1, -0.1], [1.9, -1., 0.9]],
+                                   [[0.3, 0.3, 0.1], [2.1, 2., 1.1]])
+        assert np.array_equal(ibox, [0, 0, 0, 0, 1]), ibox
+        assert np.array_equal(eids, [1, 2, 5, 6, 100]), eids
+
+        iplane, eids = bvh.intersect_plane([[0.1, 0., 0.], [0., 0., 1.]],
+                                           [[1., 0., 0.], [0., 0., 1.]])
+        assert np.array_equal(iplane, [0, 0, 0, 0, 1]), iplane
+        assert np.array_equal(eids, [1, 2, 3, 4, 100]), eids
+
+    def test_element_bvh_cache(self):
+        """tests the ElementBVH is rebuilt when the model changes"""
+        log = SimpleLogger(level='error')
+        model = BDF(log=log)
+        pid = 10
+        nid = 1
+        for z in [0., 1.]:
+            for y in [0., 1.]:
+                for x in [0., 1., 2.]:
+                    model.add_grid(nid, [x, y, z])
+                    nid += 1
+        model.add_chexa(1, pid, [1, 2, 5, 4, 7, 8, 11, 10])
+        model.add_chexa(2, pid, [2, 3, 6, 5, 8, 9, 12, 11])
+
+        bvh = get_element_bvh(model)
+        assert bvh.nfaces == 24, bvh
+        assert get_element_bvh(model) is bvh
+        assert np.allclose(bvh.centroids, [[0.5, 0.5, 0.5], [1.5, 0.5, 0.5]]), bvh.centroids
+
+        iray, eids, xyz_pierce, t = bvh.pierce_all([[-1., 0.5, 0.5]], [1., 0., 0.])
+        assert np.array_equal(eids, [1, 2]), eids
+        assert np.allclose(xyz_pierce, [[0., 0.5, 0.5], [1., 0.5, 0.5]]), xyz_pierce
+
+        # move the end of the model
+        for node in model.nodes.values():
+            if node.xyz[0] == 2.:
+                node.xyz[0] = 3.
+        bvh2 = get_element_bvh(model)
+        assert bvh2 is not bvh
+        eids, xyz_closest, distance = bvh2.nearest_element([[4., 0.5, 0.5]])
+        assert np.array_equal(eids, [2]), eids
+        assert np.allclose(distance, [1.]), distance
+
+        # adding an element rebuilds the bvh
+        model.add_grid(100, [5., 0., 0.])
+        model.add_grid(101, [6., 0., 0.])
+        model.add_grid(102, [5., 1., 0.])
+        model.add_ctria3(100, pid, [100, 101, 102])
+        bvh3 = get_element_bvh(model)
+        assert bvh3 is not bvh2
+        eids, xyz_closest, distance = bvh3.nearest_element([[5.1, 0.1, 1.]])
+        assert np.array_equal(eids, [100]), eids
+
+        bvh4 = get_element_bvh(model, etypes=['CTRIA3'])
+        assert np.array_equal(bvh4.eids, [100]), bvh4.eids
+        clear_element_bvh(model)
+        assert get_element_bvh(model) is not bvh3
 
     #def test_intersect(self):
         #p0 = np.array([0,0,0], 'd')
@@ -1201,6 +1315,86 @@ class TestEquiv(unittest.TestCase):
         node_ids = list(sorted(model.nodes))
         assert node_ids == [1], node_ids
 
+    def test_eq_blocked(self):
+        """tests the blocked equivalencing and the union-find of node chains"""
+        log = SimpleLogger(level='error')
+        msg = (
+            'CEND\n'
+            'BEGIN BULK\n'
+            'CORD2R,10,,1.,0.,0.,1.,0.,1.\n'
+            ',2.,0.,0.\n'
+            'GRID,1,,0.,0.,0.\n'
+            'GRID,2,,1.,0.,0.\n'
+            'GRID,3,10,0.,0.,0.\n'
+            'GRID*                  4                              0.              0.\n'
+            '*                     0.\n'
+            # a chain: 5-6 and 6-7 are within tol, but 5-7 isn't
+            'GRID,5,,0.,1.,0.\n'
+            'GRID,6,,0.0015,1.,0.\n'
+            'GRID,7,,0.003,1.,0.\n'
+            'CTRIA3,1,1,1,2,5\n'
+            'CTRIA3,2,1,4,3,7\n'
+            'PSHELL,1,1,0.1\n'
+            'MAT1,1,3.0,, 0.3\n'
+            'ENDDATA\n'
+        )
+        bdf_filename = os.path.join(DIRNAME, 'eq_blocked.bdf')
+        bdf_filename_out = os.path.join(DIRNAME, 'eq_blocked_out.bdf')
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(msg)
+
+        tol = 0.002
+        nids_removed, nids_kept = get_equivalence_map_from_file(bdf_filename, tol, log=log)
+        assert nids_removed.tolist() == [3, 4, 6, 7], nids_removed
+        assert nids_kept.tolist() == [2, 1, 5, 5], nids_kept
+
+        model = bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
+                                      renumber_nodes=False, xref=True, log=log,
+                                      debug=False, method='blocked', workers=2)
+        assert model.elements[2].node_ids == [1, 2, 5], model.elements[2].node_ids
+        model = save_check_nodes(bdf_filename_out, log, nnodes=3)
+        node_ids = list(sorted(model.nodes))
+        assert node_ids == [1, 2, 5], node_ids
+
+        # the node set excludes 3
+        model = bdf_equivalence_nodes(bdf_filename, bdf_filename_out, tol,
+                                      renumber_nodes=False, xref=True, node_set=[1, 2, 4],
+                                      log=log, debug=False, method='blocked')
+        model = save_check_nodes(bdf_filename_out, log, nnodes=6)
+        node_ids = list(sorted(model.nodes))
+        assert node_ids == [1, 2, 3, 5, 6, 7], node_ids
+        os.remove(bdf_filename)
+
+        # a CORD1R references GRIDs that are after it: origin=1, z=2, xz=5,
+        # so GRID 8 is at GRID 2
+        msg = (
+            'CEND\n'
+            'BEGIN BULK\n'
+            'CORD1R,11,1,2,5\n'
+            'GRID,1,,0.,0.,0.\n'
+            'GRID,2,,1.,0.,0.\n'
+            'GRID,5,,0.,1.,0.\n'
+            'GRID,8,11,0.,0.,1.\n'
+            'ENDDATA\n'
+        )
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(msg)
+        nids_removed, nids_kept = get_equivalence_map_from_file(bdf_filename, tol, log=log)
+        assert nids_removed.tolist() == [8], nids_removed
+        assert nids_kept.tolist() == [2], nids_kept
+        os.remove(bdf_filename)
+
+        # the pairs cross the block boundaries
+        nids = np.arange(1, 2001)
+        xyz = np.zeros((2000, 3))
+        xyz[:1000, 0] = np.linspace(0., 10., num=1000)
+        xyz[1000:, 0] = xyz[:1000, 0] + 0.001
+        nid_pairs = find_equivalence_pairs(nids, xyz, tol, nodes_per_block=10)
+        assert len(nid_pairs) == 1000, len(nid_pairs)
+        assert np.array_equal(nid_pairs[:, 1] - nid_pairs[:, 0], np.full(1000, 1000))
+        nids_removed, nids_kept = get_equivalence_map(nid_pairs)
+        assert np.array_equal(nids_kept, np.arange(1, 1001))
+
 
 def save_check_nodes(bdf_filename, log, nnodes, skip_cards=None):
     model = BDF(log=log, debug=False)
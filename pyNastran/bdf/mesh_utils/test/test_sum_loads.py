@@ -7,7 +7,11 @@ import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.bdf import GRID
-from pyNastran.bdf.mesh_utils.loads import sum_forces_moments, sum_forces_moments_elements
+from pyNastran.bdf.mesh_utils.mesh import create_structured_chexas, create_structured_cquad4s
+from pyNastran.bdf.mesh_utils.loads import (
+    sum_forces_moments, sum_forces_moments_elements, sum_forces_moments_batch,
+    get_static_force_vector_from_subcase_id, get_static_force_matrix, get_dof_map_arrays)
+from pyNastran.bdf.case_control_deck import CaseControlDeck
 model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
 
 
@@ -428,6 +432,80 @@ class TestLoadSum(unittest.TestCase):
             self.assertTrue(allclose(F1_expected, F1), 'loadcase_id=%s F_expected=%s F1=%s' % (loadcase_id, F1_expected, F1))
             self.assertTrue(allclose(M1_expected, M1), 'loadcase_id=%s M_expected=%s M1=%s' % (loadcase_id, M1_expected, M1))
 
+    def test_static_force_matrix_01(self):
+        """tests get_static_force_matrix vs. get_static_force_vector_from_subcase_id"""
+        model = BDF(log=log, debug=False)
+        bdf_filename = os.path.join(model_path, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        model.read_bdf(bdf_filename)
+        Fg, subcase_ids, nid_dof = get_static_force_matrix(model)
+        assert Fg.shape == (len(nid_dof), len(subcase_ids)), Fg.shape
+
+        nid_dof2, unused_ps = get_dof_map_arrays(model)
+        assert np.array_equal(nid_dof, nid_dof2)
+        for isubcase, subcase_id in enumerate(subcase_ids):
+            F = get_static_force_vector_from_subcase_id(model, subcase_id)
+            assert np.allclose(F, Fg[:, isubcase].toarray().ravel()), subcase_id
+
+    def test_static_force_matrix_02(self):
+        """tests get_static_force_matrix with SLOAD, PLOAD4, GRAV and a CD frame"""
+        model = BDF(log=log, debug=False)
+        model.add_mat1(1, 3.0e7, None, 0.3, rho=0.1)
+        model.add_pshell(1, mid1=1, t=0.5)
+        create_structured_cquad4s(model, 1, [0., 0., 0.], [2., 0., 0.], [2., 2., 0.], [0., 2., 0.],
+                                  2, 2, nid=1, eid=1)
+        model.add_grid(10, [5., 0., 0.], cd=1)
+        model.add_cord2r(1, [0., 0., 0.], [1., 0., 0.], [0., 0., 1.])
+        model.add_conm2(20, 10, 2.0, X=[0., 0., 1.])
+        model.add_spoint([100, 101])
+
+        model.add_force(1, 10, 3.0, [1., 0., 0.])
+        model.add_sload(2, [101], [4.0])
+        model.add_pload4(3, list(model.elements), [2., 2., 2., 2.])
+        model.add_grav(4, 2.0, [0., 0., -1.])
+        model.add_load(5, 2.0, [1.0, 0.5], [1, 3])
+
+        lines = []
+        for subcase_id, load_id in [(1, 1), (2, 2), (3, 3), (4, 4), (5, 5), (6, None)]:
+            lines.append('SUBCASE %d' % subcase_id)
+            if load_id is not None:
+                lines.append('  LOAD = %d' % load_id)
+        model.case_control_deck = CaseControlDeck(lines, log=model.log)
+        model.cross_reference()
+
+        Fg, subcase_ids, nid_dof = get_static_force_matrix(model)
+        assert np.array_equal(subcase_ids, [1, 2, 3, 4, 5, 6]), subcase_ids
+        assert Fg.shape == (10 * 6 + 2, 6), Fg.shape
+        F = Fg.toarray()
+        grid = nid_dof[:, 1] > 0
+        Fgrid = F[grid, :].reshape(10, 6, 6)
+
+        # the force in the output coordinate system of node 10 (x -> z, z -> x)
+        inode = 9
+        assert np.allclose(Fgrid[inode, :3, 0], [0., 0., 3.]), Fgrid[inode, :3, 0]
+        assert np.allclose(F[:, 0].sum(), 3.0)
+
+        # SPOINT 101
+        assert np.array_equal(nid_dof[-1], [101, 0])
+        assert F[-1, 1] == 4.0
+        assert np.count_nonzero(F[:, 1]) == 1
+
+        # the pressure resultant is the same as sum_forces_moments
+        forces = Fgrid[:, :3, 2].sum(axis=0)
+        f, unused_m = sum_forces_moments(model, np.zeros(3), 3)
+        assert np.allclose(forces, f), forces
+        assert np.allclose(forces, [0., 0., 8.]), forces
+
+        # GRAV; the CONM2 on node 10 is in the CD=1 frame
+        mass = 4. * 0.5 * 0.1 + 2.0
+        forces = Fgrid[:9, :3, 3].sum(axis=0)
+        assert np.allclose(forces, [0., 0., -2.0 * 0.2]), forces
+        assert np.allclose(Fgrid[inode, :3, 3], [-4., 0., 0.]), Fgrid[inode, :3, 3]
+        assert np.allclose(np.abs(Fgrid[:, :3, 3]).sum(), 2.0 * mass)
+
+        # LOAD
+        assert np.allclose(F[:, 4], 2.0 * (F[:, 0] + 0.5 * F[:, 2]))
+        assert np.count_nonzero(F[:, 5]) == 0
+
     def test_loads_sum_radial_01(self):
         model = BDF(debug=False)
         model.nodes[1] = GRID(1, cp=1, xyz=[0., 0., 0.], cd=0, ps='', seid=0,
@@ -484,5 +562,75 @@ class TestLoadSum(unittest.TestCase):
         self.assertTrue(allclose(M2_expected, M1), 'loadcase_id=%s M_expected=%s M1=%s' % (loadcase_id, M2_expected, M1))
 
 
+    def test_loads_sum_batch(self):
+        """tests sum_forces_moments_batch vs. sum_forces_moments"""
+        model = BDF(log=log, debug=False)
+        bdf_filename = os.path.join(model_path, 'real', 'loads', 'loads.bdf')
+        model.read_bdf(bdf_filename)
+
+        # LOAD cards that reuse the same load cards
+        load_ids = list(model.loads) + list(model.load_combinations)
+        model.add_load(9001, 2.0, [1.0, -0.5], [1001, 1002])
+        model.add_load(9002, 1.0, [3.0, 1.0, 1.0], [1001, 1003, 1001])
+        model.cross_reference()
+        load_ids.extend([9001, 9002])
+
+        p0 = array([1., 2., 3.])
+        forces, moments = sum_forces_moments_batch(model, p0, load_ids, include_grav=False)
+        assert forces.shape == (len(load_ids), 3), forces.shape
+        assert moments.shape == (len(load_ids), 3), moments.shape
+        for load_id, force, moment in zip(load_ids, forces, moments):
+            F1, M1 = sum_forces_moments(model, p0, load_id, include_grav=False)
+            assert np.allclose(F1, force), 'load_id=%s F1=%s force=%s' % (load_id, F1, force)
+            assert np.allclose(M1, moment), 'load_id=%s M1=%s moment=%s' % (load_id, M1, moment)
+
+        F1001, M1001 = sum_forces_moments(model, p0, 1001)
+        F1002, M1002 = sum_forces_moments(model, p0, 1002)
+        iload = load_ids.index(9001)
+        assert np.allclose(forces[iload], 2.0 * (F1001 - 0.5 * F1002)), forces[iload]
+        assert np.allclose(moments[iload], 2.0 * (M1001 - 0.5 * M1002)), moments[iload]
+
+        forces, moments = sum_forces_moments_batch(model, p0, [])
+        assert forces.shape == (0, 3), forces.shape
+
+    def test_loads_sum_batch_solid(self):
+        """tests sum_forces_moments_batch on solid faces, PLOAD4 vectors and GRAV"""
+        model = BDF(log=log, debug=False)
+        model.add_mat1(1, 3.0e7, None, 0.3, rho=0.1)
+        model.add_psolid(1, 1)
+        model.add_pshell(2, mid1=1, t=0.1)
+        x = y = z = [0., 1., 2.]
+        create_structured_chexas(model, 1, x, y, z, 3, 3, 3, eid=1, nid=1)
+        model.add_grid(100, [0., 0., 3.])
+        model.add_grid(101, [2., 0., 3.])
+        model.add_grid(102, [2., 2., 3.])
+        model.add_ctria3(10, 2, [100, 101, 102])
+
+        chexa = model.elements[1]
+        nids = chexa.node_ids
+        model.add_pload4(1, [1], [2., 2., 2., 2.], g1=nids[0], g34=nids[2])
+        model.add_pload4(2, [1], [1., 2., 3., 4.], g1=nids[0], g34=nids[5])
+        model.add_pload4(3, [10], [5., 5., 5., 5.])
+        model.add_pload4(4, [10], [5., 5., 5., 5.], nvector=[1., 1., 0.])
+        model.add_grav(5, 32.2, [0., 0., -1.])
+        model.add_force(6, 27, 10., [1., 0., 0.])
+        model.add_load(10, 1., [1., 2., -1., 1., 1.], [1, 2, 3, 4, 6])
+        model.add_load(11, 2., [1., 1.], [5, 1])
+        model.cross_reference()
+
+        load_ids = [1, 2, 3, 4, 5, 6, 10, 11]
+        p0 = 1
+        for include_grav in [False, True]:
+            forces, moments = sum_forces_moments_batch(
+                model, p0, load_ids, include_grav=include_grav)
+            for load_id, force, moment in zip(load_ids, forces, moments):
+                F1, M1 = sum_forces_moments(model, p0, load_id, include_grav=include_grav)
+                assert np.allclose(F1, force), 'load_id=%s F1=%s force=%s' % (load_id, F1, force)
+                assert np.allclose(M1, moment), 'load_id=%s M1=%s moment=%s' % (load_id, M1, moment)
+
+        # pressure * area along the CTRIA3 normal and the PLOAD4 vector
+        assert np.allclose(forces[2], [0., 0., 10.]), forces[2]
+        assert np.allclose(forces[3], [10. / np.sqrt(2.), 10. / np.sqrt(2.), 0.]), forces[3]
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -73,7 +73,7 @@ def cmd_line_equivalence(argv=None, quiet=False):
     import pyNastran
     msg = (
         'Usage:\n'
-        '  bdf equivalence IN_BDF_FILENAME EQ_TOL [-o OUT_BDF_FILENAME]\n'
+        '  bdf equivalence IN_BDF_FILENAME EQ_TOL [-o OUT_BDF_FILENAME] [--blocked]\n'
         '  bdf equivalence -h | --help\n'
         '  bdf equivalence -v | --version\n'
         '\n'
@@ -85,7 +85,9 @@ def cmd_line_equivalence(argv=None, quiet=False):
         '\n'
 
         'Options:\n'
-        "  -o OUT, --output OUT_BDF_FILENAME  path to output BDF/DAT/NAS file\n\n"
+        "  -o OUT, --output OUT_BDF_FILENAME  path to output BDF/DAT/NAS file\n"
+        "  --blocked                          equivalence blocks of nodes in parallel and\n"
+        "                                     merge chains of nodes (for large models)\n\n"
 
         'Info:\n'
         '  -h, --help      show this help message and exit\n'
@@ -107,6 +109,7 @@ def cmd_line_equivalence(argv=None, quiet=False):
         bdf_filename_out = 'merged.bdf'
     tol = data['EQ_TOL']
     size = 16
+    method = 'blocked' if data['--blocked'] else 'new'
     from pyNastran.bdf.mesh_utils.bdf_equivalence import bdf_equivalence_nodes
 
     level = 'debug' if not quiet else 'warning'
@@ -119,7 +122,7 @@ def cmd_line_equivalence(argv=None, quiet=False):
                           remove_collapsed_elements=False,
                           avoid_collapsed_elements=False,
                           crash_on_collapse=False,
-                          log=log, debug=True)
+                          log=log, debug=True, method=method)
 
 
 def cmd_line_bin(argv=None, quiet=False):  # pragma: no cover
@@ -0,0 +1,449 @@
+"""
+Times and memory-profiles the phases of reading/writing a BDF (reading the
+lines, parsing the cards, cross-referencing, and writing), so the hot paths
+(e.g., ``pybdf.py``, ``bdf_card.py``, ``assign_type.py``) can be compared
+across commits.
+
+usage::
+
+    python -m pyNastran.bdf.test.benchmark [BDF_FILENAME ...]
+    benchmark_bdf --synthetic 100 -o benchmark.json
+    benchmark_bdf -o new.json --compare old.json
+
+The synthetic deck (see ``make_synthetic_bdf``) is a CQUAD4 panel and a
+CHEXA block from ``pyNastran.bdf.mesh_utils.mesh`` with a mix of small field,
+large field, CSV and replicated cards split across INCLUDE files.
+
+The report is a json file::
+
+    {
+        "version": "1.4.0+dev.xxx",
+        "files": {
+            "/path/to/synthetic_100.bdf": {
+                "nbytes": 25104385, "ncards": 231019, "time": 4.51,
+                "cards/s": 51224.6, "peak_rss_mb": 480.2,
+                "phases": {
+                    "read_lines": {
+                        "time": 0.61, "peak_traced_mb": 120.4,
+                        "process_peak_rss_mb": 160.3, "process_peak_increase_mb": 60.1,
+                    },
+                    "parse_cards": {...},
+                    "xref": {...},
+                    "write": {...},
+                },
+            },
+        },
+    }
+
+The time of a phase is from the fastest read.  The read_lines phase is the
+part of read_bdf before the cards are parsed (e.g., the INCLUDE files and the
+case control deck), while the parse_cards phase includes the superelements
+and DMIGs.  The peak RSS is the high water mark of the process, so each BDF
+is read in a new process.  For a phase, it's the process peak after the phase
+(process_peak_rss_mb) and how much the phase raised it
+(process_peak_increase_mb), which is 0 for a phase that uses less memory than
+an earlier phase.  With ``trace_memory=True``, the BDF is read one more time
+with ``tracemalloc`` to get the peak memory that's allocated in each phase
+(peak_traced_mb).  MB is 1024**2 bytes.
+
+"""
+import os
+import sys
+import json
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional, Any
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.mesh_utils.mesh import create_structured_cquad4s, create_structured_chexas
+from pyNastran.utils.benchmark import (
+    get_process_peak_rss_mb, reset_traced_peak, get_traced_peak_mb, fmt_mb,
+    compare_benchmarks as _compare_benchmarks)
+
+
+class BenchmarkBDF(BDF):
+    """a BDF that times each phase of read_bdf"""
+    def __init__(self, trace_memory: bool=False):
+        log = SimpleLogger(level='error')
+        BDF.__init__(self, debug=False, log=log)
+        self.trace_memory = trace_memory
+        #: phase -> {time, process_peak_rss_mb, process_peak_increase_mb,
+        #:           [peak_traced_mb]}
+        self.phase_stats = {}
+        self._phase_time0 = 0.
+        self._phase_rss0 = None
+
+    def start_phase(self) -> None:
+        """starts the timer/memory tracking of a phase"""
+        self._phase_rss0 = get_process_peak_rss_mb()
+        reset_traced_peak()
+        self._phase_time0 = time.perf_counter()
+
+    def end_phase(self, phase: str) -> None:
+        """stores the time/memory of a phase"""
+        dt = time.perf_counter() - self._phase_time0
+        rss = get_process_peak_rss_mb()
+        stats = {
+            'time': dt,
+            'process_peak_rss_mb': rss,
+            'process_peak_increase_mb': None if rss is None else rss - self._phase_rss0,
+        }
+        if self.trace_memory:
+            stats['peak_traced_mb'] = get_traced_peak_mb()
+        self.phase_stats[phase] = stats
+
+    def _parse_all_cards(self, bulk_data_lines: List[str],
+                         bulk_data_ilines: Any) -> None:
+        """ends the read_lines phase and times parsing the cards"""
+        self.end_phase('read_lines')
+        self.start_phase()
+        BDF._parse_all_cards(self, bulk_data_lines, bulk_data_ilines)
+
+    def cross_reference(self, xref: bool=True, **kwargs) -> None:
+        """ends the parse_cards phase and times the cross-referencing"""
+        self.end_phase('parse_cards')
+        self.start_phase()
+        BDF.cross_reference(self, xref=xref, **kwargs)
+        self.end_phase('xref')
+
+    def read_bdf(self, bdf_filename: str, **kwargs) -> None:
+        """starts the read_lines phase"""
+        self.start_phase()
+        BDF.read_bdf(self, bdf_filename, **kwargs)
+
+    def write_bdf(self, out_filename: str, **kwargs) -> None:
+        """times writing the BDF"""
+        self.start_phase()
+        BDF.write_bdf(self, out_filename, **kwargs)
+        self.end_phase('write')
+
+
+def _get_rate(ncards: int, dt: float) -> float:
+    """gets the parse rate in cards/s"""
+    return ncards / dt if dt > 0. else 0.
+
+
+def _read_write_bdf(bdf_filename: str, trace_memory: bool=False) -> BenchmarkBDF:
+    """reads, cross-references and writes a BDF"""
+    model = BenchmarkBDF(trace_memory=trace_memory)
+    model.read_bdf(bdf_filename, validate=False, xref=True, punch=None,
+                   save_file_structure=False)
+    model.write_bdf(os.devnull)
+    return model
+
+
+def benchmark_bdf(bdf_filename: str, nrepeat: int=3,
+                  trace_memory: bool=False) -> Dict[str, Any]:
+    """
+    Times reading, cross-referencing and writing a BDF (the fastest
+    time of each phase is used)
+
+    Parameters
+    ----------
+    bdf_filename : str
+        the BDF to read
+    nrepeat : int; default=3
+        the number of times to read the BDF
+    trace_memory : bool; default=False
+        read the BDF one more time with tracemalloc to get the peak
+        memory of each phase
+
+    Returns
+    -------
+    stats : Dict[str, Any]
+        the time/size/memory of the BDF and of each phase
+        {nbytes, ncards, time, cards/s, peak_rss_mb, phases}
+
+    """
+    phases = {}
+    for unused_i in range(nrepeat):
+        model = _read_write_bdf(bdf_filename)
+        for phase, phase_stats in model.phase_stats.items():
+            if phase not in phases or phase_stats['time'] < phases[phase]['time']:
+                phases[phase] = phase_stats
+        nbytes = sum(os.path.getsize(fname) for fname in model.active_filenames)
+        ncards = sum(model.card_count.values())
+        del model
+
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            model = _read_write_bdf(bdf_filename, trace_memory=True)
+        finally:
+            tracemalloc.stop()
+        for phase, phase_stats in model.phase_stats.items():
+            phases[phase]['peak_traced_mb'] = phase_stats['peak_traced_mb']
+        del model
+
+    dt = sum(phase_stats['time'] for phase_stats in phases.values())
+    stats = {
+        'nbytes': nbytes,
+        'ncards': ncards,
+        'time': dt,
+        'cards/s': _get_rate(ncards, phases['parse_cards']['time']),
+        'peak_rss_mb': get_process_peak_rss_mb(),
+        'phases': phases,
+    }
+    return stats
+
+
+def run_benchmark(bdf_filenames: List[str], nrepeat: int=3, trace_memory: bool=False,
+                  isolate: bool=True, json_filename: Optional[str]=None,
+                  ) -> Dict[str, Any]:
+    """
+    Times reading a series of BDFs
+
+    Parameters
+    ----------
+    bdf_filenames : List[str]
+        the BDFs to read
+    nrepeat : int; default=3
+        the number of times to read each BDF (the fastest time is used)
+    trace_memory : bool; default=False
+        get the peak memory of each phase with tracemalloc
+    isolate : bool; default=True
+        read each BDF in a new process, so the peak RSS is for that BDF
+    json_filename : str; default=None
+        the report to write
+
+    Returns
+    -------
+    report : Dict[str, Any]
+        {version, files : {bdf_filename : stats}}
+
+    """
+    files = {}
+    for bdf_filename in bdf_filenames:
+        if isolate:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(benchmark_bdf, bdf_filename, nrepeat, trace_memory)
+                stats = future.result()
+        else:
+            stats = benchmark_bdf(bdf_filename, nrepeat=nrepeat, trace_memory=trace_memory)
+
+        key = os.path.abspath(bdf_filename)
+        files[key] = stats
+        print('%-60s %8.3fs %10.1f cards/s peak_rss=%s MB' % (
+            key, stats['time'], stats['cards/s'], fmt_mb(stats['peak_rss_mb'])))
+        for phase, phase_stats in stats['phases'].items():
+            print('    %-12s %8.3fs peak_traced=%s MB process_peak_rss=%s MB' % (
+                phase, phase_stats['time'], fmt_mb(phase_stats.get('peak_traced_mb')),
+                fmt_mb(phase_stats['process_peak_rss_mb'])))
+
+    report = {
+        'version': pyNastran.__version__,
+        'files': files,
+    }
+    if json_filename is not None:
+        with open(json_filename, 'w') as json_file:
+            json.dump(report, json_file, indent=1, sort_keys=True)
+    return report
+
+
+def compare_benchmarks(report_old: Dict[str, Any], report_new: Dict[str, Any],
+                       tol: float=0.2, min_time: float=0.01) -> List[str]:
+    """
+    Compares two benchmarks and finds the phases that got slower or
+    used more memory
+
+    Parameters
+    ----------
+    report_old / report_new : Dict[str, Any]
+        the reports from ``run_benchmark`` (or the loaded json files)
+    tol : float; default=0.2
+        the allowable increase in the time/peak memory (0.2 is 20%)
+    min_time : float; default=0.01
+        phases that are faster than this are too noisy to compare
+
+    Returns
+    -------
+    regressions : List[str]
+        a message for each file/phase that got slower or
+        used more memory
+
+    """
+    return _compare_benchmarks(report_old, report_new, 'phases',
+                               tol=tol, min_time=min_time)
+
+
+def make_synthetic_bdf(bdf_filename: str, nx: int=100, ny: int=100,
+                       nz: int=10) -> Tuple[str, str, str]:
+    """
+    Makes a deck with a CQUAD4 panel and a CHEXA block that mixes the
+    card formats
+
+     - main file: the executive/case control decks, the properties and
+       materials (small/large field), CONM2s, FORCEs and SPC1s (CSV),
+       and a row of replicated GRIDs and CBARs (=, =(n))
+     - shell INCLUDE file: the GRIDs and CQUAD4s (small field)
+     - solid INCLUDE file: the GRIDs and CHEXAs (large field)
+
+    Parameters
+    ----------
+    bdf_filename : str
+        the main BDF to write; the INCLUDE files are
+        <base>_shells.inc and <base>_solids.inc
+    nx / ny : int; default=100
+        the number of CQUAD4s in the x/y direction (also used
+        for the CHEXA block)
+    nz : int; default=10
+        the number of CHEXAs in the z direction
+
+    Returns
+    -------
+    bdf_filename : str
+        the main BDF
+    shell_filename / solid_filename : str
+        the INCLUDE files
+
+    The number of GRIDs is ~(nx+1)*(ny+1)*(nz+2) and the number of elements
+    is ~nx*ny*(nz+1), so nx=ny=100, nz=10 is ~122k GRIDs and ~110k elements.
+
+    """
+    base = os.path.splitext(bdf_filename)[0]
+    shell_filename = base + '_shells.inc'
+    solid_filename = base + '_solids.inc'
+
+    log = SimpleLogger(level='error')
+    model = BDF(debug=False, log=log)
+    p1 = [0., 0., 0.]
+    p2 = [float(nx), 0., 0.]
+    p3 = [float(nx), float(ny), 0.]
+    p4 = [0., float(ny), 0.]
+    nid, eid = create_structured_cquad4s(model, 1, p1, p2, p3, p4, nx, ny)
+    nshell_nodes = nid - 1
+    with open(shell_filename, 'w') as bdf_file:
+        bdf_file.write('$ the CQUAD4 panel\n')
+        for card in model.nodes.values():
+            bdf_file.write(card.write_card(size=8))
+        for card in model.elements.values():
+            bdf_file.write(card.write_card(size=8))
+
+    model = BDF(debug=False, log=log)
+    x = np.arange(nx + 1, dtype='float64')
+    y = np.arange(ny + 1, dtype='float64')
+    z = -1. - np.arange(nz + 1, dtype='float64')
+    nid, eid = create_structured_chexas(model, 2, x, y, z, nx + 1, ny + 1, nz + 1,
+                                        eid=eid, nid=nid)
+    with open(solid_filename, 'w') as bdf_file:
+        bdf_file.write('$ the CHEXA block\n')
+        for card in model.nodes.values():
+            bdf_file.write(card.write_card(size=16))
+        for card in model.elements.values():
+            bdf_file.write(card.write_card(size=16))
+
+    lines = [
+        'SOL 101',
+        'CEND',
+        'TITLE = synthetic benchmark nx=%i ny=%i nz=%i' % (nx, ny, nz),
+        'SPC = 1',
+        'LOAD = 2',
+        'DISP = ALL',
+        'BEGIN BULK',
+        'PARAM,POST,-1',
+        '$ small field',
+        'PSHELL         1       1      .1       1               1',
+        'MAT1           1   3.+7             .3  .00259',
+        '$ large field',
+        'PSOLID*                2               1',
+        '*',
+        'CORD2R*               10               0              0.              0.',
+        '*                     0.              0.              0.              1.',
+        '*                     1.              0.              0.',
+        "INCLUDE '%s'" % os.path.basename(shell_filename),
+        "INCLUDE '%s'" % os.path.basename(solid_filename),
+        '$ csv',
+        'PBAR,3,1,.1,1.,1.,1.',
+    ]
+    # a mass and a force at each node on the y=ny edge of the panel
+    for i, nidi in enumerate(range(nshell_nodes - nx, nshell_nodes + 1)):
+        lines.append('CONM2,%i,%i,,0.1' % (eid + i, nidi))
+        lines.append('FORCE,2,%i,10,100.,0.,0.,1.' % nidi)
+    eid += nx + 1
+    lines.append('SPC1,1,123456,1,THRU,%i' % (nx + 1))
+
+    # a row of CBARs above the y=0 edge of the panel
+    lines += [
+        '$ replication',
+        'GRID,%i,,0.,0.,1.' % nid,
+        '=,*(1),=,*(1.),=,=',
+        '=(%i)' % (nx - 1),
+        'CBAR,%i,3,%i,%i,0.,1.,0.' % (eid, nid, nid + 1),
+        '=,*(1),=,*(1),*(1),=,=,=',
+        '=(%i)' % (nx - 2),
+        'ENDDATA',
+    ]
+    with open(bdf_filename, 'w') as bdf_file:
+        bdf_file.write('\n'.join(lines) + '\n')
+    return bdf_filename, shell_filename, solid_filename
+
+
+def get_benchmark_data(argv: List[str]) -> Dict[str, Any]:
+    """defines the docopt interface"""
+    from docopt import docopt
+    ver = str(pyNastran.__version__)
+    msg = (
+        "Usage:\n"
+        "  benchmark_bdf [-n NREPEAT] [-t] [--synthetic NX] [--serial] [-o JSON] [-c JSON] [BDF_FILENAME ...]\n"
+        "  benchmark_bdf -h | --help\n"
+        "  benchmark_bdf -v | --version\n"
+        "\n"
+        "Times and memory-profiles the read_lines, parse_cards, xref and write phases of a BDF.\n"
+        "\n"
+        "Positional Arguments:\n"
+        "  BDF_FILENAME                   Path to BDF file(s); default=a synthetic deck (NX=100)\n"
+        "\n"
+        "Options:\n"
+        "  -n NREPEAT, --nrepeat NREPEAT  The number of reads of each BDF; the fastest\n"
+        "                                 is used [default: 3]\n"
+        "  -t, --trace                    Get the peak memory of each phase with tracemalloc\n"
+        "  --synthetic NX                 Also time a synthetic deck with NX*NX CQUAD4s and\n"
+        "                                 NX*NX*NX/10 CHEXAs\n"
+        "  --serial                       Reads the BDFs in this process, so the peak RSS\n"
+        "                                 is for all the BDFs that have been read\n"
+        "  -o JSON, --json JSON           Write the report to a json file\n"
+        "  -c JSON, --compare JSON        Compare against an old report\n"
+        "\n"
+        "Info:\n"
+        "  -h, --help     Show this help message and exit\n"
+        "  -v, --version  Show program's version number and exit\n"
+    )
+    return docopt(msg, version=ver, argv=argv[1:])
+
+
+def main(argv=None):  # pragma: no cover
+    """the interface for benchmark_bdf"""
+    if argv is None:
+        argv = sys.argv
+    data = get_benchmark_data(argv)
+    bdf_filenames = data['BDF_FILENAME']
+    nx = data['--synthetic']
+    if nx is None and not bdf_filenames:
+        nx = '100'
+
+    if nx is not None:
+        nx = int(nx)
+        synthetic_filename = os.path.abspath('synthetic_%i.bdf' % nx)
+        make_synthetic_bdf(synthetic_filename, nx=nx, ny=nx, nz=max(nx // 10, 1))
+        bdf_filenames = [synthetic_filename] + bdf_filenames
+
+    report = run_benchmark(bdf_filenames, nrepeat=int(data['--nrepeat']),
+                           trace_memory=data['--trace'], isolate=not data['--serial'],
+                           json_filename=data['--json'])
+    if data['--compare']:
+        with open(data['--compare'], 'r') as json_file:
+            report_old = json.load(json_file)
+        regressions = compare_benchmarks(report_old, report)
+        for regression in regressions:
+            print('slower: %s' % regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -0,0 +1,167 @@
+"""
+Measures the memory footprint of the common bulk data cards (e.g., GRID,
+CQUAD4), which dominates the memory use of a large model.
+
+usage::
+
+    python -m pyNastran.bdf.test.benchmark_memory
+    python -m pyNastran.bdf.test.benchmark_memory -n 100000 GRID CQUAD4
+
+The footprint of a card is the memory allocated (per ``tracemalloc``) by
+creating ``ncards`` cards divided by ``ncards``, so it includes the card
+object, its ``__dict__`` (if it has one), and the values it stores (e.g.,
+the node ids and the GRID ``xyz`` array).  The cards aren't added to a
+model, so the model dictionaries aren't included.
+
+ - get_card_footprint(card_type, ncards=10000)
+ - get_card_footprints(card_types=None, ncards=10000)
+
+"""
+import sys
+import gc
+import tracemalloc
+from typing import List, Dict, Optional, Any
+
+import pyNastran
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import CTETRA4, CTETRA10, CPENTA6, CHEXA8, CHEXA20
+from pyNastran.bdf.cards.elements.bars import CBAR
+from pyNastran.bdf.cards.elements.bush import CBUSH
+from pyNastran.bdf.cards.elements.mass import CONM2
+from pyNastran.bdf.cards.properties.shell import PSHELL
+from pyNastran.bdf.cards.properties.solid import PSOLID
+from pyNastran.bdf.cards.materials import MAT1
+
+#: card_type -> function that creates the i-th card
+CARD_MAKERS = {
+    'GRID': lambda i: GRID(i, [float(i), 2. * i, 3. * i]),
+    'CQUAD4': lambda i: CQUAD4(i, 1, [i, i + 1, i + 2, i + 3]),
+    'CTRIA3': lambda i: CTRIA3(i, 1, [i, i + 1, i + 2]),
+    'CTETRA4': lambda i: CTETRA4(i, 1, list(range(i, i + 4))),
+    'CTETRA10': lambda i: CTETRA10(i, 1, list(range(i, i + 10))),
+    'CPENTA6': lambda i: CPENTA6(i, 1, list(range(i, i + 6))),
+    'CHEXA8': lambda i: CHEXA8(i, 1, list(range(i, i + 8))),
+    'CHEXA20': lambda i: CHEXA20(i, 1, list(range(i, i + 20))),
+    'CBAR': lambda i: CBAR(i, 1, [i, i + 1], [0., 0., 1.], None),
+    'CBUSH': lambda i: CBUSH(i, 1, [i, i + 1], [0., 0., 1.], None),
+    'CONM2': lambda i: CONM2(i, i, float(i)),
+    'PSHELL': lambda i: PSHELL(i, mid1=1, t=0.1 * i),
+    'PSOLID': lambda i: PSOLID(i, 1),
+    'MAT1': lambda i: MAT1(i, 3.0e7, None, 0.3),
+}
+
+
+def get_card_footprint(card_type: str, ncards: int=10000) -> Dict[str, Any]:
+    """
+    Gets the memory footprint of a card
+
+    Parameters
+    ----------
+    card_type : str
+        the card (e.g., GRID) from ``CARD_MAKERS``
+    ncards : int; default=10000
+        the number of cards to create
+
+    Returns
+    -------
+    footprint : Dict[str, Any]
+        bytes_per_card : float
+            the memory allocated per card
+        has_dict : bool
+            does the card have a ``__dict__``
+
+    """
+    make_card = CARD_MAKERS[card_type]
+    gc.collect()
+    was_tracing = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start()
+    nbytes0 = tracemalloc.get_traced_memory()[0]
+    cards = [None] * ncards
+    nbytes1 = tracemalloc.get_traced_memory()[0]
+    for i in range(ncards):
+        cards[i] = make_card(i + 1)
+    nbytes2 = tracemalloc.get_traced_memory()[0]
+    if not was_tracing:
+        tracemalloc.stop()
+
+    # don't count the list that holds the cards
+    nbytes = (nbytes2 - nbytes0) - (nbytes1 - nbytes0)
+    footprint = {
+        'bytes_per_card': nbytes / ncards,
+        'has_dict': hasattr(cards[0], '__dict__'),
+    }
+    return footprint
+
+
+def get_card_footprints(card_types: Optional[List[str]]=None,
+                        ncards: int=10000) -> Dict[str, Dict[str, Any]]:
+    """
+    Gets the memory footprint of the cards
+
+    Parameters
+    ----------
+    card_types : List[str]; default=None -> all the cards in ``CARD_MAKERS``
+        the cards to measure
+    ncards : int; default=10000
+        the number of cards of each type to create
+
+    Returns
+    -------
+    footprints : Dict[str, Dict[str, Any]]
+        card_type -> footprint (see ``get_card_footprint``)
+
+    """
+    if card_types is None:
+        card_types = list(CARD_MAKERS)
+    footprints = {card_type: get_card_footprint(card_type, ncards=ncards)
+                  for card_type in card_types}
+    return footprints
+
+
+def get_benchmark_data(argv: List[str]) -> Dict[str, Any]:
+    """defines the docopt interface"""
+    from docopt import docopt
+    ver = str(pyNastran.__version__)
+    msg = (
+        "Usage:\n"
+        "  benchmark_memory [-n NCARDS] [CARD_TYPE ...]\n"
+        "  benchmark_memory -h | --help\n"
+        "  benchmark_memory -v | --version\n"
+        "\n"
+        "Measures the memory footprint of the common bulk data cards.\n"
+        "\n"
+        "Positional Arguments:\n"
+        "  CARD_TYPE                  the cards to measure; default=all\n"
+        "                             (%s)\n"
+        "\n"
+        "Options:\n"
+        "  -n NCARDS, --ncards NCARDS the number of cards of each type to create;\n"
+        "                             default=10000\n"
+        "\n"
+        "Info:\n"
+        "  -h, --help                 show this help message and exit\n"
+        "  -v, --version              show program's version number and exit\n" % (
+            ', '.join(CARD_MAKERS))
+    )
+    return docopt(msg, version=ver, argv=argv[1:])
+
+
+def main(argv=None):  # pragma: no cover
+    """the interface for benchmark_memory"""
+    if argv is None:
+        argv = sys.argv
+    data = get_benchmark_data(argv)
+    card_types = data['CARD_TYPE'] if data['CARD_TYPE'] else None
+    ncards = int(data['--ncards']) if data['--ncards'] else 10000
+    footprints = get_card_footprints(card_types, ncards=ncards)
+
+    print('%-10s %14s %10s' % ('card_type', 'bytes/card', 'has_dict'))
+    for card_type, footprint in footprints.items():
+        print('%-10s %14.1f %10s' % (
+            card_type, footprint['bytes_per_card'], footprint['has_dict']))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
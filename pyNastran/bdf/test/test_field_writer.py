@@ -8,7 +8,9 @@ from pyNastran.bdf.field_writer_8 import (print_field_8, print_float_8,
                                           set_blank_if_default, is_same, print_card_8,
                                           print_scientific_8)
 from pyNastran.bdf.field_writer_16 import print_field_16, print_card_16, print_float_16, print_scientific_16
-from pyNastran.bdf.field_writer_double import print_card_double
+from pyNastran.bdf.field_writer_double import print_card_double, print_scientific_double
+from pyNastran.bdf.bdf_interface.bulk_writer import (
+    print_floats_8, print_floats_16, print_floats_double)
 
 
 from pyNastran.bdf.bdf_interface.assign_type import interpret_value
@@ -385,6 +387,26 @@ class Testfield_writer_8(unittest.TestCase):
                 output = print_scientific_8(num)
                 self.assertEqual(len(output), 8, msg='output=%r len(output)=%i' % (output, len(output)))
 
+    def test_floats_bulk(self):
+        """tests print_floats_8/16/double match print_float_8/16/double"""
+        nums = [0., -0., np.nan, 0.001, -0.01, 999999.5, -999999.5, 99999.95]
+        for istart in np.arange(-20, 20):
+            nums_positive = np.logspace(istart, istart+1, num=100, endpoint=True, base=10.0)
+            nums.extend(nums_positive)
+            nums.extend(-nums_positive)
+            nums.extend(np.nextafter(10. ** istart, [0., np.inf]))
+            nums.extend(np.nextafter(-10. ** istart, [0., -np.inf]))
+        nums = np.array(nums)
+
+        for print_floats, print_float in [(print_floats_8, print_float_8),
+                                          (print_floats_16, print_float_16),
+                                          (print_floats_double, print_scientific_double)]:
+            fields = print_floats(nums.reshape(len(nums) // 2, 2))
+            assert len(fields) == len(nums)
+            for num, field in zip(nums.tolist(), fields):
+                expected = print_float(num)
+                assert field == expected, f'{print_floats.__name__}: num={num!r} field={field!r} expected={expected!r}'
+
     def test_scientific_8(self):
         expected_num = [
             ('      0.', 0.),
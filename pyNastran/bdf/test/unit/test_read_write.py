@@ -1,11 +1,23 @@
 import os
+import copy
+import pickle
+import shutil
 import unittest
 from io import StringIO
 
+import numpy as np
 from cpylog import get_logger
 import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.errors import DuplicateIDsError
 from pyNastran.bdf.bdf_interface.pybdf import BDFInputPy
+from pyNastran.bdf.bdf_interface.cache import load_bdf_cache
+from pyNastran.bdf.bdf_interface.bulk_writer import write_grids_bulk, write_elements_bulk
+from pyNastran.bdf.bdf_interface.iter_cards import iter_bdf_cards
+from pyNastran.bdf.bdf_interface.lazy_xref import LazyXrefDict
+from pyNastran.bdf.bdf_interface.bulk_arrays import BulkCardDict
+from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
+from pyNastran.bdf.test.benchmark import make_synthetic_bdf, run_benchmark, compare_benchmarks
 from pyNastran.bdf.bdf_interface.include_file import (
     split_filename_into_tokens, get_include_filename,
     PurePosixPath, PureWindowsPath,
@@ -530,6 +542,719 @@ class TestReadWrite(unittest.TestCase):
         assert eigb.comment == '$ this is a preload buckling case\n', 'comment=%r\n%s' % (eigb.comment, str(eigb))
         os.remove(bdf_filename2)
 
+    def test_read_bulk_arrays(self):
+        """tests read_bdf(..., bulk_arrays=True) against the standard reader"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        lines = [
+            'GRID           1       0      0.      0.      0.',
+            'GRID           2              1.      0.      0.       1',
+            'GRID,3,,1.-3,1.0D0,0.',
+            'GRID*                  4               0              0.              1.',
+            '*                     0.',
+            'GRID           5              1.      1.      1.        123456',
+            'GRID           6              1.      1.      1.',
+            'GRID           6              1.      1.      1.',
+            '$ the comment is kept',
+            'GRID           7              1.      2.      1.',
+            'GRID           8              1.      3.      1.',
+            'CQUAD4        10       1       1       2       3       4',
+            'CQUAD4        11               1       2       3       4      3.     0.1',
+            'CQUAD4        12       1       1       2       3       4      45',
+            'CQUAD4        13       1       1       2       3       4',
+            '                              1.      1.      1.      1.',
+            'CTRIA3        14       1       1       2       3      -1',
+            'CTRIA3        15       1       1       2       3   1.0D1',
+            'CTETRA        20       2       1       2       3       4',
+            'CTETRA        21       2       1       2       3       4       5',
+            'CHEXA         22       2       1       2       3       4       5       6',
+            '               7       8',
+            'CHEXA         23       2       1       2       3       4       5       6',
+            '               7       8               1',
+            'CBAR          30       3       1       2      0.      0.      1.',
+            'CBAR          31       3       1       2       5',
+            'CBAR          32       3       1       2       5                     GGO',
+            'CBUSH         40       4       1       2       5',
+            'CBUSH         41       4       1',
+            'CBUSH         42       4       1       2      0.      0.      1.',
+            'CBUSH         43       4       1       2      1.      1.      1.       0',
+            'CBUSH         44       4       1       2                               0',
+            'PSHELL         1       1      .1',
+            'PSOLID         2       1',
+            'PBAR           3       1     1.0     1.0     1.0',
+            'PBUSH          4       K      1.',
+            'MAT1           1   3.e7              .3',
+        ]
+        model = read_bdf(StringIO('\n'.join(lines)), punch=True, xref=False,
+                         validate=False, log=log)
+        model2 = read_bdf(StringIO('\n'.join(lines)), punch=True, xref=False,
+                          validate=False, log=log, bulk_arrays=True)
+
+        assert model2.bulk_arrays['GRID'].xyz.shape == (6, 3), model2.bulk_arrays['GRID'].xyz
+        assert model2.bulk_arrays['CQUAD4'].mcid.tolist() == [-1, -1, 45], model2.bulk_arrays['CQUAD4'].mcid
+        assert model2.bulk_arrays['CBAR'].g0.tolist() == [0, 5], model2.bulk_arrays['CBAR'].g0
+        assert len(model2.nodes) == len(model.nodes)
+        assert len(model2.elements) == len(model.elements)
+        assert 1 in model2.nodes and 9 not in model2.nodes
+
+        # the duplicate GRID 6 is compared to the first one, so it's built
+        assert model2.bulk_arrays['GRID'].is_built.sum() == 1
+
+        # the ids don't build the cards
+        assert sorted(model2.nodes.keys()) == sorted(model.nodes.keys())
+        assert sorted(model2.elements) == sorted(model.elements)
+        assert 21 in model2.elements.keys()
+        assert model2.bulk_arrays['GRID'].is_built.sum() == 1
+        assert not model2.bulk_arrays['CTETRA'].is_built.any()
+
+        # the cards are built when they're accessed
+        assert model2.nodes[3] == model.nodes[3]
+        assert model2.elements[21].type == 'CTETRA', model2.elements[21]
+        assert model2.elements.get(99) is None
+        assert model2.bulk_arrays['GRID'].is_built.sum() == 2
+        assert model2.card_count == model.card_count, model2.card_count
+        assert model2.nodes[7].comment == model.nodes[7].comment
+
+        # comparing/printing the dictionary doesn't build the cards
+        nbuilt = model2.bulk_arrays['GRID'].is_built.sum()
+        assert model2.nodes == model.nodes
+        assert model2.elements == model.elements
+        assert "unbuilt={'GRID': " in repr(model2.nodes), repr(model2.nodes)
+        assert model2.bulk_arrays['GRID'].is_built.sum() == nbuilt
+        assert model2.bulk_arrays['CTETRA'].is_built.sum() == 1
+
+        for eid, elem in model.elements.items():
+            assert str(elem) == str(model2.elements[eid]), '%s%s' % (elem, model2.elements[eid])
+        for nid, node in model.nodes.items():
+            assert str(node) == str(model2.nodes[nid]), '%s%s' % (node, model2.nodes[nid])
+        assert sorted(model2.elements) == sorted(model.elements)
+
+        # the arrays are released once all of their cards are built
+        assert not model2.bulk_arrays, model2.bulk_arrays
+        assert not model2.nodes._arrays and not model2.elements._arrays
+        assert 'unbuilt' not in repr(model2.nodes)
+
+        bdf_file = StringIO()
+        bdf_file2 = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        model2.write_bdf(bdf_file2, close=False)
+        assert bdf_file.getvalue() == bdf_file2.getvalue()
+
+        bdf_filename = os.path.join(ROOT_PATH, '..', 'models',
+                                    'sol_101_elements', 'buckling_solid_shell_bar.bdf')
+        model = read_bdf(bdf_filename, xref=True, log=log)
+        model2 = read_bdf(bdf_filename, xref=True, log=log, bulk_arrays=True)
+        # validate/xref build every card, so the arrays are released
+        assert not model2.bulk_arrays, model2.bulk_arrays
+        assert model.get_bdf_stats() == model2.get_bdf_stats()
+        mass, cg, unused_inertia = mass_properties(model)
+        mass2, cg2, unused_inertia2 = mass_properties(model2)
+        assert np.allclose(mass, mass2), (mass, mass2)
+        assert np.allclose(cg, cg2), (cg, cg2)
+
+    def test_read_bulk_arrays_duplicates(self):
+        """tests the bulk/lazy cards are added in file order with the other cards"""
+        log = get_logger(log=None, level='error', encoding='utf-8')
+        grids = ['GRID,%i,,%i.,0.,0.' % (nid, nid) for nid in range(1, 11)]
+        cards = [
+            ['CTETRA,5,1,1,2,3,4', 'CTRIA6,5,1,1,2,3,4,5,6'],
+            ['CTRIA6,5,1,1,2,3,4,5,6', 'CTETRA,5,1,1,2,3,4'],
+            ['CQUAD4,5,1,1,2,3,4', '$ comment', 'CQUAD4,5,1,1,2,3,5'],
+            ['$ comment', 'CTETRA,5,1,1,2,3,4', 'CTETRA,5,1,1,2,3,5'],
+        ]
+        for elements in cards:
+            lines = grids + elements + ['PSOLID,1,1', 'MAT1,1,3.e7,,.3']
+            with self.assertRaises(DuplicateIDsError) as error:
+                read_bdf(StringIO('\n'.join(lines)), xref=False, punch=True, log=log)
+            for kwargs in [{'bulk_arrays': True}, {'lazy': True},
+                           {'bulk_arrays': True, 'lazy': True}]:
+                with self.assertRaises(DuplicateIDsError) as error2:
+                    read_bdf(StringIO('\n'.join(lines)), xref=False, punch=True, log=log,
+                             **kwargs)
+                assert str(error.exception) == str(error2.exception), str(error2.exception)
+
+        # the GRID with a comment is compared to the first GRID 3
+        lines = grids + ['$ comment', 'GRID,3,,7.,0.,0.']
+        with self.assertRaises(AssertionError) as error:
+            read_bdf(StringIO('\n'.join(lines)), xref=False, punch=True, log=log)
+        with self.assertRaises(AssertionError) as error2:
+            read_bdf(StringIO('\n'.join(lines)), xref=False, punch=True, log=log,
+                     bulk_arrays=True)
+        assert str(error.exception) == str(error2.exception), str(error2.exception)
+
+    def test_read_bulk_arrays_pickle(self):
+        """tests pickling a read_bdf(..., bulk_arrays=True) model"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        bdf_filename = os.path.join(ROOT_PATH, '..', 'models',
+                                    'sol_101_elements', 'buckling_solid_shell_bar.bdf')
+        model = read_bdf(bdf_filename, xref=False, validate=False, log=log, bulk_arrays=True)
+        model.nodes[1]
+        nodes = pickle.loads(pickle.dumps(model.nodes))
+        assert isinstance(nodes, BulkCardDict), type(nodes)
+        assert sorted(nodes) == sorted(model.nodes)
+        assert len(nodes) == len(model.nodes)
+        assert nodes._arrays[0].is_built.sum() == 1
+        assert nodes[2] == model.nodes[2]
+
+        # pickling the model doesn't build the cards and the arrays are the
+        # arrays of the dictionaries when it's loaded
+        cache_dir = os.path.join(ROOT_PATH, '..', 'models', 'sol_101_elements',
+                                 'cache_test_bulk_arrays')
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+        obj_filename = os.path.join(ROOT_PATH, '..', 'models', 'sol_101_elements',
+                                    'buckling_solid_shell_bar.test_bulk_arrays.obj')
+        model = read_bdf(bdf_filename, xref=False, validate=False, log=log, bulk_arrays=True,
+                         cache_dir=cache_dir)
+        model.save(obj_filename, unxref=False)
+        for card_name, array in model.bulk_arrays.items():
+            assert not array.is_built.any(), card_name
+        bulk_card_names = sorted(model.bulk_arrays)
+
+        model2 = BDF(log=log)
+        model2.load(obj_filename)
+        os.remove(obj_filename)
+        model3 = read_bdf(bdf_filename, xref=False, validate=False, log=log, bulk_arrays=True,
+                          cache_dir=cache_dir)
+        shutil.rmtree(cache_dir)
+        for modeli in [model2, model3]:
+            assert isinstance(modeli.nodes, BulkCardDict), type(modeli.nodes)
+            assert isinstance(modeli.elements, BulkCardDict), type(modeli.elements)
+            assert modeli.nodes._arrays == [modeli.bulk_arrays['GRID']]
+            assert sorted(modeli.bulk_arrays) == bulk_card_names
+            for card_name, array in modeli.bulk_arrays.items():
+                assert any(array is arrayi for arrayi in modeli.elements._arrays + modeli.nodes._arrays)
+                assert not array.is_built.any(), card_name
+            assert len(modeli.nodes) == len(model.nodes)
+            assert len(modeli.elements) == len(model.elements)
+            assert model.get_bdf_stats() == modeli.get_bdf_stats()
+            assert sorted(modeli.elements) == sorted(model.elements)
+            assert modeli.elements[1] == model.elements[1]
+
+    def test_read_nworkers(self):
+        """tests read_bdf(..., nworkers=2) against the serial reader"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        lines = ['PROD           1       1     0.1', 'MAT1           1   3.e7              .3']
+        for nid in range(1, 2002):
+            lines.append('GRID    %8i        %8.1f      0.      0.' % (nid, nid))
+        for eid in range(1, 2001):
+            lines.append('CROD    %8i       1%8i%8i' % (eid, eid, eid + 1))
+        lines.append('$ the comment is kept')
+        lines.append('CONM2          1    2001            10.')
+
+        model = read_bdf(StringIO('\n'.join(lines)), punch=True, log=log)
+        model2 = read_bdf(StringIO('\n'.join(lines)), punch=True, log=log, nworkers=2)
+        assert model.card_count == model2.card_count, model2.card_count
+        assert model2.masses[1].comment == model.masses[1].comment
+        bdf_file = StringIO()
+        bdf_file2 = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        model2.write_bdf(bdf_file2, close=False)
+        assert bdf_file.getvalue() == bdf_file2.getvalue()
+
+        # the errors are the same as the serial reader
+        lines.append('CROD           5       1       5       7')
+        lines.append('CROD           6       1     6.0       7')
+        model = BDF(log=log)
+        model.set_error_storage(nparse_errors=10, stop_on_parsing_error=False)
+        model.read_bdf(StringIO('\n'.join(lines)), punch=True, xref=False)
+        model2 = BDF(log=log)
+        model2.set_error_storage(nparse_errors=10, stop_on_parsing_error=False)
+        model2.read_bdf(StringIO('\n'.join(lines)), punch=True, xref=False, nworkers=2)
+        assert len(model2._stored_parse_errors) == 1, model2._stored_parse_errors
+        assert model._stored_parse_errors == model2._stored_parse_errors
+        assert len(model2._duplicate_elements) == 1, model2._duplicate_elements
+        assert str(model._duplicate_elements) == str(model2._duplicate_elements)
+
+    def test_read_lazy(self):
+        """tests read_bdf(..., lazy=True) against the standard reader"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        lines = [
+            'GRID           1       0      0.      0.      0.',
+            'GRID,2,,1.,0.,0.',
+            'GRID*                  3               0              1.              1.',
+            '*                     0.',
+            'GRID           4              0.      1.      0.',
+            'GRID           4              0.      1.      0.',
+            '$ the comment is kept',
+            'CQUAD4        10       1       1       2       3       4',
+            'CQUAD4      10.0       1       1       2       3       4',
+            'CQUAD4        15       1       1       2       3     4.0',
+            'CONROD        11       1       2       1     0.1',
+            'CELAS2        12     1.0       1       1',
+            'CONM2         13       1            10.',
+            'RBE2          14       1     123       2',
+            'PSHELL         1       1      .1',
+            'MAT1           1   3.e7              .3',
+            'SPC1           1     123       1',
+        ]
+        model = BDF(log=log)
+        model.set_error_storage(nparse_errors=10, stop_on_parsing_error=False)
+        model.read_bdf(StringIO('\n'.join(lines)), punch=True, xref=False, validate=False)
+        model2 = BDF(log=log)
+        model2.set_error_storage(nparse_errors=10, stop_on_parsing_error=False)
+        model2.read_bdf(StringIO('\n'.join(lines)), punch=True, xref=False, validate=False,
+                        lazy=True)
+
+        # the float element id can't be indexed, so it's parsed by read_bdf
+        assert len(model._stored_parse_errors) == 2, model._stored_parse_errors
+        assert len(model2._stored_parse_errors) == 1, model2._stored_parse_errors
+        assert model2._stored_parse_errors[0] == model._stored_parse_errors[0]
+
+        assert model2.get_card_ids_by_card_types(['CQUAD4', 'GRID']) == {
+            'CQUAD4': [10, 15], 'GRID': [1, 2, 3, 4]}
+
+        # the float node id fails when it's accessed
+        assert len(model2.elements) == 4, len(model2.elements)
+        with self.assertRaises(SyntaxError):
+            model2.elements[15]
+        del model2.elements[15]
+
+        assert len(model2.nodes) == len(model.nodes)
+        assert len(model2.elements) == 3, model2.elements
+        assert len(model2.properties) == 1
+        assert 1 in model2.materials and 2 not in model2.materials
+
+        # the duplicate GRID 4 is compared to the first one, so it's built
+        nbuilt = [array.is_built.sum() for array in model2.nodes._arrays]
+        assert nbuilt == [1], nbuilt
+        assert model2.properties[1].t == 0.1
+        assert model2.elements.get(99) is None
+        assert model2.nodes[1].comment == model.nodes[1].comment
+
+        lines.remove('CQUAD4      10.0       1       1       2       3       4')
+        lines.remove('CQUAD4        15       1       1       2       3     4.0')
+        model = read_bdf(StringIO('\n'.join(lines)), punch=True, log=log)
+        model2 = read_bdf(StringIO('\n'.join(lines)), punch=True, log=log, lazy=True)
+        assert model2.card_count == model.card_count, model2.card_count
+        assert model2.elements[10].nodes_ref[0] is model2.nodes[1]
+        for slot in ['nodes', 'elements', 'properties', 'materials', 'masses', 'rigid_elements']:
+            cards = {key: str(card) for key, card in getattr(model, slot).items()}
+            cards2 = {key: str(card) for key, card in getattr(model2, slot).items()}
+            assert cards == cards2, '%s\n%s\n%s' % (slot, cards, cards2)
+
+        bdf_file = StringIO()
+        bdf_file2 = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        model2.write_bdf(bdf_file2, close=False)
+        assert bdf_file.getvalue() == bdf_file2.getvalue()
+
+    def test_read_cache(self):
+        """tests read_bdf(..., cache_dir='cache')"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        bdf_filename = os.path.join(TEST_PATH, 'cache_master.bdf')
+        include_filename = os.path.join(TEST_PATH, 'cache_include.inc')
+        cache_dir = os.path.join(TEST_PATH, 'cache_test')
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'BEGIN BULK\n'
+                'GRID,1,,0.,0.,0.\n'
+                "INCLUDE 'cache_include.inc'\n"
+                'CONROD,1,1,2,1,0.1\n'
+                'MAT1,1,3.0e7,,0.3\n'
+                'ENDDATA\n')
+        with open(include_filename, 'w') as include_file:
+            include_file.write('GRID,2,,1.,0.,0.\n')
+
+        model = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        cache_filenames = os.listdir(cache_dir)
+        assert len(cache_filenames) == 1, cache_filenames
+        cache_filename = os.path.join(cache_dir, cache_filenames[0])
+        assert load_bdf_cache(BDF(log=log), cache_filename)
+
+        model2 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        assert model2._xref
+        assert model2.elements[1].nodes_ref[1].nid == 2
+        assert model2.card_count == model.card_count
+        assert model2.get_bdf_stats() == model.get_bdf_stats()
+
+        # the settings are part of the cache filename
+        model2 = read_bdf(bdf_filename, xref=False, log=log, cache_dir=cache_dir,
+                          skip_cards=['MAT1'])
+        assert len(os.listdir(cache_dir)) == 2
+        assert len(model2.materials) == 0
+
+        # the array-backed and lazy cards are cached as well
+        ncache = 2
+        for kwargs in [{'bulk_arrays': True}, {'lazy': True}, {'bulk_arrays': True, 'lazy': True}]:
+            cache_filenames_old = set(os.listdir(cache_dir))
+            model2 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir, **kwargs)
+            ncache += 1
+            cache_filenames = set(os.listdir(cache_dir)) - cache_filenames_old
+            assert len(cache_filenames) == 1, kwargs
+            cache_filenamei = os.path.join(cache_dir, cache_filenames.pop())
+            assert load_bdf_cache(BDF(log=log), cache_filenamei), kwargs
+
+            model2 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir, **kwargs)
+            assert len(os.listdir(cache_dir)) == ncache, kwargs
+            assert model2.elements[1].nodes_ref[1].nid == 2
+            assert model2.get_bdf_stats() == model.get_bdf_stats(), kwargs
+
+        # changing the include invalidates the cache
+        with open(include_filename, 'a') as include_file:
+            include_file.write('GRID,3,,2.,0.,0.\n')
+        stat = os.stat(include_filename)
+        os.utime(include_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert not load_bdf_cache(BDF(log=log), cache_filename)
+        model2 = read_bdf(bdf_filename, log=log, cache_dir=cache_dir)
+        assert len(model2.nodes) == 3
+        assert load_bdf_cache(BDF(log=log), cache_filename)
+
+        os.remove(include_filename)
+        assert not load_bdf_cache(BDF(log=log), cache_filename)
+        os.remove(bdf_filename)
+        shutil.rmtree(cache_dir)
+
+    def test_refresh(self):
+        """tests model.refresh() after changing an INCLUDE file"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        bdf_filename = os.path.join(TEST_PATH, 'refresh_master.bdf')
+        props_filename = os.path.join(TEST_PATH, 'refresh_props.inc')
+        loads_filename = os.path.join(TEST_PATH, 'refresh_loads.inc')
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'LOAD = 1\n'
+                'BEGIN BULK\n'
+                'GRID,1,,0.,0.,0.\n'
+                'GRID,2,,1.,0.,0.\n'
+                'GRID,3,,1.,1.,0.\n'
+                'GRID,4,,0.,1.,0.\n'
+                'CQUAD4,1,10,1,2,3,4\n'
+                'LOAD,11,1.,2.,1\n'
+                "INCLUDE 'refresh_props.inc'\n"
+                "INCLUDE 'refresh_loads.inc'\n"
+                'ENDDATA\n')
+        with open(props_filename, 'w') as props_file:
+            props_file.write('PSHELL,10,100,0.1\n'
+                             'MAT1,100,3.0e7,,0.3\n')
+        with open(loads_filename, 'w') as loads_file:
+            loads_file.write('FORCE,1,3,,10.,0.,0.,1.\n')
+
+        def update_file(filename, msg):
+            """writes the file with a newer modification time"""
+            with open(filename, 'w') as file_obj:
+                file_obj.write(msg)
+            stat = os.stat(filename)
+            os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        model = read_bdf(bdf_filename, save_file_structure=True, log=log)
+        assert model.refresh() == []
+        elem = model.elements[1]
+        force = model.loads[1][0]
+
+        update_file(props_filename, 'PSHELL,10,100,0.2\n'
+                                    'MAT1,100,1.0e7,,0.3\n'
+                                    'PSHELL,11,100,0.3\n')
+        filenames = model.refresh()
+        assert filenames == [os.path.abspath(props_filename)], filenames
+        assert model.elements[1] is elem
+        assert model.loads[1][0] is force
+        assert elem.pid_ref is model.properties[10]
+        assert elem.pid_ref.t == 0.2
+        assert elem.pid_ref.mid_ref.e == 1.0e7
+        assert model.properties[11].mid_ref is model.materials[100]
+        assert model.card_count['PSHELL'] == 2, model.card_count
+        assert model._type_to_id_map['PSHELL'] == [10, 11]
+
+        update_file(loads_filename, 'FORCE,1,3,,20.,0.,0.,1.\n')
+        assert model.refresh() == [os.path.abspath(loads_filename)]
+        assert model.loads[1][0].mag == 20.
+        assert model.loads[1][0].node_ref is model.nodes[3]
+        # the LOAD in the unchanged file references the new FORCE
+        assert model.load_combinations[11][0].load_ids_ref[0][0] is model.loads[1][0]
+
+        model2 = read_bdf(bdf_filename, log=log)
+        assert model.card_count == model2.card_count, model.card_count
+        assert model.get_bdf_stats() == model2.get_bdf_stats()
+
+        # the coordinate systems that depend on a changed one are set up again
+        update_file(loads_filename, 'FORCE,1,3,,20.,0.,0.,1.\n'
+                                    'CORD2R,1,,0.,0.,0.,0.,0.,1.\n,1.,0.,0.\n'
+                                    'CORD2R,2,1,1.,0.,0.,1.,0.,1.\n,2.,0.,0.\n'
+                                    'GRID,5,2,0.,0.,0.\n')
+        assert model.refresh() == [os.path.abspath(loads_filename)]
+        assert np.allclose(model.nodes[5].get_position(), [1., 0., 0.])
+        cord2 = model.coords[2]
+        update_file(loads_filename, 'FORCE,1,3,,20.,0.,0.,1.\n'
+                                    'CORD2R,1,,0.,0.,5.,0.,0.,6.\n,1.,0.,5.\n'
+                                    'GRID,5,2,0.,0.,0.\n')
+        with open(props_filename, 'a') as props_file:
+            props_file.write('CORD2R,2,1,1.,0.,0.,1.,0.,1.\n,2.,0.,0.\n')
+        stat = os.stat(props_filename)
+        os.utime(props_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+        assert len(model.refresh()) == 2
+        assert np.allclose(model.nodes[5].get_position(), [1., 0., 5.])
+        assert model.coords[2] is not cord2
+
+        # a new INCLUDE in a changed file rereads the deck
+        more_filename = os.path.join(TEST_PATH, 'refresh_more.inc')
+        with open(more_filename, 'w') as more_file:
+            more_file.write('FORCE,2,3,,10.,0.,0.,1.\n')
+        update_file(loads_filename, 'FORCE,1,3,,20.,0.,0.,1.\n'
+                                    "INCLUDE 'refresh_more.inc'\n")
+        update_file(props_filename, 'PSHELL,10,100,0.2\n'
+                                    'MAT1,100,1.0e7,,0.3\n'
+                                    'PSHELL,11,100,0.3\n')
+        assert len(model.refresh()) == 4
+        assert model.loads[2][0].node_ref is model.nodes[3]
+        update_file(loads_filename, 'FORCE,1,3,,20.,0.,0.,1.\n')
+        assert len(model.refresh()) == 3
+        assert model.card_count == model2.card_count, model.card_count
+        os.remove(more_filename)
+
+        # a change to the master file rereads the deck
+        with open(bdf_filename, 'a') as bdf_file:
+            bdf_file.write('$ comment\n')
+        stat = os.stat(bdf_filename)
+        os.utime(bdf_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert len(model.refresh()) == 3
+        assert model.card_count == model2.card_count, model.card_count
+        assert model.elements[1].pid_ref.t == 0.2
+
+        with self.assertRaises(RuntimeError):
+            model2.refresh()
+
+        # the cards have to know what file they're from, so the bulk/lazy
+        # cards and parallel parsing aren't used
+        model = read_bdf(bdf_filename, save_file_structure=True, log=log,
+                         bulk_arrays=True, nworkers=2, lazy=True)
+        assert not model.use_bulk_arrays and not model.use_lazy_cards
+        assert model.nworkers == 1, model.nworkers
+        assert len(model.bulk_arrays) == 0, model.bulk_arrays
+        assert all(node.ifile is not None for node in model.nodes.values())
+        with open(bdf_filename, 'a') as bdf_file:
+            bdf_file.write('$ comment2\n')
+        stat = os.stat(bdf_filename)
+        os.utime(bdf_filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10**9))
+        assert len(model.refresh()) == 3
+        assert model.card_count == model2.card_count, model.card_count
+        os.remove(bdf_filename)
+        os.remove(props_filename)
+        os.remove(loads_filename)
+
+    def test_iter_bdf_cards(self):
+        """tests iter_bdf_cards against read_bdf"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        bdf_filename = os.path.join(TEST_PATH, 'iter_master.bdf')
+        include_filename = os.path.join(TEST_PATH, 'iter_include.inc')
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write(
+                'SOL 101\n'
+                'CEND\n'
+                'BEGIN BULK\n'
+                '$ node 1\n'
+                'GRID,1,,0.,0.,0.\n'
+                "INCLUDE 'iter_\n"
+                "  include.inc'\n"
+                'CQUAD4         1      10       1       2       3       4\n'
+                '$ pshell\n'
+                'PSHELL        10     100      .1\n'
+                'MAT1,100,3.0e7,,0.3\n'
+                'ENDDATA\n'
+                'GRID,5,,0.,0.,0.\n')
+        with open(include_filename, 'w') as include_file:
+            include_file.write(
+                'GRID*                  2                              1.              0.\n'
+                '*                     0.\n'
+                'GRID,3,,1.,1.,0.\n'
+                'GRID,4,,0.,1.,0. $ node 4\n')
+
+        model = read_bdf(bdf_filename, log=log)
+        cards = list(iter_bdf_cards(bdf_filename, log=log))
+        card_names = [card[0] for card in cards]
+        assert card_names == ['GRID', 'GRID', 'GRID', 'GRID', 'CQUAD4', 'PSHELL', 'MAT1'], card_names
+
+        card_name, fields, comment, ifile, iline = cards[1]
+        assert fields == ['GRID', '2', None, '1.', '0.', '0.'], fields
+        assert (ifile, iline) == (1, 0), (ifile, iline)
+        assert model.nodes[2].get_position().tolist() == [1., 0., 0.]
+
+        assert model.nodes[1].comment == '$%s\n' % cards[0][2]
+        assert model.properties[10].comment == '$%s\n' % cards[5][2]
+        assert cards[3][2:] == (' node 4', 1, 3), cards[3]
+        assert cards[5][2:] == (' pshell', 0, 9), cards[5]
+
+        cards = list(iter_bdf_cards(bdf_filename, card_names=['cquad4', 'MAT1'], log=log))
+        assert [card[0] for card in cards] == ['CQUAD4', 'MAT1']
+        assert cards[0][1] == ['CQUAD4', '1', '10', '1', '2', '3', '4'], cards[0][1]
+
+        # the INCLUDE isn't read
+        cards = list(iter_bdf_cards(bdf_filename, read_includes=False, log=log))
+        assert [card[0] for card in cards] == ['GRID', 'CQUAD4', 'PSHELL', 'MAT1']
+
+        lines = ['GRID,1,,0.,0.,0.', 'DEQATN  1       f(x) = x + 1.', 'ENDDATA']
+        cards = list(iter_bdf_cards(StringIO('\n'.join(lines)), punch=True, log=log))
+        assert cards[1][1] == ['DEQATN  1       f(x) = x + 1.'], cards[1]
+        os.remove(bdf_filename)
+        os.remove(include_filename)
+
+    def test_read_lazy_xref(self):
+        """tests read_bdf(..., xref='lazy') against the standard cross-referencing"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        lines = [
+            'GRID           1       0      0.      0.      0.',
+            'GRID           2       0      1.      0.      0.',
+            'GRID           3       0      1.      1.      0.',
+            'GRID           4       0      0.      1.      0.',
+            'CQUAD4        10       1       1       2       3       4',
+            'CQUAD4        11       2       1       2       3       4',
+            'CONM2         12       1            10.',
+            'PSHELL         1       1      .1',
+            'MAT1           1   3.e7              .3',
+            'FORCE          1       1            100.      0.      0.      1.',
+            'SPC1           1     123       1',
+        ]
+        model = read_bdf(StringIO('\n'.join(lines)), punch=True, xref='lazy', log=log)
+        assert isinstance(model.elements, LazyXrefDict)
+
+        # len/in don't cross-reference the cards
+        assert len(model.elements) == 2
+        assert 10 in model.elements
+        assert model.elements._xref_keys == set()
+        assert model.spcs[1][0].nodes_ref is not None
+
+        elem = model.elements[10]
+        assert model.elements._xref_keys == {10}
+        assert elem.pid_ref.mid_ref.mid == 1
+        assert elem.nodes_ref[2].get_position().tolist() == [1., 1., 0.]
+        assert model.loads[1][0].node_ref.nid == 1
+
+        # the missing property is logged like safe_cross_reference
+        elem = model.elements[11]
+        assert elem.pid_ref is None
+
+        # values cross-references the remaining cards
+        mass = sum(mass.Mass() for mass in model.masses.values())
+        assert np.allclose(mass, 10.)
+        model2 = read_bdf(StringIO('\n'.join(lines)), punch=True, xref=False, log=log)
+        model2.safe_cross_reference()
+        assert np.allclose(model.elements[10].Area(), model2.elements[10].Area())
+
+        model.uncross_reference()
+        assert type(model.elements) is dict
+        assert model.elements[10].pid_ref is None
+        model.cross_reference(xref='lazy')
+        assert isinstance(model.nodes, LazyXrefDict)
+        model.safe_cross_reference()
+        assert type(model.nodes) is dict
+        assert model.elements[10].pid_ref.pid == 1
+
+    def test_read_lazy_xref_models(self):
+        """tests read_bdf(..., xref='lazy') writes the same deck as safe_cross_reference"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        model_path = os.path.join(ROOT_PATH, '..', 'models')
+        # tst1d3 has a CMASS2 with a blank node
+        bdf_filenames = [
+            os.path.join(model_path, 'other', 'tst1d3.bdf'),
+            os.path.join(model_path, 'sol_101_elements', 'static_solid_shell_bar.bdf'),
+        ]
+        for bdf_filename in bdf_filenames:
+            model = read_bdf(bdf_filename, xref='lazy', log=log)
+            model2 = read_bdf(bdf_filename, xref=False, log=log)
+            model2.safe_cross_reference()
+
+            bdf_file = StringIO()
+            bdf_file2 = StringIO()
+            model.write_bdf(bdf_file, close=False)
+            model2.write_bdf(bdf_file2, close=False)
+            assert bdf_file.getvalue() == bdf_file2.getvalue(), bdf_filename
+
+    def test_bdf_benchmark(self):
+        """tests the synthetic deck and the per phase BDF benchmark"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        bdf_filename = os.path.join(TEST_PATH, 'synthetic.bdf')
+        json_filename = os.path.join(TEST_PATH, 'benchmark.json')
+        filenames = make_synthetic_bdf(bdf_filename, nx=4, ny=3, nz=2)
+
+        model = read_bdf(bdf_filename, log=log)
+        assert len(model.active_filenames) == 3, model.active_filenames
+        assert model.card_count['GRID'] == 20 + 60 + 5, model.card_count
+        assert model.card_count['CQUAD4'] == 12, model.card_count
+        assert model.card_count['CHEXA'] == 24, model.card_count
+        assert model.card_count['CONM2'] == 5, model.card_count
+        # the replicated cards
+        assert model.card_count['CBAR'] == 4, model.card_count
+        assert model.nodes[85].get_position().tolist() == [4., 0., 1.]
+        assert model.elements[45].nodes == [84, 85], model.elements[45].nodes
+
+        report = run_benchmark([bdf_filename], nrepeat=1, trace_memory=True,
+                               isolate=False, json_filename=json_filename)
+        stats = report['files'][os.path.abspath(bdf_filename)]
+        assert stats['ncards'] == sum(model.card_count.values())
+        assert stats['nbytes'] == sum(os.path.getsize(fname) for fname in filenames)
+        assert sorted(stats['phases']) == ['parse_cards', 'read_lines', 'write', 'xref']
+        parse_cards = stats['phases']['parse_cards']
+        assert parse_cards['peak_traced_mb'] > 0., parse_cards
+        assert 'process_peak_rss_mb' in parse_cards, parse_cards
+
+        assert compare_benchmarks(report, report) == []
+        report2 = copy.deepcopy(report)
+        report2['files'][os.path.abspath(bdf_filename)]['phases']['xref']['time'] = 100.
+        regressions = compare_benchmarks(report, report2)
+        assert len(regressions) == 1, regressions
+        report2['files'][os.path.abspath(bdf_filename)]['phases']['parse_cards']['peak_traced_mb'] *= 2.
+        regressions = compare_benchmarks(report, report2)
+        assert len(regressions) == 2, regressions
+        for filename in filenames + (json_filename, ):
+            os.remove(filename)
+
+    def test_write_bulk(self):
+        """tests the bulk writer is the same as write_card"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        model = BDF(log=log)
+        for nid in range(1, 41):
+            xyz = [nid * 0.37, -nid * 123.456, 1.234e-7 * nid]
+            model.add_grid(nid, xyz)
+        model.add_grid(41, [1e10, -1e-10, np.nan], cp=1)
+        model.add_grid(42, [0., -0., 99999.95], cd=1)
+        model.add_grid(43, [1., 2., 3.], ps='123', seid=2, comment='grid')
+        model.add_cord2r(1, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.])
+
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_psolid(2, 1)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.add_ctria3(1, 1, [1, 2, 3])
+        model.add_ctria3(2, 1, [1, 2, 3], theta_mcid=1, zoffset=0.1, comment='ctria3')
+        model.add_cquad4(3, 1, [1, 2, 3, 4])
+        model.add_cquad4(4, 1, [1, 2, 3, 4], theta_mcid=30., T1=0.1, T4=0.2)
+        model.add_cquad4(5, 1, [1, 2, 3, 4], theta_mcid=1, zoffset=-0.05)
+        model.add_cquad4(6, 1, [1, 2, 3, 4], tflag=1)
+        model.add_ctetra(7, 2, [1, 2, 3, 4])
+        model.add_ctetra(8, 2, [1, 2, 3, 4, 5, None, 7, 8, None, None])
+        model.add_cpenta(9, 2, [1, 2, 3, 4, 5, 6])
+        model.add_chexa(10, 2, [1, 2, 3, 4, 5, 6, 7, 8])
+        model.add_chexa(11, 2, list(range(1, 13)) + [None] * 8)
+        model.add_cpyram(12, 2, [1, 2, 3, 4, 5])
+        model.add_conrod(13, 1, [1, 2], A=1.0)
+        model.add_card(['CIHEX1', 14, 2, 1, 2, 3, 4, 5, 6, 7, 8], 'CIHEX1')
+
+        for xref in [False, True]:
+            if xref:
+                model.cross_reference()
+            for size, is_double in [(8, False), (16, False), (16, True)]:
+                bdf_file = StringIO()
+                write_grids_bulk(bdf_file, model.nodes, size, is_double)
+                write_elements_bulk(bdf_file, model.elements, size, is_double)
+
+                msg = ''.join(node.write_card(size, is_double)
+                              for unused_nid, node in sorted(model.nodes.items()))
+                msg += ''.join(element.write_card(size, is_double)
+                               for unused_eid, element in sorted(model.elements.items()))
+                assert bdf_file.getvalue() == msg, (size, is_double, xref)
+
+        # a bad card has the same error as write_card
+        model.elements[3].nodes_ref = None
+        model.elements[3].nodes[1] = None
+        with self.assertRaises(AttributeError):
+            model.elements[3].write_card()
+        with self.assertRaises(AttributeError):
+            write_elements_bulk(StringIO(), model.elements)
+
     def test_paths(self):
         """tests parsing paths"""
         include_dir = ''
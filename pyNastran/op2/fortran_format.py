@@ -7,6 +7,11 @@ from pyNastran.utils import object_attributes
 from pyNastran.utils.numpy_utils import integer_types
 #from pyNastran.op2.errors import FortranMarkerError, SortCodeError
 
+#: these tables are always fully parsed when the array is sized
+#: PVT/PVTS - we want to know what the PARAM cards are,
+#:            so we can determine the NXVER
+FULLY_PARSED_TABLES = {b'R1TABRG', b'ONRGY1', b'PVT', b'PVT0', b'PVTS'}
+
 
 class FortranFormat:
     """defines basic methods for reading Fortran formatted data files"""
@@ -18,6 +23,10 @@ class FortranFormat:
         self.isubcase = None
         self.binary_debug = None
         self.read_mode = 1
+
+        #: stores the sized records when the OP2 is read in a single pass;
+        #: None for the standard read_mode=1/2 reader
+        self.single_pass_records = None
         self._endian = None
         self._table_mapper = {}
         self._nastran_format = None
@@ -74,10 +83,20 @@ class FortranFormat:
         op2_reader = self.op2_reader
         #datai = b''
         n = 0
-        if self.read_mode == 2:
+        if self.single_pass_records is not None:
+            if op2_reader._is_mmap_record() and self.table_name not in FULLY_PARSED_TABLES:
+                # the sizing step doesn't need the data, so a record that's
+                # split across blocks isn't gathered until it's filled
+                blocks, ndata = op2_reader._read_record_blocks_mmap()
+                n = self._read_table4_single_pass(table4_parser, None, ndata, record_len,
+                                                  blocks=blocks)
+            else:
+                data, ndata = op2_reader._read_record_ndata_mmap()
+                n = self._read_table4_single_pass(table4_parser, data, ndata, record_len)
+        elif self.read_mode == 2:
             self.ntotal = 0
 
-            data, ndata = op2_reader._read_record_ndata()
+            data, ndata = op2_reader._read_record_ndata_mmap()
             n = table4_parser(data, ndata)
             assert isinstance(n, integer_types), self.table_name
 
@@ -88,7 +107,7 @@ class FortranFormat:
 
             #n = op2_reader._skip_record()
             #n = table4_parser(datai, 300000)
-            if self.table_name in {b'R1TABRG', b'ONRGY1', b'PVT', b'PVT0', b'PVTS'}:
+            if self.table_name in FULLY_PARSED_TABLES:
                 # these tables are always fully parsed
                 # PVT/PVTS - we want to know what the PARAM cards are,
                 #            so we can determine the NXVER
@@ -110,6 +129,106 @@ class FortranFormat:
         self._cleanup_data_members()
         return n
 
+    def _read_table4_single_pass(self, table4_parser, data, ndata: int,
+                                 record_len: int, blocks=None) -> int:
+        """
+        Sizes the result object for a table 4 record (like read_mode=1) and
+        stores the record, so it can be filled once every record has been
+        sized (see ``_fill_single_pass``).
+
+        Parameters
+        ----------
+        table4_parser : function
+            the parser function for table 4
+        data : bytes / memoryview / None
+            the table 4 record (None if blocks is used)
+        ndata : int
+            the length of data
+        record_len : int
+            the length of the record block
+        blocks : List[(i0, ndata)]; default=None
+            the blocks of the record in the memory mapped OP2, which are
+            gathered when the record is filled
+
+        Returns
+        -------
+        n : int
+            the number of bytes that have been read
+
+        """
+        single_pass_records = self.single_pass_records
+
+        # the table 3 state that's used to fill the record
+        attrs = single_pass_records.get_table3_attrs(self)
+        if self.table_name in FULLY_PARSED_TABLES:
+            n = table4_parser(data, ndata)
+        else:
+            sizer = single_pass_records.get_sizer(table4_parser, attrs, ndata, record_len)
+            n = self._size_single_pass_record(table4_parser, ndata, sizer)
+        if not isinstance(n, integer_types):
+            msg = 'n is not an integer; table_name=%s n=%s table4_parser=%s' % (
+                self.table_name, n, table4_parser)
+            raise TypeError(msg)
+        self._init_vector_counter(record_len)
+        single_pass_records.add_record(attrs, table4_parser, data, ndata,
+                                       blocks=blocks)
+        return n
+
+    def _size_single_pass_record(self, table4_parser, ndata: int, sizer) -> int:
+        """
+        Sizes the result object for a table 4 record without the data.
+        Once the sizer knows how the records change the result object,
+        the table 4 parser isn't called.
+
+        Parameters
+        ----------
+        table4_parser : function
+            the parser function for table 4
+        ndata : int
+            the length of the record
+        sizer : RecordSizer
+            sizes the records with the same table 3 parameters and length
+
+        Returns
+        -------
+        n : int
+            the number of bytes that have been read
+
+        """
+        if sizer.counters is not None:
+            result_name, storage_obj, class_obj, is_cid = sizer.transient_args
+            obj = sizer.obj
+            if storage_obj.get(self._get_code()) is obj:
+                self.create_transient_object(result_name, storage_obj, class_obj, is_cid=is_cid)
+                for name, value in sizer.op2_attrs.items():
+                    setattr(self, name, value)
+                for name, count in sizer.counters.items():
+                    setattr(obj, name, getattr(obj, name) + count)
+                return sizer.n
+
+            # the table 3 parameters don't find the object, so use the parser
+            sizer.is_sized_by_parser = True
+            sizer.counters = None
+
+        if sizer.is_sized_by_parser:
+            return table4_parser(None, ndata)
+
+        obj_attrs = None if sizer.obj is None else dict(vars(sizer.obj))
+        single_pass_records = self.single_pass_records
+        attrs = single_pass_records.get_table3_attrs(self)
+        single_pass_records.transient_args = []
+        try:
+            # the sizing step doesn't need the data (see read_mode=1)
+            n = table4_parser(None, ndata)
+        finally:
+            transient_args = single_pass_records.transient_args
+            single_pass_records.transient_args = None
+
+        # the table 3 attributes that the parser set (e.g., _data_factor)
+        op2_attrs = single_pass_records.get_changed_table3_attrs(self, attrs)
+        sizer.add_sizing(self.obj, n, transient_args, op2_attrs, obj_attrs)
+        return n
+
     def _reset_vector_counter(self) -> None:
         """
         if reading the data
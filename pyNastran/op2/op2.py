@@ -7,6 +7,9 @@ Defines the main OP2 class.  Defines:
             log=None, debug=True, debug_file=None, build_dataframe=None,
             skip_undefined_matrices=True, mode='msc', encoding=None)
 
+ - iter_op2_results(op2_filename, result_types=None, subcases=None,
+                   log=None, debug=False, mode=None, encoding=None,
+                   mmap=True, op2_index=None)
  - OP2(debug=True, log=None, debug_file=None, mode='msc')
    - build_dataframe()
    - combine_results(combine=True)
@@ -23,9 +26,10 @@ Defines the main OP2 class.  Defines:
 """
 from __future__ import annotations
 import sys
+import copy
 from collections import defaultdict
 from pickle import load, dump, dumps
-from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+from typing import List, Dict, Tuple, Optional, Any, Iterator, TYPE_CHECKING
 
 import numpy as np
 
@@ -42,6 +46,8 @@ from pyNastran.op2.errors import (SortCodeError, DeviceCodeError,
 from pyNastran.op2.writer.op2_writer import OP2Writer
 #from pyNastran.op2.op2_interface.op2_f06_common import Op2F06Attributes
 from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
+from pyNastran.op2.op2_interface.op2_index import OP2Index, get_op2_index
+from pyNastran.op2.op2_interface.single_pass import SinglePassRecords
 from pyNastran.op2.op2_interface.transforms import (
     transform_displacement_to_global, transform_gpforce_to_globali)
 from pyNastran.utils import check_path
@@ -517,7 +523,12 @@ class OP2(OP2_Scalar, OP2Writer):
                  combine: bool=True,
                  build_dataframe: Optional[bool]=None,
                  skip_undefined_matrices: bool=False,
-                 encoding: Optional[str]=None) -> None:
+                 encoding: Optional[str]=None,
+                 mmap: bool=False,
+                 op2_index: Optional[OP2Index]=None,
+                 single_pass: bool=False,
+                 nworkers: int=1,
+                 load_as_h5: bool=False) -> None:
         """
         Starts the OP2 file reading
 
@@ -529,15 +540,33 @@ class OP2(OP2_Scalar, OP2Writer):
             True : objects are isubcase based
             False : objects are (isubcase, subtitle) based;
                     will be used for superelements regardless of the option
-        #load_as_h5 : default=False
-            #loads the op2 as an h5 file to save memory
-            #stores the result.element/data attributes in h5 format
         build_dataframe : bool (default=None -> True if in iPython, False otherwise)
             builds a pandas DataFrame for op2 objects
         skip_undefined_matrices : bool; default=False
              True : prevents matrix reading crashes
         encoding : str
             the unicode encoding (default=None; system default)
+        mmap : bool; default=False
+            memory maps the OP2, so the result tables are parsed directly
+            from the file without copying each record
+        op2_index : OP2Index; default=None
+            None : read all the tables
+            OP2Index : only read the tables/subtables in the index
+                       (see ``get_op2_index`` and ``OP2Index.select``)
+        single_pass : bool; default=False
+            reads the OP2 once instead of twice (read_mode=1/2); the result
+            records are sized as they're read and are filled once every
+            record has been sized, so the OP2 is memory mapped;
+            ignored with load_as_h5
+        nworkers : int; default=1
+            the number of processes that decode the result tables;
+            the OP2 is indexed (see ``get_op2_index``) and the result
+            subtables are split between the processes at subcase boundaries;
+            ignored with load_as_h5
+        load_as_h5 : bool; default=False
+            loads the op2 out-of-core to save memory; the result arrays
+            (e.g., data, element_node) are datasets in fname.h5 (self.h5_file),
+            which should be closed when you're done
 
         """
         if op2_filename:
@@ -556,18 +585,43 @@ class OP2(OP2_Scalar, OP2Writer):
         assert self.ask in [True, False], self.ask
         self.is_vectorized = True
         self.log.debug('combine=%s' % combine)
-        self.log.debug('-------- reading op2 with read_mode=1 (array sizing) --------')
         self.read_mode = 1
         self._close_op2 = False
 
-        load_as_h5 = False
         if hasattr(self, 'load_as_h5'):
-            load_as_h5 = self.load_as_h5
+            load_as_h5 = load_as_h5 or self.load_as_h5
+        if load_as_h5 and (single_pass or nworkers > 1):
+            # the HDF5 datasets are built by the two pass reader in this process
+            self.log.warning('single_pass=%s and nworkers=%s are ignored with '
+                             'load_as_h5=True' % (single_pass, nworkers))
+            single_pass = False
+            nworkers = 1
+
+        if nworkers > 1:
+            self._read_op2_parallel(op2_filename, mode, mmap, op2_index,
+                                    single_pass, nworkers)
+        elif single_pass:
+            self._read_op2_single_pass(op2_filename, mode, op2_index)
+        else:
+            self._read_op2_two_pass(op2_filename, mode, load_as_h5, mmap, op2_index)
+        self._finalize()
+        if build_dataframe:
+            self.build_dataframe()
+        self.create_objects_from_matrices()
+        self.combine_results(combine=combine)
+        self.log.debug('finished reading op2')
+        str(self.op2_results)
 
+    def _read_op2_two_pass(self, op2_filename: Optional[str], mode: Optional[str],
+                           load_as_h5: bool, mmap: bool,
+                           op2_index: Optional[OP2Index]) -> None:
+        """reads the OP2 with an array sizing pass and an array filling pass"""
+        self.log.debug('-------- reading op2 with read_mode=1 (array sizing) --------')
         try:
             # get GUI object names, build objects, but don't read data
             table_names = OP2_Scalar.read_op2(self, op2_filename=op2_filename,
-                                              load_as_h5=load_as_h5, mode=mode)
+                                              load_as_h5=load_as_h5, mode=mode,
+                                              mmap=mmap, op2_index=op2_index)
             self.table_names = table_names
 
             # TODO: stuff to figure out objects
@@ -577,19 +631,94 @@ class OP2(OP2_Scalar, OP2Writer):
             self._close_op2 = True
             self.log.debug('-------- reading op2 with read_mode=2 (array filling) --------')
             _create_hdf5_info(self.op2_reader.h5_file, self)
-            OP2_Scalar.read_op2(self, op2_filename=self.op2_filename, mode=mode)
+            OP2_Scalar.read_op2(self, op2_filename=self.op2_filename, mode=mode,
+                                load_as_h5=load_as_h5, h5_file=self.op2_reader.h5_file,
+                                mmap=mmap, op2_index=op2_index)
         except FileNotFoundError:
             raise
         except:
             OP2_Scalar.close_op2(self, force=True)
             raise
-        self._finalize()
-        if build_dataframe:
-            self.build_dataframe()
-        self.create_objects_from_matrices()
-        self.combine_results(combine=combine)
-        self.log.debug('finished reading op2')
-        str(self.op2_results)
+
+    def _read_op2_single_pass(self, op2_filename: Optional[str], mode: Optional[str],
+                              op2_index: Optional[OP2Index]) -> None:
+        """
+        Reads the OP2 once.  The records are sized as they're read and
+        are filled (from the memory mapped OP2) once every record has
+        been sized.
+        """
+        self.log.debug('-------- reading op2 in a single pass --------')
+        self._close_op2 = True
+        self.single_pass_records = SinglePassRecords()
+        try:
+            # the records are filled after they're sized, so they're
+            # views of the OP2 instead of copies
+            self.table_names = OP2_Scalar.read_op2(
+                self, op2_filename=op2_filename, mode=mode,
+                mmap=True, op2_index=op2_index)
+        except FileNotFoundError:
+            raise
+        except:
+            OP2_Scalar.close_op2(self, force=True)
+            raise
+        finally:
+            self.single_pass_records = None
+        self.read_mode = 2
+
+    def _read_op2_parallel(self, op2_filename: Optional[str], mode: Optional[str],
+                           mmap: bool, op2_index: Optional[OP2Index],
+                           single_pass: bool, nworkers: int) -> None:
+        """
+        Reads the result tables with a pool of processes and the other
+        tables in this process
+        """
+        from concurrent.futures import ProcessPoolExecutor
+        from pyNastran.op2.op2_interface.parallel_reader import (
+            ParallelReadError, split_op2_index, read_op2_chunk, check_op2_chunks,
+            merge_op2_chunks, get_settings)
+        if op2_filename is None:
+            op2_filename = self.op2_filename
+        if op2_index is None:
+            op2_index = get_op2_index(op2_filename, mode=mode, log=self.log, save=False)
+
+        chunk_indexs = split_op2_index(op2_index, nworkers)
+        if len(chunk_indexs) == 1:
+            self._read_op2_serial(op2_filename, mode, mmap, op2_index, single_pass)
+            return
+
+        self.log.debug('-------- reading op2 with nworkers=%s --------' % len(chunk_indexs))
+        settings = get_settings(self)
+        with ProcessPoolExecutor(max_workers=len(chunk_indexs)) as executor:
+            futures = [
+                executor.submit(read_op2_chunk, op2_filename, chunk_index, mode,
+                                settings, self.encoding, mmap, single_pass)
+                for chunk_index in chunk_indexs]
+            chunks = [future.result() for future in futures]
+
+        try:
+            check_op2_chunks(chunks)
+        except ParallelReadError as error:
+            self.log.warning('reading op2 serially; %s' % str(error))
+            self._read_op2_serial(op2_filename, mode, mmap, op2_index, single_pass)
+            return
+
+        # the other tables are read by this process
+        table_names = [table['table_name'].encode('latin1') for table in op2_index.tables]
+        other_tables = [table for table in op2_index.tables if table['subtables'] is None]
+        other_index = OP2Index(op2_index.op2_filename, op2_index.nbytes,
+                               op2_index.mtime, other_tables)
+        self._read_op2_serial(op2_filename, mode, mmap, other_index, single_pass)
+        self.table_names = table_names
+        merge_op2_chunks(self, chunks)
+
+    def _read_op2_serial(self, op2_filename: Optional[str], mode: Optional[str],
+                         mmap: bool, op2_index: Optional[OP2Index],
+                         single_pass: bool) -> None:
+        """reads the OP2 in this process"""
+        if single_pass:
+            self._read_op2_single_pass(op2_filename, mode, op2_index)
+        else:
+            self._read_op2_two_pass(op2_filename, mode, False, mmap, op2_index)
 
     def create_objects_from_matrices(self) -> None:
         """
@@ -716,7 +845,8 @@ class OP2(OP2_Scalar, OP2Writer):
                     self.log.error('build_dataframe is broken for %s' % class_name)
                     raise
 
-    def load_hdf5_filename(self, hdf5_filename: str, combine: bool=True) -> None:
+    def load_hdf5_filename(self, hdf5_filename: str, combine: bool=True,
+                           lazy: bool=False) -> None:
         """
         Loads an h5 file into an OP2 object
 
@@ -726,6 +856,11 @@ class OP2(OP2_Scalar, OP2Writer):
             the path to the an hdf5 file
         combine : bool; default=True
             runs the combine routine
+        lazy : bool; default=False
+            False : load the result arrays
+            True : the result arrays (obj.data) are h5py datasets that are
+                   read when they're sliced; the file is left open as
+                   self.h5_file, which should be closed when you're done
 
         """
         check_path(hdf5_filename, 'hdf5_filename')
@@ -735,11 +870,16 @@ class OP2(OP2_Scalar, OP2Writer):
 
         self.log.info('hdf5_op2_filename = %r' % hdf5_filename)
         debug = False
-        with h5py.File(hdf5_filename, 'r') as h5_file:
-            load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+        if lazy:
+            self.h5_file = h5py.File(hdf5_filename, 'r')
+            load_op2_from_hdf5_file(self, self.h5_file, self.log, debug=debug, lazy=True)
+        else:
+            with h5py.File(hdf5_filename, 'r') as h5_file:
+                load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
         self.combine_results(combine=combine)
 
-    def load_hdf5_file(self, h5_file: H5File, combine: bool=True) -> None:
+    def load_hdf5_file(self, h5_file: H5File, combine: bool=True,
+                       lazy: bool=False) -> None:
         """
         Loads an h5 file object into an OP2 object
 
@@ -749,27 +889,44 @@ class OP2(OP2_Scalar, OP2Writer):
             an h5py file object
         combine : bool; default=True
             runs the combine routine
+        lazy : bool; default=False
+            the result arrays (obj.data) are h5py datasets that are read
+            when they're sliced, so h5_file must be left open
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import load_op2_from_hdf5_file
         #self.op2_filename = hdf5_filename
         #self.log.info('hdf5_op2_filename = %r' % hdf5_filename)
         debug = False
-        load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug)
+        load_op2_from_hdf5_file(self, h5_file, self.log, debug=debug, lazy=lazy)
         self.combine_results(combine=combine)
 
-    def export_hdf5_filename(self, hdf5_filename: str) -> None:
+    def export_hdf5_filename(self, hdf5_filename: str,
+                             compression: Optional[str]=None) -> None:
         """
         Converts the OP2 objects into hdf5 object
 
+        Parameters
+        ----------
+        hdf5_filename : str
+            the path to the an hdf5 file
+        compression : str; default=None
+            the compression filter of the result arrays, which are
+            chunked by time/element
+            None : no compression
+            gzip : portable, slow
+            lzf : h5py only, fast
+            blosc : requires hdf5plugin, fast
+
         TODO: doesn't support:
           - BucklingEigenvalues
 
         """
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_filename
-        export_op2_to_hdf5_filename(hdf5_filename, self)
+        export_op2_to_hdf5_filename(hdf5_filename, self, compression=compression)
 
-    def export_hdf5_file(self, hdf5_file: H5File, exporter=None) -> None:
+    def export_hdf5_file(self, hdf5_file: H5File, exporter=None,
+                         compression: Optional[str]=None) -> None:
         """
         Converts the OP2 objects into hdf5 object
 
@@ -779,6 +936,8 @@ class OP2(OP2_Scalar, OP2Writer):
             an h5py object
         exporter : HDF5Exporter; default=None
             unused
+        compression : str; default=None
+            the compression filter {None, gzip, lzf, blosc}
 
         TODO: doesn't support:
           - BucklingEigenvalues
@@ -786,7 +945,7 @@ class OP2(OP2_Scalar, OP2Writer):
         """
         ## type (file, Any) -> None
         from pyNastran.op2.op2_interface.hdf5_interface import export_op2_to_hdf5_file
-        export_op2_to_hdf5_file(hdf5_file, self)
+        export_op2_to_hdf5_file(hdf5_file, self, compression=compression)
 
     def combine_results(self, combine: str=True) -> None:
         """
@@ -1245,7 +1404,12 @@ def read_op2(op2_filename: Optional[str]=None,
              build_dataframe: Optional[bool]=None,
              skip_undefined_matrices: bool=True,
              mode: Optional[str]=None,
-             encoding: Optional[str]=None) -> OP2:
+             encoding: Optional[str]=None,
+             mmap: bool=False,
+             op2_index: Optional[OP2Index]=None,
+             single_pass: bool=False,
+             nworkers: int=1,
+             load_as_h5: bool=False) -> OP2:
     """
     Creates the OP2 object without calling the OP2 class.
 
@@ -1278,6 +1442,23 @@ def read_op2(op2_filename: Optional[str]=None,
         sets the filename that will be written to
     encoding : str
         the unicode encoding (default=None; system default)
+    mmap : bool; default=False
+        memory maps the OP2, so the result tables are parsed directly
+        from the file without copying each record
+    op2_index : OP2Index; default=None
+        None : read all the tables
+        OP2Index : only read the tables/subtables in the index
+                   (see ``get_op2_index`` and ``OP2Index.select``)
+    single_pass : bool; default=False
+        reads the OP2 once instead of twice (read_mode=1/2); the result
+        records are sized as they're read and are filled once every
+        record has been sized, so the OP2 is memory mapped;
+        ignored with load_as_h5
+    nworkers : int; default=1
+        the number of processes that decode the result tables;
+        ignored with load_as_h5
+    load_as_h5 : bool; default=False
+        stores the result arrays in fname.h5 (model.h5_file) instead of RAM
 
     Returns
     -------
@@ -1299,7 +1480,8 @@ def read_op2(op2_filename: Optional[str]=None,
 
     model.read_op2(op2_filename=op2_filename, build_dataframe=build_dataframe,
                    skip_undefined_matrices=skip_undefined_matrices, combine=combine,
-                   encoding=encoding)
+                   encoding=encoding, mmap=mmap, op2_index=op2_index,
+                   single_pass=single_pass, nworkers=nworkers, load_as_h5=load_as_h5)
     ## TODO: this will go away when OP2 is refactored
     ## TODO: many methods will be missing, but it's a start...
     ## doesn't support F06 writer
@@ -1312,6 +1494,241 @@ def read_op2(op2_filename: Optional[str]=None,
     return model
 
 
+#: the nonlinear stress tables have subtables that use the table 3 of the
+#: previous subtable, so they're read as a single block
+OES_NL_TABLES = {'OESNLXD', 'OESNL1X', 'OESNLXR'}
+
+
+def iter_op2_results(op2_filename: str,
+                     result_types: Optional[List[str]]=None,
+                     subcases: Optional[List[int]]=None,
+                     log: Any=None,
+                     debug: bool=False,
+                     mode: Optional[str]=None,
+                     encoding: Optional[str]=None,
+                     mmap: bool=True,
+                     op2_index: Optional[OP2Index]=None,
+                     chunk_size: int=100000) -> Iterator[Tuple[Any, str, Any, Any]]:
+    """
+    Reads the results of an OP2 one time step at a time, so the results
+    don't need to fit in memory (e.g., for envelopes/max/min)
+
+    The OP2 is indexed (see ``get_op2_index``), opened once, and each
+    result subtable (a table 3/4 pair) is read in file order, so only one
+    time step of one result is stored at a time.  The results aren't
+    combined (see ``OP2.combine_results``).
+
+    Parameters
+    ----------
+    op2_filename : str
+        the op2_filename
+    result_types : List[str]; default=None -> all results
+        the results to yield (e.g., ['displacements', 'stress']);
+        'stress' includes 'stress.ctetra_stress', ...
+        see ``OP2.set_results``
+    subcases : List[int]; default=None -> all subcases
+        the subcases to read
+    log : Log()
+        a logging object to write debug messages to
+    debug : bool; default=False
+        enables the debug log
+    mode : str; default=None -> 'msc'
+        the version of the Nastran you're using
+        {nx, msc, autodesk, optistruct, nasa95}
+    encoding : str
+        the unicode encoding (default=None; system default)
+    mmap : bool; default=True
+        memory maps the OP2, so the records of a subtable aren't
+        copied before they're filled
+    op2_index : OP2Index; default=None -> index the OP2
+        the table of contents of the OP2
+    chunk_size : int; default=100000
+        the max number of nodes/elements (rows of result.data) in a result.
+        A SORT2 table stores one node/element per subtable, so chunk_size
+        subtables of a SORT2 table are read at a time.
+
+    Yields
+    ------
+    subcase : int
+        the subcase id
+    result_name : str
+        the name of the result (e.g., 'displacements', 'stress.ctetra_stress')
+    time_step : int / float
+        the mode/time/frequency of the result
+    result : result object
+        the result (e.g., a RealDisplacementArray) with a single time step
+        and up to chunk_size nodes/elements; result.data[0] is the
+        (nnodes/nelements, ncomponents) array
+
+    Example
+    -------
+    Get the max von Mises stress of each CQUAD4 over all times
+
+    .. code-block:: python
+
+       ovm_max = {}
+       for subcase, result_name, time_step, result in iter_op2_results(
+               'model.op2', result_types=['stress.cquad4_stress']):
+           eids = result.element_node[:, 0]
+           for eid, ovm in zip(eids, result.data[0, :, -1]):
+               ovm_max[eid] = max(ovm, ovm_max.get(eid, ovm))
+
+    """
+    from pyNastran.op2.op2_interface.parallel_reader import get_result_dicts
+    check_path(op2_filename, name='op2_filename')
+    model = OP2(log=log, debug=debug, mode=mode)
+    model.set_subcases(subcases)
+    model.include_exclude_results(include_results=result_types)
+    if op2_index is None:
+        op2_index = get_op2_index(op2_filename, mode=mode, log=model.log, save=False)
+    if subcases is not None:
+        op2_index = op2_index.select(subcases=subcases)
+
+    if encoding is None:
+        encoding = sys.getdefaultencoding()
+    model.encoding = encoding
+    model.is_vectorized = True
+    model.read_mode = 1
+
+    _open_op2_file(model, op2_filename, model.mode, mmap)
+    try:
+        result_dicts = get_result_dicts(model)
+        for table in op2_index.tables:
+            subtables = table['subtables']
+            if subtables is None:
+                continue
+            # a SORT1 subtable is a single time step, while a SORT2 subtable is
+            # a single node/element with all the time steps, so chunk_size
+            # subtables of a SORT2 table are read at a time
+            is_sort2 = False
+            isubtable = 0
+            while isubtable < len(subtables):
+                if table['table_name'] in OES_NL_TABLES:
+                    nsubtables = len(subtables)
+                elif is_sort2:
+                    nsubtables = _get_nsubtables_sort2(subtables, isubtable, chunk_size)
+                else:
+                    nsubtables = 1
+                _read_subtables(model, table, subtables[isubtable:isubtable+nsubtables])
+                isubtable += nsubtables
+
+                # the random tables don't set the sort bits
+                is_sort2 = getattr(model, 'sort_method', 1) == 2 or any(
+                    getattr(result, 'ntimes', 1) > 1
+                    for result_dict in result_dicts.values()
+                    for result in result_dict.values())
+
+                for result_name, result_dict in result_dicts.items():
+                    if not result_dict:
+                        continue
+                    if not _is_result_type(result_name, result_types):
+                        result_dict.clear()
+                        continue
+                    for key in list(result_dict):
+                        result = result_dict.pop(key)
+                        if hasattr(result, 'finalize'):
+                            # the structs aren't deleted (see OP2._finalize),
+                            # so the OP2 can be read from
+                            result.finalize()
+                        subcase = key[0] if isinstance(key, tuple) else key
+                        for time_step, resulti in _iter_time_steps(result, chunk_size):
+                            yield subcase, result_name, time_step, resulti
+    finally:
+        model.close_op2(force=True)
+
+
+def _open_op2_file(model: OP2, op2_filename: str, mode: str, mmap: bool) -> None:
+    """opens the OP2 and reads the header, so the indexed tables can be read"""
+    model.op2_filename = op2_filename
+    model.table_count = defaultdict(int)
+    model._count = 0
+    op2_reader = model.op2_reader
+    op2_reader.load_as_h5 = False
+    op2_reader.use_mmap = mmap
+    model._create_binary_debug()
+    model._setup_op2()
+    op2_reader.read_nastran_version(mode)
+
+
+def _get_nsubtables_sort2(subtables: List[Dict[str, Any]], isubtable: int,
+                          chunk_size: int) -> int:
+    """
+    Gets the number of SORT2 subtables (nodes/elements) to read, which
+    are the same subcase/result/element type
+    """
+    subtable = subtables[isubtable]
+    key = (subtable['isubcase'], subtable['table_code'], subtable['element_type'])
+    nsubtables = 1
+    nsubtables_max = min(chunk_size, len(subtables) - isubtable)
+    while nsubtables < nsubtables_max:
+        subtable = subtables[isubtable + nsubtables]
+        if (subtable['isubcase'], subtable['table_code'], subtable['element_type']) != key:
+            break
+        nsubtables += 1
+    return nsubtables
+
+
+def _read_subtables(model: OP2, table: Dict[str, Any],
+                    subtables: List[Dict[str, Any]]) -> None:
+    """reads some of the subtables of a result table in a single pass"""
+    table_index = dict(table)
+    table_index['subtables'] = subtables
+    table_name = model.op2_reader.goto_indexed_table(table_index)
+    model.single_pass_records = SinglePassRecords()
+    try:
+        model._read_table(table_name)
+        model._fill_single_pass()
+    finally:
+        model.single_pass_records = None
+    model.obj = None
+
+
+def _is_result_type(result_name: str, result_types: Optional[List[str]]) -> bool:
+    """
+    Is the result (e.g., 'stress.ctetra_stress') one of the result_types
+    (e.g., 'stress' or 'stress.ctetra_stress')?  The reader reads every
+    result of a table, so the other results are dropped.
+    """
+    if result_types is None:
+        return True
+    if isinstance(result_types, str):
+        result_types = [result_types]
+    return any(result_name == result_type or result_name.startswith(result_type + '.')
+               for result_type in result_types)
+
+
+def _iter_time_steps(result: Any, chunk_size: int) -> Iterator[Tuple[Any, Any]]:
+    """yields the (time_step, result) for each time step and chunk of nodes/elements"""
+    nrows = result.data.shape[1]
+    if result.ntimes == 1 and nrows <= chunk_size:
+        yield result._times[0], result
+        return
+
+    # the node/element arrays (e.g., node_gridtype, element_node)
+    data_names = result.data_code.get('data_names', [])
+    skip_names = {'data', '_times'}.union(name + 's' for name in data_names)
+    row_names = [name for name, value in vars(result).items()
+                 if isinstance(value, np.ndarray) and value.ndim and len(value) == nrows and
+                 name not in skip_names]
+    for itime in range(result.ntimes):
+        time_step = result._times[itime]
+        for irow in range(0, nrows, chunk_size):
+            yield time_step, _get_result_chunk(result, itime, irow, irow + chunk_size,
+                                               row_names)
+
+
+def _get_result_chunk(result: Any, itime: int, irow0: int, irow1: int,
+                      row_names: List[str]) -> Any:
+    """gets a shallow copy of a result with a single time step and some of the rows"""
+    result2 = copy.copy(result)
+    result2.ntimes = 1
+    result2._times = result._times[itime:itime+1]
+    result2.data = result.data[itime:itime+1, irow0:irow1, ...]
+    for name in row_names:
+        setattr(result2, name, getattr(result, name)[irow0:irow1])
+    return result2
+
+
 def _create_hdf5_info(h5_file, op2_model):
     """exports the h5 info group"""
     load_as_h5 = False
@@ -303,12 +303,14 @@ class OP2Geom(BDF, OP2GeomCommon):
         return True
 
     def read_op2(self, op2_filename=None, combine=True,
-                 build_dataframe=None, skip_undefined_matrices=False, encoding=None):
+                 build_dataframe=None, skip_undefined_matrices=False, encoding=None,
+                 mmap=False, op2_index=None, single_pass=False, nworkers=1):
         """see ``OP2.read_op2``"""
         OP2.read_op2(self, op2_filename=op2_filename, combine=combine,
                      build_dataframe=build_dataframe,
                      skip_undefined_matrices=skip_undefined_matrices,
-                     encoding=encoding)
+                     encoding=encoding, mmap=mmap, op2_index=op2_index,
+                     single_pass=single_pass, nworkers=nworkers)
         if len(self.nodes) == 0:
             self.gpdt_to_nodes()
 
@@ -4,10 +4,15 @@ defines:
  model = load_op2_from_h5(h5_filename, log=None)
  export_op2_to_hdf5(hdf5_filename, op2_model)
 
- model = load_op2_from_hdf5(hdf5_filename, combine=True, log=None)
- model = load_op2_from_hdf5_file(model, h5_file, log, debug=False)
- export_op2_to_hdf5_file(hdf5_filename, op2_model)
- export_op2_to_hdf5_file(hdf5_file, op2_model)
+ model = load_op2_from_hdf5(hdf5_filename, combine=True, log=None, lazy=False)
+ model = load_op2_from_hdf5_file(model, h5_file, log, debug=False, lazy=False)
+ export_op2_to_hdf5_file(hdf5_filename, op2_model, compression=None)
+ export_op2_to_hdf5_file(hdf5_file, op2_model, compression=None)
+
+The result arrays (obj.data) are chunked by time/element and may be
+compressed (gzip, lzf, blosc).  With lazy=True, obj.data is an h5py
+dataset that's read when it's sliced (e.g., obj.data[itime, :, :]),
+so a subcase/time step can be read without loading the whole file.
 
 """
 import numpy as np
@@ -118,6 +123,7 @@ from pyNastran.op2.tables.oef_forces.oef_thermal_objects import (
 #from pyNastran.op2.tables.oqg_constraintForces.oqg_thermal_gradient_and_flux import RealTemperatureGradientAndFluxArray
 from pyNastran.utils import check_path
 from pyNastran.op2.result_objects.matrix import Matrix
+from pyNastran.op2.op2_interface.write_utils import get_hdf5_compression_kwargs
 
 
 def _cast(h5_result_attr):
@@ -1030,7 +1036,7 @@ def _load_eigenvalue(h5_result, log):
             setattr(obj, key, datai)
     return obj
 
-def _load_table(result_name, h5_result, objs, log, debug=False):# real_obj, complex_obj
+def _load_table(result_name, h5_result, objs, log, debug=False, lazy=False):# real_obj, complex_obj
     """loads a RealEigenvectorArray/ComplexEigenvectorArray"""
     is_real = _cast(h5_result.get('is_real'))
     #is_complex = _cast(h5_result.get('is_complex'))
@@ -1065,6 +1071,9 @@ def _load_table(result_name, h5_result, objs, log, debug=False):# real_obj, comp
     for key, value in list(data_code.items()):
         if isinstance(value, np.ndarray):
             pass
+        elif isinstance(value, bytes):
+            # h5py>=3 returns bytes for the strings (e.g., subtitle, table_name)
+            data_code[key] = value.decode('latin1')
         elif value in (None, np.nan):
             if key in ['nonlinear_factor']:
                 pass
@@ -1096,12 +1105,12 @@ def _load_table(result_name, h5_result, objs, log, debug=False):# real_obj, comp
         msg = 'class_name=%r selected; should be %r' % (obj.class_name, class_name)
         raise RuntimeError(msg)
     _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     debug=debug)
+                                     debug=debug, lazy=lazy)
     return obj
 
 
 def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str_data_names,
-                                     debug=False):
+                                     debug=False, lazy=False):
     """helper method for ``_load_table``"""
     keys_to_skip = [
         'class_name', 'headers', 'is_real', 'is_complex',
@@ -1124,6 +1133,9 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
             datai = _cast(h5_result.get(key))
             setattr(obj, key, datai)
             setattr(obj, '_times', datai)
+        elif lazy and key == 'data':
+            # the h5py dataset is read when it's sliced
+            setattr(obj, key, h5_result.get(key))
         elif key not in data_code:
             datai = _cast(h5_result.get(key))
             if debug:  # pragma: no cover
@@ -1131,7 +1143,8 @@ def _apply_hdf5_attributes_to_object(obj, h5_result, result_name, data_code, str
                 if key not in ['data']:
                     print(datai)
 
-            if key in STRING_KEYS and isinstance(datai, bytes):
+            if isinstance(datai, bytes):
+                # h5py>=3 returns bytes for the strings (e.g., label, element_name)
                 datai = datai.decode('latin1')
 
             try:
@@ -1184,20 +1197,38 @@ def _get_obj_class(objs, class_name, result_name, unused_is_real, log):
             #obj_class = complex_obj
     return obj_class
 
-def export_op2_to_hdf5_filename(hdf5_filename, op2_model):
-    """exports an OP2 object to an HDF5 file"""
+def export_op2_to_hdf5_filename(hdf5_filename, op2_model, compression=None):
+    """
+    exports an OP2 object to an HDF5 file
+
+    Parameters
+    ----------
+    hdf5_filename : str
+        the HDF5 file to write
+    op2_model : OP2
+        the model
+    compression : str; default=None
+        the compression filter of the arrays
+        None : no compression
+        gzip : portable, slow
+        lzf : h5py only, fast
+        blosc : requires hdf5plugin, fast
+
+    """
     #no_sort2_classes = ['RealEigenvalues', 'ComplexEigenvalues', 'BucklingEigenvalues']
 
+    # check the compression before creating the file
+    get_hdf5_compression_kwargs(compression)
     with h5py.File(hdf5_filename, 'w') as hdf5_file:
         op2_model.log.info('starting export_op2_to_hdf5_file of %r' % hdf5_filename)
-        export_op2_to_hdf5_file(hdf5_file, op2_model)
+        export_op2_to_hdf5_file(hdf5_file, op2_model, compression=compression)
 
-def export_op2_to_hdf5_file(hdf5_file, op2_model):
+def export_op2_to_hdf5_file(hdf5_file, op2_model, compression=None):
     """exports an OP2 object to an HDF5 file object"""
     assert not isinstance(hdf5_file, str), hdf5_file
     create_info_group(hdf5_file, op2_model)
-    export_matrices(hdf5_file, op2_model)
-    _export_subcases(hdf5_file, op2_model)
+    export_matrices(hdf5_file, op2_model, compression=compression)
+    _export_subcases(hdf5_file, op2_model, compression=compression)
 
 def create_info_group(hdf5_file, op2_model):
     """creates the info HDF5 group"""
@@ -1208,21 +1239,21 @@ def create_info_group(hdf5_file, op2_model):
     #info_group.create_dataset('is_nx', data=self.is_nx)
     #info_group.create_dataset('nastran_version', data=self.is_nx)
 
-def export_matrices(hdf5_file, op2_model):
+def export_matrices(hdf5_file, op2_model, compression=None):
     """exports the matrices to HDF5"""
     if len(op2_model.matrices):
         matrix_group = hdf5_file.create_group('matrices')
         for key, matrix in sorted(op2_model.matrices.items()):
             matrixi_group = matrix_group.create_group(key.encode('latin-1'))
             if hasattr(matrix, 'export_to_hdf5'):
-                matrix.export_to_hdf5(matrixi_group, op2_model.log)
+                matrix.export_to_hdf5(matrixi_group, op2_model.log, compression=compression)
             else:
                 msg = 'HDF5: key=%r type=%s cannot be exported' % (key, str(type(matrix)))
                 op2_model.log.warning(msg)
                 raise NotImplementedError(msg)
                 #continue
 
-def _export_subcases(hdf5_file, op2_model):
+def _export_subcases(hdf5_file, op2_model, compression=None):
     """exports the subcases to HDF5"""
     subcase_groups = {}
     result_types = op2_model.get_table_types()
@@ -1260,25 +1291,52 @@ def _export_subcases(hdf5_file, op2_model):
             #result_name = result_type + ':' + class_name
             result_name = result_type
             result_group = subcase_group.create_group(result_name)
-            obj.export_to_hdf5(result_group, op2_model.log)
-
-def load_op2_from_hdf5(hdf5_filename, combine=True, log=None):
-    return load_op2_from_hdf5_filename(hdf5_filename, combine=combine, log=log)
-
-def load_op2_from_hdf5_filename(hdf5_filename, combine=True, log=None):
-    """loads an hdf5 file into an OP2 object"""
+            obj.export_to_hdf5(result_group, op2_model.log, compression=compression)
+
+def load_op2_from_hdf5(hdf5_filename, combine=True, log=None, lazy=False):
+    return load_op2_from_hdf5_filename(hdf5_filename, combine=combine, log=log, lazy=lazy)
+
+def load_op2_from_hdf5_filename(hdf5_filename, combine=True, log=None, lazy=False):
+    """
+    loads an hdf5 file into an OP2 object
+
+    Parameters
+    ----------
+    hdf5_filename : str
+        the path to the an hdf5 file
+    combine : bool; default=True
+        runs the combine routine
+    log : Log(); default=None
+        a logging object
+    lazy : bool; default=False
+        False : load the result arrays
+        True : the result arrays (obj.data) are h5py datasets that are
+               read when they're sliced; the file is left open as
+               model.h5_file, which should be closed when you're done
+
+    Returns
+    -------
+    model : OP2
+        the model
+
+    """
     check_path(hdf5_filename, 'hdf5_filename')
     model = OP2(log=log)
     model.op2_filename = hdf5_filename
 
-    log.info('hdf5_op2_filename = %r' % hdf5_filename)
+    model.log.info('hdf5_op2_filename = %r' % hdf5_filename)
     debug = False
-    with h5py.File(hdf5_filename, 'r') as h5_file:
-        load_op2_from_hdf5_file(model, h5_file, log, debug=debug)
+    if lazy:
+        h5_file = h5py.File(hdf5_filename, 'r')
+        model.h5_file = h5_file
+        load_op2_from_hdf5_file(model, h5_file, model.log, debug=debug, lazy=True)
+    else:
+        with h5py.File(hdf5_filename, 'r') as h5_file:
+            load_op2_from_hdf5_file(model, h5_file, model.log, debug=debug)
     model.combine_results(combine=combine)
     return model
 
-def load_op2_from_hdf5_file(model, h5_file, log, debug=False):
+def load_op2_from_hdf5_file(model, h5_file, log, debug=False, lazy=False):
     """loads an h5 file object into an OP2 object"""
     for key in h5_file.keys():
         if key.startswith('Subcase'):
@@ -1308,7 +1366,8 @@ def load_op2_from_hdf5_file(model, h5_file, log, debug=False):
                     if objs is None:
                         log.warning(f'  skipping {result_name}...')
                         continue
-                    obj = _load_table(result_name, h5_result, objs, log=log, debug=debug)
+                    obj = _load_table(result_name, h5_result, objs, log=log, debug=debug,
+                                      lazy=lazy)
                     if obj is None:
                         continue
 
@@ -1594,6 +1594,11 @@ class OP2Common(Op2Codes, F06Writer):
         """
         assert not isinstance(class_obj, str), 'class_obj=%r' % class_obj
         assert class_obj is not None, class_obj
+        if self.single_pass_records is not None and self.single_pass_records.transient_args is not None:
+            # the single pass reader sizes the other records of the object
+            # without the table 4 parser
+            self.single_pass_records.transient_args.append(
+                (result_name, storage_obj, class_obj, is_cid))
         if debug:
             print("create Transient Object")
             print("***NF = %s" % self.nonlinear_factor)
@@ -0,0 +1,369 @@
+"""
+Defines a table of contents for an OP2, which lets a subset of the
+results be read by seeking to the tables/subtables of interest instead
+of streaming through the whole file.
+
+ - OP2Index(op2_filename, nbytes, mtime, tables)
+   - select(table_names=None, subcases=None, element_types=None, times=None)
+   - save(index_filename)
+   - load(index_filename)
+ - build_op2_index(op2_filename, mode=None, log=None)
+ - get_op2_index(op2_filename, mode=None, log=None, save=True)
+
+Example
+-------
+Read the CQUAD4 stresses for modes 1-10 of subcase 12
+
+.. code-block:: python
+
+   op2_index = get_op2_index('model.op2')
+   op2_index_oes = op2_index.select(
+       table_names=['OES1X1'], subcases=[12],
+       element_types=['CQUAD4'], times=range(1, 11))
+   model = read_op2('model.op2', op2_index=op2_index_oes)
+
+"""
+from __future__ import annotations
+import os
+import sys
+import json
+from struct import Struct
+from typing import List, Dict, Optional, Any, Iterable, Union
+
+import numpy as np
+from cpylog import get_logger2
+
+from pyNastran.op2.op2_interface.msc_tables import MSC_ELEMENTS
+from pyNastran.op2.op2_interface.nx_tables import NX_ELEMENTS
+
+#: the analysis codes where the "time" is a float (frequency, time, load step);
+#: 11 is the old geometric nonlinear statics load step
+FLOAT_ANALYSIS_CODES = {5, 6, 10, 11}
+
+#: the table names that store an element type in table 3
+ELEMENT_TABLE_PREFIXES = (b'OES', b'OSTR', b'OEF')
+
+
+class OP2Index:
+    """
+    Stores the byte offsets of the tables in an OP2 and the table 3
+    (header) subtables of the result tables.
+
+    Each table is a dictionary of:
+     - table_name : str
+         the table name (e.g., 'OES1X1')
+     - offset : int
+         the location of the table name record
+     - subtables : List[Dict[str, Any]] / None
+         the table 3 headers of a result table; None for other tables
+     - end : [int, int]
+         the (isubtable, offset) of the final subtable marker
+
+    Each subtable is a dictionary of:
+     - isubtable : int
+         the subtable marker (-3, -5, ...)
+     - offset : int
+         the location of the [isubtable, 1, 0] markers
+     - next : [int, int]
+         the (isubtable, offset) of the next table 3 or the final marker
+     - isubcase, table_code, analysis_code, element_type, element_name, time
+         the table 3 header
+
+    """
+    def __init__(self, op2_filename: str, nbytes: int, mtime: float,
+                 tables: List[Dict[str, Any]]):
+        self.op2_filename = op2_filename
+        self.nbytes = nbytes
+        self.mtime = mtime
+        self.tables = tables
+
+    def __len__(self) -> int:
+        return len(self.tables)
+
+    def __repr__(self) -> str:
+        msg = 'OP2Index(op2_filename=%r, ntables=%s)\n' % (self.op2_filename, len(self.tables))
+        for table in self.tables:
+            subtables = table['subtables']
+            nsubtables = 0 if subtables is None else len(subtables)
+            msg += '  %-8s offset=%-10s nsubtables=%s\n' % (
+                table['table_name'], table['offset'], nsubtables)
+        return msg
+
+    def is_valid(self, op2_filename: str) -> bool:
+        """is the index up to date with the OP2?"""
+        stat = os.stat(op2_filename)
+        return stat.st_size == self.nbytes and stat.st_mtime == self.mtime
+
+    def select(self, table_names: Optional[List[str]]=None,
+               subcases: Optional[List[int]]=None,
+               element_types: Optional[List[Union[int, str]]]=None,
+               times: Optional[Iterable[float]]=None) -> OP2Index:
+        """
+        Creates an index with a subset of the tables/subtables
+
+        Parameters
+        ----------
+        table_names : List[str]; default=None -> all tables
+            the tables to keep (e.g., ['OUGV1', 'OES1X1'])
+        subcases : List[int]; default=None -> all subcases
+            the subcases to keep
+        element_types : List[str/int]; default=None -> all results
+            the element names (e.g., 'CQUAD4') or element types (e.g., 33)
+            to keep; results without an element type (e.g., OUGV1) are
+            dropped when this is used
+        times : List[float]; default=None -> all times
+            the modes/times/frequencies/load steps to keep
+
+        Returns
+        -------
+        op2_index : OP2Index
+            the filtered index
+
+        """
+        if table_names is not None:
+            table_names = {_to_str(table_name) for table_name in table_names}
+        if subcases is not None:
+            subcases = set(subcases)
+        if element_types is not None:
+            element_types = set(element_types)
+        if times is not None:
+            times = np.asarray(list(times), dtype='float64')
+
+        tables = []
+        for table in self.tables:
+            if table_names is not None and table['table_name'] not in table_names:
+                continue
+            subtables = table['subtables']
+            if subtables is None:
+                tables.append(table)
+                continue
+
+            subtables2 = [
+                subtable for subtable in subtables
+                if _is_subtable_selected(subtable, subcases, element_types, times)]
+            if subtables2:
+                table2 = dict(table)
+                table2['subtables'] = subtables2
+                tables.append(table2)
+        return OP2Index(self.op2_filename, self.nbytes, self.mtime, tables)
+
+    def save(self, index_filename: str) -> None:
+        """writes the index as a json file"""
+        index_dict = {
+            'op2_filename' : self.op2_filename,
+            'nbytes' : self.nbytes,
+            'mtime' : self.mtime,
+            'tables' : self.tables,
+        }
+        with open(index_filename, 'w') as index_file:
+            json.dump(index_dict, index_file)
+
+    @classmethod
+    def load(cls, index_filename: str) -> OP2Index:
+        """loads an index that was written by ``OP2Index.save``"""
+        with open(index_filename, 'r') as index_file:
+            index_dict = json.load(index_file)
+        return OP2Index(index_dict['op2_filename'], index_dict['nbytes'],
+                        index_dict['mtime'], index_dict['tables'])
+
+
+def get_op2_index(op2_filename: str, mode: Optional[str]=None,
+                  log: Any=None, save: bool=True) -> OP2Index:
+    """
+    Loads the ``.op2idx`` sidecar file for an OP2 or builds it if it
+    doesn't exist or is out of date.
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 to index
+    mode : str; default=None -> 'msc'
+        the version of the Nastran you're using
+        {nx, msc, autodesk, optistruct, nasa95}
+    log : Log(); default=None
+        a logging object
+    save : bool; default=True
+        write the sidecar file after building an index
+
+    Returns
+    -------
+    op2_index : OP2Index
+        the table of contents
+
+    """
+    log = get_logger2(log, debug=False)
+    index_filename = os.path.splitext(op2_filename)[0] + '.op2idx'
+    if os.path.exists(index_filename):
+        op2_index = OP2Index.load(index_filename)
+        if op2_index.is_valid(op2_filename):
+            log.debug('loaded index_filename=%r' % index_filename)
+            return op2_index
+        log.info('index_filename=%r is out of date' % index_filename)
+
+    op2_index = build_op2_index(op2_filename, mode=mode, log=log)
+    if save:
+        op2_index.save(index_filename)
+    return op2_index
+
+
+def build_op2_index(op2_filename: str, mode: Optional[str]=None,
+                    log: Any=None) -> OP2Index:
+    """
+    Makes a single pass over an OP2 to find the location of every
+    table and result subtable.  Only the table 3 headers are parsed.
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 to index
+    mode : str; default=None -> 'msc'
+        the version of the Nastran you're using
+        {nx, msc, autodesk, optistruct, nasa95}
+    log : Log(); default=None
+        a logging object
+
+    Returns
+    -------
+    op2_index : OP2Index
+        the table of contents
+
+    """
+    from pyNastran.op2.op2 import OP2
+
+    model = OP2(debug=False, log=log, mode=mode)
+    model.op2_filename = op2_filename
+    model.encoding = sys.getdefaultencoding()
+    model.skip_undefined_matrices = True
+    model.is_vectorized = True
+    model._create_binary_debug()
+    model._setup_op2()
+    op2_reader = model.op2_reader
+    op2_reader.read_nastran_version(model.mode)
+
+    # non-result tables are consumed by the normal reader on the sizing
+    # pass because some of them (e.g., HISADD) allocate their arrays there
+    model.read_mode = 1
+
+    tables = []
+    try:
+        table_name = op2_reader._read_table_name(rewind=True, stop_on_failure=False)
+        while table_name is not None:
+            offset = model.n
+            subtables = None
+            end = None
+            if model._is_results_table(table_name):
+                model.table_name = table_name
+                subtables, end = _index_results_table(model)
+            else:
+                model._read_table(table_name)
+
+            tables.append({
+                'table_name' : table_name.decode('latin1'),
+                'offset' : offset,
+                'subtables' : subtables,
+                'end' : end,
+            })
+            table_name = op2_reader._read_table_name(
+                last_table_name=table_name, rewind=True, stop_on_failure=False)
+    finally:
+        model.close_op2(force=True)
+
+    stat = os.stat(op2_filename)
+    return OP2Index(op2_filename, stat.st_size, stat.st_mtime, tables)
+
+
+def _index_results_table(model) -> Any:
+    """
+    Indexes the subtables of a result table (e.g., OUG1, OES1X1).
+    This mirrors ``OP2Reader.read_results_table``.
+
+    """
+    op2_reader = model.op2_reader
+    size = op2_reader.size
+    factor = op2_reader.factor
+    table_name = op2_reader._read_table_name(rewind=False)
+    op2_reader.read_markers([-1])
+    op2_reader._skip_record()
+    op2_reader.read_3_markers([-2, 1, 0])
+    op2_reader._skip_record()
+
+    if size == 4:
+        struct_header = Struct(model._endian + b'5i')
+        struct_time = Struct(model._endian + b'f')
+    else:
+        struct_header = Struct(model._endian + b'5q')
+        struct_time = Struct(model._endian + b'd')
+    element_mapper = NX_ELEMENTS if model.is_nx else MSC_ELEMENTS
+    is_element_table = table_name.startswith(ELEMENT_TABLE_PREFIXES)
+
+    subtables = []
+    isubtable = -3
+    offset = model.n
+    op2_reader.read_3_markers([isubtable, 1, 0])
+    markers = op2_reader.get_nmarkers(1, rewind=True)
+    while markers[0] != 0:
+        record_len = op2_reader._get_record_length()
+        if record_len == 584 * factor:
+            data = op2_reader._read_record()
+            approach_code, tcode, int3, isubcase, time = struct_header.unpack(
+                data[:5 * size])
+            device_code = approach_code % 10
+            analysis_code = (approach_code - device_code) // 10
+            if analysis_code in FLOAT_ANALYSIS_CODES:
+                time, = struct_time.unpack(data[4 * size:5 * size])
+
+            element_type = None
+            element_name = None
+            if is_element_table:
+                element_type = int3
+                element_name = element_mapper.get(int3)
+
+            if subtables:
+                subtables[-1]['next'] = [isubtable, offset]
+            subtables.append({
+                'isubtable' : isubtable,
+                'offset' : offset,
+                'next' : None,
+                'isubcase' : isubcase,
+                'table_code' : tcode % 1000,
+                'analysis_code' : analysis_code,
+                'element_type' : element_type,
+                'element_name' : element_name,
+                'time' : time,
+            })
+        else:
+            op2_reader._skip_record()
+
+        isubtable -= 1
+        offset = model.n
+        op2_reader.read_3_markers([isubtable, 1, 0])
+        markers = op2_reader.get_nmarkers(1, rewind=True)
+
+    end = [isubtable, offset]
+    if subtables:
+        subtables[-1]['next'] = end
+    op2_reader.read_markers([0])
+    return subtables, end
+
+
+def _is_subtable_selected(subtable: Dict[str, Any],
+                          subcases: Optional[set],
+                          element_types: Optional[set],
+                          times: Optional[np.ndarray]) -> bool:
+    """checks a table 3 header against the filters"""
+    if subcases is not None and subtable['isubcase'] not in subcases:
+        return False
+    if element_types is not None:
+        if (subtable['element_type'] not in element_types and
+                subtable['element_name'] not in element_types):
+            return False
+    if times is not None and not np.isclose(subtable['time'], times).any():
+        return False
+    return True
+
+
+def _to_str(table_name: Union[str, bytes]) -> str:
+    """table names are stored as strings in the index"""
+    if isinstance(table_name, bytes):
+        return table_name.decode('latin1')
+    return table_name
@@ -44,10 +44,11 @@ Defines various tables that don't fit in other sections:
 from __future__ import annotations
 import os
 import sys
+import mmap
 from copy import deepcopy
 from itertools import count
 from struct import unpack, Struct, error as struct_error
-from typing import Tuple, Optional, TYPE_CHECKING
+from typing import Tuple, List, Dict, Optional, Any, TYPE_CHECKING
 
 import numpy as np
 import scipy  # type: ignore
@@ -94,6 +95,20 @@ class OP2Reader:
         self.h5_file = None
         self.size = 4
 
+        #: should the OP2 be memory mapped, so result records may be
+        #: passed to the table parsers without copying them
+        self.use_mmap = False
+        #: a memoryview of the memory mapped file
+        self.mview = None
+        #: are we in a result table (e.g., OUG1, OES1X1), which are the
+        #: only tables that support records that are memoryviews
+        self.is_results_table = False
+
+        #: the OP2Index of the tables/subtables to read; None reads everything
+        self.op2_index = None
+        #: the current table in the OP2Index
+        self.subtable_index = None
+
         # Hack to dump the IBULK/CASECC decks in reverse order
         # It's in reverse because that's how Nastran writes it.
         #
@@ -4238,6 +4253,111 @@ class OP2Reader:
             record = b''.join(records)
         return record, nrecord
 
+    def _read_record_ndata_mmap(self) -> Tuple[memoryview, int]:
+        """
+        Reads a record and the length of the record without copying it.
+
+        A single block record is returned as a memoryview into the memory
+        mapped file.  A record split across multiple blocks is gathered into
+        a single buffer, so it's copied once instead of once per ``f.read``
+        and again by the ``b''.join``.
+
+        """
+        if not self._is_mmap_record():
+            return self._read_record_ndata()
+        blocks, nrecord = self._read_record_blocks_mmap()
+        return self._join_record_blocks(blocks, nrecord), nrecord
+
+    def _is_mmap_record(self) -> bool:
+        """can the current record be read from the memory mapped OP2?"""
+        return self.use_mmap and self.is_results_table and not self.is_debug_file
+
+    def _read_record_blocks_mmap(self) -> Tuple[List[Tuple[int, int]], int]:
+        """
+        Reads the location of the blocks of a record in the memory mapped
+        OP2, so the record can be gathered later
+        (see ``_join_record_blocks``).
+
+        Returns
+        -------
+        blocks : List[(i0, ndata)]
+            i0 : int
+                the location of the block data
+            ndata : int
+                the length of the block data
+        nrecord : int
+            the length of the record
+
+        """
+        op2 = self.op2
+        mview = self.mview
+        size = self.size
+        struct_i = op2.struct_i
+        struct_marker = op2.struct_i if size == 4 else op2.struct_q
+
+        # [4, nwords, 4]
+        n = op2.n
+        marker0, = struct_marker.unpack_from(mview, n + 4)
+        n += 8 + size
+
+        # [nbytes, data, nbytes]
+        ndata, = struct_i.unpack_from(mview, n)
+        if marker0 * size != ndata:
+            raise FortranMarkerError('markers0=%s*%s len(record)=%s; table_name=%r' % (
+                marker0, size, ndata, op2.table_name))
+        blocks = [(n + 4, ndata)]
+        n += 8 + ndata
+        nrecord = ndata
+
+        # continuation blocks
+        marker1, = struct_marker.unpack_from(mview, n + 4)
+        while marker1 > 0:
+            n += 8 + size
+            ndatai, = struct_i.unpack_from(mview, n)
+            blocks.append((n + 4, ndatai))
+            n += 8 + ndatai
+            nrecord += ndatai
+            marker1, = struct_marker.unpack_from(mview, n + 4)
+        self._goto(n)
+        return blocks, nrecord
+
+    def _join_record_blocks(self, blocks: List[Tuple[int, int]],
+                            nrecord: int) -> memoryview:
+        """
+        Gets a record from the blocks in the memory mapped OP2
+        (see ``_read_record_blocks_mmap``)
+        """
+        mview = self.mview
+        if len(blocks) == 1:
+            i0 = blocks[0][0]
+            return mview[i0:i0 + nrecord]
+
+        record = bytearray(nrecord)
+        i = 0
+        for i0, ndatai in blocks:
+            record[i:i + ndatai] = mview[i0:i0 + ndatai]
+            i += ndatai
+        return memoryview(record)
+
+    def open_mmap(self, op2_filename: str) -> mmap.mmap:
+        """memory maps the OP2 and creates the memoryview used by the readers"""
+        with open(op2_filename, 'rb') as op2_file:
+            op2_mmap = mmap.mmap(op2_file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.mview = memoryview(op2_mmap)
+        return op2_mmap
+
+    def close_mmap(self, op2_mmap: mmap.mmap) -> None:
+        """releases the memoryview and unmaps the OP2"""
+        if self.mview is not None:
+            self.mview.release()
+            self.mview = None
+        try:
+            op2_mmap.close()
+        except BufferError:
+            # an array still references the file; it will be unmapped
+            # when the array is garbage collected
+            self.log.debug('the OP2 will be unmapped when its arrays are deleted')
+
     def _read_block_ndata4(self):
         """
         Reads a block following a pattern of:
@@ -4871,10 +4991,14 @@ class OP2Reader:
 
     def read_results_table(self):
         """Reads a results table"""
-        if self.size == 4:
-            self.read_results_table4()
-        else:
-            self.read_results_table8()
+        self.is_results_table = True
+        try:
+            if self.size == 4:
+                self.read_results_table4()
+            else:
+                self.read_results_table8()
+        finally:
+            self.is_results_table = False
 
     def read_results_table4(self):
         """Reads a results table"""
@@ -5038,6 +5162,44 @@ class OP2Reader:
         op2.subtable_name = subtable_name.rstrip()
         self._read_subtables()
 
+    def goto_indexed_table(self, table: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """
+        Jumps to a table in the OP2Index
+
+        Parameters
+        ----------
+        table : Dict[str, Any] / None
+            a table from OP2Index.tables; None indicates we're done
+
+        Returns
+        -------
+        table_name : bytes / None
+            the table name
+
+        """
+        self.subtable_index = table
+        if table is None:
+            return None
+        self._goto(table['offset'])
+        return self._read_table_name(rewind=True)
+
+    def _get_indexed_subtables(self) -> Optional[List[Dict[str, Any]]]:
+        """gets the table 3 subtables to read from the OP2Index"""
+        if self.subtable_index is None or self.subtable_index['subtables'] is None:
+            return None
+        table_name = self.subtable_index['table_name'].encode('latin1')
+        if table_name != self.op2.table_name:
+            return None
+        return list(self.subtable_index['subtables'])
+
+    def _goto_indexed_subtable(self, isubtable: int, offset: int) -> List[int]:
+        """jumps to an [isubtable, 1, 0] marker and peeks at the next marker"""
+        op2 = self.op2
+        self._goto(offset)
+        op2.isubtable = isubtable
+        self.read_3_markers([isubtable, 1, 0])
+        return self.get_nmarkers(1, rewind=True)
+
     def _read_subtables(self):
         """reads a series of subtables"""
         # this parameters is used for numpy streaming
@@ -5049,6 +5211,11 @@ class OP2Reader:
         #nstart = op2.n
         op2.isubtable = -3
         self.read_3_markers([-3, 1, 0])
+
+        # when reading from an OP2Index, we skip the table 3/4 pairs that
+        # weren't selected by jumping to the next selected table 3
+        indexed_subtables = self._get_indexed_subtables()
+        isubtable3 = -3
         if self.is_debug_file:
             self.binary_debug.write('***isubtable = %i\n' % op2.isubtable)
             self.binary_debug.write('---markers = [-3, 1, 0]---\n')
@@ -5090,6 +5257,19 @@ class OP2Reader:
 
         # while the subtables aren't done
         while markers[0] != 0:
+            if indexed_subtables is not None and op2.isubtable == isubtable3:
+                if indexed_subtables and indexed_subtables[0]['isubtable'] == isubtable3:
+                    # read this table 3/4 pair
+                    isubtable3 = indexed_subtables.pop(0)['next'][0]
+                else:
+                    if indexed_subtables:
+                        subtable = indexed_subtables[0]
+                        isubtable3, offset = subtable['isubtable'], subtable['offset']
+                    else:
+                        isubtable3, offset = self.subtable_index['end']
+                    markers = self._goto_indexed_subtable(isubtable3, offset)
+                    continue
+
             op2.is_start_of_subtable = True
             if self.is_debug_file:
                 self.binary_debug.write('***isubtable = %i\n' % op2.isubtable)
@@ -5167,7 +5347,11 @@ class OP2Reader:
         factor = self.factor
         if record_len == 584 * factor:  # table3 has a length of 584
             if op2.table_name in oes_nl and hasattr(op2, 'num_wide') and op2.num_wide == 146:
-                data_code_old = deepcopy(op2.data_code)
+                # the h5_file can't be copied
+                data_code_old = deepcopy({key: value for key, value in op2.data_code.items()
+                                          if key != 'h5_file'})
+                if 'h5_file' in op2.data_code:
+                    data_code_old['h5_file'] = op2.data_code['h5_file']
 
             if self.load_as_h5:
                 assert self.h5_file is not None, self.h5_file
@@ -5187,6 +5371,9 @@ class OP2Reader:
                         self.binary_debug.write('except SortCodeError!\n')
                     if op2.table_name in oes_nl:
                         update_op2_datacode(op2, data_code_old)
+                        if op2.single_pass_records is not None:
+                            op2._read_table4_single_pass(table4_parser, data, ndata, record_len)
+                            return False
 
                         n = table4_parser(data, ndata)
                         #print(data_code_old)
@@ -5220,6 +5407,15 @@ class OP2Reader:
                     # num_wide is the result size and is usually found in
                     # table3, but some B-list tables don't have it
                     unused_n = op2._read_subtable_results(table4_parser, record_len)
+                elif op2.single_pass_records is not None:
+                    # size and then fill the record
+                    data, ndata = self._read_record_ndata()
+                    unused_n = table4_parser(data, ndata)
+                    op2.read_mode = 2
+                    try:
+                        unused_n = table4_parser(data, ndata)
+                    finally:
+                        op2.read_mode = 1
                 else:
                     data, ndata = self._read_record_ndata()
                     unused_n = table4_parser(data, ndata)
@@ -32,6 +32,8 @@ Defines the sub-OP2 class.  This should never be called outisde of the OP2 class
    - _create_binary_debug()
    - _make_tables()
    - _read_tables(table_name)
+   - _read_table(table_name)
+   - _is_results_table(table_name)
    - _skip_table(table_name)
    - _read_table_name(rewind=False, stop_on_failure=True)
    - _update_generalized_tables(tables)
@@ -76,6 +78,7 @@ from pyNastran.op2.tables.ogpwg import OGPWG
 from pyNastran.op2.fortran_format import FortranFormat
 
 from pyNastran.utils import is_binary_file
+from pyNastran.utils.numpy_utils import integer_types
 """
 ftp://161.24.15.247/Nastran2011/seminar/SEC04-DMAP_MODULES.pdf
 
@@ -1531,7 +1534,9 @@ class OP2_Scalar(LAMA, ONR, OGPF,
                  combine: bool=False,
                  load_as_h5: bool=False,
                  h5_file=None,
-                 mode: Optional[str]=None) -> None:
+                 mode: Optional[str]=None,
+                 mmap: bool=False,
+                 op2_index=None) -> None:
         """
         Starts the OP2 file reading
 
@@ -1548,8 +1553,15 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             True : loads the op2 as an h5 file to save memory
                    stores the result.element/data attributes in h5 format
         h5_file : h5File; default=None
-            None : ???
-            h5File : ???
+            None : creates the h5_file (fname.h5) if load_as_h5=True
+            h5File : the open h5_file to store the results in
+                     (e.g., from the array sizing pass)
+        mmap : bool; default=False
+            memory maps the OP2, so the result tables are parsed directly
+            from the file without copying each record
+        op2_index : OP2Index; default=None
+            None : read all the tables
+            OP2Index : only read the tables/subtables in the index
 
         +--------------+-----------------------+
         | op2_filename | Description           |
@@ -1567,11 +1579,14 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         self.h5_filename = fname + '.h5'
 
         self.op2_reader.load_as_h5 = load_as_h5
+        self.op2_reader.use_mmap = mmap
+        self.op2_reader.op2_index = op2_index
         if load_as_h5:
-            h5_file = None
-            import h5py
-            self.h5_file = h5py.File(self.h5_filename, 'w')
-            self.op2_reader.h5_file = self.h5_file
+            if h5_file is None:
+                import h5py
+                h5_file = h5py.File(self.h5_filename, 'w')
+            self.h5_file = h5_file
+            self.op2_reader.h5_file = h5_file
 
         self._count = 0
         if self.read_mode == 1:
@@ -1632,7 +1647,10 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             if self.f is not None:
                 # can happen if:
                 #  - is ascii file
-                self.f.close()
+                if self.op2_reader.use_mmap:
+                    self.op2_reader.close_mmap(self.f)
+                else:
+                    self.f.close()
             del self.binary_debug
             del self.f
             self._cleanup_data_members()
@@ -1689,7 +1707,10 @@ class OP2_Scalar(LAMA, ONR, OGPF,
 
         if not hasattr(self, 'f') or self.f is None:
             #: the OP2 file object
-            self.f = open(self.op2_filename, 'rb')
+            if self.op2_reader.use_mmap:
+                self.f = self.op2_reader.open_mmap(self.op2_filename)
+            else:
+                self.f = open(self.op2_filename, 'rb')
             #: the endian in bytes
             self._endian = None
             #: the endian in unicode
@@ -1753,6 +1774,13 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         op2_reader = self.op2_reader
         table_names = []
         self.table_count = defaultdict(int)
+
+        indexed_tables = None
+        if op2_reader.op2_index is not None:
+            # jump straight to the tables in the index
+            indexed_tables = iter(op2_reader.op2_index.tables)
+            table_name = op2_reader.goto_indexed_table(next(indexed_tables, None))
+
         while table_name is not None:
             self.table_count[table_name] += 1
             table_names.append(table_name)
@@ -1764,63 +1792,167 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             if is_release:
                 self.log.debug('  table_name=%r' % table_name)
 
-            self.table_name = table_name
-            #if 0:
-                #op2_reader._skip_table(table_name)
-            #else:
-            #print(table_name, table_name in op2_reader.mapped_tables)
-            if table_name in self.generalized_tables:
-                t0 = self.f.tell()
-                self.generalized_tables[table_name](self)
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in op2_reader.mapped_tables:
-                t0 = self.f.tell()
-                op2_reader.mapped_tables[table_name]()
-                assert self.f.tell() != t0, 'the position was unchanged...'
-            elif table_name in GEOM_TABLES:
-                op2_reader.read_geom_table()  # DIT (agard)
-            elif table_name in MATRIX_TABLES:
-                op2_reader.read_matrix(table_name)
-            elif table_name in RESULT_TABLES:
-                op2_reader.read_results_table()
-            elif self.skip_undefined_matrices:
-                op2_reader.read_matrix(table_name)
-            elif table_name.strip() in self.additional_matrices:
-                op2_reader.read_matrix(table_name)
+            if self.single_pass_records is not None and not self._is_results_table(table_name):
+                # the result tables are sized one record at a time, but the
+                # other tables (e.g., HISADD) are sized and filled now
+                self._read_table_single_pass(table_name)
             else:
-                #self.show(1000, types='ifsq')
-                msg = (
-                    'Invalid Table = %r\n\n'
-                    'If you have matrices that you want to read, see:\n'
-                    '  model.set_additional_matrices_to_read(matrices)'
-                    '  matrices = {\n'
-                    "      b'BHH' : True,\n"
-                    "      b'KHH' : False,\n"
-                    '  }  # you want to read some matrices, but not others\n'
-                    "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
-
-                    'If you the table is a geom/result table, see:\n'
-                    '  model.set_additional_result_tables_to_read(methods_dict)\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method3, method4],\n"
-                    "      b'GEOM4SX' : [method3, method4],\n"
-                    "      b'OES1X1' : False,\n"
-                    '  }\n\n'
-
-                    'If you want to take control of the OP2 reader (mainly useful '
-                    'for obscure tables), see:\n'
-                    "  methods_dict = {\n"
-                    "      b'OUGV1' : [method],\n"
-                    '  }\n'
-                    '  model.set_additional_generalized_tables_to_read(methods_dict)\n' % (
-                        table_name)
-                )
-                raise NotImplementedError(msg)
-
-            table_name = op2_reader._read_table_name(last_table_name=table_name,
-                                                     rewind=True, stop_on_failure=False)
+                self._read_table(table_name)
+
+            if indexed_tables is None:
+                table_name = op2_reader._read_table_name(last_table_name=table_name,
+                                                         rewind=True, stop_on_failure=False)
+            else:
+                table_name = op2_reader.goto_indexed_table(next(indexed_tables, None))
+
+        if self.single_pass_records is not None:
+            self._fill_single_pass()
         return table_names
 
+    def _read_table_single_pass(self, table_name: bytes) -> None:
+        """
+        Reads a table that isn't a result table (e.g., HISADD) for the
+        single pass reader.  The table is sized and then filled (like
+        read_mode=1/2), so it's not read again once the records are filled.
+        """
+        single_pass_records = self.single_pass_records
+        n = self.n
+        count = self._count
+        self.single_pass_records = None
+        try:
+            self._read_table(table_name)
+
+            # the table is counted once (e.g., R1TABRG)
+            self._count = count
+            self.read_mode = 2
+            self.op2_reader._goto(n)
+            self._read_table(table_name)
+        finally:
+            self.read_mode = 1
+            self.single_pass_records = single_pass_records
+
+    def _fill_single_pass(self) -> None:
+        """
+        Fills the records for the single pass reader once every record
+        has been sized, so the arrays are built once with the final size.
+        """
+        single_pass_records = self.single_pass_records
+        attrs_record = {}
+
+        self.read_mode = 2
+        self.single_pass_records = None
+        try:
+            for record in single_pass_records.records:
+                # restore the table 3 state of the record
+                for key in record.deleted:
+                    del attrs_record[key]
+                    if hasattr(self, key):
+                        delattr(self, key)
+                attrs_record.update(record.changed)
+                for key, value in attrs_record.items():
+                    setattr(self, key, value)
+
+                data = record.data
+                if record.blocks is not None:
+                    data = self.op2_reader._join_record_blocks(record.blocks, record.ndata)
+                self._fill_single_pass_record(record.table4_parser, data, record.ndata)
+        finally:
+            self.read_mode = 1
+            self.single_pass_records = single_pass_records
+            single_pass_records.records = []
+
+    def _fill_single_pass_record(self, table4_parser, data, ndata: int) -> None:
+        """
+        Fills a table 4 record that was sized by the single pass reader
+
+        Parameters
+        ----------
+        table4_parser : function
+            the parser function for table 4
+        data : bytes / memoryview
+            the table 4 record
+        ndata : int
+            the length of data
+
+        """
+        self.ntotal = 0
+        n = table4_parser(data, ndata)
+        assert isinstance(n, integer_types), self.table_name
+        self._reset_vector_counter()
+        self._cleanup_data_members()
+
+    def _read_table(self, table_name: bytes) -> None:
+        """
+        Reads a geometry/result table.  The table name has not been read yet.
+
+        Parameters
+        ----------
+        table_name : bytes str
+            the table's name
+
+        """
+        op2_reader = self.op2_reader
+        self.table_name = table_name
+        #if 0:
+            #op2_reader._skip_table(table_name)
+        #else:
+        #print(table_name, table_name in op2_reader.mapped_tables)
+        if table_name in self.generalized_tables:
+            t0 = self.f.tell()
+            self.generalized_tables[table_name](self)
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in op2_reader.mapped_tables:
+            t0 = self.f.tell()
+            op2_reader.mapped_tables[table_name]()
+            assert self.f.tell() != t0, 'the position was unchanged...'
+        elif table_name in GEOM_TABLES:
+            op2_reader.read_geom_table()  # DIT (agard)
+        elif table_name in MATRIX_TABLES:
+            op2_reader.read_matrix(table_name)
+        elif table_name in RESULT_TABLES:
+            op2_reader.read_results_table()
+        elif self.skip_undefined_matrices:
+            op2_reader.read_matrix(table_name)
+        elif table_name.strip() in self.additional_matrices:
+            op2_reader.read_matrix(table_name)
+        else:
+            #self.show(1000, types='ifsq')
+            msg = (
+                'Invalid Table = %r\n\n'
+                'If you have matrices that you want to read, see:\n'
+                '  model.set_additional_matrices_to_read(matrices)'
+                '  matrices = {\n'
+                "      b'BHH' : True,\n"
+                "      b'KHH' : False,\n"
+                '  }  # you want to read some matrices, but not others\n'
+                "  matrices = [b'BHH', b'KHH']  # assumes True\n\n"
+
+                'If you the table is a geom/result table, see:\n'
+                '  model.set_additional_result_tables_to_read(methods_dict)\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method3, method4],\n"
+                "      b'GEOM4SX' : [method3, method4],\n"
+                "      b'OES1X1' : False,\n"
+                '  }\n\n'
+
+                'If you want to take control of the OP2 reader (mainly useful '
+                'for obscure tables), see:\n'
+                "  methods_dict = {\n"
+                "      b'OUGV1' : [method],\n"
+                '  }\n'
+                '  model.set_additional_generalized_tables_to_read(methods_dict)\n' % (
+                    table_name)
+            )
+            raise NotImplementedError(msg)
+
+    def _is_results_table(self, table_name: bytes) -> bool:
+        """is the table read by ``OP2Reader.read_results_table``?"""
+        return (table_name not in self.generalized_tables and
+                table_name not in self.op2_reader.mapped_tables and
+                table_name not in GEOM_TABLES and
+                table_name not in MATRIX_TABLES and
+                table_name in RESULT_TABLES)
+
     def set_additional_generalized_tables_to_read(self, tables):
         """
         Adds methods to call a generalized table.
@@ -0,0 +1,285 @@
+"""
+Defines the parallel OP2 reader (``read_op2(..., nworkers=4)``), which
+decodes the result tables of an OP2 with a pool of processes.
+
+The OP2 is indexed (see ``op2_index.py``) and the result subtables are
+split into contiguous chunks at subcase boundaries.  Each worker reads the
+non-result tables (e.g., R1TABRG changes the keys of the results) and its
+chunk of the result tables.  The parent reads the non-result tables and
+then merges the result objects from the workers in file order, so the
+model is the same as the serial reader.
+
+ - split_op2_index(op2_index, nworkers)
+ - read_op2_chunk(op2_filename, op2_index, mode, settings, mmap, single_pass)
+ - merge_op2_chunks(model, chunks)
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import List, Dict, Optional, Any
+
+from cpylog import SimpleLogger
+
+from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2_interface.op2_index import OP2Index
+
+#: the reader settings that are copied to the workers (e.g., set_subcases)
+SETTINGS = ['is_all_subcases', 'valid_subcases', 'expected_times', '_results']
+
+
+class ParallelReadError(RuntimeError):
+    """the result tables can't be read in parallel"""
+    pass
+
+
+class OP2Chunk:
+    """the results from a chunk of the result tables"""
+    def __init__(self, results: Dict[str, Dict[Any, Any]],
+                 isubcase_name_map: Dict[int, Any],
+                 subcases: Dict[int, Any]):
+        #: the result objects that were created by the result tables;
+        #: result_name -> {key : obj}
+        self.results = results
+
+        #: the subtitle/label/etc. of each subcase
+        self.isubcase_name_map = isubcase_name_map
+
+        #: the case control subcases, which store the requested results
+        self.subcases = subcases
+
+
+class _ChunkReader(OP2):
+    """an OP2 that tracks the results that are created by the result tables"""
+    def __init__(self, mode: Optional[str]=None):
+        log = SimpleLogger(level='error')
+        OP2.__init__(self, debug=False, log=log, mode=mode)
+        #: result_name -> list of keys in the order they were created
+        self.result_keys = defaultdict(list)
+
+    def _read_table(self, table_name: bytes) -> None:
+        """reads a table and stores the keys of the new results"""
+        if self.read_mode != 1 or not self._is_results_table(table_name):
+            OP2._read_table(self, table_name)
+            return
+
+        result_dicts = get_result_dicts(self)
+        nresults = {name: len(result) for name, result in result_dicts.items()}
+        OP2._read_table(self, table_name)
+        for name, result in result_dicts.items():
+            nresult = nresults[name]
+            if len(result) > nresult:
+                self.result_keys[name].extend(list(result)[nresult:])
+
+
+def get_result_dicts(model: Any) -> Dict[str, Dict[Any, Any]]:
+    """
+    Gets the result dictionaries (e.g., displacements, cquad4_stress)
+
+    Parameters
+    ----------
+    model : OP2
+        the model
+
+    Returns
+    -------
+    result_dicts : Dict[str, Dict[key, obj]]
+        result_name -> {key : obj}; includes the PSD results (e.g., psds.stress)
+
+    """
+    result_dicts = {}
+    for result_name in model.get_table_types():
+        result = model.get_result(result_name)
+        if isinstance(result, dict):
+            result_dicts[result_name] = result
+        elif result_name == 'psds':
+            for table in result._tables():
+                result_dicts[result_name + '.' + table] = getattr(result, table)
+    return result_dicts
+
+
+def split_op2_index(op2_index: OP2Index, nworkers: int) -> List[OP2Index]:
+    """
+    Splits the result subtables of an OP2 into chunks of similar size.
+    The chunks are split at subcase boundaries, so a result is normally
+    read by a single worker.  Every chunk has the non-result tables.
+
+    Parameters
+    ----------
+    op2_index : OP2Index
+        the table of contents
+    nworkers : int
+        the maximum number of chunks
+
+    Returns
+    -------
+    chunk_indexs : List[OP2Index]
+        the table of contents for each chunk
+
+    """
+    # a block is a run of subtables of a table with the same subcase
+    blocks = []  # type: List[List[Any]]  # [itable, subtables, nbytes]
+    for itable, table in enumerate(op2_index.tables):
+        subtables = table['subtables']
+        if not subtables:
+            continue
+        for subtable in subtables:
+            nbytes = subtable['next'][1] - subtable['offset']
+            if blocks and blocks[-1][0] == itable and (
+                    blocks[-1][1][-1]['isubcase'] == subtable['isubcase']):
+                blocks[-1][1].append(subtable)
+                blocks[-1][2] += nbytes
+            else:
+                blocks.append([itable, [subtable], nbytes])
+
+    nbytes_total = sum(block[2] for block in blocks)
+    nbytes_chunk = nbytes_total / max(nworkers, 1)
+    chunks = [[]]  # type: List[List[Any]]
+    nbytes = 0
+    for block in blocks:
+        if chunks[-1] and nbytes >= nbytes_chunk * len(chunks) and len(chunks) < nworkers:
+            chunks.append([])
+        chunks[-1].append(block)
+        nbytes += block[2]
+
+    chunk_indexs = []
+    for chunk in chunks:
+        subtables_map = defaultdict(list)
+        for itable, subtables, unused_nbytes in chunk:
+            subtables_map[itable].extend(subtables)
+
+        tables = []
+        for itable, table in enumerate(op2_index.tables):
+            if table['subtables'] is None:
+                tables.append(table)
+            elif itable in subtables_map:
+                table2 = dict(table)
+                table2['subtables'] = subtables_map[itable]
+                tables.append(table2)
+        chunk_indexs.append(OP2Index(op2_index.op2_filename, op2_index.nbytes,
+                                     op2_index.mtime, tables))
+    return chunk_indexs
+
+
+def read_op2_chunk(op2_filename: str, op2_index: OP2Index, mode: Optional[str],
+                   settings: Dict[str, Any], encoding: str,
+                   mmap: bool, single_pass: bool) -> OP2Chunk:
+    """
+    Reads a chunk of an OP2 (this runs in the worker process)
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 to read
+    op2_index : OP2Index
+        the tables/subtables of the chunk
+    mode : str
+        the version of the Nastran you're using
+    settings : Dict[str, Any]
+        the reader settings (e.g., is_all_subcases, valid_subcases)
+    encoding : str
+        the unicode encoding
+    mmap : bool
+        memory map the OP2
+    single_pass : bool
+        read the OP2 in a single pass
+
+    Returns
+    -------
+    chunk : OP2Chunk
+        the results of the chunk
+
+    """
+    model = _ChunkReader(mode=mode)
+    for key, value in settings.items():
+        setattr(model, key, value)
+    model.encoding = encoding
+    model.is_vectorized = True
+    model.read_mode = 1
+    model._close_op2 = False
+    if single_pass:
+        model._read_op2_single_pass(op2_filename, model.mode, op2_index)
+    else:
+        model._read_op2_two_pass(op2_filename, model.mode, False, mmap, op2_index)
+
+    result_dicts = get_result_dicts(model)
+    results = {}
+    for result_name, keys in model.result_keys.items():
+        result = result_dicts[result_name]
+        results[result_name] = {key: result[key] for key in keys}
+
+    subcases = model.case_control_deck.subcases
+    for subcase in subcases.values():
+        subcase.log = None
+    return OP2Chunk(results, model.isubcase_name_map, subcases)
+
+
+def merge_op2_chunks(model: Any, chunks: List[OP2Chunk]) -> None:
+    """
+    Merges the results from the workers into the model
+
+    Parameters
+    ----------
+    model : OP2
+        the model, which has read the non-result tables
+    chunks : List[OP2Chunk]
+        the results of each chunk in file order
+
+    """
+    result_dicts = get_result_dicts(model)
+    for chunk in chunks:
+        for result_name, results in chunk.results.items():
+            result_dicts[result_name].update(results)
+
+    # every worker read the non-result tables, so the first chunk that has
+    # a subcase found it first
+    isubcase_name_map = {}
+    for chunk in chunks:
+        for isubcase, name in chunk.isubcase_name_map.items():
+            if isubcase not in isubcase_name_map:
+                isubcase_name_map[isubcase] = name
+    for isubcase, name in model.isubcase_name_map.items():
+        if isubcase not in isubcase_name_map:
+            isubcase_name_map[isubcase] = name
+    model.isubcase_name_map = isubcase_name_map
+
+    # the result tables add the requested results to the subcases
+    model_subcases = model.case_control_deck.subcases
+    subcases = {}
+    for chunk in chunks:
+        for isubcase, subcase in chunk.subcases.items():
+            if isubcase not in subcases:
+                subcases[isubcase] = model_subcases.get(isubcase, subcase)
+                subcases[isubcase].log = model.log
+            if subcase is not subcases[isubcase]:
+                subcases[isubcase].params.update(subcase.params)
+    for isubcase, subcase in model_subcases.items():
+        if isubcase not in subcases:
+            subcases[isubcase] = subcase
+    model.case_control_deck.subcases = subcases
+
+
+def check_op2_chunks(chunks: List[OP2Chunk]) -> None:
+    """
+    Checks that a result wasn't split between the workers,
+    which happens when a table is repeated for the same subcase
+
+    Parameters
+    ----------
+    chunks : List[OP2Chunk]
+        the results of each chunk
+
+    """
+    keys = set()
+    for chunk in chunks:
+        for result_name, results in chunk.results.items():
+            for key in results:
+                result_key = (result_name, key)
+                if result_key in keys:
+                    msg = 'result=%r key=%s was read by multiple workers' % (result_name, key)
+                    raise ParallelReadError(msg)
+                keys.add(result_key)
+
+
+def get_settings(model: Any) -> Dict[str, Any]:
+    """gets the reader settings that are copied to the workers"""
+    return {key: getattr(model, key) for key in SETTINGS if hasattr(model, key)}
@@ -0,0 +1,290 @@
+"""
+Defines the SinglePassRecords, which lets the OP2 be traversed once
+(``read_op2(..., single_pass=True)``).
+
+In the two pass reader, read_mode=1 reads the table 3 headers and sizes each
+table 4 record (from the record length) and then read_mode=2 reads the
+headers again, allocates the arrays and fills them.  In the single pass
+reader, the headers are read once.  Each table 4 record is sized when it's
+found, so the data isn't parsed.  The record (the location of its blocks in
+the memory mapped OP2) and the table 3 parameters that are needed to fill it
+are stored.  Once every record has been sized, the arrays are built (once,
+with the same counters as the two pass reader) and the stored records are
+filled, so each record is parsed once.
+
+Sizing a record only depends on the table 3 parameters and the length of the
+record, so the records of a result object are sized from the first ones.
+The table 4 parser sizes the first records; once the parser has changed the
+result object the same way twice, the change is applied to the remaining
+records without calling the parser (see ``RecordSizer``).
+
+The other tables (e.g., HISADD) aren't stored.  They're sized and filled
+when they're found.
+
+ - SinglePassRecords()
+   - get_table3_attrs(op2)
+   - get_changed_table3_attrs(op2, attrs)
+   - add_record(attrs, table4_parser, data, ndata, blocks=None)
+   - get_sizer(table4_parser, attrs, ndata, record_len)
+ - RecordSizer()
+   - add_sizing(obj, n, transient_args, op2_attrs, obj_attrs)
+
+"""
+from typing import List, Tuple, Dict, Any, Callable, Optional, Union
+import numpy as np
+
+_MISSING = object()
+
+#: the attributes that are set by table 3 and are needed to fill a record
+#: in addition to the data_code parameters and the words
+TABLE3_ATTRS = [
+    'data_code', 'words', 'obj', 'table_name', 'isubtable', 'isubcase', 'num_wide',
+    'nonlinear_factor', '_data_factor', '_count', 'ogs', 'int3', 'date', 'title',
+    'subcase', 'subtable_name', '_analysis_code_fmt', 'format_code_original',
+    'is_table_1', 'is_table_2', 'result_type', 'etotal', 'element_id',
+    'reference_point',
+]
+
+#: the table 3 attributes that change for each record of a result object,
+#: so they're not used to find the RecordSizer
+_RECORD_ATTRS = {'nonlinear_factor', 'isubtable'}
+
+_SCALAR_TYPES = (int, float, str, bytes, type(None), np.generic)
+_INTEGER_TYPES = (int, np.integer)
+
+
+class DeferredRecord:
+    """a table 4 record that has been sized, but not filled"""
+    def __init__(self, changed: Dict[str, Any], deleted: List[str],
+                 table4_parser: Callable, data: Optional[Union[bytes, memoryview]],
+                 ndata: int, blocks: Optional[List[Tuple[int, int]]]=None):
+        #: the table 3 attributes that changed since the last record
+        self.changed = changed
+
+        #: the table 3 attributes that were deleted since the last record
+        self.deleted = deleted
+
+        self.table4_parser = table4_parser
+        self.data = data
+        self.ndata = ndata
+
+        #: the blocks of the record in the memory mapped OP2, so a record
+        #: that's split across blocks isn't stored as a copy
+        self.blocks = blocks
+
+
+class RecordSizer:
+    """
+    Sizes the table 4 records that have the same table 3 parameters and
+    length (e.g., the time steps of a displacement result).
+
+    The first records are sized by the table 4 parser.  The parser creates
+    the result object with ``create_transient_object`` and increases the
+    counters of the object (e.g., nelements).  Once the counters have been
+    increased by the same amount twice, the remaining records are sized by
+    calling ``create_transient_object`` and increasing the counters.
+    """
+    def __init__(self):
+        #: the number of bytes that the table 4 parser returns
+        self.n = None
+
+        #: the (result_name, storage_obj, class_obj, is_cid) that were
+        #: passed to create_transient_object
+        self.transient_args = None
+
+        #: the result object that the records are stored in
+        self.obj = None
+
+        #: the table 3 attributes that the table 4 parser sets on the OP2
+        #: (e.g., _data_factor)
+        self.op2_attrs = None
+
+        #: the amount that the table 4 parser increases each counter by;
+        #: None if the records have to be sized by the table 4 parser
+        self.counters = None
+
+        #: the counters from the last record that was sized by the parser
+        self._counters = None
+
+        #: the records can't be sized without the table 4 parser
+        #: (e.g., the parser doesn't create a result object)
+        self.is_sized_by_parser = False
+
+    def add_sizing(self, obj: Any, n: int,
+                   transient_args: List[Tuple[str, Dict[Any, Any], Any, bool]],
+                   op2_attrs: Dict[str, Any],
+                   obj_attrs: Optional[Dict[str, Any]]) -> None:
+        """
+        Stores how the table 4 parser sized a record
+
+        Parameters
+        ----------
+        obj : result object / None
+            the result object after the record was sized
+        n : int
+            the number of bytes that the table 4 parser returned
+        transient_args : List[(result_name, storage_obj, class_obj, is_cid)]
+            the arguments that were passed to create_transient_object
+        op2_attrs : Dict[str, Any]
+            the table 3 attributes that the table 4 parser changed
+        obj_attrs : Dict[str, Any] / None
+            the attributes of the result object before the record was sized;
+            None for the first record
+
+        """
+        if (obj is None or len(transient_args) != 1 or
+                (self.n is not None and (n != self.n or obj is not self.obj or
+                                         op2_attrs != self.op2_attrs))):
+            self.is_sized_by_parser = True
+            return
+
+        self.n = n
+        self.obj = obj
+        self.transient_args = transient_args[0]
+        self.op2_attrs = op2_attrs
+        if obj_attrs is None:
+            return
+
+        # the data_code parameters are set by create_transient_object
+        data_code = obj.data_code
+        counters = {}
+        for key, value in vars(obj).items():
+            value_old = obj_attrs.get(key, _MISSING)
+            if value_old is value or key in data_code or key == 'data_code':
+                continue
+            if (not isinstance(value, _INTEGER_TYPES) or isinstance(value, bool) or
+                    not isinstance(value_old, _INTEGER_TYPES) or isinstance(value_old, bool)):
+                self.is_sized_by_parser = True
+                return
+            if value != value_old:
+                counters[key] = value - value_old
+
+        if counters == self._counters:
+            self.counters = counters
+        self._counters = counters
+
+
+class SinglePassRecords:
+    """
+    Stores the records that have been sized by the single pass reader, so
+    they can be filled once every record has been sized
+    """
+    def __init__(self):
+        #: the records in file order
+        self.records = []  # type: List[DeferredRecord]
+
+        #: the table 3 attributes at the last record
+        self._attrs = {}  # type: Dict[str, Any]
+
+        #: the RecordSizer for each set of table 3 parameters
+        self.sizers = {}  # type: Dict[Tuple[Any, ...], RecordSizer]
+
+        #: the arguments of create_transient_object while a record is
+        #: sized by the table 4 parser
+        self.transient_args = None  # type: Optional[List[Tuple[Any, ...]]]
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get_table3_attrs(self, op2: Any) -> Dict[str, Any]:
+        """
+        Gets the table 3 attributes that are needed to fill a record
+
+        Parameters
+        ----------
+        op2 : OP2
+            the OP2 after table 3 has been read
+
+        Returns
+        -------
+        attrs : Dict[str, Any]
+            the table 3 attributes that are set
+
+        """
+        op2_attrs = vars(op2)
+        names = TABLE3_ATTRS + list(op2.data_code) + list(getattr(op2, 'words', []))
+        return {name: op2_attrs[name] for name in names if name in op2_attrs}
+
+    def get_changed_table3_attrs(self, op2: Any, attrs: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Gets the table 3 attributes (other than obj) that have changed
+
+        Parameters
+        ----------
+        op2 : OP2
+            the OP2
+        attrs : Dict[str, Any]
+            the table 3 attributes from ``get_table3_attrs``
+
+        Returns
+        -------
+        changed_attrs : Dict[str, Any]
+            the table 3 attributes that have been set since attrs
+
+        """
+        return {name: value for name, value in self.get_table3_attrs(op2).items()
+                if name != 'obj' and attrs.get(name, _MISSING) is not value}
+
+    def add_record(self, attrs: Dict[str, Any], table4_parser: Callable,
+                   data: Optional[Union[bytes, memoryview]], ndata: int,
+                   blocks: Optional[List[Tuple[int, int]]]=None) -> None:
+        """
+        Stores a table 4 record that has been sized
+
+        Parameters
+        ----------
+        attrs : Dict[str, Any]
+            the table 3 attributes of the OP2 (see ``get_table3_attrs``),
+            which are the state that's used to fill the record
+        table4_parser : function
+            the parser function for table 4
+        data : bytes / memoryview / None
+            the table 4 record (None if blocks is used)
+        ndata : int
+            the length of data
+        blocks : List[(i0, ndata)]; default=None
+            the blocks of the record in the memory mapped OP2
+
+        """
+        # only the changes are stored, so the table 3 attributes aren't
+        # copied for every record
+        attrs_old = self._attrs
+        changed = {key: value for key, value in attrs.items()
+                   if attrs_old.get(key, _MISSING) is not value}
+        deleted = [key for key in attrs_old if key not in attrs]
+        self.records.append(DeferredRecord(changed, deleted, table4_parser, data, ndata,
+                                           blocks=blocks))
+        self._attrs = attrs
+
+    def get_sizer(self, table4_parser: Callable, attrs: Dict[str, Any],
+                  ndata: int, record_len: int) -> RecordSizer:
+        """
+        Gets the RecordSizer for a record
+
+        Parameters
+        ----------
+        table4_parser : function
+            the parser function for table 4
+        attrs : Dict[str, Any]
+            the table 3 attributes of the OP2 (see ``get_table3_attrs``)
+        ndata : int
+            the length of the record
+        record_len : int
+            the length of the record block
+
+        Returns
+        -------
+        sizer : RecordSizer
+            sizes the records with the same table 3 parameters and length
+
+        """
+        # the time/mode/frequency changes for each record of a result
+        record_attrs = _RECORD_ATTRS.union(attrs['data_code'].get('data_names', []))
+        key = (table4_parser, ndata, record_len) + tuple(
+            (name, value) for name, value in sorted(attrs.items())
+            if name not in record_attrs and isinstance(value, _SCALAR_TYPES))
+        try:
+            sizer = self.sizers[key]
+        except KeyError:
+            sizer = self.sizers[key] = RecordSizer()
+        return sizer
@@ -13,10 +13,15 @@ def build_obj(obj):
 
 def apply_mag_phase(floats: Any, is_magnitude_phase: bool,
                     isave1: List[int], isave2: List[int]) -> Any:
-    """converts mag/phase data to real/imag"""
+    """
+    converts mag/phase data to real/imag
+
+    The conversion is done in double precision, so the results are
+    the same as the unvectorized path (see ``polar_to_real_imag``).
+    """
     if is_magnitude_phase:
-        mag = floats[:, isave1]
-        phase = floats[:, isave2]
+        mag = floats[:, isave1].astype('float64')
+        phase = floats[:, isave2].astype('float64')
         rtheta = np.radians(phase)
         real_imag = mag * (np.cos(rtheta) + 1.j * np.sin(rtheta))
     else:
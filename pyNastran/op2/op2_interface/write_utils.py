@@ -1,6 +1,7 @@
 """
 Defines methods for the op2 & hdf5 writer
 """
+from typing import Optional
 from struct import Struct, pack
 import numpy as np
 import scipy.sparse as sp
@@ -54,8 +55,198 @@ def write_table_header(op2_file, fascii, table_name):
     op2_file.write(st.pack(*table0))
     fascii.write('%s header0 = %s\n' % (table_name, table0))
 
-def export_to_hdf5(self, group, log):
-    """exports the object to HDF5 format"""
+#: the maximum number of words in a Fortran block of an OP2 record;
+#: longer records are split into multiple blocks, which the reader joins
+OP2_BLOCK_NWORDS = 2 ** 12
+
+
+def get_record_dtype(fields, endian) -> np.dtype:
+    """
+    Gets the structured dtype of a row of an OP2 record
+
+    Parameters
+    ----------
+    fields : List[Tuple[str, str]] / List[Tuple[str, str, int]]
+        the fields of the row (e.g., [('eid_device', 'i4'), ('data', 'f4', 6)])
+    endian : bytes / str
+        the byte order ('<' or '>')
+
+    Returns
+    -------
+    dtype : np.dtype
+        the dtype of the row
+
+    """
+    if isinstance(endian, bytes):
+        endian = endian.decode('latin1')
+    return np.dtype(fields).newbyteorder(endian)
+
+
+def write_record(op2_file, fascii, record, endian=b'<',
+                 nwords_block: Optional[int]=None) -> int:
+    """
+    Writes a data record (e.g., a table 4 record) as a series of Fortran
+    blocks without packing the record row by row::
+
+        [4, nwords, 4, 4*nwords] data [4*nwords]
+
+    Parameters
+    ----------
+    op2_file : file
+        the op2 file object
+    fascii : file
+        the ascii debug file object
+    record : np.ndarray / bytes
+        the record, which is a multiple of 4 bytes
+        (e.g., a structured array from ``get_record_dtype``)
+    endian : bytes / str; default=b'<'
+        the byte order of the markers
+    nwords_block : int; default=None -> OP2_BLOCK_NWORDS
+        the maximum number of words in a block
+
+    Returns
+    -------
+    nwords : int
+        the number of words in the record
+
+    """
+    if isinstance(endian, str):
+        endian = endian.encode('latin1')
+    if isinstance(record, np.ndarray):
+        record = np.ascontiguousarray(record).reshape(-1).view(np.uint8)
+    data = memoryview(record)
+    nbytes = data.nbytes
+    assert nbytes > 0 and nbytes % 4 == 0, nbytes
+
+    if nwords_block is None:
+        nwords_block = OP2_BLOCK_NWORDS
+    struct_4i = Struct(endian + b'4i')
+    struct_i = Struct(endian + b'i')
+    nbytes_block = 4 * nwords_block
+    for i0 in range(0, nbytes, nbytes_block):
+        block = data[i0:i0 + nbytes_block]
+        nbytesi = block.nbytes
+        op2_file.write(struct_4i.pack(4, nbytesi // 4, 4, nbytesi))
+        op2_file.write(block)
+        op2_file.write(struct_i.pack(nbytesi))
+        fascii.write('r4 [4, %i, 4]\n' % (nbytesi // 4))
+    return nbytes // 4
+
+
+def get_cbeam_station_index(eids: np.ndarray, nstations: int=11):
+    """
+    Gets the station of each row of a CBEAM result, which is written with
+    11 stations per element.  The first and last rows of an element are
+    stations 0 and 10, the intermediate rows follow station 0 and the
+    unused stations before station 10 are 0.
+
+    Parameters
+    ----------
+    eids : (nrows, ) int ndarray
+        the element id of each row
+    nstations : int; default=11
+        the number of stations per element
+
+    Returns
+    -------
+    istart / iend : (nelements, ) int ndarray
+        the first/last row of each element
+    imiddle : (nmiddle, ) int ndarray
+        the intermediate rows
+    imiddle_element / imiddle_station : (nmiddle, ) int ndarray
+        the element/station of the intermediate rows
+
+    """
+    istart = np.hstack([0, np.where(eids[1:] != eids[:-1])[0] + 1])
+    iend = np.hstack([istart[1:], len(eids)]) - 1
+    nrows = iend - istart + 1
+    assert nrows.min() >= 2 and nrows.max() <= nstations, 'nrows per element=%s' % nrows
+    is_middle = np.ones(len(eids), dtype='bool')
+    is_middle[istart] = False
+    is_middle[iend] = False
+    imiddle = np.where(is_middle)[0]
+    imiddle_element = np.searchsorted(iend, imiddle)
+    imiddle_station = imiddle - istart[imiddle_element]
+    return istart, iend, imiddle, imiddle_element, imiddle_station
+
+#: the approximate size of a chunk of an HDF5 result array (1 MB)
+HDF5_CHUNK_NBYTES = 1024 ** 2
+
+#: the arrays that are smaller than this aren't chunked/compressed (16 KB),
+#: which would make the file larger
+HDF5_MIN_CHUNK_NBYTES = 16 * 1024
+
+#: the supported HDF5 compression filters
+HDF5_COMPRESSION = [None, 'gzip', 'lzf', 'blosc']
+
+
+def get_hdf5_compression_kwargs(compression):
+    """
+    Gets the h5py create_dataset arguments for a compression filter
+
+    Parameters
+    ----------
+    compression : str; default=None
+        None : no compression
+        gzip : portable, slow
+        lzf : h5py only, fast
+        blosc : requires hdf5plugin, fast
+
+    Returns
+    -------
+    kwargs : dict
+        the compression/compression_opts/shuffle arguments
+
+    """
+    if compression is None:
+        return {}
+    elif compression == 'gzip':
+        return {'compression': 'gzip', 'compression_opts': 4, 'shuffle': True}
+    elif compression == 'lzf':
+        return {'compression': 'lzf', 'shuffle': True}
+    elif compression == 'blosc':
+        import hdf5plugin
+        return dict(hdf5plugin.Blosc(cname='lz4', clevel=5, shuffle=hdf5plugin.Blosc.SHUFFLE))
+    raise ValueError(f'compression={compression!r} is not in {HDF5_COMPRESSION}')
+
+
+def _get_dataset_kwargs(name, value, compression_kwargs):
+    """
+    Gets the chunking/compression of an HDF5 dataset.  The result arrays
+    are chunked by time/element, so a subset of the time steps/elements
+    can be read without reading the whole array.
+    """
+    if (not isinstance(value, np.ndarray) or value.dtype.kind in 'OSU' or
+            value.nbytes < HDF5_MIN_CHUNK_NBYTES):
+        return {}
+
+    kwargs = {}
+    if name == 'data' and value.ndim >= 2:
+        # data is [ntimes, nnodes/nelements, ...]
+        nbytes_row = value.itemsize * int(np.prod(value.shape[2:]))
+        nrows = max(1, min(value.shape[1], HDF5_CHUNK_NBYTES // nbytes_row))
+        kwargs['chunks'] = (1, nrows) + value.shape[2:]
+    elif not compression_kwargs or value.ndim == 0:
+        return kwargs
+    kwargs.update(compression_kwargs)
+    return kwargs
+
+
+def export_to_hdf5(self, group, log, compression=None):
+    """
+    exports the object to HDF5 format
+
+    Parameters
+    ----------
+    group : h5py.Group
+        the group to write to
+    log : Log()
+        a logging object
+    compression : str; default=None
+        the compression filter {None, gzip, lzf, blosc}
+
+    """
+    compression_kwargs = get_hdf5_compression_kwargs(compression)
     #headers = self.get_headers()
 
     # for some reason we can't just not write the properties...
@@ -79,9 +270,9 @@ def export_to_hdf5(self, group, log):
             #
             # https://stackoverflow.com/questions/43390038/storing-scipy-sparse-matrix-as-hdf5
             #g = group.create_group('Mcoo')
-            group.create_dataset('data', data=value.data)
-            group.create_dataset('row', data=value.row)
-            group.create_dataset('col', data=value.col)
+            for namei, valuei in [('data', value.data), ('row', value.row), ('col', value.col)]:
+                group.create_dataset(namei, data=valuei,
+                                     **_get_dataset_kwargs(namei, valuei, compression_kwargs))
             group.attrs['shape'] = value.shape
             continue
 
@@ -113,7 +304,8 @@ def export_to_hdf5(self, group, log):
             #msg = 'sub-object export_to_hdf5 not supported\nkey=%s value=%s' % (key, value)
             #raise NotImplementedError(msg)
         try:
-            group.create_dataset(name, data=value)
+            group.create_dataset(name, data=value,
+                                 **_get_dataset_kwargs(name, value, compression_kwargs))
         except TypeError:
             print('name = %r; type=%s' % (name, type(value)))
             print(value)
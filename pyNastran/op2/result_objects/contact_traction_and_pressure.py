@@ -396,21 +396,12 @@ class RealContactTractionAndPressureArray(ScalarObject):  # displacement style t
         self._nnodes = nnodes
         self.ntotal = ntotal
 
-        _times = np.zeros(ntimes, dtype=float_fmt)
+        self._times = np.zeros(ntimes, dtype=float_fmt)
         int_fmt = 'int32' if self.size == 4 else 'int64'
-        node_gridtype = np.zeros((nnodes, 2), dtype=int_fmt)
+        self.node_gridtype = self._build_array('node_gridtype', (nnodes, 2), dtype=int_fmt)
 
         #[pressure, s1, s2, s3]
-        data = np.zeros((nx, ny, 4), self.data_type())
-        if self.load_as_h5:
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.node_gridtype = group.create_dataset('node_gridtype', data=node_gridtype)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.node_gridtype = node_gridtype
-            self.data = data
+        self.data = self._build_array('data', (nx, ny, 4), self.data_type())
         #print('ntimes=%s nnodes=%s; nx=%s ny=%s; ntotal=%s' % (
             #ntimes, nnodes, nx, ny, self.ntotal))
 
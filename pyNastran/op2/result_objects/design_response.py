@@ -805,6 +805,21 @@ class Convergence:
             self.row_constraint_max = np.zeros(self.n, dtype='int32')
             self.desvar_values = np.zeros((self.n, self.ndesign_variables), dtype='float32')
             self.is_built = True
+        elif self._n == len(self.design_iter):
+            # the single pass reader fills each HISADD table once it's
+            # sized, so the arrays grow as the design cycles are found
+            nadd = self.n - self._n
+            self.design_iter = np.hstack([self.design_iter, np.zeros(nadd, dtype='int32')])
+            self.iconvergence = np.hstack([self.iconvergence, np.zeros(nadd, dtype=object)])
+            self.conv_result = np.hstack([self.conv_result, np.zeros(nadd, dtype=object)])
+            self.obj_initial = np.hstack([self.obj_initial, np.zeros(nadd, dtype='float32')])
+            self.obj_final = np.hstack([self.obj_final, np.zeros(nadd, dtype='float32')])
+            self.constraint_max = np.hstack([self.constraint_max, np.zeros(nadd, dtype='float32')])
+            self.row_constraint_max = np.hstack([self.row_constraint_max,
+                                                 np.zeros(nadd, dtype='int32')])
+            self.desvar_values = np.vstack([
+                self.desvar_values,
+                np.zeros((nadd, self.ndesign_variables), dtype='float32')])
 
         n = self._n
         self.design_iter[n] = design_iter
@@ -173,11 +173,11 @@ class ElementTableArray(BaseElement):  # displacement style table
         self._times = zeros(ntimes, dtype=self._times_dtype)
         #self.types = array(self.nelements, dtype='|S1')
 
-        self.element = zeros(nelements, dtype='int32')
+        self.element = self._build_array('element', nelements, dtype='int32')
         self.element_data_type = empty(nelements, dtype='|U8')
 
         #[t1, t2, t3, r1, r2, r3]
-        self.data = zeros((nx, ny, 6), self.data_type())
+        self.data = self._build_array('data', (nx, ny, 6), self.data_type())
 
     def add_sort1(self, dt, eid, etype, v1, v2, v3, v4, v5, v6):
         """unvectorized method for adding SORT1 transient data"""
@@ -252,7 +252,7 @@ class RealElementTableArray(ElementTableArray):  # displacement style table
         #words += self.getTableMarker()
         f.write(''.join(header + words))
 
-        element = self.element
+        element = self.element[:]
         element_type = self.element_data_type
         t1 = self.data[0, :, 0]
         t2 = self.data[0, :, 1]
@@ -269,7 +269,7 @@ class RealElementTableArray(ElementTableArray):  # displacement style table
         return page_num
 
     def _write_sort1_as_sort2(self, f06_file, page_num, page_stamp, header, words):
-        element = self.element
+        element = self.element[:]
         element_type = self.element_data_type
         times = self._times
 
@@ -295,7 +295,7 @@ class RealElementTableArray(ElementTableArray):  # displacement style table
         return page_num
 
     def _write_sort1_as_sort1(self, f06_file, page_num, page_stamp, header, words):
-        element = self.element
+        element = self.element[:]
         element_type = self.element_data_type
         times = self._times
 
@@ -324,7 +324,7 @@ class RealElementTableArray(ElementTableArray):  # displacement style table
         return page_num
 
     def _write_sort2_as_sort2(self, f06_file, page_num, page_stamp, header, words):
-        element = self.element
+        element = self.element[:]
         element_type = self.element_data_type
         times = self._times
         for ieid, (element_id, etypei) in enumerate(zip(element, element_type)):
@@ -368,7 +368,7 @@ class RealElementTableArray(ElementTableArray):  # displacement style table
         element_ids = asarray(element_ids, dtype='int32')
         i = index - 1
         assert index in [1, 2, 3, 4, 5, 6], index
-        eids = self.element
+        eids = self.element[:]
         ieids = searchsorted(eids, element_ids)
         assert all(eids[ieids] == element_ids), 'nids=%s expected=%s; all=%s'  % (eids[ieids], element_ids, eids)
         return self.data[:, ieids, i]
@@ -102,9 +102,9 @@ class GridPointWeight:
         self.approach_code = approach_code
         self.table_code = table_code
 
-    def export_to_hdf5(self, group, log) -> None:
+    def export_to_hdf5(self, group, log, compression=None) -> None:
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, compression=compression)
 
     def object_attributes(self, mode='public', keys_to_skip=None,
                           filter_properties=False):
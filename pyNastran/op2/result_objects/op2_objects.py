@@ -98,9 +98,9 @@ class BaseScalarObject(Op2Codes):
         """creates a pandas dataframe"""
         print('build_dataframe is not implemented in %s' % self.__class__.__name__)
 
-    def export_to_hdf5(self, group, log) -> None:
+    def export_to_hdf5(self, group, log, compression=None) -> None:
         """exports the object to HDF5 format"""
-        export_to_hdf5(self, group, log)
+        export_to_hdf5(self, group, log, compression=compression)
 
     def write_f06(self, f06_file, header=None, page_stamp='PAGE %s',
                   page_num=1, is_mag_phase=False, is_sort1=True) -> int:
@@ -173,8 +173,10 @@ class ScalarObject(BaseScalarObject):
         # length of each time step
         self._ntotals = []
 
-        self.load_as_h5 = False
-        self.h5_file = None
+        # the stress/strain classes call __init__ twice, so the h5_file
+        # from the first call (which removes it from data_code) is kept
+        self.load_as_h5 = getattr(self, 'load_as_h5', False)
+        self.h5_file = getattr(self, 'h5_file', None)
         if 'load_as_h5' in data_code:
             self.load_as_h5 = data_code['load_as_h5']
             del data_code['load_as_h5']
@@ -271,9 +273,76 @@ class ScalarObject(BaseScalarObject):
             subcase_group = self.h5_file[case_name]
         else:
             subcase_group = self.h5_file.create_group(case_name)
-        group = subcase_group.create_group(self.result_name)
+        group = subcase_group.require_group(self.result_name)
         return group
 
+    def _build_array(self, name: str, shape, dtype='float64'):
+        """
+        Allocates a result array (e.g., data, element_node).  When the OP2
+        is loaded with ``load_as_h5=True``, the array is an HDF5 dataset, so
+        the parser writes the results to the file instead of RAM.
+
+        Parameters
+        ----------
+        name : str
+            the name of the array (e.g., 'data')
+        shape : int / Tuple[int, ...]
+            the shape of the array
+        dtype : str / np.dtype; default='float64'
+            the type of the array
+
+        Returns
+        -------
+        array : np.ndarray / h5py.Dataset
+            a zeroed array
+
+        """
+        if not self.load_as_h5 or self.h5_file is None:
+            return np.zeros(shape, dtype=dtype)
+        group = self._get_result_group()
+        if name in group:
+            del group[name]
+        return group.create_dataset(name, shape=shape, dtype=dtype)
+
+    def _take_array(self, name: str, i: np.ndarray, axis: int=0):
+        """
+        Slices a result array (e.g., removes the unused CBEAM stations).
+        An HDF5 dataset is copied one time step at a time, so it stays
+        out-of-core.
+
+        Parameters
+        ----------
+        name : str
+            the name of the array (e.g., 'data')
+        i : (n, ) int ndarray
+            the sorted, unique indices to keep
+        axis : int; default=0
+            the axis to slice (0 or 1)
+
+        Returns
+        -------
+        array : np.ndarray / h5py.Dataset
+            the sliced array
+
+        """
+        array = getattr(self, name)
+        if isinstance(array, np.ndarray):
+            return array.take(i, axis=axis)
+
+        group = self._get_result_group()
+        shape = list(array.shape)
+        shape[axis] = len(i)
+        array2 = group.create_dataset(name + '_take', shape=tuple(shape), dtype=array.dtype)
+        if axis == 0:
+            array2[...] = array[:][i]
+        else:
+            assert axis == 1, axis
+            for itime in range(shape[0]):
+                array2[itime] = array[itime][i]
+        del group[name]
+        group.move(name + '_take', name)
+        return group[name]
+
     def _get_code(self) -> Tuple[int, int, int, int, int, str, str]:
         code = self.isubcase
         ogs = 0
@@ -296,7 +365,10 @@ class ScalarObject(BaseScalarObject):
         try:
             sort_method, unused_is_real, unused_is_random = self._table_specs()
         except:
-            sort_method = get_sort_method_from_table_name(self.table_name)
+            table_name = self.table_name
+            if isinstance(table_name, str):
+                table_name = table_name.encode('latin1')
+            sort_method = get_sort_method_from_table_name(table_name)
         #is_sort1 = self.table_name.endswith('1')
         #is_sort1 = self.is_sort1  # uses the sort_bits
         assert sort_method in [1, 2], 'sort_method=%r\n%s' % (sort_method, self.code_information())
@@ -821,7 +893,7 @@ def _check_element(table1: BaseElement, table2: BaseElement, log: SimpleLogger):
         print(msg)
         raise ValueError(msg)
 
-    element = table1.element
+    element = np.asarray(table1.element)
     eid_min = element.min()
     nshape = len(element.shape)
     if eid_min <= 0:
@@ -862,6 +934,6 @@ def _check_element_node(table1: BaseElement, table2: BaseElement, log: SimpleLog
         print(msg)
         raise ValueError(msg)
 
-    eids = table1.element_node[:, 0]
+    eids = np.asarray(table1.element_node)[:, 0]
     if eids.min() <= 0:
         log.error(f'{table1}\neids={eids}.min = {eids.min()}')
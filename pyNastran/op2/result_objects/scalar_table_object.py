@@ -3,7 +3,7 @@ defines:
  - ScalarTableObject
 
 """
-from struct import Struct, pack
+from struct import pack
 import warnings
 from typing import List
 
@@ -14,7 +14,8 @@ from numpy import allclose, asarray, vstack
 from pyNastran.op2.result_objects.op2_objects import ScalarObject
 from pyNastran.op2.result_objects.table_object import append_sort1_sort2
 from pyNastran.f06.f06_formatting import write_floats_13e, write_float_12e
-from pyNastran.op2.op2_interface.write_utils import set_table3_field
+from pyNastran.op2.op2_interface.write_utils import (
+    set_table3_field, get_record_dtype, write_record)
 
 float_types = (float, np.float32)
 integer_types = (int, np.int32)
@@ -199,21 +200,12 @@ class ScalarTableArray(ScalarObject):  # displacement style table
         self._nnodes = nnodes
         self.ntotal = ntotal
 
-        _times = zeros(ntimes, dtype=float_fmt)
+        self._times = zeros(ntimes, dtype=float_fmt)
         #self.types = array(self.nelements, dtype='|S1')
-        node_gridtype = zeros((nnodes, 2), dtype='int32')
+        self.node_gridtype = self._build_array('node_gridtype', (nnodes, 2), dtype='int32')
 
         #[t1]
-        data = zeros((nx, ny, 1), self.data_type())
-        if self.load_as_h5:
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.node_gridtype = group.create_dataset('node_gridtype', data=node_gridtype)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.node_gridtype = node_gridtype
-            self.data = data
+        self.data = self._build_array('data', (nx, ny, 1), self.data_type())
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -505,20 +497,15 @@ class RealScalarTableArray(ScalarTableArray):  # temperature style table
             self._write_table_header(op2_file, fascii, date)
             itable = -3
 
-        if self.is_sort1:
-            s = Struct(endian + b'2i6f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
-        unused_node = self.node_gridtype[:, 0]
+        node = self.node_gridtype[:, 0]
         gridtype = self.node_gridtype[:, 1]
-        #format_table4_1 = Struct(self._endian + b'15i')
-        #format_table4_2 = Struct(self._endian + b'3i')
 
         # table 4 info
         #ntimes = self.data.shape[0]
         nnodes = self.data.shape[1]
-        nnodes_device = self.node_gridtype[:, 0] * 10 + self.device_code
 
         #(2+6) => (node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i)
         ntotal = nnodes * (2 + 6)
@@ -530,8 +517,11 @@ class RealScalarTableArray(ScalarTableArray):  # temperature style table
         unused_device_code = self.device_code
         fascii.write('  ntimes = %s\n' % self.ntimes)
 
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
+        dtype = get_record_dtype([('node_device', 'i4'), ('gridtype', 'i4'),
+                                  ('data', 'f4', 6)], endian)
+        record = np.zeros(nnodes, dtype=dtype)
+        record['node_device'] = node * 10 + self.device_code
+        record['gridtype'] = gridtype
         for itime in range(self.ntimes):
             self._write_table_3(op2_file, fascii, new_result, itable, itime)
 
@@ -539,24 +529,16 @@ class RealScalarTableArray(ScalarTableArray):  # temperature style table
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4*ntotal]
+                      4, 0, 4]
             op2_file.write(pack(b'%ii' % len(header), *header))
             fascii.write('r4 [4, 0, 4]\n')
             fascii.write('r4 [4, %s, 4]\n' % (itable))
-            fascii.write('r4 [4, %i, 4]\n' % (4*ntotal))
 
-            t1 = self.data[itime, :, 0]
-            for node_id, gridtypei, t1i in zip(nnodes_device, gridtype, t1):
-                data = [node_id, gridtypei, t1i, 0., 0., 0., 0., 0.]
-                fascii.write('  nid, grid_type, dx, dy, dz, rx, ry, rz = %s\n' % data)
-                op2_file.write(s.pack(*data))
+            # [t1, 0., 0., 0., 0., 0.]
+            record['data'][:, 0] = self.data[itime, :, 0]
+            write_record(op2_file, fascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack(b'i', *header))
-            fascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -23,7 +23,7 @@ these are used by:
 
 """
 import copy
-from struct import Struct, pack
+from struct import pack
 import warnings
 from typing import List
 
@@ -33,7 +33,8 @@ import numpy as np
 from pyNastran.op2.result_objects.op2_objects import ScalarObject
 from pyNastran.f06.f06_formatting import write_floats_13e, write_imag_floats_13e, write_float_12e
 from pyNastran.op2.errors import SixtyFourBitError
-from pyNastran.op2.op2_interface.write_utils import set_table3_field
+from pyNastran.op2.op2_interface.write_utils import (
+    set_table3_field, get_record_dtype, write_record)
 
 float_types = (float, np.float32)
 integer_types = (int, np.int32)
@@ -401,21 +402,12 @@ class TableArray(ScalarObject):  # displacement style table
         self._nnodes = nnodes
         self.ntotal = ntotal
 
-        _times = np.zeros(ntimes, dtype=float_fmt)
+        self._times = np.zeros(ntimes, dtype=float_fmt)
         int_fmt = 'int32' if self.size == 4 else 'int64'
-        node_gridtype = np.zeros((nnodes, 2), dtype=int_fmt)
+        self.node_gridtype = self._build_array('node_gridtype', (nnodes, 2), dtype=int_fmt)
 
         #[t1, t2, t3, r1, r2, r3]
-        data = np.zeros((nx, ny, 6), self.data_type())
-        if self.load_as_h5:
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.node_gridtype = group.create_dataset('node_gridtype', data=node_gridtype)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.node_gridtype = node_gridtype
-            self.data = data
+        self.data = self._build_array('data', (nx, ny, 6), self.data_type())
         #print('ntimes=%s nnodes=%s; nx=%s ny=%s; ntotal=%s' % (
             #ntimes, nnodes, nx, ny, self.ntotal))
 
@@ -1048,11 +1040,8 @@ class RealTableArray(TableArray):
             itable = -3
 
         #print('nonlinear_factor =', self.nonlinear_factor)
-        if self.is_sort1:
-            op2_format = endian + b'2i6f'
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
-        s = Struct(op2_format)
 
         node = self.node_gridtype[:, 0]
         gridtype = self.node_gridtype[:, 1]
@@ -1060,13 +1049,9 @@ class RealTableArray(TableArray):
         if max_id > 99999999:
             raise SixtyFourBitError(f'64-bit OP2 writing is not supported; max id={max_id}')
 
-        #format_table4_1 = Struct(self._endian + b'15i')
-        #format_table4_2 = Struct(self._endian + b'3i')
-
         # table 4 info
         #ntimes = self.data.shape[0]
         nnodes = self.data.shape[1]
-        nnodes_device = self.node_gridtype[:, 0] * 10 + self.device_code
 
         #(2+6) => (node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i)
         ntotal = nnodes * (2 + 6)
@@ -1078,8 +1063,11 @@ class RealTableArray(TableArray):
         unused_device_code = self.device_code
         fascii.write('  ntimes = %s\n' % self.ntimes)
 
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
+        dtype = get_record_dtype([('node_device', 'i4'), ('gridtype', 'i4'),
+                                  ('data', 'f4', 6)], endian)
+        record = np.empty(nnodes, dtype=dtype)
+        record['node_device'] = node * 10 + self.device_code
+        record['gridtype'] = gridtype
         for itime in range(self.ntimes):
             self._write_table_3(op2_file, fascii, new_result, itable, itime)
 
@@ -1087,30 +1075,16 @@ class RealTableArray(TableArray):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4*ntotal]
+                      4, 0, 4]
             op2_file.write(pack(b'%ii' % len(header), *header))
             fascii.write('r4 [4, 0, 4]\n')
             fascii.write('r4 [4, %s, 4]\n' % (itable))
-            fascii.write('r4 [4, %i, 4]\n' % (4*ntotal))
-
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
 
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nnodes_device, gridtype, t1, t2, t3, r1, r2, r3):
-                data = [node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i]
-                fascii.write('  nid, grid_type, dx, dy, dz, rx, ry, rz = %s\n' % data)
-                op2_file.write(s.pack(*data))
+            # [t1, t2, t3, r1, r2, r3]
+            record['data'] = self.data[itime, :, :]
+            write_record(op2_file, fascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack(b'i', *header))
-            fascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -1573,11 +1547,8 @@ class ComplexTableArray(TableArray):
             itable = -3
 
         #print('nonlinear_factor =', self.nonlinear_factor)
-        if self.is_sort1:
-            op2_format = endian + b'2i 12f'
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
-        s = Struct(op2_format)
 
         node = self.node_gridtype[:, 0]
         max_id = node.max()
@@ -1585,13 +1556,10 @@ class ComplexTableArray(TableArray):
             raise SixtyFourBitError(f'64-bit OP2 writing is not supported; max id={max_id}')
 
         gridtype = self.node_gridtype[:, 1]
-        #format_table4_1 = Struct(self._endian + b'15i')
-        #format_table4_2 = Struct(self._endian + b'3i')
 
         # table 4 info
         #ntimes = self.data.shape[0]
         nnodes = self.data.shape[1]
-        nnodes_device = self.node_gridtype[:, 0] * 10 + self.device_code
 
         #(2+6) => (node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i)
         ntotal = nnodes * (2 + 12)
@@ -1603,8 +1571,11 @@ class ComplexTableArray(TableArray):
         unused_device_code = self.device_code
         fascii.write('  ntimes = %s\n' % self.ntimes)
 
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
+        dtype = get_record_dtype([('node_device', 'i4'), ('gridtype', 'i4'),
+                                  ('real', 'f4', 6), ('imag', 'f4', 6)], endian)
+        record = np.empty(nnodes, dtype=dtype)
+        record['node_device'] = node * 10 + self.device_code
+        record['gridtype'] = gridtype
         for itime in range(self.ntimes):
             self._write_table_3(op2_file, fascii, new_result, itable, itime)
 
@@ -1612,40 +1583,19 @@ class ComplexTableArray(TableArray):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4*ntotal]
+                      4, 0, 4]
             op2_file.write(pack(b'%ii' % len(header), *header))
             fascii.write('r4 [4, 0, 4]\n')
             fascii.write('r4 [4, %s, 4]\n' % (itable))
-            fascii.write('r4 [4, %i, 4]\n' % (4*ntotal))
-
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
 
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nnodes_device, gridtype, t1, t2, t3, r1, r2, r3):
-                data = [node_id, gridtypei,
-                        t1i.real, t2i.real, t3i.real, r1i.real, r2i.real, r3i.real,
-                        t1i.imag, t2i.imag, t3i.imag, r1i.imag, r2i.imag, r3i.imag]
-                fascii.write('  nid, grid_type, dx, dy, dz, rx, ry, rz = %s\n' % data)
-                op2_file.write(s.pack(*data))
+            # [t1, t2, t3, r1, r2, r3] real/imag
+            data = self.data[itime, :, :]
+            record['real'] = data.real
+            record['imag'] = data.imag
+            write_record(op2_file, fascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2_file.write(pack(b'i', *header))
-            fascii.write('footer = %s\n' % header)
             new_result = False
-            #header = [
-                #4, itable, 4,
-                #4, 1, 4,
-                #4, 0, 4,
-            #]
-            #op2_file.write(pack(b'%ii' % len(header), *header))
-            #fascii.write('footer2 = %s\n' % header)
         return itable
 
     #def write_sort2_as_sort2(self, f06_file, page_num, page_stamp, header, words, is_mag_phase):
@@ -99,15 +99,15 @@ class RealStrainEnergyArray(BaseElement):
         #if dtype in 'DMIG':
         #print(self.element_name, self.element_type)
         if self.element_name == 'DMIG':
-            self.element = np.zeros((self.ntimes, self.nelements), dtype='|U8')
+            self.element = self._build_array('element', (self.ntimes, self.nelements), dtype='|U8')
         else:
-            self.element = np.zeros((self.ntimes, self.nelements), dtype=idtype)
+            self.element = self._build_array('element', (self.ntimes, self.nelements), dtype=idtype)
         #self.element_data_type = empty(self.nelements, dtype='|U8')
 
         #[energy, percent, density]
         assert isinstance(self.ntimes, integer_types), self.ntimes
         assert isinstance(self.ntotal, integer_types), self.ntotal
-        self.data = np.zeros((self.ntimes, self.nelements, 3), dtype=fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 3), dtype=fdtype)
 
     def build_dataframe(self):
         """
@@ -819,13 +819,13 @@ class ComplexStrainEnergyArray(BaseElement):
         """actually performs the build step"""
         self._times = np.zeros(self.ntimes, dtype=dtype)
         #self.element = np.zeros(self.nelements, dtype='int32')
-        self.element = np.zeros((self.ntimes, self.nelements), dtype='int32')
+        self.element = self._build_array('element', (self.ntimes, self.nelements), dtype='int32')
         #self.element_data_type = empty(self.nelements, dtype='|U8')
 
         #[energy, percent, density]
         assert isinstance(self.ntimes, integer_types), self.ntimes
         assert isinstance(self.ntotal, integer_types), self.ntotal
-        self.data = np.zeros((self.ntimes, self.nelements, 4), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 4), dtype='float32')
 
     #def build_dataframe(self):
         #"""
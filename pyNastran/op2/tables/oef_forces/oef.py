@@ -1769,7 +1769,8 @@ class OEF(OP2Common):
                 isave2 = slice(8, None)
                 real_imag = apply_mag_phase(floats2, is_magnitude_phase, isave1, isave2)
 
-                sd = floats2[:, 0]
+                # data may be an h5py.Dataset, which doesn't cast real to complex
+                sd = floats2[:, 0].astype(real_imag.dtype)
                 obj.data[obj.itime, itotal:itotal2, 0] = sd
                 obj.data[obj.itime, itotal:itotal2, 1:] = real_imag
 
@@ -8,6 +8,8 @@ from numpy import zeros, searchsorted, allclose
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import BaseElement, get_complex_times_dtype
 from pyNastran.op2.tables.oef_forces.oef_force_objects import ForceObject
+from pyNastran.op2.op2_interface.write_utils import (
+    get_record_dtype, write_record, get_cbeam_station_index)
 from pyNastran.f06.f06_formatting import write_imag_floats_13e, write_float_12e # get_key0,
 from pyNastran.f06.f06_formatting import _eigenvalue_header
 
@@ -72,10 +74,10 @@ class ComplexRodForceArray(ComplexForceObject):
         dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
 
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype=idtype)
+        self.element = self._build_array('element', self.nelements, dtype=idtype)
 
         #[axial_force, torque]
-        self.data = zeros((self.ntimes, self.ntotal, 2), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 2), dtype=cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -207,7 +209,7 @@ class ComplexRodForceArray(ComplexForceObject):
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         #is_odd = False
         #nwrite = len(eids)
         #if len(eids) % 2 == 1:
@@ -240,7 +242,7 @@ class ComplexRodForceArray(ComplexForceObject):
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -259,21 +261,20 @@ class ComplexRodForceArray(ComplexForceObject):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i4f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
 
+        # [eid_device, axial_real, torsion_real, axial_imag, torsion_imag]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('real', 'f4', 2), ('imag', 'f4', 2)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -281,26 +282,17 @@ class ComplexRodForceArray(ComplexForceObject):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            axial = self.data[itime, :, 0]
-            torsion = self.data[itime, :, 1]
 
-            for eid_device, axiali, torsioni in zip(eids_device, axial, torsion):
-                data = [eid_device, axiali.real, torsioni.real, axiali.imag, torsioni.imag]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, tuple(data)))
-                op2.write(struct1.pack(*data))
+            datai = self.data[itime, :, :]
+            record['real'] = datai.real
+            record['imag'] = datai.imag
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -368,12 +360,12 @@ class ComplexCShearForceArray(BaseElement):
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype=idtype)
+        self.element = self._build_array('element', self.nelements, dtype=idtype)
 
         #[force41, force14, force21, force12, force32, force23, force43, force34,
         #kick_force1, kick_force2, kick_force3, kick_force4,
         #shear12, shear23, shear34, shear41]
-        self.data = zeros((self.ntimes, self.ntotal, 16), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 16), dtype=cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -519,7 +511,7 @@ class ComplexCShearForceArray(BaseElement):
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -636,10 +628,10 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype=idtype)
+        self.element = self._build_array('element', self.nelements, dtype=idtype)
 
         #[axial_force, torque]
-        self.data = zeros((self.ntimes, self.ntotal, 1), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 1), dtype=cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -783,7 +775,7 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         #is_odd = False
         #nwrite = len(eids)
         #if len(eids) % 2 == 1:
@@ -814,7 +806,7 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -833,26 +825,26 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i2f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
+
+        # [eid_device, force_real, force_imag]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('real', 'f4'), ('imag', 'f4')], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -860,25 +852,17 @@ class ComplexSpringDamperForceArray(ComplexForceObject):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
             force = self.data[itime, :, 0]
-
-            for eid, forcei in zip(eids_device, force):
-                data = [eid, forcei.real, forcei.imag]
-                op2_ascii.write('  eid=%s force=%s\n' % (eid, forcei))
-                op2.write(struct1.pack(*data))
+            record['real'] = force.real
+            record['imag'] = force.imag
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -948,10 +932,10 @@ class ComplexViscForceArray(BaseElement):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         #[axial_force, torque]
-        self.data = zeros((self.ntimes, self.ntotal, 2), dtype='complex64')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 2), dtype='complex64')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -1089,7 +1073,7 @@ class ComplexViscForceArray(BaseElement):
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         #is_odd = False
         #nwrite = len(eids)
         #if len(eids) % 2 == 1:
@@ -1157,10 +1141,10 @@ class ComplexPlateForceArray(ComplexForceObject):
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype=idtype)
+        self.element = self._build_array('element', self.nelements, dtype=idtype)
 
         #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), dtype=cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -1328,7 +1312,7 @@ class ComplexPlateForceArray(ComplexForceObject):
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -1368,7 +1352,7 @@ class ComplexPlateForceArray(ComplexForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -1384,7 +1368,7 @@ class ComplexPlateForceArray(ComplexForceObject):
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        eids = self.element
+        eids = self.element[:]
         eids_device = eids * 10 + self.device_code
 
         # table 4 info
@@ -1395,9 +1379,6 @@ class ComplexPlateForceArray(ComplexForceObject):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
@@ -1407,48 +1388,33 @@ class ComplexPlateForceArray(ComplexForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 16f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
+
+        # [eid_device, (mx, my, mxy, bmx, bmy, bmxy, tx, ty)_real, (...)_imag]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('real', 'f4', 8), ('imag', 'f4', 8)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            mx = self.data[itime, :, 0]
-            my = self.data[itime, :, 1]
-            mxy = self.data[itime, :, 2]
-            bmx = self.data[itime, :, 3]
-            bmy = self.data[itime, :, 4]
-            bmxy = self.data[itime, :, 5]
-            tx = self.data[itime, :, 6]
-            ty = self.data[itime, :, 7]
 
-            for eid_device, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(eids_device, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                data = [eid_device,
-                        mxi.real, myi.real, mxyi.real, bmxi.real, bmyi.real, bmxyi.real, txi.real, tyi.real,
-                        mxi.imag, myi.imag, mxyi.imag, bmxi.imag, bmyi.imag, bmxyi.imag, txi.imag, tyi.imag]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                op2.write(struct1.pack(*data))
+            datai = self.data[itime, :, :]
+            record['real'] = datai.real
+            record['imag'] = datai.imag
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -1495,11 +1461,11 @@ class ComplexPlate2ForceArray(ComplexForceObject):
         dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype=dtype)
 
-        self.element = zeros(self.nelements, dtype=idtype)
-        self.element_node = zeros((self.ntotal, 2), dtype=idtype)
+        self.element = self._build_array('element', self.nelements, dtype=idtype)
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype=idtype)
 
         #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), dtype=cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -1699,7 +1665,7 @@ class ComplexPlate2ForceArray(ComplexForceObject):
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -1739,7 +1705,7 @@ class ComplexPlate2ForceArray(ComplexForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -1756,7 +1722,7 @@ class ComplexPlate2ForceArray(ComplexForceObject):
         #s = Struct(op2_format)
 
         #eids = self.element
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
         eids = self.element_node[:, 0]
         nids = self.element_node[:, 1]
 
@@ -1785,61 +1751,42 @@ class ComplexPlate2ForceArray(ComplexForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 4s i 16f')
-            struct2 = Struct(endian + b'i 16f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
+
+        # [eid_device, 'CEN/',
+        #  (nid, (mx, my, mxy, bmx, bmy, bmxy, tx, ty)_real, (...)_imag) * nnodes_all]
+        # where the nid of the center is 0
+        dtype = get_record_dtype([
+            ('eid_device', 'i4'), ('cen', 'S4'),
+            ('nodes', [('nid', 'i4'), ('real', 'f4', 8), ('imag', 'f4', 8)], nnodes_all)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
+        record['cen'] = b'CEN/'
+        assert len(eids) == nelements * nnodes_all, 'nrows=%s nelements=%s' % (len(eids), nelements)
+        assert (nids[::nnodes_all] == 0).all(), nids
+        record['nodes']['nid'] = nids.reshape(nelements, nnodes_all)
+        assert record.nbytes == 4 * ntotal, 'ntotal=%s nwide=%s' % (ntotal, record.nbytes // 4)
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            mx = self.data[itime, :, 0]
-            my = self.data[itime, :, 1]
-            mxy = self.data[itime, :, 2]
-            bmx = self.data[itime, :, 3]
-            bmy = self.data[itime, :, 4]
-            bmxy = self.data[itime, :, 5]
-            tx = self.data[itime, :, 6]
-            ty = self.data[itime, :, 7]
+            datai = self.data[itime, :, :].reshape(nelements, nnodes_all, 8)
+            record['nodes']['real'] = datai.real
+            record['nodes']['imag'] = datai.imag
+            write_record(op2, op2_ascii, record, endian)
 
-            nwide = 0
-            ielement = -1
-            for eid, nid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(eids, nids, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                if nid == 0:
-                    ielement += 1
-                    eid_device = eids_device[ielement]
-                    data = [eid_device, b'CEN/', nid,
-                            mxi.real, myi.real, mxyi.real, bmxi.real, bmyi.real, bmxyi.real, txi.real, tyi.real,
-                            mxi.imag, myi.imag, mxyi.imag, bmxi.imag, bmyi.imag, bmxyi.imag, txi.imag, tyi.imag]
-                    op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                    op2.write(struct1.pack(*data))
-                else:
-                    data = [nid,
-                            mxi.real, myi.real, mxyi.real, bmxi.real, bmyi.real, bmxyi.real, txi.real, tyi.real,
-                            mxi.imag, myi.imag, mxyi.imag, bmxi.imag, bmyi.imag, bmxyi.imag, txi.imag, tyi.imag]
-                    op2_ascii.write('    data=%s\n' % (str(data)))
-                    op2.write(struct2.pack(*data))
-                nwide += len(data)
-            assert nwide == ntotal, 'nwide=%s ntotal=%s' % (nwide, ntotal)
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -1894,7 +1841,7 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.ntotal, dtype=idtype)
+        self.element = self._build_array('element', self.ntotal, dtype=idtype)
 
         # the number is messed up because of the offset for the element's properties
 
@@ -1903,7 +1850,7 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
                 #self.ntimes, self.nelements, nnodes, self.nelements * nnodes, self.ntotal)
             #raise RuntimeError(msg)
         #[bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), dtype=cfdtype)
 
 
     def build_dataframe(self):
@@ -2034,7 +1981,7 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
         return page_num - 1
 
     def _write_sort1_as_sort1(self, f06_file, page_num, page_stamp, header, msg_temp, is_mag_phase):
-        eids = self.element
+        eids = self.element[:]
         #times = self._times
         ntimes = self.data.shape[0]
         for itime in range(ntimes):
@@ -2070,7 +2017,7 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
         return page_num
 
     def _write_sort1_as_sort2(self, f06_file, page_num, page_stamp, header, msg_temp, is_mag_phase):
-        eids = self.element
+        eids = self.element[:]
         times = self._times
         #ntimes = self.data.shape[0]
         for ieid, eid in enumerate(eids):
@@ -2108,7 +2055,7 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -2124,7 +2071,7 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        eids = self.element
+        eids = self.element[:]
         eids_device = eids * 10 + self.device_code
 
         # table 4 info
@@ -2135,9 +2082,6 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
@@ -2147,52 +2091,33 @@ class ComplexCBarWeldForceArray(ComplexForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 16f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
+
+        # [eid_device, (bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq)_real, (...)_imag]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('real', 'f4', 8), ('imag', 'f4', 8)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            #bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq
-            bm1a = self.data[itime, :, 0]
-            bm2a = self.data[itime, :, 1]
-            bm1b = self.data[itime, :, 2]
-            bm2b = self.data[itime, :, 3]
-            ts1 = self.data[itime, :, 4]
-            ts2 = self.data[itime, :, 5]
-            af = self.data[itime, :, 6]
-            trq = self.data[itime, :, 7]
-            assert len(eids_device) == len(bm1a.real)
 
-            for eid_device, bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi in zip(
-                eids_device, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq):
-
-                data = [eid_device,
-                        bm1ai.real, bm2ai.real, bm1bi.real, bm2bi.real, ts1i.real, ts2i.real, afi.real, trqi.real,
-                        bm1ai.imag, bm2ai.imag, bm1bi.imag, bm2bi.imag, ts1i.imag, ts2i.imag, afi.imag, trqi.imag]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                op2.write(struct1.pack(*data))
+            datai = self.data[itime, :, :]
+            record['real'] = datai.real
+            record['imag'] = datai.imag
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -2248,8 +2173,8 @@ class ComplexCBeamForceArray(ComplexForceObject):
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype)
-        self.element = zeros(self.ntotal, idtype)
-        self.element_node = zeros((self.ntotal, 2), idtype)
+        self.element = self._build_array('element', self.ntotal, idtype)
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), idtype)
 
         # the number is messed up because of the offset for the element's properties
 
@@ -2258,7 +2183,7 @@ class ComplexCBeamForceArray(ComplexForceObject):
                 #self.ntimes, self.nelements, nnodes, self.nelements * nnodes, self.ntotal)
             #raise RuntimeError(msg)
         #[sd, bm1, bm2, ts1, ts2, af, ttrq, wtrq]
-        self.data = zeros((self.ntimes, self.ntotal, 8), cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), cfdtype)
 
     def finalize(self):
         sd = self.data[0, :, 0].real
@@ -2266,9 +2191,9 @@ class ComplexCBeamForceArray(ComplexForceObject):
         i_node_zero = np.where(self.element_node[:, 1] != 0)[0]
         assert i_node_zero.max() > 0, 'CBEAM element_node hasnt been filled'
         i = np.union1d(i_sd_zero, i_node_zero)
-        self.element = self.element[i]
-        self.element_node = self.element_node[i, :]
-        self.data = self.data[:, i, :]
+        self.element = self._take_array('element', i)
+        self.element_node = self._take_array('element_node', i)
+        self.data = self._take_array('data', i, axis=1)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -2472,7 +2397,7 @@ class ComplexCBeamForceArray(ComplexForceObject):
         return page_num - 1
 
     def _write_sort1_as_sort1(self, f06_file, page_num, page_stamp, header, msg_temp, is_mag_phase):
-        eids = self.element
+        eids = self.element[:]
         #times = self._times
         ntimes = self.data.shape[0]
         for itime in range(ntimes):
@@ -2512,7 +2437,7 @@ class ComplexCBeamForceArray(ComplexForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -2546,13 +2471,29 @@ class ComplexCBeamForceArray(ComplexForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'2i 15f')
-            struct2 = Struct(endian + b'i 15f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
+
+        # 11 stations, with the end stations getting an nid and the
+        # unused stations before the end station being 0
+        # [eid_device, (nid, sd, (bm1, bm2, ts1, ts2, af, ttrq, wtrq)_real, (...)_imag) * 11]
+        istart, iend, imiddle, imiddle_element, imiddle_station = get_cbeam_station_index(eids)
+        assert len(istart) == nelements, 'nelements=%s expected=%s' % (len(istart), nelements)
+        dtype = get_record_dtype([
+            ('eid_device', 'i4'),
+            ('stations', [('nid', 'i4'), ('sd', 'f4'), ('real', 'f4', 7), ('imag', 'f4', 7)], 11)],
+            endian)
+        record = np.zeros(nelements, dtype=dtype)
+        record['eid_device'] = eids_device[istart]
+        nids_stations = np.zeros((nelements, 11), dtype='int32')
+        nids_stations[:, 0] = nids[istart]
+        nids_stations[:, 10] = nids[iend]
+        record['stations']['nid'] = nids_stations
+        assert record.nbytes == 4 * ntotal, 'ntotal=%s nwide=%s' % (ntotal, record.nbytes // 4)
+
+        stations = np.zeros((nelements, 11, 8), dtype=self.data.dtype)
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -2560,73 +2501,22 @@ class ComplexCBeamForceArray(ComplexForceObject):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            sd = self.data[itime, :, 0]
-            bm1 = self.data[itime, :, 1]
-            bm2 = self.data[itime, :, 2]
-            ts1 = self.data[itime, :, 3]
-            ts2 = self.data[itime, :, 4]
-            af = self.data[itime, :, 5]
-            ttrq = self.data[itime, :, 6]
-            wtrq = self.data[itime, :, 7]
 
-            icount = 0
-            nwide = 0
-            ielement = 0
-            assert len(eids) == len(sd)
-            for eid, sdi, bm1i, bm2i, ts1i, ts2i, afi, ttrqi, wtrqi in zip(eids, sd, bm1, bm2, ts1, ts2, af, ttrq, wtrq):
-                if icount == 0:
-                    eid_device = eids_device[ielement]
-                    nid = nids[ielement]
-                    data = [eid_device, nid, sdi.real,
-                            bm1i.real, bm2i.real, ts1i.real, ts2i.real, afi.real, ttrqi.real, wtrqi.real,
-                            bm1i.imag, bm2i.imag, ts1i.imag, ts2i.imag, afi.imag, ttrqi.imag, wtrqi.imag] # 17
-                    op2.write(struct1.pack(*data))
-                    ielement += 1
-                    icount = 1
-                elif nid > 0 and icount > 0:
-                    # 11 total nodes, with 1, 11 getting an nid; the other 9 being
-                    # xxb sections
-                    data = [0, 0.,
-                            0., 0., 0., 0., 0., 0., 0.,
-                            0., 0., 0., 0., 0., 0., 0.]
-                    #print('***adding %s\n' % (10-icount))
-                    for unused_i in range(10 - icount):
-                        op2.write(struct2.pack(*data))
-                        nwide += len(data)
-
-                    eid_device2 = eids_device[ielement]
-                    #print(eids_device)
-                    assert eid_device == eid_device2, 'eid_device=%s eid_device2=%s' % (eid_device, eid_device2)
-                    nid = nids[ielement]
-                    data = [nid, sdi.real,
-                            bm1i.real, bm2i.real, ts1i.real, ts2i.real, afi.real, ttrqi.real, wtrqi.real,
-                            bm1i.imag, bm2i.imag, ts1i.imag, ts2i.imag, afi.imag, ttrqi.imag, wtrqi.imag] # 16
-                    op2.write(struct2.pack(*data))
-                    ielement += 1
-                    icount = 0
-                else:
-                    raise RuntimeError('CBEAM OEF op2 writer')
-                    #data = [0, xxb, sxc, sxd, sxe, sxf, smax, smin, smt, smc]  # 10
-                    #op2.write(struct2.pack(*data))
-                    #icount += 1
-
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                nwide += len(data)
-
-            assert ntotal == nwide, 'ntotal=%s nwide=%s' % (ntotal, nwide)
+            # [sd, bm1, bm2, ts1, ts2, af, ttrq, wtrq]
+            datai = self.data[itime, :, :]
+            stations[:, 0, :] = datai[istart, :]
+            stations[imiddle_element, imiddle_station, :] = datai[imiddle, :]
+            stations[:, 10, :] = datai[iend, :]
+            record['stations']['sd'] = stations[:, :, 0].real
+            record['stations']['real'] = stations[:, :, 1:].real
+            record['stations']['imag'] = stations[:, :, 1:].imag
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -2688,11 +2578,11 @@ class ComplexCBendForceArray(BaseElement):  # 69-CBEND
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element_node = zeros((self.nelements, 3), dtype='int32')
+        self.element_node = self._build_array('element_node', (self.nelements, 3), dtype='int32')
 
         #[bending_moment_1a, bending_moment_2a, shear_1a, shear_2a, axial_a, torque_a
         # bending_moment_1b, bending_moment_2b, shear_1b, shear_2b, axial_b, torque_b]
-        self.data = zeros((self.ntimes, self.nelements, 12), dtype='complex64')
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 12), dtype='complex64')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -2961,10 +2851,10 @@ class ComplexSolidPressureForceArray(ComplexForceObject):
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype=idtype)
+        self.element = self._build_array('element', self.nelements, dtype=idtype)
 
         #[ax, ay, az, vx, vy, vz, pressure]
-        self.data = zeros((self.ntimes, self.ntotal, 7), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 7), dtype=cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -3113,7 +3003,7 @@ class ComplexSolidPressureForceArray(ComplexForceObject):
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
 
         #print('len(eids)=%s nwrite=%s is_odd=%s' % (len(eids), nwrite, is_odd))
         etypei = self.element_type
@@ -3150,7 +3040,7 @@ class ComplexSolidPressureForceArray(ComplexForceObject):
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -3159,7 +3049,7 @@ class ComplexSolidPressureForceArray(ComplexForceObject):
             self._write_table_header(op2, op2_ascii, date)
             itable = -3
 
-        eids = self.element
+        eids = self.element[:]
 
         # table 4 info
         #ntimes = self.data.shape[0]
@@ -3169,17 +3059,12 @@ class ComplexSolidPressureForceArray(ComplexForceObject):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = eids * 10 + self.device_code
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 8s13f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
@@ -3193,7 +3078,14 @@ class ComplexSolidPressureForceArray(ComplexForceObject):
             ename = b'TETPR'
         else:
             raise NotImplementedError(self)
-        #etypeb = self.element_type#.encode('ascii')
+
+        # [eid_device, ename, (ax, ay, az, vx, vy, vz, pressure)_real,
+        #  (ax, ay, az, vx, vy, vz)_imag]
+        dtype = get_record_dtype([
+            ('eid_device', 'i4'), ('ename', 'S8'), ('real', 'f4', 7), ('imag', 'f4', 6)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
+        record['ename'] = ename
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -3201,61 +3093,27 @@ class ComplexSolidPressureForceArray(ComplexForceObject):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            ax = self.data[itime, :, 0]
-            ay = self.data[itime, :, 0]
-            az = self.data[itime, :, 0]
-            vx = self.data[itime, :, 0]
-            vy = self.data[itime, :, 0]
-            vz = self.data[itime, :, 0]
-            pressure = self.data[itime, :, 0]
 
-            for eid, eid_device, axi, ayi, azi, vxi, vyi, vzi, pressurei in zip(
-                    eids, eids_device, ax, ay, az, vx, vy, vz, pressure):
-                out = write_imag_floats_13e([axi, ayi, azi, vxi, vyi, vzi, pressurei], is_mag_phase)
+            datai = self.data[itime, :, :]
+            for eid, datai_row in zip(eids, datai):
+                out = write_imag_floats_13e(datai_row, is_mag_phase)
                 [saxr, sayr, sazr, svxr, svyr, svzr, spressurer,
-                 saxi, sayi, sazi, svxi, svyi, svzi, spressurei] = out
+                 saxi, sayi, sazi, svxi, svyi, svzi, unused_spressurei] = out
                 #'       1000    HEXPR      1.582050E-08    5.505425E+06    2.598164E-09    -8.884337E-10  -4.806934E+04   1.046571E-10   9.968034E+01'
                 #'                         -1.116439E-08   -6.040572E+05    1.315160E-09    -1.258955E-09  -4.381078E+05  -2.067553E-10'
-                data = [
-                    eid_device, ename,
-                    axi.real, ayi.real, azi.real, vxi.real, vyi.real, vzi.real, pressurei.real,
-                    axi.imag, ayi.imag, azi.imag, vxi.imag, vyi.imag, vzi.imag,
-                ]
                 op2_ascii.write('      %8i %8s %-13s %-13s %-13s %-13s %-13s %-13s %s\n'
                                 '      %8s %8s %-13s %-13s %-13s %-13s %-13s %s\n\n'
                                 % (eid, etypei, saxr, sayr, sazr, svxr, svyr, svzr, spressurer,
                                    '', '',      saxi, sayi, sazi, svxi, svyi, svzi))
-                op2.write(struct1.pack(*data))
-
-            #for eid, eid_device, fxi, fyi, fzi, mxi, myi, mzi in zip(eids, eids_device, fx, fy, fz, mx, my, mz):
-                #data = [
-                    #eid_device,
-                    #fxi.real, fyi.real, fzi.real, mxi.real, myi.real, mzi.real,
-                    #fxi.imag, fyi.imag, fzi.imag, mxi.imag, myi.imag, mzi.imag,
-                #]
-
-                #vals = (fxi, fyi, fzi, mxi, myi, mzi)
-                #vals2 = write_imag_floats_13e(vals, is_mag_phase)
-                #(fxir, fyir, fzir, mxir, myir, mzir,
-                 #fxii, fyii, fzii, mxii, myii, mzii) = vals2
-                #op2_ascii.write('0%26i   %-13s  %-13s  %-13s  %-13s  %-13s  %s\n'
-                               #' %26s   %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                                   #eid, fxir, fyir, fzir, mxir, myir, mzir,
-                                   #'', fxii, fyii, fzii, mxii, myii, mzii))
-                #op2.write(struct1.pack(*data))
+            record['real'] = datai.real
+            record['imag'] = datai[:, :6].imag
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -3309,7 +3167,7 @@ class ComplexForceMomentArray(ComplexForceObject):
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         self._times = zeros(self.ntimes, 'float32')
-        self.element = zeros(self.ntotal, 'int32')
+        self.element = self._build_array('element', self.ntotal, 'int32')
 
         # the number is messed up because of the offset for the element's properties
 
@@ -3318,7 +3176,7 @@ class ComplexForceMomentArray(ComplexForceObject):
                 self.ntimes, self.nelements, nnodes, self.nelements * nnodes, self.ntotal)
             raise RuntimeError(msg)
         #[fx, fy, fz, mx, my, mz]
-        self.data = zeros((self.ntimes, self.ntotal, 6), 'complex64')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 6), 'complex64')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -3453,7 +3311,7 @@ class ComplexForceMomentArray(ComplexForceObject):
 
     def _write_sort1_as_sort1(self, f06_file, page_num, page_stamp, header, msg_temp, is_mag_phase):
         ntimes = self.data.shape[0]
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]
             dt_line = ' %14s = %12.5E\n' % (self.data_code['name'], dt)
@@ -3492,7 +3350,7 @@ class ComplexForceMomentArray(ComplexForceObject):
         return page_num
 
     def _write_sort1_as_sort2(self, f06_file, page_num, page_stamp, header, msg_temp, is_mag_phase):
-        eids = self.element
+        eids = self.element[:]
         times = self._times
         for ieid, eid in enumerate(eids):
             eid_line = ' ELEMENT-ID = %s' % (eid)
@@ -3529,7 +3387,7 @@ class ComplexForceMomentArray(ComplexForceObject):
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -3538,7 +3396,7 @@ class ComplexForceMomentArray(ComplexForceObject):
             self._write_table_header(op2, op2_ascii, date)
             itable = -3
 
-        eids = self.element
+        eids = self.element[:]
 
         # table 4 info
         #ntimes = self.data.shape[0]
@@ -3548,21 +3406,20 @@ class ComplexForceMomentArray(ComplexForceObject):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = eids * 10 + self.device_code
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 12f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
 
+        # [eid_device, (fx, fy, fz, mx, my, mz)_real, (...)_imag]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('real', 'f4', 6), ('imag', 'f4', 6)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -3570,42 +3427,25 @@ class ComplexForceMomentArray(ComplexForceObject):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            fx = self.data[itime, :, 0]
-            fy = self.data[itime, :, 1]
-            fz = self.data[itime, :, 2]
-            mx = self.data[itime, :, 3]
-            my = self.data[itime, :, 4]
-            mz = self.data[itime, :, 5]
-
-            for eid, eid_device, fxi, fyi, fzi, mxi, myi, mzi in zip(eids, eids_device, fx, fy, fz, mx, my, mz):
-                data = [
-                    eid_device,
-                    fxi.real, fyi.real, fzi.real, mxi.real, myi.real, mzi.real,
-                    fxi.imag, fyi.imag, fzi.imag, mxi.imag, myi.imag, mzi.imag,
-                ]
 
-                vals = (fxi, fyi, fzi, mxi, myi, mzi)
-                vals2 = write_imag_floats_13e(vals, is_mag_phase)
+            datai = self.data[itime, :, :]
+            for eid, datai_row in zip(eids, datai):
+                vals2 = write_imag_floats_13e(datai_row, is_mag_phase)
                 (fxir, fyir, fzir, mxir, myir, mzir,
                  fxii, fyii, fzii, mxii, myii, mzii) = vals2
                 op2_ascii.write('0%26i   %-13s  %-13s  %-13s  %-13s  %-13s  %s\n'
                                ' %26s   %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
                                    eid, fxir, fyir, fzir, mxir, myir, mzir,
                                    '', fxii, fyii, fzii, mxii, myii, mzii))
-                op2.write(struct1.pack(*data))
+            record['real'] = datai.real
+            record['imag'] = datai.imag
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -3730,11 +3570,11 @@ class ComplexCBeamForceVUArray(BaseElement):  # 191-VUBEAM
             #self.element_name, self.element_type, nnodes_per_element, self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
         self._times = np.zeros(self.ntimes, dtype=dtype)
-        self.element_node = np.zeros((self.ntotal, 2), dtype=idtype)
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype=idtype)
         self.parent_coord = np.zeros((self.ntotal, 2), dtype=idtype)
 
         #[xxb, force_x, shear_y, shear_z, torsion, bending_y, bending_z]
-        self.data = np.zeros((self.ntimes, self.ntotal, 7), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 7), dtype=cfdtype)
 
     #def build_dataframe(self):
         #"""creates a pandas dataframe"""
@@ -4047,11 +3887,11 @@ class ComplexForceVU_2DArray(BaseElement):  # 189-VUQUAD,190-VUTRIA
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element_node = zeros((self.nelements, 2), dtype=idtype)
+        self.element_node = self._build_array('element_node', (self.nelements, 2), dtype=idtype)
 
         #[membrane_x, membrane_y, membrane_xy, bending_x, bending_y, bending_xy,
         # shear_yz, shear_xz]
-        self.data = zeros((self.ntimes, self.nelements, 8), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 8), dtype=cfdtype)
 
     def get_headers(self) -> List[str]:
         headers = [
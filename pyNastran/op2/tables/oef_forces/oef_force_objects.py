@@ -1,5 +1,5 @@
 #pylint disable=C0301
-from struct import Struct, pack
+from struct import pack
 from abc import abstractmethod
 import inspect
 from typing import List
@@ -14,7 +14,8 @@ from pyNastran.f06.f06_formatting import (
     write_float_13e, # write_float_12e,
     _eigenvalue_header,
 )
-from pyNastran.op2.op2_interface.write_utils import set_table3_field
+from pyNastran.op2.op2_interface.write_utils import (
+    set_table3_field, get_record_dtype, write_record, get_cbeam_station_index)
 
 
 SORT2_TABLE_NAME_MAP = {
@@ -313,10 +314,10 @@ class FailureIndicesArray(RealForceObject):
 
         self._times = zeros(self.ntimes, dtype=dtype)
         self.failure_theory = np.full(self.nelements, '', dtype='U8')
-        self.element_layer = zeros((self.nelements, 2), dtype=idtype)
+        self.element_layer = self._build_array('element_layer', (self.nelements, 2), dtype=idtype)
 
         #[failure_stress_for_ply, interlaminar_stress, max_value]
-        self.data = zeros((self.ntimes, self.nelements, 3), dtype=fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 3), dtype=fdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -519,10 +520,10 @@ class RealSpringDamperForceArray(RealForceObject):
         self.nelements = nelements
 
         self._times = zeros(ntimes, dtype=dtype)
-        self.element = zeros(nelements, dtype=idtype)
+        self.element = self._build_array('element', nelements, dtype=idtype)
 
         #[force]
-        self.data = zeros((ntimes, nelements, 1), dtype=fdtype)
+        self.data = self._build_array('data', (ntimes, nelements, 1), dtype=fdtype)
 
 
     def build_dataframe(self):
@@ -670,7 +671,7 @@ class RealSpringDamperForceArray(RealForceObject):
     def _write_sort1_as_sort1(self, header, page_stamp, page_num, f06_file, msg_temp):
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         nwrite = len(eids)
         nrows = nwrite // 4
         nleftover = nwrite - nrows * 4
@@ -706,7 +707,7 @@ class RealSpringDamperForceArray(RealForceObject):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -725,26 +726,26 @@ class RealSpringDamperForceArray(RealForceObject):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'if')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
+
+        # [eid_device, force]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4')], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -752,25 +753,15 @@ class RealSpringDamperForceArray(RealForceObject):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            force = self.data[itime, :, 0]
-
-            for eid, forcei in zip(eids_device, force):
-                data = [eid, forcei]
-                op2_ascii.write('  eid=%s force=%s\n' % tuple(data))
-                op2.write(struct1.pack(*data))
+            record['data'] = self.data[itime, :, 0]
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -946,10 +937,10 @@ class RealRodForceArray(RealForceObject):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(ntimes, dtype=dtype)
-        self.element = zeros(nelements, dtype='int32')
+        self.element = self._build_array('element', nelements, dtype='int32')
 
         #[axial_force, torque]
-        self.data = zeros((ntimes, nelements, 2), dtype='float32')
+        self.data = self._build_array('data', (ntimes, nelements, 2), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -1033,7 +1024,7 @@ class RealRodForceArray(RealForceObject):
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         is_odd = False
         nwrite = len(eids)
         if len(eids) % 2 == 1:
@@ -1142,56 +1133,43 @@ class RealRodForceArray(RealForceObject):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i2f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
+
+        # [eid_device, axial, torsion]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4', 2)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            axial = self.data[itime, :, 0]
-            torsion = self.data[itime, :, 1]
 
-            #print('eids3', eids3)
-            for eid, axiali, torsioni in zip(eids_device, axial, torsion):
-                data = [eid, axiali, torsioni]
-                op2_ascii.write('  eid=%s axial=%s torsion=%s\n' % tuple(data))
-                op2.write(struct1.pack(*data))
+            record['data'] = self.data[itime, :, :]
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -1231,8 +1209,8 @@ class RealCBeamForceArray(RealForceObject):
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype)
-        self.element = zeros(self.ntotal, idtype)
-        self.element_node = zeros((self.ntotal, 2), idtype)
+        self.element = self._build_array('element', self.ntotal, idtype)
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), idtype)
 
         # the number is messed up because of the offset for the element's properties
         if not (self.nelements * nnodes) == self.ntotal:
@@ -1242,7 +1220,7 @@ class RealCBeamForceArray(RealForceObject):
                                                                            self.ntotal)
             raise RuntimeError(msg)
         #[sd, bm1, bm2, ts1, ts2, af, ttrq, wtrq]
-        self.data = zeros((self.ntimes, self.ntotal, 8), fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), fdtype)
 
     def finalize(self):
         sd = self.data[0, :, 0]
@@ -1252,9 +1230,9 @@ class RealCBeamForceArray(RealForceObject):
         i = np.union1d(i_sd_zero, i_node_zero)
 
         #self.nelements = len(self.element) // 11
-        self.element = self.element[i]
-        self.element_node = self.element_node[i, :]
-        self.data = self.data[:, i, :]
+        self.element = self._take_array('element', i)
+        self.element_node = self._take_array('element_node', i)
+        self.data = self._take_array('data', i, axis=1)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -1498,13 +1476,28 @@ class RealCBeamForceArray(RealForceObject):
 
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'2i 8f')
-            struct2 = Struct(endian + b'i 8f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
+
+        # 11 stations, with the end stations getting an nid and the
+        # unused stations before the end station being 0
+        # [eid_device, (nid, sd, bm1, bm2, ts1, ts2, af, ttrq, wtrq) * 11]
+        istart, iend, imiddle, imiddle_element, imiddle_station = get_cbeam_station_index(eids)
+        assert len(istart) == nelements, 'nelements=%s expected=%s' % (len(istart), nelements)
+        dtype = get_record_dtype([
+            ('eid_device', 'i4'),
+            ('stations', [('nid', 'i4'), ('data', 'f4', 8)], 11)], endian)
+        record = np.zeros(nelements, dtype=dtype)
+        record['eid_device'] = eids_device[istart]
+        nids_stations = np.zeros((nelements, 11), dtype='int32')
+        nids_stations[:, 0] = nids[istart]
+        nids_stations[:, 10] = nids[iend]
+        record['stations']['nid'] = nids_stations
+        assert record.nbytes == 4 * ntotal, 'ntotal=%s nwide=%s' % (ntotal, record.nbytes // 4)
+
+        stations = np.zeros((nelements, 11, 8), dtype=self.data.dtype)
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -1512,66 +1505,20 @@ class RealCBeamForceArray(RealForceObject):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            sd = self.data[itime, :, 0]
-            bm1 = self.data[itime, :, 1]
-            bm2 = self.data[itime, :, 2]
-            ts1 = self.data[itime, :, 3]
-            ts2 = self.data[itime, :, 4]
-            af = self.data[itime, :, 5]
-            ttrq = self.data[itime, :, 6]
-            wtrq = self.data[itime, :, 7]
-
-            icount = 0
-            nwide = 0
-            ielement = 0
-            assert len(eids) == len(sd)
-            for eid, nid, sdi, bm1i, bm2i, ts1i, ts2i, afi, ttrqi, wtrqi in zip(eids, nids, sd, bm1, bm2, ts1, ts2, af, ttrq, wtrq):
-                if icount == 0:
-                    eid_device = eids_device[ielement]
-                    nid = nids[ielement]
-                    data = [eid_device, nid, sdi, bm1i, bm2i, ts1i, ts2i, afi, ttrqi, wtrqi] # 10
-                    op2.write(struct1.pack(*data))
-                    ielement += 1
-                    icount = 1
-                elif nid > 0 and icount > 0:
-                    # 11 total nodes, with 1, 11 getting an nid; the other 9 being
-                    # xxb sections
-                    data = [0, 0., 0., 0., 0., 0., 0., 0., 0.]
-                    #print('***adding %s\n' % (10-icount))
-                    for unused_i in range(10 - icount):
-                        op2.write(struct2.pack(*data))
-                        nwide += len(data)
-
-                    eid_device2 = eids_device[ielement]
-                    assert eid_device == eid_device2
-                    nid = nids[ielement]
-                    data = [nid, sdi, bm1i, bm2i, ts1i, ts2i, afi, ttrqi, wtrqi] # 9
-                    op2.write(struct2.pack(*data))
-                    ielement += 1
-                    icount = 0
-                else:
-                    raise RuntimeError('CBEAM op2 writer')
-                    #data = [0, xxb, sxc, sxd, sxe, sxf, smax, smin, smt, smc]  # 10
-                    #op2.write(struct2.pack(*data))
-                    #icount += 1
-
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                nwide += len(data)
-
-            assert ntotal == nwide, 'ntotal=%s nwide=%s' % (ntotal, nwide)
+            # [sd, bm1, bm2, ts1, ts2, af, ttrq, wtrq]
+            datai = self.data[itime, :, :]
+            stations[:, 0, :] = datai[istart, :]
+            stations[imiddle_element, imiddle_station, :] = datai[imiddle, :]
+            stations[:, 10, :] = datai[iend, :]
+            record['stations']['data'] = stations
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -1631,13 +1578,13 @@ class RealCShearForceArray(RealForceObject):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         #[force41, force21, force12, force32, force23, force43,
         # force34, force14,
         # kick_force1, shear12, kick_force2, shear23,
         # kick_force3, shear34, kick_force4, shear41]
-        self.data = zeros((self.ntimes, self.ntotal, 16), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 16), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -1793,7 +1740,7 @@ class RealCShearForceArray(RealForceObject):
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
 
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
@@ -1864,8 +1811,6 @@ class RealCShearForceArray(RealForceObject):
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        unused_eids = self.element
-
         # table 4 info
         #ntimes = self.data.shape[0]
         #nnodes = self.data.shape[1]
@@ -1874,93 +1819,43 @@ class RealCShearForceArray(RealForceObject):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids = self.element
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 16f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
 
+        # [eid_device, f14, f12, f21, f23, f32, f34, f43, f41,
+        #  kick1, tau12, kick2, tau23, kick3, tau34, kick4, tau41]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4', 16)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
-            #print('3, %s' % itable)
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
-            #print('4, %s' % itable)
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            f14 = self.data[itime, :, 0]
-            f12 = self.data[itime, :, 1]
-            f21 = self.data[itime, :, 2]
-            f23 = self.data[itime, :, 3]
-            f32 = self.data[itime, :, 4]
-            f34 = self.data[itime, :, 5]
-            f43 = self.data[itime, :, 6]
-            f41 = self.data[itime, :, 7]
-
-            kick1 = self.data[itime, :, 8]
-            tau12 = self.data[itime, :, 9]
-            kick2 = self.data[itime, :, 10]
-            tau23 = self.data[itime, :, 11]
-            kick3 = self.data[itime, :, 12]
-            tau34 = self.data[itime, :, 13]
-            kick4 = self.data[itime, :, 14]
-            tau41 = self.data[itime, :, 15]
-
-            for (eid, eid_device, f14i, f12i, f21i, f23i, f32i, f34i, f43i, f41i,
-                 kick1i, tau12i, kick2i, tau23i, kick3i, tau34i, kick4i, tau41i) in zip(
-                    eids, eids_device, f14, f12, f21, f23, f32, f34, f43, f41,
-                    kick1, tau12, kick2, tau23, kick3, tau34, kick4, tau41):
-                op2.write(struct1.pack(
-                            eid_device, f14i, f12i, f21i, f23i, f32i, f34i, f43i, f41i,
-                            kick1i, tau12i, kick2i, tau23i, kick3i, tau34i, kick4i, tau41i))
-
-                vals2 = write_floats_12e([
-                    f14i, f12i, f21i, f23i, f32i, f34i, f43i, f41i,
-                    kick1i, tau12i, kick2i, tau23i, kick3i, tau34i, kick4i, tau41i])
-                [
-                    f14i, f12i,
-                    f21i, f23i,
-                    f32i, f34i,
-                    f43i, f41i,
-                    kick1i, tau12i, kick2i, tau23i,
-                    kick3i, tau34i, kick4i, tau41i
-                ] = vals2
-                op2_ascii.write(
-                    '0%13i%-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n'
-                    '                     %-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n' % (
-                            eid, f14i, f12i, f21i, f23i, f32i, f34i, f43i, f41i,
-                            kick1i, tau12i, kick2i, tau23i, kick3i, tau34i, kick4i, tau41i))
+            record['data'] = self.data[itime, :, :]
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -2011,10 +1906,10 @@ class RealViscForceArray(RealForceObject):  # 24-CVISC
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         #[axial_force, torque]
-        self.data = zeros((self.ntimes, self.ntotal, 2), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 2), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -2113,7 +2008,7 @@ class RealViscForceArray(RealForceObject):  # 24-CVISC
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         is_odd = False
         nwrite = len(eids)
         if len(eids) % 2 == 1:
@@ -2234,10 +2129,10 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.ntotal, dtype=idtype)
+        self.element = self._build_array('element', self.ntotal, dtype=idtype)
 
         #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype=fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), dtype=fdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -2406,7 +2301,7 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         # write the f06
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         cen_word = 'CEN/%i' % nnodes
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
@@ -2479,82 +2374,40 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
         #cen_word_ascii = 'CEN/%i' % nnodes
         #cen_word = b'CEN/%i' % nnodes
 
-        eids = self.element
-        #cen_word = 'CEN/%i' % nnodes
-
-        #msg.append('  element_node.shape = %s\n' % str(self.element_node.shape).replace('L', ''))
-        #msg.append('  data.shape=%s\n' % str(self.data.shape).replace('L', ''))
-
-        eids = self.element
+        eids = self.element[:]
         eids_device = eids * 10 + self.device_code
 
         nelements = len(eids)
         assert nelements > 0, eids
-        #print('nelements =', nelements)
-        # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
-        #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
-        #print('shape = %s' % str(self.data.shape))
-        #assert nnodes > 1, nnodes
-        #assert self.ntimes == 1, self.ntimes
-
-        #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
-        #assert ntotal == 193, ntotal
-
-        #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-
-        if self.is_sort1:
-            structi = Struct(endian + b'i 8f')
-        else:
+        #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
+
+        # [eid_device, mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4', 8)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            mx = self.data[itime, :, 0]
-            my = self.data[itime, :, 1]
-            mxy = self.data[itime, :, 2]
-            bmx = self.data[itime, :, 3]
-            bmy = self.data[itime, :, 4]
-            bmxy = self.data[itime, :, 5]
-            tx = self.data[itime, :, 6]
-            ty = self.data[itime, :, 7]
 
-            nwide = 0
-            for eid_device, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(eids_device, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                data = [eid_device, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi]
-                #[mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi] = write_floats_13e(
-                #    [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi])
-                op2.write(structi.pack(*data))
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data[1:])))
-                nwide += len(data)
+            record['data'] = self.data[itime, :, :]
+            write_record(op2, op2_ascii, record, endian)
 
-            assert nwide == ntotal, "nwide=%s ntotal=%s" % (nwide, ntotal)
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -2599,13 +2452,13 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element_node = zeros((self.ntotal, 2), dtype='int32')
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype='int32')
 
         # -MEMBRANE FORCES-   -BENDING MOMENTS- -TRANSVERSE SHEAR FORCES -
         #     FX FY FXY           MX MY MXY            QX QY
         #[fx, fy, fxy,  mx,  my,  mxy, qx, qy]
         #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -2880,110 +2733,53 @@ class RealPlateBilinearForceArray(RealForceObject):  # 144-CQUAD4
         eids = self.element_node[:, 0]
         nids = self.element_node[:, 1]
         if self.element_type  in [64, 82, 144]: # CQUAD8, CQUADR, CQUAD4
-            cyci = [0, 1, 2, 3, 4]
-            #cyc = cycle([0, 1, 2, 3, 4])  # TODO: this is totally broken...
             nnodes_per_eid = 5
         elif self.element_type  in [70, 75]: # CTRIAR, CTRIA6
-            cyci = [0, 1, 2, 3]
-            #cyc = cycle([0, 1, 2, 3])  # TODO: this is totally broken...
             nnodes_per_eid = 4
         else:
             raise NotImplementedError(self.element_type)
-
-        # TODO: this shouldn't be neccessary
-        cyc = cyci * (len(eids) // nnodes_per_eid)
         assert len(eids) % nnodes_per_eid == 0
 
-        #print("nnodes_all =", nnodes_all)
-        #cen_word_ascii = 'CEN/%i' % nnodes
-        cen_word = b'CEN/'
-
-        #msg.append('  element_node.shape = %s\n' % str(self.element_node.shape).replace('L', ''))
-        #msg.append('  data.shape=%s\n' % str(self.data.shape).replace('L', ''))
-
-        eids = self.element_node[:, 0]
-        nids = self.element_node[:, 1]
-        eids_device = eids * 10 + self.device_code
-
-        nelements = len(np.unique(eids))
-        #print('nelements =', nelements)
-        # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
-        #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
-
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
-        #print('shape = %s' % str(self.data.shape))
+        eids_device = eids[::nnodes_per_eid] * 10 + self.device_code
+        nelements = len(eids_device)
         assert nnodes > 1, nnodes
-        #assert self.ntimes == 1, self.ntimes
 
-        #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        #fmt = '%2i %6f'
-        #print('ntotal=%s' % (ntotal))
-        #assert ntotal == 193, ntotal
-
-        #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i4s i 8f')
-            struct2 = Struct(endian + b'i 8f')
-        else:
+        #[mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
+
+        # [eid_device, 'CEN/', nnodes, mx, my, mxy, bmx, bmy, bmxy, tx, ty,
+        #  (nid, mx, my, mxy, bmx, bmy, bmxy, tx, ty) * (nnodes_per_eid - 1)]
+        dtype = get_record_dtype([
+            ('eid_device', 'i4'), ('cen', 'S4'), ('nnodes', 'i4'), ('data', 'f4', 8),
+            ('nodes', [('nid', 'i4'), ('data', 'f4', 8)], nnodes_per_eid - 1)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
+        record['cen'] = b'CEN/'
+        record['nnodes'] = nnodes
+        record['nodes']['nid'] = nids.reshape(nelements, nnodes_per_eid)[:, 1:]
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            mx = self.data[itime, :, 0]
-            my = self.data[itime, :, 1]
-            mxy = self.data[itime, :, 2]
-            bmx = self.data[itime, :, 3]
-            bmy = self.data[itime, :, 4]
-            bmxy = self.data[itime, :, 5]
-            tx = self.data[itime, :, 6]
-            ty = self.data[itime, :, 7]
-
-            nwide = 0
-            for i, eid, eid_device, nid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(cyc, eids, eids_device, nids, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                #[mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi] = write_floats_13e(
-                #    [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi])
+            datai = self.data[itime, :, :].reshape(nelements, nnodes_per_eid, 8)
+            record['data'] = datai[:, 0, :]
+            record['nodes']['data'] = datai[:, 1:, :]
+            write_record(op2, op2_ascii, record, endian)
 
-                if i == 0:
-                    data = [eid_device, cen_word, nnodes, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi]
-                    op2.write(struct1.pack(*data))
-                    op2_ascii.write(
-                        '0  %8i    %s %-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n' % (
-                            eid, cen_word, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
-                else:
-                    data = [nid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi]
-                    op2.write(struct2.pack(*data))
-                    op2_ascii.write(
-                        '            %8i %-13s %-13s %-13s %-13s %-13s %-13s %-13s %s\n' % (
-                            nid, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi))
-
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                nwide += len(data)
-
-            assert nwide == ntotal, "nwide=%s ntotal=%s" % (nwide, ntotal)
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -3054,10 +2850,10 @@ class RealCBarFastForceArray(RealForceObject):
         #print(f"*ntimes={ntimes} nelements={nelements} ntotal={ntotal} data_names={self.data_names}")
         unused_dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(ntimes, dtype=dtype)
-        self.element = zeros(nelements, dtype=idtype)
+        self.element = self._build_array('element', nelements, dtype=idtype)
 
         #[bending_moment_a1, bending_moment_a2, bending_moment_b1, bending_moment_b2, shear1, shear2, axial, torque]
-        self.data = zeros((ntimes, ntotal, 8), dtype=fdtype)
+        self.data = self._build_array('data', (ntimes, ntotal, 8), dtype=fdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -3149,7 +2945,7 @@ class RealCBarFastForceArray(RealForceObject):
 
         #msg = []
         #header[1] = ' %s = %10.4E\n' % (self.data_code['name'], dt)
-        eids = self.element
+        eids = self.element[:]
         #f06_file.write(''.join(words))
 
         ntimes = self.data.shape[0]
@@ -3222,7 +3018,7 @@ class RealCBarFastForceArray(RealForceObject):
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        eids = self.element
+        eids = self.element[:]
         eids_device = eids * 10 + self.device_code
 
         # table 4 info
@@ -3233,9 +3029,6 @@ class RealCBarFastForceArray(RealForceObject):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
@@ -3245,47 +3038,31 @@ class RealCBarFastForceArray(RealForceObject):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 8f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
+
+        # [eid_device, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4', 8)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            bm1a = self.data[itime, :, 0]
-            bm2a = self.data[itime, :, 1]
-            bm1b = self.data[itime, :, 2]
-            bm2b = self.data[itime, :, 3]
-            ts1 = self.data[itime, :, 4]
-            ts2 = self.data[itime, :, 5]
-            af = self.data[itime, :, 6]
-            trq = self.data[itime, :, 7]
-            for eid_device, bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi in zip(
-                    eids_device, bm1a, bm2a, bm1b, bm2b, ts1, ts2, af, trq):
-
-                data = [eid_device, bm1ai, bm2ai, bm1bi, bm2bi, ts1i, ts2i, afi, trqi]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                op2.write(struct1.pack(*data))
+            record['data'] = self.data[itime, :, :]
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -3405,10 +3182,10 @@ class RealConeAxForceArray(RealForceObject):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         #[hopa, bmu, bmv, tm, su, sv]
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 6), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -3517,7 +3294,7 @@ class RealConeAxForceArray(RealForceObject):
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -3593,10 +3370,10 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         # [station, bending_moment1, bending_moment2, shear1, shear2, axial, torque]
-        self.data = zeros((self.ntimes, self.ntotal, 7), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 7), dtype='float32')
 
     #def finalize(self):
         #sd = self.data[0, :, 0]
@@ -3697,7 +3474,7 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
             # '        15893   0.000   1.998833E+02   9.004551E+01      2.316835E+00   1.461960E+00         -2.662207E+03       9.795244E-02'
         #msg = []
         #header[1] = ' %s = %10.4E\n' % (self.data_code['name'], dt)
-        eids = self.element
+        eids = self.element[:]
         #f.write(''.join(words))
 
         ntimes = self.data.shape[0]
@@ -3741,8 +3518,6 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        eids = self.element
-
         # table 4 info
         #ntimes = self.data.shape[0]
         #nnodes = self.data.shape[1]
@@ -3751,70 +3526,43 @@ class RealCBar100ForceArray(RealForceObject):  # 100-CBAR
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i2f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
-        eids = self.element
-        #f.write(''.join(words))
 
-        #ntimes = self.data.shape[0]
-        struct1 = Struct(endian + b'i7f')
+        # [eid_device, sd, bm1, bm2, ts1, ts2, af, trq]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4', 7)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            # sd, bm1, bm2, ts1, ts2, af, trq
-            sd = self.data[itime, :, 0]
-            bm1 = self.data[itime, :, 1]
-            bm2 = self.data[itime, :, 2]
-            ts1 = self.data[itime, :, 3]
-            ts2 = self.data[itime, :, 4]
-            af = self.data[itime, :, 5]
-            trq = self.data[itime, :, 6]
-            for eid, eid_device, sdi, bm1i, bm2i, ts1i, ts2i, afi, trqi in zip(
-                    eids, eids_device, sd, bm1, bm2, ts1, ts2, af, trq):
-                [sbm1i, sbm2i, sts1i, sts2i, safi, strqi] = write_floats_13e([
-                    bm1i, bm2i, ts1i, ts2i, afi, trqi])
-                op2_ascii.write(
-                    '     %8i   %4.3f  %-13s  %-13s     %-13s  %-13s         %-13s      %s\n' % (
-                        eid, sdi, sbm1i, sbm2i, sts1i, sts2i, safi, strqi))
-                data = [eid_device, sdi, bm1i, bm2i, ts1i, ts2i, afi, trqi]
-                op2.write(struct1.pack(*data))
+            record['data'] = self.data[itime, :, :]
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -3894,10 +3642,10 @@ class RealCGapForceArray(RealForceObject):  # 38-CGAP
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         # [fx, sfy, sfz, u, v, w, sv, sw]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -4015,7 +3763,7 @@ class RealCGapForceArray(RealForceObject):  # 38-CGAP
         #ntimes, ntotal = self.data.shape[:1]
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
 
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
@@ -4074,11 +3822,11 @@ class RealBendForceArray(RealForceObject):  # 69-CBEND
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element_node = zeros((self.nelements, 3), dtype='int32')
+        self.element_node = self._build_array('element_node', (self.nelements, 3), dtype='int32')
 
         #[bending_moment_1a, bending_moment_2a, shear_1a, shear_2a, axial_a, torque_a
         # bending_moment_1b, bending_moment_2b, shear_1b, shear_2b, axial_b, torque_b]
-        self.data = zeros((self.ntimes, self.nelements, 12), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 12), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -4304,10 +4052,10 @@ class RealSolidPressureForceArray(RealForceObject):  # 77-PENTA_PR,78-TETRA_PR
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype=idtype)
+        self.element = self._build_array('element', self.nelements, dtype=idtype)
 
         #[ax, ay, az, vx, vy, vz, pressure]
-        self.data = zeros((self.ntimes, self.ntotal, 7), dtype=fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 7), dtype=fdtype)
 
     def __eq__(self, table):  # pragma: no cover
         self._eq_header(table)
@@ -4398,7 +4146,7 @@ class RealSolidPressureForceArray(RealForceObject):  # 77-PENTA_PR,78-TETRA_PR
                     '    TIME         EL-TYPE             X-ACCELERATION            Y-ACCELERATION            Z-ACCELERATION            PRESSURE (DB)\n']
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         etype = self.element_name
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
@@ -4432,7 +4180,7 @@ class RealSolidPressureForceArray(RealForceObject):  # 77-PENTA_PR,78-TETRA_PR
                     '    ELEMENT-ID   EL-TYPE             X-ACCELERATION            Y-ACCELERATION            Z-ACCELERATION            PRESSURE (DB)\n']  # TODO: bad line...
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         etype = self.element_name
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
@@ -4544,11 +4292,11 @@ class RealCBeamForceVUArray(RealForceObject):  # 191-VUBEAM
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element_node = zeros((self.ntotal, 2), dtype='int32')
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype='int32')
         self.parent_coord = zeros((self.ntotal, 2), dtype='int32')
 
         #[xxb, fx, fy, fz, mx, my, mz]
-        self.data = zeros((self.ntimes, self.ntotal, 7), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 7), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -4803,10 +4551,10 @@ class RealForceMomentArray(RealForceObject):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         #[fx, fy, fz, mx, my, mz]
-        self.data = zeros((self.ntimes, self.nelements, 6), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 6), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -4959,7 +4707,7 @@ class RealForceMomentArray(RealForceObject):
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -5010,27 +4758,27 @@ class RealForceMomentArray(RealForceObject):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i6f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
+
+        # [eid_device, fx, fy, fz, mx, my, mz]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4', 6)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -5038,30 +4786,15 @@ class RealForceMomentArray(RealForceObject):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            fx = self.data[itime, :, 0]
-            fy = self.data[itime, :, 1]
-            fz = self.data[itime, :, 2]
-            mx = self.data[itime, :, 3]
-            my = self.data[itime, :, 4]
-            mz = self.data[itime, :, 5]
 
-            for eid, fxi, fyi, fzi, mxi, myi, mzi in zip(eids_device, fx, fy, fz, mx, my, mz):
-                data = [eid, fxi, fyi, fzi, mxi, myi, mzi]
-                op2_ascii.write('  eid=%s data=%s\n' % (eid, str(data[1:])))
-                op2.write(struct1.pack(*data))
+            record['data'] = self.data[itime, :, :]
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -5147,10 +4880,10 @@ class RealForceVU2DArray(RealForceObject):  # 189-VUQUAD, 190-VUTRIA
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element_node = zeros((self.ntotal, 2), dtype=idtype)
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype=idtype)
 
         #[mfx, mfy, mfxy, bmx, bmy, bmxy, syz, szx]
-        self.data = zeros((self.ntimes, self.ntotal, 8), dtype=fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), dtype=fdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -74,11 +74,11 @@ class Real1DHeatFluxArray(BaseElement):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = np.zeros(self.ntimes, dtype=dtype)
-        self.element = np.zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
         self.element_data_type = np.empty(self.nelements, dtype='|U8')
 
         #[xgrad, ygrad, zgrad, xflux, yflux, zflux]
-        self.data = np.zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 6), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -201,7 +201,7 @@ class Real1DHeatFluxArray(BaseElement):
         ]
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         etype = self.element_data_type
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
@@ -273,9 +273,9 @@ class RealHeatFluxVU3DArray(BaseElement):
         self._times = np.zeros(self.ntimes, dtype=dtype)
         self.element_parent = np.zeros((self.nelements, 2), dtype='int32')
 
-        self.vugrid = np.zeros((self.ntimes, self.ntotal), dtype='int32')
+        self.vugrid = self._build_array('vugrid', (self.ntimes, self.ntotal), dtype='int32')
         #[xgrad, ygrad, zgrad, xflux, yflux, zflux]
-        self.data = np.zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 6), dtype='float32')
 
     def _build_dataframe(self):
         """creates a pandas dataframe"""
@@ -491,8 +491,8 @@ class RealHeatFluxVUBeamArray(BaseElement):  # 191-VUBEAM
         self.element_parent_coord = np.zeros((self.nelements, 3), dtype='int32')
 
         #[xgrad, ygrad, zgrad, xflux, yflux, zflux]
-        self.vugrid = np.zeros((self.ntimes, self.ntotal, 1), dtype='int32')
-        self.data = np.zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.vugrid = self._build_array('vugrid', (self.ntimes, self.ntotal, 1), dtype='int32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 6), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -766,10 +766,10 @@ class RealConvHeatFluxArray(BaseElement):  # 107-CHBDYE 108-CHBDYG 109-CHBDYP
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = np.zeros(self.ntimes, dtype=dtype)
-        self.element_node = np.zeros((self.nelements, 2), dtype='int32')
+        self.element_node = self._build_array('element_node', (self.nelements, 2), dtype='int32')
 
         #[free_conv, free_conv_k]
-        self.data = np.zeros((self.ntimes, self.ntotal, 2), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 2), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -990,11 +990,11 @@ class RealChbdyHeatFluxArray(BaseElement):  # 107-CHBDYE 108-CHBDYG 109-CHBDYP
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = np.zeros(self.ntimes, dtype=dtype)
-        self.element = np.zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
         self.element_type = np.empty(self.nelements, dtype='|U8')
 
         #[fapplied, free_conv, force_conv, frad, ftotal]
-        self.data = np.zeros((self.ntimes, self.ntotal, 5), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 5), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -1130,7 +1130,7 @@ class RealChbdyHeatFluxArray(BaseElement):  # 107-CHBDYE 108-CHBDYG 109-CHBDYP
         #(ntimes, ntotal, two) = self.data.shape
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]  # TODO: rename this...
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -1261,12 +1261,12 @@ class RealHeatFluxVUShellArray(BaseElement):
         self._times = np.zeros(ntimes, dtype=self._times_dtype)
         #self.types = array(self.nelements, dtype='|S1')
 
-        self.element = np.zeros(nelements, dtype='int32')
+        self.element = self._build_array('element', nelements, dtype='int32')
         self.element_parent_coord_icord = np.zeros((nelements, 4), dtype='int32')
         #self.element_data_type = empty(nelements, dtype='|U8')
 
         #[xgrad, ygrad, zgrad, xflux, yflux, zflux]
-        self.data = np.zeros((nx, ny, 6), self.data_type())
+        self.data = self._build_array('data', (nx, ny, 6), self.data_type())
 
     def __eq__(self, table):  # pragma: no cover
         assert self.is_sort1 == table.is_sort1
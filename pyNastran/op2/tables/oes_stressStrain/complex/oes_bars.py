@@ -4,6 +4,7 @@ import numpy as np
 from numpy import zeros
 
 from pyNastran.op2.result_objects.op2_objects import get_complex_times_dtype
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.f06.f06_formatting import write_imag_floats_13e
@@ -66,7 +67,7 @@ class ComplexBarArray(OES_Object):
         #self.element = array(self.nelements, dtype='|S8')
 
         #self.ntotal = self.nelements * nnodes
-        self.element = zeros(self.ntotal, dtype=idtype)
+        self.element = self._build_array('element', self.ntotal, dtype=idtype)
 
         # the number is messed up because of the offset for the element's properties
         #if self.nelements * nnodes != self.ntotal:
@@ -77,7 +78,7 @@ class ComplexBarArray(OES_Object):
             #raise RuntimeError(msg)
 
         #[s1a, s2a, s3a, s4a, axial, s2a, s2b, s2c, s2d]
-        self.data = zeros((self.ntimes, self.ntotal, 9), cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 9), cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -263,7 +264,7 @@ class ComplexBarArray(OES_Object):
             sb4 = self.data[itime, :, 8]
             #[sa1, sa2, sa3, sa4, axial, sb1, sb2, sb3, sb4]
 
-            eids = self.element
+            eids = self.element[:]
             for eid, s1ai, s2ai, s3ai, s4ai, axiali, s2ai, s2bi, s2ci, s2di in zip(eids, sa1, sa2, sa3, sa4, axial, sb1, sb2, sb3, sb4):
                 vals = (s1ai, s2ai, s3ai, s4ai, axiali,
                         s2ai, s2bi, s2ci, s2di)
@@ -292,7 +293,7 @@ class ComplexBarArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -308,7 +309,7 @@ class ComplexBarArray(OES_Object):
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        eids = self.element
+        eids = self.element[:]
         eids_device = eids * 10 + self.device_code
 
         # table 4 info
@@ -319,9 +320,6 @@ class ComplexBarArray(OES_Object):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
@@ -331,52 +329,33 @@ class ComplexBarArray(OES_Object):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 18f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
+
+        # [eid_device, s1a, s2a, s3a, s4a, axial, s1b, s2b, s3b, s4b (real), ... (imag)]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('real', 'f4', 9), ('imag', 'f4', 9)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            sa1 = self.data[itime, :, 0]
-            sa2 = self.data[itime, :, 1]
-            sa3 = self.data[itime, :, 2]
-            sa4 = self.data[itime, :, 3]
-            axial = self.data[itime, :, 4]
-            sb1 = self.data[itime, :, 5]
-            sb2 = self.data[itime, :, 6]
-            sb3 = self.data[itime, :, 7]
-            sb4 = self.data[itime, :, 8]
-            #[sa1, sa2, sa3, sa4, axial, sb1, sb2, sb3, sb4]
-
-            eids = self.element
-            for eid_device, s1ai, s2ai, s3ai, s4ai, axiali, s2ai, s2bi, s2ci, s2di in zip(eids_device, sa1, sa2, sa3, sa4, axial, sb1, sb2, sb3, sb4):
 
-                data = [eid_device,
-                        s1ai.real, s2ai.real, s3ai.real, s4ai.real, axiali.real, s2ai.real, s2bi.real, s2ci.real, s2di.real,
-                        s1ai.imag, s2ai.imag, s3ai.imag, s4ai.imag, axiali.imag, s2ai.imag, s2bi.imag, s2ci.imag, s2di.imag]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                op2.write(struct1.pack(*data))
+            datai = self.data[itime, :, :]
+            record['real'] = datai.real
+            record['imag'] = datai.imag
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -5,6 +5,8 @@ from numpy import zeros
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_complex_times_dtype
+from pyNastran.op2.op2_interface.write_utils import (
+    get_record_dtype, write_record, get_cbeam_station_index)
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.f06.f06_formatting import write_imag_floats_13e
@@ -61,7 +63,7 @@ class ComplexBeamArray(OES_Object):
         #self.element = array(self.nelements, dtype='|S8')
 
         #self.ntotal = self.nelements * nnodes
-        self.element_node = zeros((self.ntotal, 2), idtype)
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), idtype)
         self.sd = zeros(self.ntotal, 'float32')
 
         # the number is messed up because of the offset for the element's properties
@@ -73,7 +75,7 @@ class ComplexBeamArray(OES_Object):
             #raise RuntimeError(msg)
 
         #[sxc, sxd, sxe, sxf]
-        self.data = zeros((self.ntimes, self.ntotal, 4), cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 4), cfdtype)
 
     def finalize(self):
         #enode_sum = self.element_node.sum(axis=1)
@@ -90,9 +92,9 @@ class ComplexBeamArray(OES_Object):
         # returns unique sorted set
         inonzero = np.union1d(ielem_sdzero, isd_nonzero)
         self.nelements = len(inonzero)
-        self.element_node = self.element_node[inonzero, :]
+        self.element_node = self._take_array('element_node', inonzero)
         self.sd = self.sd[inonzero]
-        self.data = self.data[:, inonzero, :]
+        self.data = self._take_array('data', inonzero, axis=1)
 
     def _build_dataframe(self):
         """creates a pandas dataframe"""
@@ -304,7 +306,7 @@ class ComplexBeamArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -335,13 +337,35 @@ class ComplexBeamArray(OES_Object):
 
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'2i 9f')
-            struct2 = Struct(endian + b'i 9f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
+
+        # 11 stations, with the end stations getting an nid and the
+        # unused stations before the end station being 0
+        # [eid_device, (nid, sd, sxc, sxd, sxe, sxf (real), sxc, sxd, sxe, sxf (imag)) * 11]
+        istart, iend, imiddle, imiddle_element, imiddle_station = get_cbeam_station_index(eids)
+        assert len(istart) == nelements, 'nelements=%s expected=%s' % (len(istart), nelements)
+
+        dtype = get_record_dtype([
+            ('eid_device', 'i4'),
+            ('stations', [('nid', 'i4'), ('sd', 'f4'), ('real', 'f4', 4), ('imag', 'f4', 4)], 11)],
+            endian)
+        record = np.zeros(nelements, dtype=dtype)
+        record['eid_device'] = eids_device[istart]
+        nids_stations = np.zeros((nelements, 11), dtype='int32')
+        nids_stations[:, 0] = nids[istart]
+        nids_stations[:, 10] = nids[iend]
+        record['stations']['nid'] = nids_stations
+        sd_stations = np.zeros((nelements, 11), dtype='float32')
+        sd_stations[:, 0] = self.sd[istart]
+        sd_stations[imiddle_element, imiddle_station] = self.sd[imiddle]
+        sd_stations[:, 10] = self.sd[iend]
+        record['stations']['sd'] = sd_stations
+        assert record.nbytes == 4 * ntotal, 'ntotal=%s nwide=%s' % (ntotal, record.nbytes // 4)
+
+        stations = np.zeros((nelements, 11, 4), dtype=self.data.dtype)
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -349,83 +373,21 @@ class ComplexBeamArray(OES_Object):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            sxc = self.data[itime, :, 0]
-            sxd = self.data[itime, :, 1]
-            sxe = self.data[itime, :, 2]
-            sxf = self.data[itime, :, 3]
-            #[sxc, sxd, sxe, sxf]
-
-            eids = self.element_node[:, 0]
-            nids = self.element_node[:, 1]
-            ueids = np.unique(eids)
-            i_sd_zero = np.searchsorted(eids, ueids, side='left')
-            i_sd_one = np.searchsorted(eids, ueids, side='right')
-            i_wrong_index = np.where(i_sd_one == len(eids))
-            i_sd_one[i_wrong_index] = i_sd_one[i_wrong_index] - 1
-            i_sd_one -= 1
-            inid = np.union1d(i_sd_zero, i_sd_one)
-
-            nid_type = np.zeros(len(eids), dtype='bool')
-            i_sd_zero_all = np.zeros(len(eids), dtype='bool')
-            nid_type[inid] = 1
-            i_sd_zero_all[i_sd_zero] = 1
-
-            nwide = 0
-            icount = 0
-            ielement = 0
-            for eid, nid, i_sd_zeroi, nid_typei, sd, sxc, sxd, sxe, sxf in zip(eids, nids, i_sd_zero_all, nid_type, self.sd, sxc, sxd, sxe, sxf):
-                if icount == 0:
-                    eid_device = eids_device[ielement]
-                    nid = nids[ielement]
-                    data = [eid_device, nid, sd.real,
-                            sxc.real, sxd.real, sxe.real, sxf.real,
-                            sxc.imag, sxd.imag, sxe.imag, sxf.imag,] # 10
-                    op2.write(struct1.pack(*data))
-                    ielement += 1
-                    icount = 1
-                elif nid > 0 and icount > 0:
-                    # 11 total nodes, with 1, 11 getting an nid; the other 9 being
-                    # xxb sections
-                    data = [0, 0.,
-                            0., 0., 0., 0.,
-                            0., 0., 0., 0.,]
-                    #print('***adding %s\n' % (10-icount))
-                    for i in range(10 - icount):
-                        op2.write(struct2.pack(*data))
-                        nwide += len(data)
-
-                    eid_device2 = eids_device[ielement]
-                    assert eid_device == eid_device2
-                    nid = nids[ielement]
-                    data = [nid, sd.real,
-                            sxc.real, sxd.real, sxe.real, sxf.real,
-                            sxc.imag, sxd.imag, sxe.imag, sxf.imag,] # 10
-                    op2.write(struct2.pack(*data))
-                    ielement += 1
-                    icount = 0
-                else:
-                    raise RuntimeError('CBEAM OES op2 writer')
-                    #data = [0, xxb, sxc, sxd, sxe, sxf, smax, smin, smt, smc]  # 10
-                    #op2.write(struct2.pack(*data))
-                    #icount += 1
-
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                nwide += len(data)
 
-            assert ntotal == nwide, 'ntotal=%s nwide=%s' % (ntotal, nwide)
+            # [sxc, sxd, sxe, sxf]
+            datai = self.data[itime, :, :]
+            stations[:, 0, :] = datai[istart, :]
+            stations[imiddle_element, imiddle_station, :] = datai[imiddle, :]
+            stations[:, 10, :] = datai[iend, :]
+            record['stations']['real'] = stations.real
+            record['stations']['imag'] = stations.imag
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
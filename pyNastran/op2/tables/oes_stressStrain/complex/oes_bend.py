@@ -70,7 +70,7 @@ class ComplexBendArray(OES_Object):
         self._times = np.zeros(self.ntimes, 'float32')
         #self.ntotal = self.nelements * nnodes
 
-        self.element_node = np.zeros((self.ntotal, 2), 'int32')
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), 'int32')
 
         # the number is messed up because of the offset for the element's properties
         if not self.nelements * nnodes * 2 == self.ntotal:
@@ -80,7 +80,7 @@ class ComplexBendArray(OES_Object):
             raise RuntimeError(msg)
 
         # [angle, sc, sd, se, sf]
-        self.data = np.zeros((self.ntimes, self.ntotal, 5), 'complex64')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 5), 'complex64')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
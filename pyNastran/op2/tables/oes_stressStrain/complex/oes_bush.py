@@ -4,6 +4,7 @@ from numpy import zeros, searchsorted, allclose
 
 
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.f06.f06_formatting import write_imag_floats_13e, _eigenvalue_header
@@ -49,10 +50,10 @@ class ComplexCBushArray(OES_Object):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         #[tx, ty, tz, rx, ry, rz]
-        self.data = zeros((self.ntimes, self.nelements, 6), dtype='complex64')
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 6), dtype='complex64')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -179,7 +180,7 @@ class ComplexCBushArray(OES_Object):
         """
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -210,7 +211,7 @@ class ComplexCBushArray(OES_Object):
         """writes an OP2"""
         # see TestOP2.test_op2_other_01
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -226,8 +227,6 @@ class ComplexCBushArray(OES_Object):
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        eids = self.element
-
         # table 4 info
         #ntimes = self.data.shape[0]
         #nnodes = self.data.shape[1]
@@ -236,66 +235,45 @@ class ComplexCBushArray(OES_Object):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i12f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
 
+        # [eid_device, tx, ty, tz, rx, ry, rz (real), tx, ty, tz, rx, ry, rz (imag)]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('real', 'f4', 6), ('imag', 'f4', 6)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
-            #print('3, %s' % itable)
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
-            #print('4, %s' % itable)
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            tx = self.data[itime, :, 0]
-            ty = self.data[itime, :, 1]
-            tz = self.data[itime, :, 2]
-            rx = self.data[itime, :, 3]
-            ry = self.data[itime, :, 4]
-            rz = self.data[itime, :, 5]
-            for eid, itx, ity, itz, irx, iry, irz in zip(eids, tx, ty, tz, rx, ry, rz):
-                [txr, tyr, tzr, rxr, ryr, rzr,
-                 txi, tyi, tzi, rxi, ryi, rzi] = write_imag_floats_13e([itx, ity, itz, irx, iry, irz], is_mag_phase)
-                data = [
-                    eid,
-                    itx.real, ity.real, itz.real, irx.real, iry.real, irz.real,
-                    itx.imag, ity.imag, itz.imag, irx.imag, iry.imag, irz.imag]
-                op2_ascii.write('  eid=%s data=%s\n' % (eids_device, str(data)))
-                op2.write(struct1.pack(*data))
+            datai = self.data[itime, :, :]
+            record['real'] = datai.real
+            record['imag'] = datai.imag
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
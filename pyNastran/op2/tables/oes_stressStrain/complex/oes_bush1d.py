@@ -48,10 +48,10 @@ class ComplexCBush1DArray(OES_Object):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = np.zeros(self.ntimes, dtype=dtype)
-        self.element = np.zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         #[tx, ty, tz, rx, ry, rz]
-        self.data = np.zeros((self.ntimes, self.nelements, 6), dtype='complex64')
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 6), dtype='complex64')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -166,7 +166,7 @@ class ComplexCBush1DArray(OES_Object):
     def _write_sort1_as_sort1(self, header, page_stamp, page_num, f06_file, msg_temp, is_mag_phase):
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
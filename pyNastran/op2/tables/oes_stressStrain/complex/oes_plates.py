@@ -6,6 +6,7 @@ from numpy import zeros
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_complex_times_dtype
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
 from pyNastran.f06.f06_formatting import write_imag_floats_13e, write_float_13e
 
@@ -75,7 +76,7 @@ class ComplexTriaxStressArray(OES_Object):
         #self.ntotal = self.nelements * nnodes
 
         # TODO: could be more efficient by using nelements for cid
-        self.element_node = zeros((self.ntotal, 2), 'int32')
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), 'int32')
         #self.element_cid = zeros((self.nelements, 2), 'int32')
 
         # the number is messed up because of the offset for the element's properties
@@ -87,7 +88,7 @@ class ComplexTriaxStressArray(OES_Object):
 
         self.fiber_curvature = zeros(self.ntotal, 'float32')
         # [oxx, oyy, txy]
-        self.data = zeros((self.ntimes, self.ntotal, 3), 'complex64')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 3), 'complex64')
 
     def _get_headers(self) -> List[str]:
         return ['oxx', 'oyy', 'txy']
@@ -320,14 +321,14 @@ class ComplexPlateArray(OES_Object):
             nelement_nodes = nelements * 2
             #nelement_nodes = nelements
             # [oxx, oyy, txy, ovm]
-            self.data = zeros((ntimes, nlayers, 4), dtype=cfdtype)
+            self.data = self._build_array('data', (ntimes, nlayers, 4), dtype=cfdtype)
         else:
             # [oxx, oyy, txy]
             nelement_nodes = nlayers
-            self.data = zeros((ntimes, nlayers, 3), 'complex64')
+            self.data = self._build_array('data', (ntimes, nlayers, 3), 'complex64')
 
         # TODO: could be more efficient by using nelements for cid
-        self.element_node = zeros((nelement_nodes, 2), dtype=idtype)
+        self.element_node = self._build_array('element_node', (nelement_nodes, 2), dtype=idtype)
         #self.element_cid = zeros((self.nelements, 2), 'int32')
 
     def build_dataframe(self) -> None:
@@ -643,7 +644,7 @@ class ComplexPlateArray(OES_Object):
                   date, is_mag_phase=False, endian='>') -> int:
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -687,19 +688,31 @@ class ComplexPlateArray(OES_Object):
         #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
         op2_ascii.write('  #elementi = [eid_device, node, fds, oxx, oyy, txy...\n')
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 4s i 7f')
-            struct2 = Struct(endian + b'i 7f')
-            struct3 = Struct(endian + b'7f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
         if nnodes == 1: # CTRIA3 centroid
             itable = self._write_op2_ctria3(
                 op2, op2_ascii, new_result, itable,
-                ntotal, eids_device)
+                ntotal, eids_device, endian)
             return itable
+
+        # [eid_device, 'CEN/', (node,
+        #    fd, oxx_real, oxx_imag, oyy_real, oyy_imag, txy_real, txy_imag, (ovm),
+        #    fd, oxx_real, oxx_imag, oyy_real, oyy_imag, txy_real, txy_imag) * nnodes]
+        nvalues = 8 if self.has_von_mises else 7
+        dtype = get_record_dtype([
+            ('eid_device', 'i4'), ('cen', 'S4'),
+            ('nodes', [('nid', 'i4'), ('layer0', 'f4', nvalues), ('layer1', 'f4', 7)], nnodes)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device[::2 * nnodes]
+        record['cen'] = b'CEN/'
+        record['nodes']['nid'] = self.element_node[::2, 1].reshape(nelements, nnodes)
+        assert record.nbytes == 4 * ntotal, "nwide=%s ntotal=%s" % (record.nbytes // 4, ntotal)
+
+        values = np.empty((len(eids), nvalues), dtype='float32')
+        values[:, 0] = self.fiber_curvature
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -707,173 +720,73 @@ class ComplexPlateArray(OES_Object):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            fds = self.fiber_curvature
-            oxx = self.data[itime, :, 0]
-            oyy = self.data[itime, :, 1]
-            txy = self.data[itime, :, 2]
-
-            eids = self.element_node[:, 0]
-            nodes = self.element_node[:, 1]
-
-            ilayer0 = True
-            nwide = 0
-            if self.has_von_mises:
-                ovm = self.data[itime, :, 3]
-                for eid_device, eid, node, fd, doxx, doyy, dtxy, dovm in zip(eids_device, eids, nodes, fds, oxx, oyy, txy, ovm):
-                    if node == 0 and ilayer0:
-                        data = [eid_device, b'CEN/', node, fd,
-                                doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag,
-                                dovm.real]
-                        op2.write(struct1.pack(*data))
-                        op2_ascii.write('eid=%s node=%s data=%s' % (eid, node, str(data[2:])))
-                        #f06_file.write('0  %8i %8s  %-13s   %-13s / %-13s   %-13s / %-13s   %-13s / %s\n' % (
-                            #eid, cen, fdr, oxxr, oxxi, oyyr, oyyi, txyr, txyi))
-                    elif ilayer0:    # TODO: assuming 2 layers?
-                        data = [node, fd,
-                                doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag,
-                                dovm.real]
-                        op2.write(struct2.pack(*data))
-                        op2_ascii.write('  node=%s data=%s' % (node, str(data[2:])))
-                        #f06_file.write('   %8s %8i  %-13s   %-13s / %-13s   %-13s / %-13s   %-13s / %s\n' % (
-                            #'', node, fdr, oxxr, oxxi, oyyr, oyyi, txyr, txyi))
-                    else:
-                        data = [fd,
-                                doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag]
-                        op2.write(struct3.pack(*data))
-                        op2_ascii.write('    data=%s' % (str(data[2:])))
-                        #f06_file.write('   %8s %8s  %-13s   %-13s / %-13s   %-13s / %-13s   %-13s / %s\n\n' % (
-                            #'', '', fdr, oxxr, oxxi, oyyr, oyyi, txyr, txyi))
-                    ilayer0 = not ilayer0
-                    nwide += len(data)
-            else:
-                for eid_device, eid, node, fd, doxx, doyy, dtxy in zip(eids_device, eids, nodes, fds, oxx, oyy, txy):
-                    if node == 0 and ilayer0:
-                        data = [eid_device, b'CEN/', node, fd,
-                                doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag]
-                        op2.write(struct1.pack(*data))
-                        op2_ascii.write('eid=%s node=%s data=%s' % (eid, node, str(data[2:])))
-                        #f06_file.write('0  %8i %8s  %-13s   %-13s / %-13s   %-13s / %-13s   %-13s / %s\n' % (
-                            #eid, cen, fdr, oxxr, oxxi, oyyr, oyyi, txyr, txyi))
-                    elif ilayer0:    # TODO: assuming 2 layers?
-                        data = [node, fd,
-                                doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag]
-                        op2.write(struct2.pack(*data))
-                        op2_ascii.write('  node=%s data=%s' % (node, str(data[2:])))
-                        #f06_file.write('   %8s %8i  %-13s   %-13s / %-13s   %-13s / %-13s   %-13s / %s\n' % (
-                            #'', node, fdr, oxxr, oxxi, oyyr, oyyi, txyr, txyi))
-                    else:
-                        data = [fd,
-                                doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag]
-                        op2.write(struct3.pack(*data))
-                        op2_ascii.write('    data=%s' % (str(data[2:])))
-                        #f06_file.write('   %8s %8s  %-13s   %-13s / %-13s   %-13s / %-13s   %-13s / %s\n\n' % (
-                            #'', '', fdr, oxxr, oxxi, oyyr, oyyi, txyr, txyi))
-                    ilayer0 = not ilayer0
-                    nwide += len(data)
-
-            assert nwide == ntotal, "nwide=%s ntotal=%s" % (nwide, ntotal)
+
+            _fill_plate_values(values, self.data[itime, :, :], self.has_von_mises)
+            values_layers = values.reshape(nelements, nnodes, 2, nvalues)
+            record['nodes']['layer0'] = values_layers[:, :, 0, :]
+            record['nodes']['layer1'] = values_layers[:, :, 1, :7]
+            write_record(op2, op2_ascii, record, endian)
+
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
     def _write_op2_ctria3(self, op2, op2_ascii, new_result, itable,
-                          ntotal, eids_device) -> int:
-        from struct import Struct, pack
-        has_von_mises = self.has_von_mises
-        if has_von_mises:
-            struct1 = Struct(b'i 8f')
-            struct2 = Struct(b'8f')
-        else:
-            struct1 = Struct(b'i 7f')
-            struct2 = Struct(b'7f')
+                          ntotal, eids_device, endian) -> int:
+        from struct import pack
+        # [eid_device,
+        #  fd, oxx_real, oxx_imag, oyy_real, oyy_imag, txy_real, txy_imag, (ovm),
+        #  fd, oxx_real, oxx_imag, oyy_real, oyy_imag, txy_real, txy_imag, (ovm)]
+        nvalues = 8 if self.has_von_mises else 7
+        nelements = len(eids_device) // 2
+        dtype = get_record_dtype([
+            ('eid_device', 'i4'), ('layers', 'f4', (2, nvalues))], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device[::2]
+        assert record.nbytes == 4 * ntotal, (
+            f"numwide={self.num_wide} nwide={record.nbytes // 4} ntotal={ntotal} headers={self.get_headers()}")
+
+        values = np.empty((len(eids_device), nvalues), dtype='float32')
+        values[:, 0] = self.fiber_curvature
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
-            # record 4
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            fds = self.fiber_curvature
-            oxx = self.data[itime, :, 0]
-            oyy = self.data[itime, :, 1]
-            txy = self.data[itime, :, 2]
-
-            eids = self.element_node[:, 0]
-            #nodes = self.element_node[:, 1]
-
-            ilayer0 = True
-            nwide = 0
-
-            if self.has_von_mises:
-                ovm = self.data[itime, :, 3]
-                for eid_device, eid, fd, doxx, doyy, dtxy, dovm in zip(eids_device, eids, fds, oxx, oyy, txy, ovm):
-                    #ilyaer0 = True
-                    if ilayer0:
-                        ndatai = 0
-                        data = [eid_device, fd,
-                                doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag,
-                                dovm.real]
-                        op2.write(struct1.pack(*data))
-                        #op2_ascii.write('eid=%s node=%s data=%s' % (eid, node, str(data[2:])))
-                        op2_ascii.write('0  %6i   %-13s     %-13s / %-13s     %-13s / %-13s     %-13s / %s\n' % (
-                            eid, fd, doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag, ))
-                    else:
-                        data = [fd,
-                                doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag,
-                                dovm.real]
-                        op2.write(struct2.pack(*data))
-                        #op2_ascii.write('    data=%s' % (str(data[2:])))
-                        op2_ascii.write('   %6s   %-13s     %-13s / %-13s     %-13s / %-13s     %-13s / %s\n' % (
-                            '', fd, doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag))
-                    ndatai += len(data)
-                    ilayer0 = not ilayer0
-                    nwide += len(data)
-                assert nwide == ntotal, f"numwide={self.num_wide} ndatai={ndatai} nwide={nwide} ntotal={ntotal} headers={self.get_headers()}"
-            else:
-                for eid_device, eid, fd, doxx, doyy, dtxy in zip(eids_device, eids, fds, oxx, oyy, txy):
-                    #ilyaer0 = True
-                    if ilayer0:
-                        data = [eid_device, fd,
-                                doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag]
-                        op2.write(struct1.pack(*data))
-                        #op2_ascii.write('eid=%s node=%s data=%s' % (eid, node, str(data[2:])))
-                        op2_ascii.write('0  %6i   %-13s     %-13s / %-13s     %-13s / %-13s     %-13s / %s\n' % (
-                            eid, fd, doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag))
-                    else:
-                        data = [fd,
-                                doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag]
-                        op2.write(struct2.pack(*data))
-                        #op2_ascii.write('    data=%s' % (str(data[2:])))
-                        op2_ascii.write('   %6s   %-13s     %-13s / %-13s     %-13s / %-13s     %-13s / %s\n' % (
-                            '', fd, doxx.real, doxx.imag, doyy.real, doyy.imag, dtxy.real, dtxy.imag))
-                    ilayer0 = not ilayer0
-                    nwide += len(data)
-                assert nwide == ntotal, f"numwide={self.num_wide} nwide={nwide} ntotal={ntotal} headers={self.get_headers()}"
+
+            _fill_plate_values(values, self.data[itime, :, :], self.has_von_mises)
+            record['layers'] = values.reshape(nelements, 2, nvalues)
+            write_record(op2, op2_ascii, record, endian)
+
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
+def _fill_plate_values(values, data, has_von_mises: bool) -> None:
+    """
+    fills the [fd, oxx_real, oxx_imag, oyy_real, oyy_imag, txy_real, txy_imag, (ovm)]
+    values of a row of a complex plate; the fiber distance is already filled
+    """
+    oxx = data[:, 0]
+    oyy = data[:, 1]
+    txy = data[:, 2]
+    values[:, 1] = oxx.real
+    values[:, 2] = oxx.imag
+    values[:, 3] = oyy.real
+    values[:, 4] = oyy.imag
+    values[:, 5] = txy.real
+    values[:, 6] = txy.imag
+    if has_von_mises:
+        values[:, 7] = data[:, 3].real
+
 def _get_plate_msg(self, is_mag_phase=True, is_sort1=True) -> Tuple[List[str], int, bool]:
     #if self.is_von_mises:
         #von_mises = 'VON MISES'
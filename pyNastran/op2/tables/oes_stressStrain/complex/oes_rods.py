@@ -4,6 +4,7 @@ from numpy import zeros, allclose
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_complex_times_dtype
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
 from pyNastran.f06.f06_formatting import write_imag_floats_13e, _eigenvalue_header # get_key0,
 
@@ -51,10 +52,10 @@ class ComplexRodArray(OES_Object):
         dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
 
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype=idtype)
+        self.element = self._build_array('element', self.nelements, dtype=idtype)
 
         #[axial, torsion]
-        self.data = zeros((self.ntimes, self.nelements, 2), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 2), dtype=cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -179,7 +180,7 @@ class ComplexRodArray(OES_Object):
     def _write_sort1_as_sort1(self, header, page_stamp, page_num, f06_file, msg_temp, is_mag_phase):
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -200,7 +201,7 @@ class ComplexRodArray(OES_Object):
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -209,8 +210,6 @@ class ComplexRodArray(OES_Object):
             self._write_table_header(op2, op2_ascii, date)
             itable = -3
 
-        eids = self.element
-
         # table 4 info
         #ntimes = self.data.shape[0]
         #nnodes = self.data.shape[1]
@@ -219,21 +218,20 @@ class ComplexRodArray(OES_Object):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i4f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
 
+        # [eid_device, axial_real, torsion_real, axial_imag, torsion_imag]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('real', 'f4', 2), ('imag', 'f4', 2)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -241,26 +239,17 @@ class ComplexRodArray(OES_Object):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            axial = self.data[itime, :, 0]
-            torsion = self.data[itime, :, 1]
 
-            for eid_device, axiali, torsioni in zip(eids_device, axial, torsion):
-                data = [eid_device, axiali.real, torsioni.real, axiali.imag, torsioni.imag]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, tuple(data)))
-                op2.write(struct1.pack(*data))
+            datai = self.data[itime, :, :]
+            record['real'] = datai.real
+            record['imag'] = datai.imag
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -72,7 +72,7 @@ class ComplexShearArray(OES_Object):
         self._times = np.zeros(self.ntimes, dtype=dtype)
         #self.ntotal = self.nelements * nnodes
 
-        self.element = np.zeros(self.nelements, dtype=idtype)
+        self.element = self._build_array('element', self.nelements, dtype=idtype)
 
         # the number is messed up because of the offset for the element's properties
         if self.nelements != self.ntotal:
@@ -82,7 +82,7 @@ class ComplexShearArray(OES_Object):
             raise RuntimeError(msg)
 
         # [max_shear, avg_shear]
-        self.data = np.zeros((self.ntimes, self.ntotal, 2), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 2), dtype=cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -191,7 +191,7 @@ class ComplexShearArray(OES_Object):
         msg_temp = _get_cshear_msg(is_mag_phase, is_sort1)
 
         ntimes = self.data.shape[0]
-        eids = self.element
+        eids = self.element[:]
         if self.is_sort1:
             if is_sort1:
                 for itime in range(ntimes):
@@ -5,6 +5,7 @@ import numpy as np
 from numpy import zeros, concatenate
 
 from pyNastran.op2.result_objects.op2_objects import get_complex_times_dtype
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
 from pyNastran.f06.f06_formatting import write_imag_floats_13e
 
@@ -103,8 +104,8 @@ class ComplexSolidArray(OES_Object):
         #self.ntotal = self.nelements * nnodes
 
         # TODO: could be more efficient by using nelements for cid
-        self.element_node = zeros((self.ntotal, 2), dtype=idtype)
-        self.element_cid = zeros((self.nelements, 2), dtype=idtype)
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype=idtype)
+        self.element_cid = self._build_array('element_cid', (self.nelements, 2), dtype=idtype)
 
         # the number is messed up because of the offset for the element's properties
 
@@ -116,7 +117,7 @@ class ComplexSolidArray(OES_Object):
             #raise RuntimeError(msg)
 
         # [oxx, oyy, ozz, txy, tyz, txz]
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 6), dtype=cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -297,7 +298,7 @@ class ComplexSolidArray(OES_Object):
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -327,16 +328,31 @@ class ComplexSolidArray(OES_Object):
         eids = self.element_node[:, 0]
         eids_device = eids * 10 + self.device_code
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'2i 4s 2i 12f')
-            struct2 = Struct(endian + b'i 12f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
 
-        #cid = 0
         unused_msg_temp, nnodes = get_f06_header(self, is_mag_phase, is_sort1=True)
+
+        # [eid_device, cid, 'GRID', nnodes, (node,
+        #     oxx, oyy, ozz, txy, tyz, txz (real),
+        #     oxx, oyy, ozz, txy, tyz, txz (imag)) * (nnodes + 1)]
+        nodes = self.element_node[:, 1]
+        nnodes_all = len(nodes) // nelements
+        assert nnodes_all * nelements == len(nodes) and (nodes[::nnodes_all] == 0).all(), (
+            'nnodes_all=%s nelements=%s nodes=%s' % (nnodes_all, nelements, nodes))
+        dtype = get_record_dtype([
+            ('eid_device', 'i4'), ('cid', 'i4'), ('cen', 'S4'), ('nnodes', 'i4'),
+            ('nodes', [('nid', 'i4'), ('real', 'f4', 6), ('imag', 'f4', 6)], nnodes_all)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device[::nnodes_all]
+        record['cid'] = self.element_cid[:, 1]
+        record['cen'] = b'GRID'
+        record['nnodes'] = nnodes
+        record['nodes']['nid'] = nodes.reshape(nelements, nnodes_all)
+        assert record.nbytes == 4 * ntotal, 'nwide=%s ntotal=%s' % (record.nbytes // 4, ntotal)
+
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -344,70 +360,17 @@ class ComplexSolidArray(OES_Object):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            oxx = self.data[itime, :, 0]
-            oyy = self.data[itime, :, 1]
-            ozz = self.data[itime, :, 2]
-            txy = self.data[itime, :, 3]
-            tyz = self.data[itime, :, 4]
-            txz = self.data[itime, :, 5]
-
-            eids2 = self.element_node[:, 0]
-            nodes = self.element_node[:, 1]
-            assert len(eids2) == len(oxx)
-            #print(len(eids2), self.num_wide)
-            #(eid_device, cid, ctype, nodef) = out
-            #(grid,
-             #exr, eyr, ezr, etxyr, etyzr, etzxr,
-            #exi, eyi, ezi, etxyi, etyzi, etzxi) = out
-
-            nwide = 0
-            ielement = -1
-            for eid_device, deid, node, doxx, doyy, dozz, dtxy, dtyz, dtxz in zip(eids_device, eids2, nodes, oxx, oyy, ozz, txy, tyz, txz):
 
-                if node == 0:  # CENTER
-                    ielement += 1
-                    cid = self.element_cid[ielement, 1]
-                    data = [eid_device, cid, b'GRID', nnodes, node,
-                            doxx.real, doyy.real, dozz.real, dtxy.real, dtyz.real, dtxz.real,
-                            doxx.imag, doyy.imag, dozz.imag, dtxy.imag, dtyz.imag, dtxz.imag]
-                    #op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, tuple(data)))
-                    op2.write(struct1.pack(*data))
-
-                    op2_ascii.write(
-                        '0 %12i %11sGRID CS %2i GP\n'
-                        '0   %22s    %-13s  %-13s  %-13s    %-13s  %-13s  %s\n'
-                        '    %22s    %-13s  %-13s  %-13s    %-13s  %-13s  %s\n' % (
-                            deid, cid, nnodes,
-                            'CENTER', doxx.real, doyy.real, dozz.real, dtxy.real, dtyz.real, dtxz.real,
-                            '', doxx.imag, doyy.imag, dozz.imag, dtxy.imag, dtyz.imag, dtxz.imag,
-                    ))
-                else:
-                    data = [node,
-                            doxx.real, doyy.real, dozz.real, dtxy.real, dtyz.real, dtxz.real,
-                            doxx.imag, doyy.imag, dozz.imag, dtxy.imag, dtyz.imag, dtxz.imag]
-                    op2.write(struct2.pack(*data))
-                    op2_ascii.write(
-                        '0   %22s    %-13s  %-13s  %-13s    %-13s  %-13s  %s\n'
-                        '    %22s    %-13s  %-13s  %-13s    %-13s  %-13s  %s\n' % (
-                            node, doxx.real, doyy.real, dozz.real, dtxy.real, dtyz.real, dtxz.real,
-                            '', doxx.imag, doyy.imag, dozz.imag, dtxy.imag, dtyz.imag, dtxz.imag,
-                    ))
-                nwide += len(data)
-                #print(data)
-            assert nwide == ntotal, 'nwide=%s ntotal=%s' % (nwide, ntotal)
+            datai = self.data[itime, :, :].reshape(nelements, nnodes_all, 6)
+            record['nodes']['real'] = datai.real
+            record['nodes']['imag'] = datai.imag
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
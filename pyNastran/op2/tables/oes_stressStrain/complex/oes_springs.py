@@ -4,6 +4,7 @@ from numpy import zeros
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_complex_times_dtype
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.f06.f06_formatting import write_imag_floats_13e, _eigenvalue_header
@@ -59,10 +60,10 @@ class ComplexSpringDamperArray(OES_Object):
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, cfdtype = get_complex_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype=idtype)
+        self.element = self._build_array('element', self.nelements, dtype=idtype)
 
         #[spring_stress]
-        self.data = zeros((self.ntimes, self.ntotal, 1), dtype=cfdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 1), dtype=cfdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -180,7 +181,7 @@ class ComplexSpringDamperArray(OES_Object):
 
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         #is_odd = False
         #nwrite = len(eids)
         #if len(eids) % 2 == 1:
@@ -212,7 +213,8 @@ class ComplexSpringDamperArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
+        from pyNastran.op2.op2_interface.utils import to_mag_phase
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -231,26 +233,26 @@ class ComplexSpringDamperArray(OES_Object):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i2f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
+
+        # [eid_device, stress_real, stress_imag]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('real', 'f4'), ('imag', 'f4')], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -258,27 +260,16 @@ class ComplexSpringDamperArray(OES_Object):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            from pyNastran.op2.op2_interface.utils import to_mag_phase
             stress = self.data[itime, :, 0]
-            reals, imags = to_mag_phase(stress, is_mag_phase)
-
-            for eid, stress_real, stress_imag in zip(eids_device, reals, imags):
-                data = [eid, stress_real, stress_imag]
-                op2_ascii.write(f'  eid={eid} stress={[stress_real, stress_imag]}\n')
-                op2.write(struct1.pack(*data))
+            record['real'], record['imag'] = to_mag_phase(stress, is_mag_phase)
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
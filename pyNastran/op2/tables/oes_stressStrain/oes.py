@@ -2218,7 +2218,6 @@ class OES(OP2Common):
 
         slot = self.get_result(result_name)
         if result_type == 0 and self.num_wide == 111:  # real
-            # TODO: vectorize
             ntotal = 444 * self.factor # 44 + 10*40  (11 nodes)
 
             if self.is_stress:
@@ -2237,8 +2236,27 @@ class OES(OP2Common):
 
             ntotal = self.num_wide * 4 * self.factor
             nelements = ndata // ntotal
-            if self.use_vector and is_vectorized and 0:
-                raise NotImplementedError('CBEAM-2-real not vectorized')
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * 11
+
+                # chop off eid
+                floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, 111)[:, 1:]
+                floats2 = floats.reshape(nelements * 11, 10)
+                ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, 111)
+                ints2 = ints[:, 1:].reshape(nelements * 11, 10)
+                eids, dt = self.get_eids_dt(data, nelements, 111, dt)
+
+                #  0    1   2    3    4    5    6     7     8    9
+                # grid, sd, sxc, sxd, sxe, sxf, smax, smin, mst, msc
+                obj._times[obj.itime] = dt
+                obj.element_node[itotal:itotal2, 0] = repeat(eids, 11)
+                obj.element_node[itotal:itotal2, 1] = ints2[:, 0]
+                obj.xxb[itotal:itotal2] = floats2[:, 1]
+                obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 2:]
+                obj.itotal = itotal2
+                obj.ielement += nelements
             else:
                 if is_vectorized and self.use_vector:  # pragma: no cover
                     self.log.debug('vectorize CBEAM real SORT%s' % self.sort_method)
@@ -2268,7 +2286,7 @@ class OES(OP2Common):
 
             nnodes = 10  # 11-1
             #ntotal = self.num_wide * 4
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 itotal = obj.itotal
                 itotal2 = itotal + nelements * 11
@@ -2276,17 +2294,16 @@ class OES(OP2Common):
                 # chop off eid
                 floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, 111)[:, 1:]
                 floats2 = floats.reshape(nelements * 11, 10).copy()
+                eids, dt = self.get_eids_dt(data, nelements, 111, dt)
 
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
+                if obj.itime == 0 or self.sort_method == 2:
                     ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, 111)
-                    eids = ints[:, 0] // 10
                     eids2 = array([eids] * 11, dtype='int32').T.ravel()
 
                     ints2 = ints[:, 1:].reshape(nelements * 11, 10)
 
                     nids = ints2[:, 0]
-                    assert eids.min() > 0, eids.min()
                     #assert nids.min() > 0, nids.min()
                     obj.element_node[itotal:itotal2, 0] = eids2
                     obj.element_node[itotal:itotal2, 1] = nids
@@ -2307,7 +2324,6 @@ class OES(OP2Common):
                                           is_magnitude_phase)
 
         elif result_type == 2 and self.num_wide == 67: # random
-            # TODO: vectorize
             ntotal = 268 # 1 + 11*6  (11 nodes)
 
             if self.is_stress:
@@ -2327,8 +2343,27 @@ class OES(OP2Common):
             nnodes = 10  # 11-1
             ntotal = self.num_wide * 4
             nelements = ndata // ntotal
-            if self.use_vector and is_vectorized and 0:
-                raise NotImplementedError('CBEAM-2-random not vectorized')
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * 11
+
+                # chop off eid
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, 67)[:, 1:]
+                floats2 = floats.reshape(nelements * 11, 6)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nelements, 67)
+                ints2 = ints[:, 1:].reshape(nelements * 11, 6)
+                eids, dt = self.get_eids_dt(data, nelements, 67, dt)
+
+                #  0    1   2    3    4    5
+                # grid, sd, sxc, sxd, sxe, sxf
+                obj._times[obj.itime] = dt
+                obj.element_node[itotal:itotal2, 0] = repeat(eids, 11)
+                obj.element_node[itotal:itotal2, 1] = ints2[:, 0]
+                obj.xxb[itotal:itotal2] = floats2[:, 1]
+                obj.data[obj.itime, itotal:itotal2, :] = floats2[:, 2:]
+                obj.itotal = itotal2
+                obj.ielement += nelements
             else:
                 if is_vectorized and self.use_vector:  # pragma: no cover
                     self.log.debug('vectorize CBEAM random SORT%s' % self.sort_method)
@@ -2856,6 +2891,43 @@ class OES(OP2Common):
                 obj.data[obj.itime, itotal:itotal2, 9] = floats1[:, 8]
                 obj.itotal = itotal2
                 obj.ielement = itotali
+            elif self.use_vector and is_vectorized and self.sort_method == 2:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * nnodes_expected
+                eids, dt = self.get_eids_dt(data, nelements, numwide_real, dt)
+
+                # (eid_device, cid, abcd, nnodes)
+                ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, numwide_real)
+                cids = ints[:, 1]
+                ints1 = ints[:, 4:].reshape(nelements, nnodes_expected, 21)
+
+                # the centroid is node 0
+                nids = ints1[:, :, 0].copy()
+                nids[:, 0] = 0
+
+                # the element_cid index wraps around for each time
+                ielements = (obj.ielement + np.arange(nelements)) % obj.nelements
+                obj.element_cid[ielements, 0] = eids
+                obj.element_cid[ielements, 1] = cids
+                obj.element_node[itotal:itotal2, 0] = repeat(eids, nnodes_expected)
+                obj.element_node[itotal:itotal2, 1] = nids.ravel()
+
+                #(grid_device,
+                    #sxx, sxy, s1, a1, a2, a3, pressure, svm,
+                    #syy, syz, s2, b1, b2, b3,
+                    #szz, sxz, s3, c1, c2, c3)
+                floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, numwide_real)[:, 4:]
+                floats1 = floats.reshape(nelements * nnodes_expected, 21)
+                max_mid_min = floats1[:, [3, 11, 17]]
+                max_mid_min.sort(axis=1)
+
+                obj._times[obj.itime] = dt
+                obj.data[obj.itime, itotal:itotal2, :6] = floats1[:, [1, 9, 15, 2, 10, 16]]
+                obj.data[obj.itime, itotal:itotal2, 6:9] = max_mid_min[:, [2, 1, 0]]
+                obj.data[obj.itime, itotal:itotal2, 9] = floats1[:, 8]
+                obj.itotal = itotal2
+                obj.ielement = int(ielements[-1]) + 1
             else:
                 if is_vectorized and self.use_vector:  # pragma: no cover
                     self.log.debug('vectorize CSolid real SORT%s' % self.sort_method)
@@ -2935,7 +3007,7 @@ class OES(OP2Common):
 
             obj = self.obj
 
-            if self.use_vector and is_vectorized and self.sort_method == 1:
+            if self.use_vector and is_vectorized:
                 n = nelements * ntotal
                 ielement = obj.ielement
                 ielement2 = ielement + nelements
@@ -2944,15 +3016,14 @@ class OES(OP2Common):
 
                 floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, numwide_imag)
                 floats1 = floats[:, 4:].reshape(nelements * nnodes_expected, 13).copy()
+                eids, dt = self.get_eids_dt(data, nelements, numwide_imag, dt)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
+                if obj.itime == 0 or self.sort_method == 2:
                     ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, numwide_imag)
                     ints1 = ints[:, 4:].reshape(nelements * nnodes_expected, 13)
-                    eids = ints[:, 0] // 10
                     cids = ints[:, 1]
                     nids = ints1[:, 0]
                     # TODO: ctype, nodef not considered
-                    assert eids.min() > 0, eids.min()
                     assert nids.min() >= 0, nids.min()
                     eids2 = np.vstack([eids] * nnodes_expected).T.ravel()
                     #nids2 = np.vstack([nids] * nnodes_expected).T.ravel()
@@ -2960,8 +3031,11 @@ class OES(OP2Common):
                     obj.element_node[itotal:itotal2, 0] = eids2
                     obj.element_node[itotal:itotal2, 1] = nids
 
-                    obj.element_cid[ielement:ielement2, 0] = eids
-                    obj.element_cid[ielement:ielement2, 1] = cids
+                    # the element_cid is only filled for the first time
+                    nelements_cid = max(min(ielement2, obj.nelements) - ielement, 0)
+                    ielement_cid2 = ielement + nelements_cid
+                    obj.element_cid[ielement:ielement_cid2, 0] = eids[:nelements_cid]
+                    obj.element_cid[ielement:ielement_cid2, 1] = cids[:nelements_cid]
 
                 # 0 is nid
                 isave1 = [1, 2, 3, 4, 5, 6]
@@ -3034,68 +3108,35 @@ class OES(OP2Common):
                 return nelements * self.num_wide * 4, None, None
 
             obj = self.obj
-            if self.use_vector and is_vectorized and 0:  # pragma: no cover
-                n = nelements * 4 * self.num_wide
-                itotal = obj.ielement
-                itotali = obj.itotal + nelements
-                itotal2 = obj.itotal + nelements * nnodes_expected
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * nnodes_expected
+                eids, dt = self.get_eids_dt(data, nelements, numwide_random, dt)
+
+                # (eid_device, cid, abcd, nnodes)
+                ints = frombuffer(data, dtype=self.idtype).reshape(nelements, numwide_random)
+                cids = ints[:, 1]
+                ints1 = ints[:, 4:].reshape(nelements, nnodes_expected, 7)
+
+                # the centroid is node 0
+                nids = ints1[:, :, 0].copy()
+                nids[:, 0] = 0
+
+                # the element_cid index wraps around for each time
+                ielements = (obj.ielement + np.arange(nelements)) % obj.nelements
+                obj.element_cid[ielements, 0] = eids
+                obj.element_cid[ielements, 1] = cids
+                obj.element_node[itotal:itotal2, 0] = repeat(eids, nnodes_expected)
+                obj.element_node[itotal:itotal2, 1] = nids.ravel()
+
+                # (grid_device, sxx, syy, szz, txy, tyz, txz)
+                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_random)[:, 4:]
+                floats1 = floats.reshape(nelements * nnodes_expected, 7)
                 obj._times[obj.itime] = dt
-                if obj.itime == 0:
-                    # (eid_device, cid, abcd, nnodes)
-                    ints = frombuffer(data, dtype=self.idtype).copy()
-                    try:
-                        ints1 = ints.reshape(nelements, numwide_real)
-                    except ValueError:
-                        msg = 'ints.shape=%s; size=%s ' % (str(ints.shape), ints.size)
-                        msg += 'nelements=%s numwide_real=%s nelements*numwide=%s' % (
-                            nelements, numwide_real, nelements * numwide_real)
-                        raise ValueError(msg)
-                    eids = ints1[:, 0] // 10
-                    cids = ints1[:, 1]
-                    #nids = ints1[:, 4]
-                    assert eids.min() > 0, eids.min()
-                    obj.element_node[itotal:itotal2, 0] = repeat(eids, nnodes_expected)
-                    ints2 = ints1[:, 4:].reshape(nelements * nnodes_expected, 21)
-                    grid_device = ints2[:, 0]#.reshape(nelements, nnodes_expected)
-
-                    #print('%s-grid_device=%s' % (self.element_name, grid_device))
-                    unused_grid_device2 = repeat(grid_device, nnodes_expected)
-                    try:
-                        obj.element_node[itotal:itotal2, 1] = grid_device
-                    except ValueError:
-                        msg = '%s; nnodes=%s\n' % (self.element_name, nnodes_expected)
-                        msg += 'itotal=%s itotal2=%s\n' % (itotal, itotal2)
-                        msg += 'grid_device.shape=%s; size=%s\n' % (str(grid_device.shape), grid_device.size)
-                        #msg += 'nids=%s' % nids
-                        raise ValueError(msg)
-                    obj.element_cid[itotal:itotali, 0] = eids
-                    obj.element_cid[itotal:itotali, 1] = cids
-
-                floats = frombuffer(data, dtype=self.fdtype).reshape(nelements, numwide_real)[:, 4:]
-                # 1     9    15   2    10   16  3   11  17   8
-                #[oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovm]
-                #isave = [1, 9, 15, 2, 10, 16, 3, 11, 17, 8]
-                #(grid_device,
-                    #sxx, sxy, s1, a1, a2, a3, pressure, svm,
-                    #syy, syz, s2, b1, b2, b3,
-                    #szz, sxz, s3, c1, c2, c3)
-                floats1 = floats.reshape(nelements * nnodes_expected, 21)#[:, 1:] # drop grid_device
-
-                # o1/o2/o3 is not max/mid/min.  They are not consistently ordered, so we force it.
-                max_mid_min = np.vstack([
-                    floats1[:, 3],
-                    floats1[:, 11],
-                    floats1[:, 17],
-                ]).T
-                max_mid_min.sort(axis=1)
-                assert max_mid_min.shape == (nelements * nnodes_expected, 3), max_mid_min.shape
-                obj.data[obj.itime, itotal:itotal2, 6:9] = max_mid_min[:, [2, 1, 0]]
-
-                #obj.data[obj.itime, itotal:itotal2, :] = floats1[:, isave]
-                obj.data[obj.itime, itotal:itotal2, :6] = floats1[:, [1, 9, 15, 2, 10, 16]]
-                obj.data[obj.itime, itotal:itotal2, 9] = floats1[:, 8]
+                obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
                 obj.itotal = itotal2
-                obj.ielement = itotali
+                obj.ielement = int(ielements[-1]) + 1
             else:
                 if is_vectorized and self.use_vector and obj.itime == 0:  # pragma: no cover
                     self.log.debug('vectorize CSolid random SORT%s' % self.sort_method)
@@ -4149,51 +4190,23 @@ class OES(OP2Common):
                 #21 CY RS
                 #22 CZ RS
                 #Words 3 through 22 repeat 027 times
-                struct1 = Struct(self._endian + self._analysis_code_fmt + b'4s')
-                struct2 = Struct(self._endian + b'i19f')
+                # the results aren't saved, so the data is only unpacked for the debug file
+                n = nelements * ntotal
                 if self.is_debug_file:
-                    #msg = (
-                        #f'{self.element_name}-{self.element_type} nelements={nelements} '
-                        #f'nnodes={nnodes_expected}; '
-                        #'C=[sxx, syy, szz, txy, tyz, txz, pressure, '
-                        #'evol, exx, eyy, ezz, exy, eyz, exz]\n')
-                    self.binary_debug.write(msg)
-
-                for unused_i in range(nelements):
-                    edata = data[n:n+8]
-                    out = struct1.unpack(edata)
-                    (eid_device, unused_abcd, ) = out
-                    eid, dt = get_eid_dt_from_eid_device(
-                        eid_device, self.nonlinear_factor, self.sort_method)
-
-                    if self.is_debug_file:
+                    struct1 = Struct(self._endian + self._analysis_code_fmt + b'4s')
+                    struct2 = Struct(self._endian + b'i19f')
+                    n2 = 0
+                    for unused_i in range(nelements):
+                        out = struct1.unpack(data[n2:n2+8])
+                        (eid_device, unused_abcd, ) = out
+                        eid, dt = get_eid_dt_from_eid_device(
+                            eid_device, self.nonlinear_factor, self.sort_method)
                         self.binary_debug.write('%s - eid=%i; %s\n' % (preline1, eid, str(out)))
-                    #assert nnodes < 21, 'print_block(data[n:n+16])'  #self.print_block(data[n:n+16])
-
-                    n += 8
-                    for inode in range(nnodes_expected):  # nodes pts, no centroid
-                        out = struct2.unpack(data[n:n + 80]) # 4*20 = 80
-                        if self.is_debug_file:
+                        n2 += 8
+                        for unused_inode in range(nnodes_expected):  # nodes pts, no centroid
+                            out = struct2.unpack(data[n2:n2 + 80]) # 4*20 = 80
                             self.binary_debug.write('%s - %s\n' % (preline2, str(out)))
-                        #(grid_device, sxx, syy, szz, txy, tyz, txz, pressure,
-                         #evol, exx, eyy, ezz, exy, eyz, exz) = out
-                        #print(out)
-
-                        if self.is_debug_file:
-                            self.binary_debug.write('  eid=%s inode=%i; C=[%s]\n' % (
-                                eid, grid_device, ', '.join(['%r' % di for di in out])))
-
-                        #grid = grid_device
-                        #if 0:
-                            #if inode == 0:
-                                ##  this is correct, but fails
-                                ##element_name = self.element_name + str(nnodes)
-                                #obj.add_eid_sort1(element_name, cid, dt, eid, grid,
-                                                  #sxx, syy, szz, txy, tyz, txz, ovm)
-                            #else:
-                                #obj.add_node_sort1(dt, eid, inode, grid,
-                                                   #sxx, syy, szz, txy, tyz, txz, ovm)
-                        n += 80
+                            n2 += 80
             self.log.warning(f'skipping {self.table_name_str}: {self.element_name}-{self.element_type} linear hyperelastic {word}')
         else:  # pragma: no cover
             raise RuntimeError(self.code_information() +
@@ -4561,10 +4574,32 @@ class OES(OP2Common):
                 return nelements * ntotal, None, None
 
             n = 0
-            s1 = Struct(self._endian + self._analysis_code_fmt + b'4s')
-            s2 = Struct(self._endian + b'i15f')
             nelements = ndata // ntotal
             obj = self.obj
+            if self.use_vector and is_vectorized:
+                n = nelements * ntotal
+                itotal = obj.itotal
+                itotal2 = itotal + nelements * nnodes
+                eids, dt = self.get_eids_dt(data, nelements, numwide_random, dt)
+
+                # (eid_device, ctype)
+                # (grid,
+                #  sx, sy, sz, sxy, syz, sxz, se, eps, ecs,
+                #  ex, ey, ez, exy, eyz, exz)
+                ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, numwide_random)
+                floats = frombuffer(data, dtype=self.fdtype8).reshape(nelements, numwide_random)
+                ints1 = ints[:, 2:].reshape(nelements * nnodes, 16)
+                floats1 = floats[:, 2:].reshape(nelements * nnodes, 16)
+
+                obj._times[obj.itime] = dt
+                obj.element_node[itotal:itotal2, 0] = repeat(eids, nnodes)
+                obj.element_node[itotal:itotal2, 1] = ints1[:, 0]
+                obj.data[obj.itime, itotal:itotal2, :] = floats1[:, 1:]
+                obj.itotal = itotal2
+                return n, nelements, ntotal
+
+            s1 = Struct(self._endian + self._analysis_code_fmt + b'4s')
+            s2 = Struct(self._endian + b'i15f')
             for unused_i in range(nelements):  # 2+16*9 = 146 -> 146*4 = 584
                 edata = data[n:n+8]
                 n += 8
@@ -7842,6 +7877,42 @@ class OES(OP2Common):
             assert eids.min() > 0, eids.min()
             obj.element[ielement:ielement2] = eids
 
+    def get_eids_dt(self, data: bytes, nelements: int, numwide: int, dt: Any) -> Tuple[Any, Any]:
+        """
+        Vectorized version of ``get_eid_dt_from_eid_device``
+
+        Parameters
+        ----------
+        data : bytes
+            the element data
+        nelements : int
+            the number of elements in data
+        numwide : int
+            the number of words per element
+        dt : int/float
+            the current time/mode/frequency
+
+        Returns
+        -------
+        eids : (nelements, ) int ndarray
+            the element ids
+        dt : int/float
+            the time/mode/frequency; for SORT2, the eid_device is the time,
+            so this is the time of the last element like the unvectorized method
+
+        """
+        if self.sort_method == 1:
+            ints = frombuffer(data, dtype=self.idtype8).reshape(nelements, numwide)
+            eids = ints[:, 0] // 10
+        else:
+            # SORT2: the element id is in table 3
+            dtype = self.fdtype8 if self._analysis_code_fmt == b'f' else self.idtype8
+            eid_devices = frombuffer(data, dtype=dtype).reshape(nelements, numwide)[:, 0]
+            eids = np.full(nelements, self.nonlinear_factor, dtype=self.idtype8)
+            dt = eid_devices[-1]
+        assert eids.min() > 0, eids.min()
+        return eids, dt
+
 
 def oes_cquad4_33_complex_17(self, data: bytes,
                              obj: Union[ComplexPlateStressArray, ComplexPlateStrainArray],
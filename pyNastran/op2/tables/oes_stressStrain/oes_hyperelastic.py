@@ -95,7 +95,7 @@ class HyperelasticQuadArray(OES_Object):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = np.zeros(self.ntimes, dtype=dtype)
-        self.element_node = np.zeros((self.ntotal, 2), dtype='int32')
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype='int32')
 
         #self.Type[eid] = Type
         #self.oxx[dt] = {eid: [oxx]}
@@ -107,7 +107,7 @@ class HyperelasticQuadArray(OES_Object):
 
 
         #[oxx, oyy, txy, angle, majorp, minorp]
-        self.data = np.zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 6), dtype='float32')
 
     #def build_dataframe(self):
         #"""creates a pandas dataframe"""
@@ -112,10 +112,10 @@ class RealNonlinearPlateArray(OES_Object):
             #self.element_name, self.element_type, nnodes_per_element, self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
         self._times = np.zeros(self.ntimes, dtype=dtype)
-        self.element = np.zeros(self.nelements, dtype=idtype)
+        self.element = self._build_array('element', self.nelements, dtype=idtype)
 
         #[fiber_dist, oxx, oyy, ozz, txy, es, eps, ecs, exx, eyy, ezz, etxy]
-        self.data = np.zeros((self.ntimes, self.ntotal, 12), dtype=fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 12), dtype=fdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -344,7 +344,7 @@ class RealNonlinearPlateArray(OES_Object):
 
         # write the f06
         ntimes = self.data.shape[0]
-        eids = self.element
+        eids = self.element[:]
 
         #cen_word = 'CEN/%i' % nnodes
         for itime in range(ntimes):
@@ -511,11 +511,11 @@ class RealNonlinearSolidArray(OES_Object):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = np.zeros(self.ntimes, dtype=dtype)
-        self.element_node = np.zeros((self.ntotal, 2), dtype='int32')
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype='int32')
 
         #[sx, sy, sz, sxy, syz, sxz, se, eps, ecs,
         # ex, ey, ez, exy, eyz, exz]
-        self.data = np.zeros((self.ntimes, self.ntotal, 15), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 15), dtype='float32')
 
     #def build_dataframe(self):
         #"""creates a pandas dataframe"""
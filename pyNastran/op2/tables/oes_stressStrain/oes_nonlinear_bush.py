@@ -2,6 +2,7 @@ from typing import List
 import numpy as np
 
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import OES_Object
 from pyNastran.f06.f06_formatting import write_floats_12e, _eigenvalue_header # write_floats_13e,
 
@@ -68,11 +69,11 @@ class RealNonlinearBushArray(OES_Object): # 226-CBUSHNL
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = np.zeros(self.ntimes, dtype=dtype)
-        self.element = np.zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         #[fx, fy, fz, otx, oty, otz, etx, ety, etz,
         # mx, my, mz, orx, ory, orz, erx, ery, erz]
-        self.data = np.zeros((self.ntimes, self.nelements, 18), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 18), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -204,7 +205,7 @@ class RealNonlinearBushArray(OES_Object): # 226-CBUSHNL
     def _write_sort1_as_sort1(self, header, page_stamp, page_num, f06_file, msg_temp):
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         #is_odd = False
         #nwrite = len(eids)
 
@@ -259,7 +260,7 @@ class RealNonlinearBushArray(OES_Object): # 226-CBUSHNL
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -275,84 +276,48 @@ class RealNonlinearBushArray(OES_Object): # 226-CBUSHNL
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        eids = self.element
-
         # table 4 info
         #ntimes = self.data.shape[0]
         #nnodes = self.data.shape[1]
         nelements = self.data.shape[1]
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i18f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
 
+        # [eid_device, fx, fy, fz, otx, oty, otz, etx, ety, etz,
+        #  mx, my, mz, orx, ory, orz, erx, ery, erz]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4', 18)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
-            #print('3, %s' % itable)
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
-            #print('4, %s' % itable)
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            fx = self.data[itime, :, 0]
-            fy = self.data[itime, :, 1]
-            fz = self.data[itime, :, 2]
-            otx = self.data[itime, :, 3]
-            oty = self.data[itime, :, 4]
-            otz = self.data[itime, :, 5]
-            etx = self.data[itime, :, 6]
-            ety = self.data[itime, :, 7]
-            etz = self.data[itime, :, 8]
-
-            mx = self.data[itime, :, 9]
-            my = self.data[itime, :, 10]
-            mz = self.data[itime, :, 11]
-            orx = self.data[itime, :, 12]
-            ory = self.data[itime, :, 13]
-            orz = self.data[itime, :, 14]
-            erx = self.data[itime, :, 15]
-            ery = self.data[itime, :, 16]
-            erz = self.data[itime, :, 17]
 
-            for (eid_device, fxi, fyi, fzi, otxi, otyi, otzi, etxi, etyi, etzi, mxi, myi, mzi, orxi, oryi, orzi, erxi, eryi, erzi) in zip(
-                eids_device, fx, fy, fz, otx, oty, otz, etx, ety, etz, mx, my, mz, orx, ory, orz, erx, ery, erz):
-                data = [eid_device,
-                        fxi, fyi, fzi, otxi, otyi, otzi, etxi, etyi, etzi,
-                        mxi, myi, mzi, orxi, oryi, orzi, erxi, eryi, erzi]
-                op2_ascii.write('  eid=%s data=%s\n' % (eid_device, str(data)))
-                op2.write(struct1.pack(*data))
+            record['data'] = self.data[itime, :, :]
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
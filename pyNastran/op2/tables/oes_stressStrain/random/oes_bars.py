@@ -82,11 +82,11 @@ class RandomBarArray(OES_Object):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.ntotal, dtype='int32')
+        self.element = self._build_array('element', self.ntotal, dtype='int32')
 
         #[s1a, s2a, s3a, s4a, axial,
         # s1b, s2b, s3b, s4b]
-        self.data = zeros((self.ntimes, self.ntotal, 9), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 9), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -211,7 +211,7 @@ class RandomBarArray(OES_Object):
             header = []
         msg = self._get_msgs()
         ntimes = self.data.shape[0]
-        eids = self.element
+        eids = self.element[:]
         #print('CBAR ntimes=%s ntotal=%s' % (ntimes, ntotal))
         for itime in range(ntimes):
             dt = self._times[itime]
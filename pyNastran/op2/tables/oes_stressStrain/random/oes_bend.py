@@ -83,11 +83,11 @@ class RandomBendArray(OES_Object):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element_node = zeros((self.ntotal, 2), dtype='int32')
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype='int32')
 
         # sxc, sxd, sxe, sxf
         self.angle = zeros(self.ntotal, dtype='float32')
-        self.data = zeros((self.ntimes, self.ntotal, 4), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 4), dtype='float32')
 
     def finalize(self):
         sd = self.data[0, :, 0].real
@@ -96,8 +96,8 @@ class RandomBendArray(OES_Object):
         assert i_node_zero.max() > 0, 'CBEAM element_node hasnt been filled'
         i = np.union1d(i_sd_zero, i_node_zero)
         #self.element = self.element[i]
-        self.element_node = self.element_node[i, :]
-        self.data = self.data[:, i, :]
+        self.element_node = self._take_array('element_node', i)
+        self.data = self._take_array('data', i, axis=1)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -93,7 +93,7 @@ class RandomCompositePlateArray(OES_Object):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
 
-        self.element_layer = zeros((self.ntotal, 2), dtype='int32')
+        self.element_layer = self._build_array('element_layer', (self.ntotal, 2), dtype='int32')
 
         # [oxx, oyy, txy]
         nresults = 5
@@ -103,7 +103,7 @@ class RandomCompositePlateArray(OES_Object):
 
         #[o11, o22, t12, t1z, t2z]; 5
         #[o11, o22, t12, t1z, t2z, angle, major, minor, ovm]; 9
-        self.data = zeros((self.ntimes, self.ntotal, nresults), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, nresults), dtype='float32')
 
     @property
     def has_von_mises(self):
@@ -135,7 +135,7 @@ class RandomPlateArray(OES_Object):
         #self.ntotal = self.nelements * nnodes
 
         #print(f'nelements={nelements} nlayers={nlayers} ntimes={ntimes} ntotal={ntotal}')
-        self.element_node = zeros((nlayers, 2), 'int32')
+        self.element_node = self._build_array('element_node', (nlayers, 2), 'int32')
 
         # the number is messed up because of the offset for the element's properties
         #if not self.nelements * 2 == self.ntotal:
@@ -152,7 +152,7 @@ class RandomPlateArray(OES_Object):
             nresults += 1
         #print('has_vm =', self.has_von_mises)
         #print(f'ntimes={self.ntimes} nelements={self.nelements} ntotal={self.ntotal}')
-        self.data = zeros((nx, ny, nresults), 'float32')
+        self.data = self._build_array('data', (nx, ny, nresults), 'float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
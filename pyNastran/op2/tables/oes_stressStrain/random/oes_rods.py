@@ -63,10 +63,10 @@ class RandomRodArray(OES_Object):
         self.ntimes = ntimes
         self.nelements = nelements
         self._times = zeros(ntimes, dtype=dtype)
-        self.element = zeros(nelements, dtype='int32')
+        self.element = self._build_array('element', nelements, dtype='int32')
 
         #[axial, torsion]
-        self.data = zeros((ntimes, nelements, 2), dtype='float32')
+        self.data = self._build_array('data', (ntimes, nelements, 2), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -211,7 +211,7 @@ class RandomRodArray(OES_Object):
         print('update the RandomRodArray header')
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         is_odd = False
         nwrite = len(eids)
         if len(eids) % 2 == 1:
@@ -56,10 +56,10 @@ class RandomShearArray(OES_Object):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.nelements, dtype='int32')
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         # [max_shear, avg_shear]
-        self.data = zeros((self.ntimes, self.ntotal, 2), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 2), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -163,7 +163,7 @@ class RandomShearArray(OES_Object):
         # write the f06
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         is_odd = False
         nwrite = len(eids)
         if len(eids) % 2 == 1:
@@ -56,8 +56,8 @@ class RandomSolidArray(OES_Object):
         self._times = zeros(self.ntimes, dtype=dtype)
 
         # TODO: could be more efficient by using nelements for cid
-        self.element_node = zeros((self.ntotal, 2), dtype='int32')
-        self.element_cid = zeros((self.nelements, 2), dtype='int32')
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype='int32')
+        self.element_cid = self._build_array('element_cid', (self.nelements, 2), dtype='int32')
 
         #if self.element_name == 'CTETRA':
             #nnodes = 4
@@ -68,7 +68,7 @@ class RandomSolidArray(OES_Object):
         #self.element_node = zeros((self.ntotal, nnodes, 2), 'int32')
 
         #[oxx, oyy, ozz, txy, tyz, txz]
-        self.data = zeros((self.ntimes, self.ntotal, 6), 'float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 6), 'float32')
         self.nnodes = self.element_node.shape[0] // self.nelements
         #self.data = zeros((self.ntimes, self.nelements, nnodes+1, 10), 'float32')
 
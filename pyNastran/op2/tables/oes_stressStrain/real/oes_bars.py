@@ -5,6 +5,7 @@ from numpy import zeros, searchsorted, ravel
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object, oes_data_code)
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
@@ -123,23 +124,12 @@ class RealBarArray(OES_Object):
             #self.element_name, self.element_type, nnodes_per_element, self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
 
-        _times = zeros(self.ntimes, dtype=dtype)
-        element = zeros(self.ntotal, dtype=idtype)
+        self._times = zeros(self.ntimes, dtype=dtype)
+        self.element = self._build_array('element', self.ntotal, dtype=idtype)
 
         #[s1a, s2a, s3a, s4a, axial, smaxa, smina, MS_tension,
         # s1b, s2b, s3b, s4b,        sminb, sminb, MS_compression]
-        data = zeros((self.ntimes, self.ntotal, 15), dtype=fdtype)
-        if self.load_as_h5:
-            #for key, value in sorted(self.data_code.items()):
-                #print(key, value)
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.element = group.create_dataset('element', data=element)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.element = element
-            self.data = data
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 15), dtype=fdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -268,7 +258,7 @@ class RealBarArray(OES_Object):
             header = []
         msg = self._get_msgs()
         ntimes = self.data.shape[0]
-        eids = self.element
+        eids = self.element[:]
         #print('CBAR ntimes=%s ntotal=%s' % (ntimes, ntotal))
         for itime in range(ntimes):
             dt = self._times[itime]
@@ -320,7 +310,7 @@ class RealBarArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -336,7 +326,7 @@ class RealBarArray(OES_Object):
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        eids = self.element
+        eids = self.element[:]
         eids_device = eids * 10 + self.device_code
 
         # table 4 info
@@ -347,9 +337,6 @@ class RealBarArray(OES_Object):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
@@ -359,64 +346,32 @@ class RealBarArray(OES_Object):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 15f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
+
+        # [eid_device, s1a, s2a, s3a, s4a, axial, smaxa, smina, MSt,
+        #  s1b, s2b, s3b, s4b, smaxb, sminb, MSc]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4', 15)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            s1a = self.data[itime, :, 0]
-            s2a = self.data[itime, :, 1]
-            s3a = self.data[itime, :, 2]
-            s4a = self.data[itime, :, 3]
-
-            axial = self.data[itime, :, 4]
-            smaxa = self.data[itime, :, 5]
-            smina = self.data[itime, :, 6]
-            MSt = self.data[itime, :, 7]
-
-            s1b = self.data[itime, :, 8]
-            s2b = self.data[itime, :, 9]
-            s3b = self.data[itime, :, 10]
-            s4b = self.data[itime, :, 11]
-
-            smaxb = self.data[itime, :, 12]
-            sminb = self.data[itime, :, 13]
-            MSc = self.data[itime, :, 14]
-
-            for (eid_device,
-                 s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                 s1bi, s2bi, s3bi, s4bi,         smaxbi, sminbi, MSci) in zip(
-                eids_device,
-                s1a, s2a, s3a, s4a, axial, smaxa, smina, MSt,
-                s1b, s2b, s3b, s4b,        smaxb, sminb, MSc):
-
-                data = [eid_device,
-                        s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                        s1bi, s2bi, s3bi, s4bi,         smaxbi, sminbi, MSci]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                op2.write(struct1.pack(*data))
+            record['data'] = self.data[itime, :, :]
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
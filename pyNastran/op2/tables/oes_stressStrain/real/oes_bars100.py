@@ -70,23 +70,11 @@ class RealBar10NodesArray(OES_Object):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
 
-        _times = zeros(self.ntimes, dtype=dtype)
-        element = zeros(self.ntotal, dtype='int32')
+        self._times = zeros(self.ntimes, dtype=dtype)
+        self.element = self._build_array('element', self.ntotal, dtype='int32')
 
         #[sd, sxc, sxd, sxe, sxf, axial, smax, smin, MS]
-        data = zeros((self.ntimes, self.ntotal, 9), dtype='float32')
-
-        if self.load_as_h5:
-            #for key, value in sorted(self.data_code.items()):
-                #print(key, value)
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.element = group.create_dataset('element', data=element)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.element = element
-            self.data = data
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 9), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -247,7 +235,7 @@ class RealBar10NodesArray(OES_Object):
 
     def _write_sort1_as_sort1(self, f06_file, header, page_stamp, msg, page_num):
         ntimes = self.data.shape[0]
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -1,4 +1,3 @@
-from itertools import count
 from typing import List
 
 import numpy as np
@@ -6,6 +5,8 @@ from numpy import zeros
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
+from pyNastran.op2.op2_interface.write_utils import (
+    get_record_dtype, write_record, get_cbeam_station_index)
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
@@ -84,27 +85,13 @@ class RealBeamArray(OES_Object):
             #self.element_name, self.element_type, nnodes_per_element, self.ntimes,
             #self.nelements, self.ntotal))
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
-        _times = zeros(self.ntimes, dtype=dtype)
-        element_node = zeros((self.ntotal, 2), dtype=idtype)
+        self._times = zeros(self.ntimes, dtype=dtype)
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype=idtype)
 
         # sxc, sxd, sxe, sxf
         # smax, smin, MSt, MSc
-        xxb = zeros(self.ntotal, dtype=fdtype)
-        data = zeros((self.ntimes, self.ntotal, 8), dtype=fdtype)
-
-        if self.load_as_h5:
-            #for key, value in sorted(self.data_code.items()):
-                #print(key, value)
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.element_node = group.create_dataset('element_node', data=element_node)
-            self.xxb = group.create_dataset('xxb', data=xxb)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.element_node = element_node
-            self.xxb = xxb
-            self.data = data
+        self.xxb = self._build_array('xxb', self.ntotal, dtype=fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), dtype=fdtype)
 
     def finalize(self):
         sd = self.data[0, :, 0].real
@@ -113,9 +100,9 @@ class RealBeamArray(OES_Object):
         assert i_node_zero.max() > 0, 'CBEAM element_node hasnt been filled'
         i = np.union1d(i_sd_zero, i_node_zero)
         #self.element = self.element[i]
-        self.element_node = self.element_node[i, :]
-        self.data = self.data[:, i, :]
-        self.xxb = self.xxb[i]
+        self.element_node = self._take_array('element_node', i)
+        self.data = self._take_array('data', i, axis=1)
+        self.xxb = self._take_array('xxb', i)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -313,7 +300,7 @@ class RealBeamArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -357,85 +344,52 @@ class RealBeamArray(OES_Object):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'2i 9f')
-            struct2 = Struct(endian + b'i 9f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
+
+        # 11 stations, with the end stations getting an nid and the
+        # unused stations before the end station being 0
+        # [eid_device, (nid, xxb, sxc, sxd, sxe, sxf, smax, smin, smt, smc) * 11]
+        istart, iend, imiddle, imiddle_element, imiddle_station = get_cbeam_station_index(eids)
+        assert len(istart) == nelements, 'nelements=%s expected=%s' % (len(istart), nelements)
+
+        dtype = get_record_dtype([
+            ('eid_device', 'i4'),
+            ('stations', [('nid', 'i4'), ('data', 'f4', 9)], 11)], endian)
+        record = np.zeros(nelements, dtype=dtype)
+        record['eid_device'] = eids_device[istart]
+        nids_stations = np.zeros((nelements, 11), dtype='int32')
+        nids_stations[:, 0] = nids[istart]
+        nids_stations[:, 10] = nids[iend]
+        record['stations']['nid'] = nids_stations
+        assert record.nbytes == 4 * ntotal, 'ntotal=%s nwide=%s' % (ntotal, record.nbytes // 4)
+
+        datai = np.empty((len(xxbs), 9), dtype=self.data.dtype)
+        datai[:, 0] = xxbs
+        stations = np.zeros((nelements, 11, 9), dtype=self.data.dtype)
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            sxcs = self.data[itime, :, 0]
-            sxds = self.data[itime, :, 1]
-            sxes = self.data[itime, :, 2]
-            sxfs = self.data[itime, :, 3]
-            smaxs = self.data[itime, :, 4]
-            smins = self.data[itime, :, 5]
-            smts = self.data[itime, :, 6]
-            smcs = self.data[itime, :, 7]
-
-            #eid_old = None
-            #xxb_old = None
-            icount = 0
-            nwide = 0
-            ielement = 0
-            #print('------------')
-            #print(self.element_node.shape, self.data.shape)
-            for (unused_i, xxb, sxc, sxd, sxe, sxf, smax, smin, smt, smc) in zip(
-                    count(), xxbs, sxcs, sxds, sxes, sxfs, smaxs, smins, smts, smcs):
-
-                if icount == 0:
-                    eid_device = eids_device[ielement]
-                    nid = nids[ielement]
-                    data = [eid_device, nid, xxb, sxc, sxd, sxe, sxf, smax, smin, smt, smc] # 11
-                    op2.write(struct1.pack(*data))
-                    ielement += 1
-                    icount = 1
-                elif xxb == 1.0:
-                    # 11 total nodes, with 1, 11 getting an nid; the other 9 being
-                    # xxb sections
-                    data = [0, 0., 0., 0., 0., 0., 0., 0., 0., 0.]
-                    #print('***adding %s\n' % (10-icount))
-                    for unused_j in range(10 - icount):
-                        op2.write(struct2.pack(*data))
-                        nwide += len(data)
-
-                    eid_device2 = eids_device[ielement]
-                    assert eid_device == eid_device2
-                    nid = nids[ielement]
-                    data = [nid, xxb, sxc, sxd, sxe, sxf, smax, smin, smt, smc] # 11
-                    op2.write(struct2.pack(*data))
-                    ielement += 1
-                    icount = 0
-                else:
-                    data = [0, xxb, sxc, sxd, sxe, sxf, smax, smin, smt, smc]  # 10
-                    op2.write(struct2.pack(*data))
-                    icount += 1
-
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                nwide += len(data)
 
-            assert ntotal == nwide, 'ntotal=%s nwide=%s' % (ntotal, nwide)
+            # [xxb, sxc, sxd, sxe, sxf, smax, smin, smt, smc]
+            datai[:, 1:] = self.data[itime, :, :]
+            stations[:, 0, :] = datai[istart, :]
+            stations[imiddle_element, imiddle_station, :] = datai[imiddle, :]
+            stations[:, 10, :] = datai[iend, :]
+            record['stations']['data'] = stations
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -504,7 +458,7 @@ class RealNonlinearBeamArray(OES_Object):
             #self.nelements, self.ntotal))
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element_node = zeros((self.ntotal, 3), dtype=idtype)
+        self.element_node = self._build_array('element_node', (self.ntotal, 3), dtype=idtype)
 
         #gridA, CA, long_CA, eqS_CA, tE_CA, eps_CA, ecs_CA,
         #       DA, long_DA, eqS_DA, tE_DA, eps_DA, ecs_DA,
@@ -515,7 +469,7 @@ class RealNonlinearBeamArray(OES_Object):
         #       EB, long_EB, eqS_EB, tE_EB, eps_EB, ecs_EB,
         #       FB, long_FB, eqS_FB, tE_FB, eps_FB, ecs_FB,
         #self.xxb = zeros(self.ntotal, dtype='float32')
-        self.data = zeros((self.ntimes, self.ntotal, 5), dtype=fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 5), dtype=fdtype)
 
     def get_stats(self, short=False) -> List[str]:
         if not self.is_built:
@@ -68,7 +68,7 @@ class RealBendArray(OES_Object):
         self._times = np.zeros(self.ntimes, 'float32')
         #self.ntotal = self.nelements * nnodes
 
-        self.element_node = np.zeros((self.ntotal, 2), 'int32')
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), 'int32')
 
         # the number is messed up because of the offset for the element's properties
         if not self.nelements * nnodes * 2 == self.ntotal:
@@ -78,7 +78,7 @@ class RealBendArray(OES_Object):
             raise RuntimeError(msg)
 
         # [angle, sc, sd, se, sf, omax, omin, mst, msc]
-        self.data = np.zeros((self.ntimes, self.ntotal, 9), 'float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 9), 'float32')
 
     #def build_dataframe(self):
         #"""creates a pandas dataframe"""
@@ -3,6 +3,7 @@ import numpy as np
 from numpy import zeros
 
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
 
@@ -73,23 +74,11 @@ class RealBushArray(OES_Object):
         dtype = 'float32'
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
-        _times = zeros(self.ntimes, dtype=dtype)
-        element = zeros(self.ntotal, dtype='int32')
+        self._times = zeros(self.ntimes, dtype=dtype)
+        self.element = self._build_array('element', self.ntotal, dtype='int32')
 
         # [tx, ty, tz, rx, ry, rz]
-        data = zeros((self.ntimes, self.ntotal, 6), dtype='float32')
-
-        if self.load_as_h5:
-            #for key, value in sorted(self.data_code.items()):
-                #print(key, value)
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.element = group.create_dataset('element', data=element)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.element = element
-            self.data = data
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 6), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -221,7 +210,7 @@ class RealBushArray(OES_Object):
             header = []
         msg = self._get_msgs()
         (ntimes, unused_ntotal) = self.data.shape[:2]
-        eids = self.element
+        eids = self.element[:]
 
         for itime in range(ntimes):
             dt = self._times[itime]
@@ -252,7 +241,7 @@ class RealBushArray(OES_Object):
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -268,8 +257,6 @@ class RealBushArray(OES_Object):
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        eids = self.element
-
         # table 4 info
         #ntimes = self.data.shape[0]
         #nnodes = self.data.shape[1]
@@ -278,73 +265,43 @@ class RealBushArray(OES_Object):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i6f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
 
+        # [eid_device, tx, ty, tz, rx, ry, rz]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4', 6)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
-            #print('3, %s' % itable)
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
-            #print('4, %s' % itable)
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            tx = self.data[itime, :, 0]
-            ty = self.data[itime, :, 1]
-            tz = self.data[itime, :, 2]
-            rx = self.data[itime, :, 3]
-            ry = self.data[itime, :, 4]
-            rz = self.data[itime, :, 5]
-
-            for eid, eid_device, txi, tyi, tzi, rxi, ryi, rzi in zip(
-                    eids, eids_device, tx, ty, tz, rx, ry, rz):
-                data = [eid_device, txi, tyi, tzi, rxi, ryi, rzi]
-
-                vals = [txi, tyi, tzi, rxi, ryi, rzi]
-                vals2 = write_floats_13e(vals)
-                [txi, tyi, tzi, rxi, ryi, rzi] = vals2
-                op2_ascii.write('0                   %8i     %-13s %-13s %-13s %-13s %-13s %s\n' % (
-                        eid, txi, tyi, tzi, rxi, ryi, rzi))
-                op2.write(struct1.pack(*data))
 
-            #for eid, axiali, SMai, torsioni, SMti in zip(eids_device, axial, SMa, torsion, SMt):
-                #data = [eid, axiali, SMai, torsioni, SMti]
-                #op2_ascii.write('  eid=%s axial=%s SMa=%s torsion=%s SMt=%s\n' % tuple(data))
-                #op2.write(struct1.pack(*data))
+            record['data'] = self.data[itime, :, :]
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
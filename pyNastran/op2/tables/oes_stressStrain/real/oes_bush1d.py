@@ -82,11 +82,11 @@ class RealBush1DStressArray(OES_Object):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = zeros(self.ntimes, dtype=dtype)
-        self.element = zeros(self.ntotal, dtype='int32')
-        self.is_failed = zeros((self.ntimes, self.ntotal, 1), dtype='int32')
+        self.element = self._build_array('element', self.ntotal, dtype='int32')
+        self.is_failed = self._build_array('is_failed', (self.ntimes, self.ntotal, 1), dtype='int32')
 
         # [element_force, axial_displacement, axial_velocity, axial_stress, axial_strain, plastic_strain, is_failed]
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 6), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -218,7 +218,7 @@ class RealBush1DStressArray(OES_Object):
             header = []
         msg = self._get_msgs()
         ntimes = self.data.shape[0]
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
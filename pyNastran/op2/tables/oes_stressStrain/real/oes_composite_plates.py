@@ -3,6 +3,7 @@ import numpy as np
 from numpy import zeros, searchsorted, unique, ravel
 
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.f06.f06_formatting import write_floats_12e, _eigenvalue_header
@@ -81,23 +82,11 @@ class RealCompositePlateArray(OES_Object):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
 
-        _times = zeros(self.ntimes, dtype=dtype)
-        element_layer = zeros((self.ntotal, 2), dtype='int32')
+        self._times = zeros(self.ntimes, dtype=dtype)
+        self.element_layer = self._build_array('element_layer', (self.ntotal, 2), dtype='int32')
 
         #[o11, o22, t12, t1z, t2z, angle, major, minor, ovm]
-        data = zeros((self.ntimes, self.ntotal, 9), dtype='float32')
-
-        if self.load_as_h5:
-            #for key, value in sorted(self.data_code.items()):
-                #print(key, value)
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.element_layer = group.create_dataset('element_layer', data=element_layer)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.element_layer = element_layer
-            self.data = data
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 9), dtype='float32')
 
     def build_dataframe(self):
         """
@@ -388,7 +377,7 @@ class RealCompositePlateArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -428,64 +417,34 @@ class RealCompositePlateArray(OES_Object):
         op2_ascii.write('  #elementi = [eid_device, fd1, sx1, sy1, txy1, angle1, major1, minor1, vm1,\n')
         op2_ascii.write('  #                        fd2, sx2, sy2, txy2, angle2, major2, minor2, vm2,]\n')
 
-        #struct1 = Struct(endian + b'i16f')
-        struct2 = Struct(endian + b'2i 9f')
         if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
         ntimes = self.data.shape[0]
 
+        # [eid_device, layer, o11, o22, t12, t1z, t2z, angle, major, minor, ovm]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('layer', 'i4'), ('data', 'f4', 9)], endian)
+        record = np.empty(nlayers, dtype=dtype)
+        record['eid_device'] = eids_device
+        record['layer'] = layers
+        assert record.nbytes == 4 * ntotal, "nwide=%s ntotal=%s" % (record.nbytes // 4, ntotal)
         for itime in range(ntimes):
-            nwide = 0
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            #dt = self._times[itime]
-            #header = _eigenvalue_header(self, header, itime, ntimes, dt)
-            #f06_file.write(''.join(header + msg))
-
-            #[o11, o22, t12, t1z, t2z, angle, major, minor, ovm]
-            o11 = self.data[itime, :, 0]
-            o22 = self.data[itime, :, 1]
-            t12 = self.data[itime, :, 2]
-            t1z = self.data[itime, :, 3]
-            t2z = self.data[itime, :, 4]
-            angle = self.data[itime, :, 5]
-            major = self.data[itime, :, 6]
-            minor = self.data[itime, :, 7]
-            ovm = self.data[itime, :, 8]
-
-            for eid_device, eid, layer, o11i, o22i, t12i, t1zi, t2zi, anglei, majori, minori, ovmi in zip(
-                    eids_device, eids, layers, o11, o22, t12, t1z, t2z, angle, major, minor, ovm):
-
-                data = [eid_device, layer, o11i, o22i, t12i, t1zi, t2zi, anglei, majori, minori, ovmi]
-                op2.write(struct2.pack(*data))
-
-                [o11i, o22i, t12i, t1zi, t2zi, majori, minori, ovmi] = write_floats_12e([
-                    o11i, o22i, t12i, t1zi, t2zi, majori, minori, ovmi])
-                op2_ascii.write('0 %8s %4s  %12s %12s %12s   %12s %12s  %6.2F %12s %12s %s\n'
-                                % (eid, layer, o11i, o22i, t12i, t1zi, t2zi, anglei, majori, minori, ovmi))
 
-                nwide += len(data)
+            record['data'] = self.data[itime, :, :]
+            write_record(op2, op2_ascii, record, endian)
 
-            assert nwide == ntotal, "nwide=%s ntotal=%s" % (nwide, ntotal)
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -74,23 +74,11 @@ class NonlinearGapStressArray(OES_Object):
             #self.element_name, self.element_type, nnodes_per_element,
             #self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
-        _times = zeros(self.ntimes, dtype=dtype)
-        element = zeros(self.ntotal, dtype=idtype)
+        self._times = zeros(self.ntimes, dtype=dtype)
+        self.element = self._build_array('element', self.ntotal, dtype=idtype)
 
         # [comp_x, shear_y, shear_z, axial_u, shear_v, shear_w, slip_v, slip_w]
-        data = zeros((self.ntimes, self.ntotal, 8), dtype=fdtype)
-
-        if self.load_as_h5:
-            #for key, value in sorted(self.data_code.items()):
-                #print(key, value)
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.element = group.create_dataset('element', data=element)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.element = element
-            self.data = data
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), dtype=fdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -223,7 +211,7 @@ class NonlinearGapStressArray(OES_Object):
             header = []
         msg = self._get_msgs()
         (ntimes, ntotal) = self.data.shape[:2]
-        eids = self.element
+        eids = self.element[:]
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
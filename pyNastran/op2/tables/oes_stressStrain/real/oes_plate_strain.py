@@ -81,10 +81,10 @@ class RealCPLSTRNPlateArray(OES_Object):
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
         self._times = np.zeros(self.ntimes, dtype=dtype)
-        self.element = np.zeros(self.ntotal, dtype='int32')
+        self.element = self._build_array('element', self.ntotal, dtype='int32')
 
         #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-        self.data = np.zeros((self.ntimes, self.ntotal, 5), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 5), dtype='float32')
 
     def __eq__(self, table):  # pragma: no cover
         self._eq_header(table)
@@ -8,6 +8,7 @@ from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
 
 
@@ -96,22 +97,11 @@ class RealPlateArray(OES_Object):
             #self.nelements, self.ntotal))
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
 
-        _times = np.zeros(self.ntimes, dtype=dtype)
-        element_node = np.zeros((self.ntotal, 2), dtype=idtype)
+        self._times = np.zeros(self.ntimes, dtype=dtype)
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype=idtype)
 
         #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-        data = np.zeros((self.ntimes, self.ntotal, 8), dtype=fdtype)
-        if self.load_as_h5:
-            #for key, value in sorted(self.data_code.items()):
-                #print(key, value)
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.element_node = group.create_dataset('element_node', data=element_node)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.element_node = element_node
-            self.data = data
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), dtype=fdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -396,7 +386,7 @@ class RealPlateArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -412,8 +402,6 @@ class RealPlateArray(OES_Object):
         else:
             nnodes_all = nnodes
         #print("nnodes_all =", nnodes_all)
-        cen_word_ascii = 'CEN/%i' % nnodes
-        cen_word = b'CEN/%i' % nnodes
 
         #msg.append('  element_node.shape = %s\n' % str(self.element_node.shape).replace('L', ''))
         #msg.append('  data.shape=%s\n' % str(self.data.shape).replace('L', ''))
@@ -437,87 +425,52 @@ class RealPlateArray(OES_Object):
         op2_ascii.write('  #elementi = [eid_device, fd1, sx1, sy1, txy1, angle1, major1, minor1, vm1,\n')
         op2_ascii.write('  #                        fd2, sx2, sy2, txy2, angle2, major2, minor2, vm2,]\n')
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i16f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
+
+        if self.element_type in [33, 74, 227, 228]:
+            # CQUAD4, CTRIA3, CTRIAR-linear, CQUADR-linear
+            dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4', 16)], endian)
+            record = np.empty(nelements, dtype=dtype)
+            record['eid_device'] = eids_device[::2]
+        elif self.element_type in [64, 70, 75, 82, 144]:
+            # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
+            # bilinear
+            dtype = get_record_dtype([
+                ('eid_device', 'i4'), ('cen', 'S4'),
+                ('nodes', [('nid', 'i4'), ('data', 'f4', 16)], nnodes_all)], endian)
+            record = np.empty(nelements, dtype=dtype)
+            record['eid_device'] = eids_device[::2 * nnodes_all]
+            record['cen'] = b'CEN/'
+            record['nodes']['nid'] = nids[::2].reshape(nelements, nnodes_all)
+        else:  # pragma: no cover
+            msg = f'element_name={self.element_name} element_type={self.element_type}'
+            raise NotImplementedError(msg)
+        assert record.nbytes == 4 * ntotal, 'nwide=%s ntotal=%s' % (record.nbytes // 4, ntotal)
+
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            fiber_dist = self.data[itime, :, 0]
-            oxx = self.data[itime, :, 1]
-            oyy = self.data[itime, :, 2]
-            txy = self.data[itime, :, 3]
-            angle = self.data[itime, :, 4]
-            major_principal = self.data[itime, :, 5]
-            minor_principal = self.data[itime, :, 6]
-            ovm = self.data[itime, :, 7]
 
-            nwide = 0
-            for (i, eid_device, eid, nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi) in zip(
-                 count(), eids_device, eids, nids, fiber_dist, oxx, oyy, txy, angle, major_principal, minor_principal, ovm):
-                ilayer = i % 2
-                # tria3
-                if self.element_type in [33, 74, 227, 228]:
-                    # CQUAD4, CTRIA3, CTRIAR-linear, CQUADR-linear
-                    if ilayer == 0:
-                        #print([eid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi])
-                        data = [eid_device, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
-                        op2.write(pack('i8f', *data))
-                        op2_ascii.write('eid=%s ilayer=0 data=%s' % (eid, str(data[1:])))
-
-                    else:
-                        data = [fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
-                        op2.write(pack('8f', *data))
-                        op2_ascii.write('eid=%s ilayer=1 data=%s' % (eid, str(data[1:])))
-                    #print('eid=%-2s ilayer=%s data=%s' % (eid_device, ilayer, str(data[1:])))
-
-                elif self.element_type in [64, 70, 75, 82, 144]:
-                    # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
-                    # bilinear
-                    if nid == 0 and ilayer == 0:  # CEN
-                        data = [eid_device, cen_word, nid,
-                                fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
-                        op2.write(pack('i 4s i 8f', *data))
-                        op2_ascii.write('0  %8i %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            eid, cen_word_ascii, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 0:
-                        data = [nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
-                        op2.write(pack('i 8f', *data))
-                        op2_ascii.write('   %8s %8i  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            '', nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 1:
-                        data = [fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
-                        op2.write(pack('8f', *data))
-                        op2_ascii.write('   %8s %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n\n' % (
-                            '', '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    else:  # pragma: no cover
-                        raise RuntimeError()
-                else:  # pragma: no cover
-                    msg = f'element_name={self.element_name} element_type={self.element_type}'
-                    raise NotImplementedError(msg)
-                nwide += len(data)
+            # the 2 layers of a node are a row
+            datai = self.data[itime, :, :].reshape(nelements, -1, 16)
+            if self.element_type in [33, 74, 227, 228]:
+                record['data'] = datai[:, 0, :]
+            else:
+                record['nodes']['data'] = datai
+            write_record(op2, op2_ascii, record, endian)
 
-            assert nwide == ntotal, "nwide=%s ntotal=%s" % (nwide, ntotal)
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -3,6 +3,7 @@ import numpy as np
 from numpy import zeros, searchsorted, allclose
 
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object, oes_data_code)
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header #, get_key0
@@ -112,23 +113,11 @@ class RealRodArray(OES_Object):
         """actually performs the build step"""
         self.ntimes = ntimes
         self.nelements = nelements
-        _times = zeros(ntimes, dtype=dtype)
-        element = zeros(nelements, dtype=idtype)
+        self._times = zeros(ntimes, dtype=dtype)
+        self.element = self._build_array('element', nelements, dtype=idtype)
 
         #[axial, torsion, SMa, SMt]
-        data = zeros((ntimes, nelements, 4), dtype=fdtype)
-
-        if self.load_as_h5:
-            #for key, value in sorted(self.data_code.items()):
-                #print(key, value)
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.element = group.create_dataset('element', data=element)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.element = element
-            self.data = data
+        self.data = self._build_array('data', (ntimes, nelements, 4), dtype=fdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -270,7 +259,7 @@ class RealRodArray(OES_Object):
     def _write_sort1_as_sort1(self, header, page_stamp, page_num, f06_file, msg_temp):
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         is_odd = False
         nwrite = len(eids)
         if len(eids) % 2 == 1:
@@ -307,7 +296,7 @@ class RealRodArray(OES_Object):
                   is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -323,8 +312,6 @@ class RealRodArray(OES_Object):
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        unused_eids = self.element
-
         # table 4 info
         #ntimes = self.data.shape[0]
         #nnodes = self.data.shape[1]
@@ -333,59 +320,42 @@ class RealRodArray(OES_Object):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i4f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
 
+        # [eid_device, axial, SMa, torsion, SMt]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4', 4)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
-            #print('3, %s' % itable)
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
-            #print('4, %s' % itable)
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            axial = self.data[itime, :, 0]
-            SMa = self.data[itime, :, 1]
-            torsion = self.data[itime, :, 2]
-            SMt = self.data[itime, :, 3]
 
-            for eid, axiali, SMai, torsioni, SMti in zip(eids_device, axial, SMa, torsion, SMt):
-                data = [eid, axiali, SMai, torsioni, SMti]
-                op2_ascii.write('  eid=%s axial=%s SMa=%s torsion=%s SMt=%s\n' % tuple(data))
-                op2.write(struct1.pack(*data))
+            record['data'] = self.data[itime, :, :]
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
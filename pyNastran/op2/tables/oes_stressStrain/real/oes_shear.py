@@ -1,4 +1,4 @@
-from struct import Struct, pack
+from struct import pack
 import inspect
 from typing import List
 
@@ -6,6 +6,7 @@ import numpy as np
 from numpy import zeros, allclose
 
 from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
 from pyNastran.f06.f06_formatting import _eigenvalue_header #, get_key0
 
@@ -62,23 +63,11 @@ class RealShearArray(OES_Object):
         dtype = 'float32'
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
-        _times = zeros(self.ntimes, dtype=dtype)
-        element = zeros(self.nelements, dtype='int32')
+        self._times = zeros(self.ntimes, dtype=dtype)
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         # [max_shear, avg_shear, margin]
-        data = zeros((self.ntimes, self.ntotal, 3), dtype='float32')
-
-        if self.load_as_h5:
-            #for key, value in sorted(self.data_code.items()):
-                #print(key, value)
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.element = group.create_dataset('element', data=element)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.element = element
-            self.data = data
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 3), dtype='float32')
 
     def build_dataframe(self):
         """creates a pandas dataframe"""
@@ -195,7 +184,7 @@ class RealShearArray(OES_Object):
         # write the f06
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         is_odd = False
         nwrite = len(eids)
         if len(eids) % 2 == 1:
@@ -244,8 +233,6 @@ class RealShearArray(OES_Object):
             #op2_format = 'i21f'
         #s = Struct(op2_format)
 
-        unused_eids = self.element
-
         # table 4 info
         #ntimes = self.data.shape[0]
         #nnodes = self.data.shape[1]
@@ -254,59 +241,42 @@ class RealShearArray(OES_Object):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids = self.element
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 3f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('nelements=%i\n' % nelements)
 
+        # [eid_device, max_shear, avg_shear, margin]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('data', 'f4', 3)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
-            #print('3, %s' % itable)
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
-            #print('4, %s' % itable)
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            max_shear = self.data[itime, :, 0]
-            avg_shear = self.data[itime, :, 1]
-            margin = self.data[itime, :, 2]
-
-            for eid, eid_device, max_sheari, avg_sheari, margini in zip(eids, eids_device, max_shear, avg_shear, margin):
-                #[max_sheari, avg_sheari, margini] = write_floats_13e([max_sheari, avg_sheari, margini])
-                op2.write(struct1.pack(eid_device, max_sheari, avg_sheari, margini))
-                op2_ascii.write('      %8i   %13s  %10.4E %s\n' % (eid, max_sheari, avg_sheari, margini))
+            record['data'] = self.data[itime, :, :]
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -1,6 +1,6 @@
 # pylint: disable=C0301,C0103,R0913,R0914,R0904,C0111,R0201,R0902
 from itertools import count
-from struct import Struct, pack
+from struct import pack
 from typing import List
 
 import numpy as np
@@ -10,6 +10,7 @@ from numpy.linalg import eigh  # type: ignore
 from pyNastran.utils.numpy_utils import integer_types, float_types
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
 
 
@@ -116,11 +117,11 @@ class RealSolidArray(OES_Object):
 
         #print("ntimes=%s nelements=%s ntotal=%s" % (self.ntimes, self.nelements, self.ntotal))
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
-        _times = zeros(self.ntimes, dtype=dtype)
+        self._times = zeros(self.ntimes, dtype=dtype)
 
         # TODO: could be more efficient by using nelements for cid
-        element_node = zeros((self.ntotal, 2), dtype=idtype)
-        element_cid = zeros((self.nelements, 2), dtype=idtype)
+        self.element_node = self._build_array('element_node', (self.ntotal, 2), dtype=idtype)
+        self.element_cid = self._build_array('element_cid', (self.nelements, 2), dtype=idtype)
 
         #if self.element_name == 'CTETRA':
             #nnodes = 4
@@ -131,24 +132,10 @@ class RealSolidArray(OES_Object):
         #self.element_node = zeros((self.ntotal, nnodes, 2), 'int32')
 
         #[oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovmShear]
-        data = zeros((self.ntimes, self.ntotal, 10), fdtype)
-        self.nnodes = element_node.shape[0] // self.nelements
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 10), fdtype)
+        self.nnodes = self.element_node.shape[0] // self.nelements
         #self.data = zeros((self.ntimes, self.nelements, nnodes+1, 10), 'float32')
 
-        if self.load_as_h5:
-            #for key, value in sorted(self.data_code.items()):
-                #print(key, value)
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.element_node = group.create_dataset('element_node', data=element_node)
-            self.element_cid = group.create_dataset('element_cid', data=element_cid)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.element_node = element_node
-            self.element_cid = element_cid
-            self.data = data
-
     def build_dataframe(self):
         """creates a pandas dataframe"""
         import pandas as pd
@@ -449,30 +436,44 @@ class RealSolidArray(OES_Object):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            #op2_format = endian + b'2i6f'
-            struct1 = Struct(endian + b'ii4si')
-            struct2 = Struct(endian + b'i20f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
-        cen = b'GRID'
         op2_ascii.write('nelements=%i\n' % nelements)
+
+        # [eid_device, cid, 'GRID', nnodes, (node_id,
+        #     oxx, txy, o1, v01, v02, v00, p, ovm,
+        #     oyy, tyz, o2, v11, v12, v10,
+        #     ozz, txz, o3, v21, v22, v20) * (nnodes + 1)]
+        cnnodes = nnodes_expected + 1
+        dtype = get_record_dtype([
+            ('eid_device', 'i4'), ('cid', 'i4'), ('cen', 'S4'), ('nnodes', 'i4'),
+            ('nodes', [('nid', 'i4'), ('data', 'f4', 20)], cnnodes)], endian)
+        record = np.empty(nelements, dtype=dtype)
+        eids = eids2[::cnnodes]
+        isort = np.argsort(eids3, kind='stable')
+        ieid3 = isort[searchsorted(eids3, eids, sorter=isort)]
+        assert np.array_equal(eids3[ieid3], eids), 'eids=%s eids3=%s' % (eids, eids3)
+        record['eid_device'] = eids * 10 + self.device_code
+        record['cid'] = cids3[ieid3]
+        record['cen'] = b'GRID'
+        record['nnodes'] = nnodes_expected
+        record['nodes']['nid'] = nodes.reshape(nelements, cnnodes)
+        assert record.nbytes == 4 * ntotal, 'nwide=%s ntotal=%s' % (record.nbytes // 4, ntotal)
+
+        datai = np.empty((nnodes, 20), dtype=self.data.dtype)
+        stress = np.empty((nnodes, 3, 3), dtype=self.data.dtype)
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
-            #print('stress itable = %s' % itable)
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
             oxx = self.data[itime, :, 0]
             oyy = self.data[itime, :, 1]
@@ -486,51 +487,32 @@ class RealSolidArray(OES_Object):
             ovm = self.data[itime, :, 9]
             p = (o1 + o2 + o3) / -3.
 
-            #print('eids3', eids3)
-            cnnodes = nnodes_expected + 1
-            for i, deid, node_id, doxx, doyy, dozz, dtxy, dtyz, dtxz, do1, do2, do3, dp, dovm in zip(
-                    count(), eids2, nodes, oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, p, ovm):
-                #print('  eid =', deid, node_id)
-
-                j = where(eids3 == deid)[0]
-                assert len(j) > 0, j
-                cid = cids3[j][0]
-                A = [[doxx, dtxy, dtxz],
-                     [dtxy, doyy, dtyz],
-                     [dtxz, dtyz, dozz]]
-                (_lambda, v) = eigh(A)  # a hermitian matrix is a symmetric-real matrix
-
-                #node_id, oxxi, txyi, o1i, v[0, 1], v[0, 2], v[0, 0], pi, ovmi,
-                    #'', oyyi, tyzi, o2i, v[1, 1], v[1, 2], v[1, 0],
-                    #'', ozzi, txzi, o3i, v[2, 1], v[2, 2], v[2, 0]
-                    #(grid_device, sxx, sxy, s1, a1, a2, a3, pressure, svm,
-                     #syy, syz, s2, b1, b2, b3,
-                     #szz, sxz, s3, c1, c2, c3)
-
-                if i % cnnodes == 0:
-                    data = [deid * 10 + self.device_code, cid, cen, nnodes_expected]
-                    op2_ascii.write('  eid=%s cid=%s cen=%s nnodes = %s\n' % tuple(data))
-                    op2.write(
-                        struct1.pack(*data)
-                        #pack(b'2i 4s i', *data)
-                    )
-                #else:
-                op2_ascii.write('    nid=%i\n' % node_id)
-
-                data = [node_id,
-                        doxx, dtxy, do1, v[0, 1], v[0, 2], v[0, 0], dp, dovm,
-                        doyy, dtyz, do2, v[1, 1], v[1, 2], v[1, 0],
-                        dozz, dtxz, do3, v[2, 1], v[2, 2], v[2, 0], ]
-                op2_ascii.write('      oxx, txy, o1, v01, v02, v00, p, ovm = %s\n' % data[1:8])
-                op2_ascii.write('      oyy, tyz, o2, v11, v12, v10         = %s\n' % data[8:14])
-                op2_ascii.write('      ozz, txz, o3, v21, v22, v20         = %s\n' % data[14:])
-                op2.write(struct2.pack(*data))
-                i += 1
+            stress[:, 0, 0] = oxx
+            stress[:, 1, 1] = oyy
+            stress[:, 2, 2] = ozz
+            stress[:, 0, 1] = stress[:, 1, 0] = txy
+            stress[:, 1, 2] = stress[:, 2, 1] = tyz
+            stress[:, 0, 2] = stress[:, 2, 0] = txz
+            (unused_lambda, v) = eigh(stress)  # a hermitian matrix is a symmetric-real matrix
+
+            datai[:, 0] = oxx
+            datai[:, 1] = txy
+            datai[:, 2] = o1
+            datai[:, 3:6] = v[:, 0, [1, 2, 0]]
+            datai[:, 6] = p
+            datai[:, 7] = ovm
+            datai[:, 8] = oyy
+            datai[:, 9] = tyz
+            datai[:, 10] = o2
+            datai[:, 11:14] = v[:, 1, [1, 2, 0]]
+            datai[:, 14] = ozz
+            datai[:, 15] = txz
+            datai[:, 16] = o3
+            datai[:, 17:20] = v[:, 2, [1, 2, 0]]
+            record['nodes']['data'] = datai.reshape(nelements, cnnodes, 20)
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
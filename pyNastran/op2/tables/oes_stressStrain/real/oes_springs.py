@@ -6,6 +6,7 @@ from numpy import zeros
 
 from pyNastran.utils.numpy_utils import integer_types, float_types
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object, oes_data_code)
 from pyNastran.f06.f06_formatting import write_float_13e, _eigenvalue_header
@@ -187,24 +188,12 @@ class RealSpringArray(OES_Object):
         """actually performs the build step"""
         self.ntimes = ntimes
         self.nelements = nelements
-        _times = zeros(ntimes, dtype=dtype)
+        self._times = zeros(ntimes, dtype=dtype)
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
-        element = zeros(nelements, dtype=idtype)
+        self.element = self._build_array('element', nelements, dtype=idtype)
 
         #[stress]
-        data = zeros((ntimes, nelements, 1), dtype=fdtype)
-
-        if self.load_as_h5:
-            #for key, value in sorted(self.data_code.items()):
-                #print(key, value)
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.element = group.create_dataset('element', data=element)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.element = element
-            self.data = data
+        self.data = self._build_array('data', (ntimes, nelements, 1), dtype=fdtype)
 
     def build_dataframe(self):
         """creates a pandas dataframe
@@ -356,7 +345,7 @@ class RealSpringArray(OES_Object):
     def _write_sort1_as_sort1(self, header, page_stamp, page_num, f06_file, msg_temp):
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         nwrite = len(eids)
         nrows = nwrite // 4
         nleftover = nwrite - nrows * 4
@@ -392,7 +381,7 @@ class RealSpringArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -411,26 +400,26 @@ class RealSpringArray(OES_Object):
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
 
-        ntotali = self.num_wide
-        ntotal = ntotali * nelements
-
         #print('shape = %s' % str(self.data.shape))
         #assert self.ntimes == 1, self.ntimes
 
         #device_code = self.device_code
         op2_ascii.write('  ntimes = %s\n' % self.ntimes)
 
-        eids_device = self.element * 10 + self.device_code
+        eids_device = self.element[:] * 10 + self.device_code
 
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'if')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
         op2_ascii.write('%s-nelements=%i\n' % (self.element_name, nelements))
+
+        # [eid_device, stress]
+        dtype = get_record_dtype([('eid_device', 'i4'), ('stress', 'f4')], endian)
+        record = np.empty(nelements, dtype=dtype)
+        record['eid_device'] = eids_device
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -438,25 +427,15 @@ class RealSpringArray(OES_Object):
             itable -= 1
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            stress = self.data[itime, :, 0]
 
-            for eid, stressi in zip(eids_device, stress):
-                data = [eid, stressi]
-                op2_ascii.write('  eid=%s force=%s\n' % tuple(data))
-                op2.write(struct1.pack(*data))
+            record['stress'] = self.data[itime, :, 0]
+            write_record(op2, op2_ascii, record, endian)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -587,23 +566,11 @@ class RealNonlinearSpringStressArray(OES_Object):
         dtype = 'float32'
         if isinstance(self.nonlinear_factor, integer_types):
             dtype = 'int32'
-        _times = zeros(self.ntimes, dtype=dtype)
-        element = zeros(self.nelements, dtype='int32')
+        self._times = zeros(self.ntimes, dtype=dtype)
+        self.element = self._build_array('element', self.nelements, dtype='int32')
 
         #[force, stress]
-        data = zeros((self.ntimes, self.nelements, 2), dtype='float32')
-
-        if self.load_as_h5:
-            #for key, value in sorted(self.data_code.items()):
-                #print(key, value)
-            group = self._get_result_group()
-            self._times = group.create_dataset('_times', data=_times)
-            self.element = group.create_dataset('element', data=element)
-            self.data = group.create_dataset('data', data=data)
-        else:
-            self._times = _times
-            self.element = element
-            self.data = data
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 2), dtype='float32')
 
     def __eq__(self, table):  # pragma: no cover
         self._eq_header(table)
@@ -717,7 +684,7 @@ class RealNonlinearSpringStressArray(OES_Object):
         """
         ntimes = self.data.shape[0]
 
-        eids = self.element
+        eids = self.element[:]
         neids = len(eids)
         is_odd = neids % 2 == 1
         if is_odd:
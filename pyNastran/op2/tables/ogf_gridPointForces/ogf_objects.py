@@ -7,7 +7,8 @@ from pyNastran.f06.f06_formatting import (
 from pyNastran.op2.vector_utils import (
     transform_force_moment, transform_force_moment_sum, sortedsum1d)
 from pyNastran.utils.numpy_utils import integer_types
-from pyNastran.op2.op2_interface.write_utils import set_table3_field
+from pyNastran.op2.op2_interface.write_utils import (
+    set_table3_field, get_record_dtype, write_record)
 
 
 class GridPointForces(BaseElement):
@@ -207,14 +208,14 @@ class RealGridPointForcesArray(GridPointForces):
         assert self.ntotal < 2147483647, self.ntotal # max int
         if self.is_unique:
             assert isinstance(self.ntotal, integer_types), 'ntotal=%r type=%s' % (self.ntotal, type(self.ntotal))
-            self.node_element = zeros((self.ntimes, self.ntotal, 2), dtype=idtype)
+            self.node_element = self._build_array('node_element', (self.ntimes, self.ntotal, 2), dtype=idtype)
             self.element_names = empty((self.ntimes, self.ntotal), dtype='U8')
         else:
-            self.node_element = zeros((self.ntotal, 2), dtype=idtype)
+            self.node_element = self._build_array('node_element', (self.ntotal, 2), dtype=idtype)
             self.element_names = empty(self.ntotal, dtype='U8')
 
         #[t1, t2, t3, r1, r2, r3]
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype=fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 6), dtype=fdtype)
 
     def build_dataframe(self):
         """
@@ -1049,7 +1050,7 @@ class RealGridPointForcesArray(GridPointForces):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -1084,11 +1085,11 @@ class RealGridPointForcesArray(GridPointForces):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'2i 8s 6f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
+        dtype = get_record_dtype([('node_device', 'i4'), ('eid', 'i4'), ('ename', 'S8'),
+                                  ('data', 'f4', 6)], endian)
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -1096,57 +1097,32 @@ class RealGridPointForcesArray(GridPointForces):
             #print('stress itable = %s' % itable)
             itable -= 1
 
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-
             nids = self.node_element[itime, :, 0]
             eids = self.node_element[itime, :, 1]
             enames = self.element_names[itime, :]
-
-            nids_device = nids * 10 + self.device_code
             assert nids.min() > 0, nids.min()
             nnodes = len(nids)
 
-            ntotal = ntotali * nnodes
+            ntotal = self._ntotals[itime]
+            assert len(enames) == len(nids), 'enames=%s nnids=%s' % (len(enames), len(nids))
+            assert len(nids) <= ntotal, 'len(nids)=%s ntotal=%s' % (len(nids), ntotal)
+
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            #zero = ' '
-            ntotal = self._ntotals[itime]
-            #print(self._ntotals)
-            assert len(eids) == len(nids)
-            assert len(enames) == len(nids), 'enames=%s nnids=%s' % (len(enames), len(nids))
-            assert len(t1) == len(nids)
-            assert len(t2) == len(nids)
-            assert len(t3) == len(nids)
-            assert len(r1) == len(nids)
-            assert len(r2) == len(nids)
-            assert len(nids) <= ntotal, 'len(nids)=%s ntotal=%s' % (len(nids), ntotal)
-
-            for (i, nid, eid, ename, t1i, t2i, t3i, r1i, r2i, r3i) in zip(
-                 range(ntotal), nids_device, eids, enames, t1, t2, t3, r1, r2, r3):
 
-                #print(nid, eid, ename, t1i)
-                data = [nid, eid, ename.encode('ascii'), t1i, t2i, t3i, r1i, r2i, r3i]
-                #print('  nid=%s eid=%s data=%s' % (nid, eid, str(data[2:])))
-                op2_ascii.write('  nid=%-3s eid=%-3s data=%s\n' % (nid, eid, str(data[2:])))
-                op2.write(struct1.pack(*data))
+            record = np.empty(nnodes, dtype=dtype)
+            record['node_device'] = nids * 10 + self.device_code
+            record['eid'] = eids
+            record['ename'] = enames
+            record['data'] = self.data[itime, :, :]
+            nwords = write_record(op2, op2_ascii, record, endian)
+            assert nwords == ntotali * nnodes, 'nwords=%s ntotal=%s' % (nwords, ntotali * nnodes)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
 
@@ -1217,13 +1193,13 @@ class ComplexGridPointForcesArray(GridPointForces):
         self._times = zeros(self.ntimes, dtype=dtype)
 
         if self.is_unique:
-            self.node_element = zeros((self.ntimes, self.ntotal, 2), dtype=idtype)
+            self.node_element = self._build_array('node_element', (self.ntimes, self.ntotal, 2), dtype=idtype)
             self.element_names = empty((self.ntimes, self.ntotal), dtype='U8')
         else:
-            self.node_element = zeros((self.ntotal, 2), dtype=idtype)
+            self.node_element = self._build_array('node_element', (self.ntotal, 2), dtype=idtype)
             self.element_names = empty(self.ntotal, dtype='U8')
         #[t1, t2, t3, r1, r2, r3]
-        self.data = zeros((self.ntimes, self.ntotal, 6), dtype='complex64')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 6), dtype='complex64')
 
     def build_dataframe(self):
         """
@@ -1630,7 +1606,7 @@ class ComplexGridPointForcesArray(GridPointForces):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -1656,11 +1632,11 @@ class ComplexGridPointForcesArray(GridPointForces):
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'2i 8s 12f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
+        dtype = get_record_dtype([('node_device', 'i4'), ('eid', 'i4'), ('ename', 'S8'),
+                                  ('real', 'f4', 6), ('imag', 'f4', 6)], endian)
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
@@ -1672,56 +1648,30 @@ class ComplexGridPointForcesArray(GridPointForces):
             nids = nids_all[inids]
             eids = self.node_element[itime, inids, 1]
             enames = self.element_names[itime, inids]
-
-            t1 = self.data[itime, inids, 0]
-            t2 = self.data[itime, inids, 1]
-            t3 = self.data[itime, inids, 2]
-            r1 = self.data[itime, inids, 3]
-            r2 = self.data[itime, inids, 4]
-            r3 = self.data[itime, inids, 5]
-
-            nids_device = nids * 10 + self.device_code
             assert nids.min() > 0, nids.min()
             nnodes = len(nids)
 
-            ntotal = ntotali * nnodes
+            ntotal = self._ntotals[itime]
+            assert len(enames) == len(nids), 'enames=%s nnids=%s' % (len(enames), len(nids))
+            assert len(nids) <= ntotal, 'len(nids)=%s ntotal=%s' % (len(nids), ntotal)
+
             header = [4, itable, 4,
                       4, 1, 4,
-                      4, 0, 4,
-                      4, ntotal, 4,
-                      4 * ntotal]
+                      4, 0, 4]
             op2.write(pack('%ii' % len(header), *header))
             op2_ascii.write('r4 [4, 0, 4]\n')
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
-            op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
-
-            #zero = ' '
-            ntotal = self._ntotals[itime]
-            #print(self._ntotals)
-            assert len(eids) == len(nids)
-            assert len(enames) == len(nids), 'enames=%s nnids=%s' % (len(enames), len(nids))
-            assert len(t1) == len(nids)
-            assert len(t2) == len(nids)
-            assert len(t3) == len(nids)
-            assert len(r1) == len(nids)
-            assert len(r2) == len(nids)
-            assert len(nids) <= ntotal, 'len(nids)=%s ntotal=%s' % (len(nids), ntotal)
-
-            for (i, nid, eid, ename, t1i, t2i, t3i, r1i, r2i, r3i) in zip(
-                 range(ntotal), nids_device, eids, enames, t1, t2, t3, r1, r2, r3):
 
-                #print(nid, eid, ename, t1i)
-                data = [nid, eid, ename.encode('ascii'),
-                        t1i.real, t2i.real, t3i.real, r1i.real, r2i.real, r3i.real,
-                        t1i.imag, t2i.imag, t3i.imag, r1i.imag, r2i.imag, r3i.imag]
-                #print('  nid=%s eid=%s data=%s' % (nid, eid, str(data[2:])))
-                op2_ascii.write('  nid=%-3s eid=%-3s data=%s\n' % (nid, eid, str(data[2:])))
-                op2.write(struct1.pack(*data))
-                assert len(data) + 1 == self.num_wide
+            data = self.data[itime, inids, :]
+            record = np.empty(nnodes, dtype=dtype)
+            record['node_device'] = nids * 10 + self.device_code
+            record['eid'] = eids
+            record['ename'] = enames
+            record['real'] = data.real
+            record['imag'] = data.imag
+            nwords = write_record(op2, op2_ascii, record, endian)
+            assert nwords == ntotali * nnodes, 'nwords=%s ntotal=%s' % (nwords, ntotali * nnodes)
 
             itable -= 1
-            header = [4 * ntotal,]
-            op2.write(pack('i', *header))
-            op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
@@ -58,9 +58,9 @@ class GridPointSurfaceStressesArray(ScalarObject):
         self.nelements //= self.ntimes
 
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
-        self.node_element = np.zeros((self.ntotal, 2), dtype=idtype)
+        self.node_element = self._build_array('node_element', (self.ntotal, 2), dtype=idtype)
         #oxx, oyy, txy, angle, major, minor, ovm
-        self.data = np.zeros((self.ntimes, self.nelements, 8), dtype=fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.nelements, 8), dtype=fdtype)
         self.location = np.empty(self.ntotal, dtype='U8')
 
         self._times = np.zeros(self.ntimes, dtype=dtype)
@@ -290,9 +290,9 @@ class GridPointStressesVolumePrincipalArray(ScalarObject):
         self.nelements //= self.ntimes
 
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
-        self.node = np.zeros(self.ntotal, dtype=idtype)
+        self.node = self._build_array('node', self.ntotal, dtype=idtype)
         #lxa, lxb, lxc, lya, lyb, lyc, lza, lzb, lzc, sa, sb, sc, epr, ovm
-        self.data = np.zeros((self.ntimes, self.ntotal, 14), dtype=fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 14), dtype=fdtype)
         self.location = np.empty(self.ntotal, dtype='U8')
 
         self._times = np.zeros(self.ntimes, dtype=dtype)
@@ -381,9 +381,9 @@ class GridPointStressesVolumeDirectArray(ScalarObject):
         self.nelements //= self.ntimes
 
         dtype, idtype, fdtype = get_times_dtype(self.nonlinear_factor, self.size)
-        self.node = np.zeros(self.ntotal, dtype=idtype)
+        self.node = self._build_array('node', self.ntotal, dtype=idtype)
         #oxx, oyy, txy, angle, major, minor, ovm
-        self.data = np.zeros((self.ntimes, self.ntotal, 8), dtype=fdtype)
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 8), dtype=fdtype)
         self.location = np.empty(self.ntotal, dtype='U8')
         self._times = np.zeros(self.ntimes, dtype=dtype)
         self.is_built = True
@@ -570,9 +570,9 @@ class GridPointStressesSurfaceDiscontinutiesArray(ScalarObject): # tCode=35
         #self.names = []
         self.nelements //= self.ntimes
 
-        self.node = np.zeros(self.ntotal, dtype='int32')
+        self.node = self._build_array('node', self.ntotal, dtype='int32')
         #oxx, oyy, ozz, txy, pressure
-        self.data = np.zeros((self.ntimes, self.ntotal, 5), dtype='float32')
+        self.data = self._build_array('data', (self.ntimes, self.ntotal, 5), dtype='float32')
         self.location = np.empty(self.ntotal, dtype='U8')
         dtype = 'float32'
         if isinstance(self.nonlinear_factor, integer_types):
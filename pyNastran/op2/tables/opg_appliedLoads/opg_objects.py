@@ -26,7 +26,7 @@ class AppliedLoadsVectorArray(ScalarObject):
         self.eids = np.zeros(self.itotal, dtype='int32')
         self.sources = np.zeros(self.itotal, dtype='|S8')
         #[f1, f2, f3, m1, m2, m3]
-        self.data = np.zeros((self.ntimes, self.itotal, 6), dtype=self.data_type())
+        self.data = self._build_array('data', (self.ntimes, self.itotal, 6), dtype=self.data_type())
 
     def get_stats(self, short=False) -> List[str]:
         if not self.is_built:
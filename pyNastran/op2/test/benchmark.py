@@ -0,0 +1,512 @@
+"""
+Times and memory-profiles ``read_op2`` for each table and element type, so
+the hot paths (e.g., ``op2_common.py``, ``oes.py``) can be compared across
+commits.
+
+usage::
+
+    python -m pyNastran.op2.test.benchmark [OP2_FILENAME ...]
+    benchmark_op2 --synthetic 100 -o benchmark.json
+    benchmark_op2 -t -o new.json --compare old.json
+
+The report is a json file::
+
+    {
+        "version": "1.4.0+dev.xxx",
+        "files": {
+            "sol_101_elements/static_solid_shell_bar.op2": {
+                "nbytes": 1005260, "time": 0.41, "MB/s": 2.33,
+                "peak_rss_mb": 105.3,
+                "tables": {
+                    "OES1X1": {
+                        "time": 0.12, "nbytes": 80124, "MB/s": 0.64,
+                        "peak_traced_mb": 0.6,
+                        "process_peak_rss_mb": 104.9, "process_peak_increase_mb": 0.2,
+                        "elements": {
+                            "CHEXA": {"time": 0.01, "nbytes": 7652, "MB/s": 0.73},
+                            ...
+                        },
+                    },
+                    ...
+                },
+            },
+        },
+    }
+
+The time of a table is the sum of both passes of the reader (or the single
+pass), while the number of bytes is the size of the table in the file.
+With ``single_pass=True``, the two pass reader is also timed, so each file has
+a ``two_pass_time`` and a ``speedup``.
+The peak RSS is the high water mark of the process, so each OP2 is read in a
+new process.  For a table, it's the process peak after the table has been read
+(process_peak_rss_mb) and how much the table raised it
+(process_peak_increase_mb), which is 0 for a table that uses less memory than
+an earlier table.  With ``trace_memory=True``, the OP2 is read one more time
+with ``tracemalloc`` to get the peak memory that's allocated while reading each
+table (peak_traced_mb).  MB is 1024**2 bytes.
+
+"""
+import os
+import sys
+import glob
+import json
+import time
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Any
+
+import numpy as np
+from cpylog import SimpleLogger
+
+import pyNastran
+from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2_interface.parallel_reader import get_result_dicts
+from pyNastran.utils.benchmark import (
+    MB, get_process_peak_rss_mb, reset_traced_peak, get_traced_peak_mb, fmt_mb,
+    compare_benchmarks as _compare_benchmarks)
+
+PKG_PATH = pyNastran.__path__[0]
+MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
+
+#: the transient model that's repeated to make a synthetic OP2
+SYNTHETIC_BASE_FILENAME = os.path.join(
+    MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+
+
+class BenchmarkOP2(OP2):
+    """an OP2 that times each table and each element type of a table"""
+    def __init__(self, mode: Optional[str]=None):
+        log = SimpleLogger(level='error')
+        OP2.__init__(self, debug=False, log=log, mode=mode)
+        self.clear_stats()
+
+    def clear_stats(self) -> None:
+        """resets the timings"""
+        #: table_name -> time
+        self.table_time = defaultdict(float)
+        #: (read_mode, table_name) -> nbytes
+        self.table_nbytes = defaultdict(int)
+        #: table_name -> [process_peak_rss_mb, process_peak_increase_mb]
+        self.table_rss = {}
+        #: table_name -> peak_traced_mb (tracemalloc must be started)
+        self.table_traced = {}
+        #: (table_name, element_name) -> time
+        self.element_time = defaultdict(float)
+        #: (read_mode, table_name, element_name) -> nbytes
+        self.element_nbytes = defaultdict(int)
+
+    def _read_table(self, table_name: bytes) -> None:
+        """reads a table and stores the time/size/memory of it"""
+        rss0 = get_process_peak_rss_mb()
+        reset_traced_peak()
+        n0 = self.f.tell()
+        time0 = time.perf_counter()
+        OP2._read_table(self, table_name)
+        dt = time.perf_counter() - time0
+
+        name = table_name.decode('latin1')
+        self.table_time[name] += dt
+        self.table_nbytes[(self.read_mode, name)] += self.f.tell() - n0
+
+        traced = get_traced_peak_mb()
+        if traced is not None:
+            self.table_traced[name] = max(self.table_traced.get(name, 0.), traced)
+
+        rss = get_process_peak_rss_mb()
+        if rss is not None:
+            peak_rss, rss_increase = self.table_rss.get(name, (0., 0.))
+            self.table_rss[name] = (max(peak_rss, rss), max(rss_increase, rss - rss0))
+
+    def _read_subtable_results(self, table4_parser, record_len: int):
+        """reads a table 4 and stores the time/size of the element type"""
+        # the data_code is replaced when the record is done
+        data_code = getattr(self, 'data_code', {})
+        n0 = self.f.tell()
+        time0 = time.perf_counter()
+        n = OP2._read_subtable_results(self, table4_parser, record_len)
+        dt = time.perf_counter() - time0
+
+        element_name = self._get_element_name(data_code)
+        if element_name is not None:
+            name = self.table_name.decode('latin1')
+            self.element_time[(name, element_name)] += dt
+            self.element_nbytes[(self.read_mode, name, element_name)] += self.f.tell() - n0
+        return n
+
+    def _fill_single_pass_record(self, table4_parser, data, ndata: int) -> None:
+        """
+        fills a table 4 for the single pass reader, which is done after
+        the tables are read, and stores the time of the table/element type
+        """
+        data_code = getattr(self, 'data_code', {})
+        time0 = time.perf_counter()
+        OP2._fill_single_pass_record(self, table4_parser, data, ndata)
+        dt = time.perf_counter() - time0
+
+        name = self.table_name.decode('latin1')
+        self.table_time[name] += dt
+        element_name = self._get_element_name(data_code)
+        if element_name is not None:
+            self.element_time[(name, element_name)] += dt
+
+    def _get_element_name(self, data_code: Dict[str, Any]) -> Optional[str]:
+        """gets the element name of a record (None if it's not an element result)"""
+        element_type = data_code.get('element_type')
+        if element_type is None:
+            return None
+        element_name = data_code.get('element_name')
+        if element_name is None:
+            try:
+                element_name = self.get_element_type(element_type)
+            except KeyError:
+                element_name = str(element_type)
+        return element_name
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Gets the time/size/memory of each table
+
+        Returns
+        -------
+        stats : Dict[str, Dict[str, Any]]
+            table_name -> {time, nbytes, MB/s, process_peak_rss_mb,
+                           process_peak_increase_mb, [peak_traced_mb],
+                           elements : {element_name : {time, nbytes, MB/s}}}
+
+        """
+        # the tables are read in both passes, so use the largest size
+        table_nbytes = defaultdict(int)
+        for (unused_read_mode, name), nbytes in self.table_nbytes.items():
+            table_nbytes[name] = max(table_nbytes[name], nbytes)
+        element_nbytes = defaultdict(int)
+        for (unused_read_mode, name, element_name), nbytes in self.element_nbytes.items():
+            key = (name, element_name)
+            element_nbytes[key] = max(element_nbytes[key], nbytes)
+
+        stats = {}
+        for name, dt in self.table_time.items():
+            nbytes = table_nbytes[name]
+            peak_rss, rss_increase = self.table_rss.get(name, (None, None))
+            stats[name] = {
+                'time': dt,
+                'nbytes': nbytes,
+                'MB/s': _get_rate(nbytes, dt),
+                'process_peak_rss_mb': peak_rss,
+                'process_peak_increase_mb': rss_increase,
+                'elements': {},
+            }
+            if name in self.table_traced:
+                stats[name]['peak_traced_mb'] = self.table_traced[name]
+        for (name, element_name), dt in sorted(self.element_time.items()):
+            nbytes = element_nbytes[(name, element_name)]
+            stats[name]['elements'][element_name] = {
+                'time': dt,
+                'nbytes': nbytes,
+                'MB/s': _get_rate(nbytes, dt),
+            }
+        return stats
+
+
+def _get_rate(nbytes: int, dt: float) -> float:
+    """gets the read rate in MB/s"""
+    return nbytes / MB / dt if dt > 0. else 0.
+
+
+def _read_op2(op2_filename: str, single_pass: bool) -> BenchmarkOP2:
+    """reads an OP2"""
+    model = BenchmarkOP2()
+    model.read_op2(op2_filename, build_dataframe=False, single_pass=single_pass)
+    return model
+
+
+def benchmark_op2(op2_filename: str, nrepeat: int=3, single_pass: bool=False,
+                  trace_memory: bool=False) -> Dict[str, Any]:
+    """
+    Times reading an OP2 (the fastest read is used)
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 to read
+    nrepeat : int; default=3
+        the number of times to read the OP2
+    single_pass : bool; default=False
+        use the single pass reader; the two pass reader is also timed,
+        so the speedup is in the stats
+    trace_memory : bool; default=False
+        read the OP2 one more time with tracemalloc to get the peak
+        memory of each table
+
+    Returns
+    -------
+    stats : Dict[str, Any]
+        the time/size/memory of the OP2 and of each table
+        {nbytes, time, MB/s, peak_rss_mb, tables, [two_pass_time, speedup]}
+
+    """
+    stats = None
+    for unused_i in range(nrepeat):
+        time0 = time.perf_counter()
+        model = _read_op2(op2_filename, single_pass)
+        dt = time.perf_counter() - time0
+        if stats is None or dt < stats['time']:
+            nbytes = os.path.getsize(op2_filename)
+            stats = {
+                'nbytes': nbytes,
+                'time': dt,
+                'MB/s': _get_rate(nbytes, dt),
+                'peak_rss_mb': get_process_peak_rss_mb(),
+                'tables': model.get_stats(),
+            }
+        del model
+
+    if single_pass:
+        two_pass_time = None
+        for unused_i in range(nrepeat):
+            time0 = time.perf_counter()
+            model = _read_op2(op2_filename, False)
+            dt = time.perf_counter() - time0
+            del model
+            if two_pass_time is None or dt < two_pass_time:
+                two_pass_time = dt
+        stats['two_pass_time'] = two_pass_time
+        stats['speedup'] = two_pass_time / stats['time']
+
+    if trace_memory:
+        tracemalloc.start()
+        try:
+            model = _read_op2(op2_filename, single_pass)
+        finally:
+            tracemalloc.stop()
+        tables = stats['tables']
+        for name, peak_traced in model.table_traced.items():
+            if name in tables:
+                tables[name]['peak_traced_mb'] = peak_traced
+        del model
+    return stats
+
+
+def _benchmark_op2(op2_filename: str, nrepeat: int, single_pass: bool,
+                   trace_memory: bool) -> Optional[Dict[str, Any]]:
+    """times an OP2 and returns None if it can't be read"""
+    try:
+        return benchmark_op2(op2_filename, nrepeat=nrepeat, single_pass=single_pass,
+                             trace_memory=trace_memory)
+    except Exception:
+        # the OP2 can't be read, so there's nothing to time
+        return None
+
+
+def run_benchmark(op2_filenames: List[str], nrepeat: int=3, single_pass: bool=False,
+                  trace_memory: bool=False, isolate: bool=True,
+                  json_filename: Optional[str]=None) -> Dict[str, Any]:
+    """
+    Times reading a series of OP2s
+
+    Parameters
+    ----------
+    op2_filenames : List[str]
+        the OP2s to read
+    nrepeat : int; default=3
+        the number of times to read each OP2 (the fastest time is used)
+    single_pass : bool; default=False
+        use the single pass reader and compare it to the two pass reader
+    trace_memory : bool; default=False
+        get the peak memory of each table with tracemalloc
+    isolate : bool; default=True
+        read each OP2 in a new process, so the peak RSS is for that OP2
+    json_filename : str; default=None
+        the report to write
+
+    Returns
+    -------
+    report : Dict[str, Any]
+        {version, single_pass, files : {op2_filename : stats}}
+        where the op2_filename is relative to models/
+
+    """
+    files = {}
+    for op2_filename in op2_filenames:
+        if isolate:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(_benchmark_op2, op2_filename, nrepeat,
+                                         single_pass, trace_memory)
+                stats = future.result()
+        else:
+            stats = _benchmark_op2(op2_filename, nrepeat, single_pass, trace_memory)
+        if stats is None:
+            continue
+
+        key = _get_key(op2_filename)
+        files[key] = stats
+        msg = '%-60s %8.3fs %8.2f MB/s peak_rss=%s MB' % (
+            key, stats['time'], stats['MB/s'], fmt_mb(stats['peak_rss_mb']))
+        if single_pass:
+            msg += ' two_pass=%.3fs speedup=%.2f' % (stats['two_pass_time'], stats['speedup'])
+        print(msg)
+
+    if single_pass and files:
+        single_pass_time = sum(stats['time'] for stats in files.values())
+        two_pass_time = sum(stats['two_pass_time'] for stats in files.values())
+        print('nfiles=%s single_pass=%.3fs two_pass=%.3fs speedup=%.2f' % (
+            len(files), single_pass_time, two_pass_time, two_pass_time / single_pass_time))
+
+    report = {
+        'version': pyNastran.__version__,
+        'single_pass': single_pass,
+        'files': files,
+    }
+    if json_filename is not None:
+        with open(json_filename, 'w') as json_file:
+            json.dump(report, json_file, indent=1, sort_keys=True)
+    return report
+
+
+def _get_key(op2_filename: str) -> str:
+    """gets the name of the OP2 in the report"""
+    op2_filename = os.path.abspath(op2_filename)
+    if op2_filename.startswith(MODEL_PATH):
+        return os.path.relpath(op2_filename, MODEL_PATH).replace(os.sep, '/')
+    return op2_filename
+
+
+def compare_benchmarks(report_old: Dict[str, Any], report_new: Dict[str, Any],
+                       tol: float=0.2, min_time: float=0.01) -> List[str]:
+    """
+    Compares two benchmarks and finds the tables that got slower or
+    used more memory
+
+    Parameters
+    ----------
+    report_old / report_new : Dict[str, Any]
+        the reports from ``run_benchmark`` (or the loaded json files)
+    tol : float; default=0.2
+        the allowable increase in the time/peak memory (0.2 is 20%)
+    min_time : float; default=0.01
+        tables that are faster than this are too noisy to compare
+
+    Returns
+    -------
+    regressions : List[str]
+        a message for each file/table that got slower or
+        used more memory
+
+    """
+    return _compare_benchmarks(report_old, report_new, 'tables',
+                               tol=tol, min_time=min_time)
+
+
+def make_synthetic_op2(op2_filename: str, nrepeat: int=100,
+                       base_op2_filename: str=SYNTHETIC_BASE_FILENAME) -> str:
+    """
+    Makes a large OP2 by repeating the time steps of a transient model,
+    so the records have the same element types as a real model
+
+    Parameters
+    ----------
+    op2_filename : str
+        the OP2 to write
+    nrepeat : int; default=100
+        the number of times to repeat the time steps
+    base_op2_filename : str; default=SYNTHETIC_BASE_FILENAME
+        the transient OP2 to repeat
+
+    Returns
+    -------
+    op2_filename : str
+        the OP2 that was written
+
+    """
+    log = SimpleLogger(level='error')
+    model = OP2(debug=False, log=log)
+    model.read_op2(base_op2_filename, build_dataframe=False)
+    for result in get_result_dicts(model).values():
+        for obj in result.values():
+            if not hasattr(obj, '_times') or obj.data.shape[0] != obj.ntimes:
+                continue
+            times = obj._times
+            dt = times[1] - times[0] if len(times) > 1 else 1
+            ntimes = obj.ntimes * nrepeat
+            for name in ['data', 'node_element', 'element_names', 'element']:
+                # some results (e.g., grid_point_forces) have ids for each time
+                array = getattr(obj, name, None)
+                if isinstance(array, np.ndarray) and array.ndim > 1 and (
+                        array.shape[0] == obj.ntimes):
+                    setattr(obj, name, np.tile(array, (nrepeat, ) + (1, ) * (array.ndim - 1)))
+            if len(getattr(obj, '_ntotals', [])) == obj.ntimes:
+                obj._ntotals = obj._ntotals * nrepeat
+            obj._times = (times[0] + np.arange(ntimes) * dt).astype(times.dtype)
+            obj.ntimes = ntimes
+            for name in obj.data_names:
+                # e.g., dts
+                setattr(obj, name + 's', obj._times.tolist())
+    model.write_op2(op2_filename)
+    return op2_filename
+
+
+def get_benchmark_data(argv: List[str]) -> Dict[str, Any]:
+    """defines the docopt interface"""
+    from docopt import docopt
+    ver = str(pyNastran.__version__)
+    msg = (
+        "Usage:\n"
+        "  benchmark_op2 [-n NREPEAT] [-s] [-t] [--synthetic NREPEAT] [--serial] [-o JSON] [-c JSON] [OP2_FILENAME ...]\n"
+        "  benchmark_op2 -h | --help\n"
+        "  benchmark_op2 -v | --version\n"
+        "\n"
+        "Times and memory-profiles read_op2 per table and element type.\n"
+        "\n"
+        "Positional Arguments:\n"
+        "  OP2_FILENAME                   Path to OP2 file(s); default=models/**/*.op2\n"
+        "\n"
+        "Options:\n"
+        "  -n NREPEAT, --nrepeat NREPEAT  The number of reads of each OP2; the fastest\n"
+        "                                 is used [default: 3]\n"
+        "  -s, --single_pass              Use the single pass reader and compare it to\n"
+        "                                 the two pass reader\n"
+        "  -t, --trace                    Get the peak memory of each table with tracemalloc\n"
+        "  --synthetic NREPEAT            Also time a synthetic OP2, which repeats the time steps\n"
+        "                                 of sol_101_elements/transient_solid_shell_bar.op2\n"
+        "  --serial                       Reads the OP2s in this process, so the peak RSS\n"
+        "                                 is for all the OP2s that have been read\n"
+        "  -o JSON, --json JSON           Write the report to a json file\n"
+        "  -c JSON, --compare JSON        Compare against an old report\n"
+        "\n"
+        "Info:\n"
+        "  -h, --help     Show this help message and exit\n"
+        "  -v, --version  Show program's version number and exit\n"
+    )
+    return docopt(msg, version=ver, argv=argv[1:])
+
+
+def main(argv=None):  # pragma: no cover
+    """the interface for benchmark_op2"""
+    if argv is None:
+        argv = sys.argv
+    data = get_benchmark_data(argv)
+    op2_filenames = data['OP2_FILENAME']
+    if not op2_filenames:
+        op2_filenames = sorted(glob.glob(os.path.join(MODEL_PATH, '**', '*.op2'), recursive=True))
+
+    if data['--synthetic']:
+        synthetic_filename = os.path.abspath('synthetic_%s.op2' % data['--synthetic'])
+        make_synthetic_op2(synthetic_filename, nrepeat=int(data['--synthetic']))
+        op2_filenames = [synthetic_filename] + op2_filenames
+
+    report = run_benchmark(op2_filenames, nrepeat=int(data['--nrepeat']),
+                           single_pass=data['--single_pass'], trace_memory=data['--trace'],
+                           isolate=not data['--serial'],
+                           json_filename=data['--json'])
+    if data['--compare']:
+        with open(data['--compare'], 'r') as json_file:
+            report_old = json.load(json_file)
+        regressions = compare_benchmarks(report_old, report)
+        for regression in regressions:
+            print('slower: %s' % regression)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
@@ -1,5 +1,6 @@
 """various OP2 tests"""
 import os
+import copy
 import unittest
 import getpass
 
@@ -26,10 +27,15 @@ except ImportError:  # pragma: no cover
 
 import pyNastran
 from pyNastran.bdf.bdf import BDF, read_bdf, CORD2R
-from pyNastran.op2.op2 import OP2, read_op2, FatalError, FortranMarkerError
+from pyNastran.op2.op2 import OP2, read_op2, iter_op2_results, FatalError, FortranMarkerError
 from pyNastran.op2.op2_interface.op2_common import get_scode_word
+from pyNastran.op2.op2_interface.op2_index import get_op2_index, build_op2_index
+from pyNastran.op2.op2_interface.parallel_reader import (
+    OP2Chunk, ParallelReadError, split_op2_index, check_op2_chunks)
 from pyNastran.op2.op2_geom import OP2Geom, read_op2_geom
 from pyNastran.op2.test.test_op2 import run_op2, main as test_op2
+from pyNastran.op2.test.benchmark import (
+    run_benchmark, compare_benchmarks, make_synthetic_op2)
 
 from pyNastran.bdf.test.bdf_unit_tests import Tester
 from pyNastran.bdf.cards.test.utils import save_load_deck
@@ -318,6 +324,349 @@ class TestOP2(Tester):
         os.remove(op2_filename_m1_out)
         os.remove(op2_filename_m2_out)
 
+    def test_op2_mmap(self):
+        """tests that the memory mapped reader matches the file reader"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False, log=log)
+        op2_mmap = read_op2(op2_filename, debug=False, log=log, mmap=True)
+        assert op2.assert_op2_equal(op2_mmap, stop_on_failure=True)
+
+        stress = op2_mmap.ctetra_stress[1]
+        assert stress.data.flags.writeable
+        assert np.array_equal(stress.data, op2.ctetra_stress[1].data)
+
+    def test_op2_index(self):
+        """tests reading a subset of an OP2 with the table of contents"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'mode_solid_shell_bar.op2')
+        index_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'mode_solid_shell_bar.op2idx')
+        if os.path.exists(index_filename):
+            os.remove(index_filename)
+
+        op2_index = get_op2_index(op2_filename, log=log)
+        assert os.path.exists(index_filename)
+        op2_index2 = get_op2_index(op2_filename, log=log)
+        assert op2_index2.tables == op2_index.tables
+        os.remove(index_filename)
+
+        op2 = read_op2(op2_filename, debug=False, log=log)
+        op2_all = read_op2(op2_filename, debug=False, log=log, op2_index=op2_index)
+        assert op2.assert_op2_equal(op2_all, stop_on_failure=True)
+
+        op2_index_oes = op2_index.select(
+            table_names=['OES1X1'], element_types=['CTETRA'], times=[1, 2])
+        assert len(op2_index_oes) == 1
+        assert len(op2_index_oes.tables[0]['subtables']) == 2
+        op2_oes = read_op2(op2_filename, debug=False, log=log, op2_index=op2_index_oes)
+        assert len(op2_oes.eigenvectors) == 0
+        assert len(op2_oes.ctria3_stress) == 0
+        stress = op2_oes.ctetra_stress[1]
+        assert stress.modes == [1, 2], stress.modes
+        assert np.array_equal(stress.data, op2.ctetra_stress[1].data[:2, :, :])
+
+    def test_op2_index_nonlinear(self):
+        """tests the load steps of a SOL 106 OP2 are indexed as floats"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'other', 'mne7a.op2')
+        op2_index = build_op2_index(op2_filename, log=log)
+        times = [subtable['time'] for table in op2_index.tables
+                 for subtable in table['subtables'] or []]
+        assert times == [0.25, 0.5, 0.75, 1.0] * 2, times
+
+        # analysis_code=11 (old geometric nonlinear statics) also has a
+        # float load step, so change the approach codes from 10 to 11
+        with open(op2_filename, 'rb') as op2_file:
+            data = bytearray(op2_file.read())
+        for table in op2_index.tables:
+            for subtable in table['subtables'] or []:
+                # [4, -3, 4, 4, 1, 4, 4, 0, 4, 4, 146, 4, 584, approach_code, ...]
+                i = subtable['offset'] + 52
+                approach_code = np.frombuffer(data, dtype='<i4', count=1, offset=i)[0]
+                assert approach_code // 10 == 10, approach_code
+                data[i:i+4] = np.int32(approach_code + 10).tobytes()
+
+        op2_filename_11 = os.path.join(MODEL_PATH, 'other', 'mne7a_acode11.op2')
+        with open(op2_filename_11, 'wb') as op2_file:
+            op2_file.write(data)
+        try:
+            op2_index_11 = build_op2_index(op2_filename_11, log=log)
+        finally:
+            os.remove(op2_filename_11)
+        subtables = [subtable for table in op2_index_11.tables
+                     for subtable in table['subtables'] or []]
+        assert [subtable['analysis_code'] for subtable in subtables] == [11] * 8
+        assert [subtable['time'] for subtable in subtables] == times
+
+    def test_op2_single_pass(self):
+        """tests reading an OP2 with a single pass"""
+        log = get_logger(level='warning')
+        op2_filenames = [
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'mode_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'other', 'ofprand1.op2'),  # sort2
+            os.path.join(MODEL_PATH, 'sol200', 'model_200.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            op2 = read_op2(op2_filename, debug=False, log=log)
+            op2_single = read_op2(op2_filename, debug=False, log=log, single_pass=True)
+            assert op2.get_table_types() == op2_single.get_table_types()
+            assert op2.assert_op2_equal(op2_single, stop_on_failure=True)
+
+            stress = op2.ctetra_stress
+            stress_single = op2_single.ctetra_stress
+            for key, obj in stress.items():
+                assert obj.data.shape == stress_single[key].data.shape
+                assert np.array_equal(obj.data, stress_single[key].data)
+
+    def test_op2_parallel(self):
+        """tests reading the result tables with a pool of processes"""
+        log = get_logger(level='warning')
+        op2_filenames = [
+            os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2'),
+            os.path.join(MODEL_PATH, 'elements', 'modes_elements.op2'),
+        ]
+        for op2_filename in op2_filenames:
+            op2_index = build_op2_index(op2_filename, log=log)
+            chunk_indexs = split_op2_index(op2_index, 2)
+            assert len(chunk_indexs) == 2, len(chunk_indexs)
+
+            op2 = read_op2(op2_filename, debug=False, log=log)
+            op2_parallel = read_op2(op2_filename, debug=False, log=log, nworkers=2)
+            assert op2.table_names == op2_parallel.table_names
+            assert op2.assert_op2_equal(op2_parallel, stop_on_failure=True)
+            assert op2.isubcase_name_map == op2_parallel.isubcase_name_map
+            for result_name in op2.get_table_types():
+                result = op2.get_result(result_name)
+                if isinstance(result, dict):
+                    assert list(result) == list(op2_parallel.get_result(result_name)), result_name
+
+        # a result that's split between the workers can't be merged
+        chunk = OP2Chunk({'displacements' : {1 : None}}, {}, {})
+        with self.assertRaises(ParallelReadError):
+            check_op2_chunks([chunk, chunk])
+
+    def test_op2_vectorized_solid_beam(self):
+        """tests the vectorized solid/beam stress is identical to the unvectorized stress"""
+        log = get_logger(level='warning')
+        op2_filenames = [
+            os.path.join(MODEL_PATH, 'elements', 'static_elements.op2'),  # real
+            os.path.join(MODEL_PATH, 'elements', 'loadstep_elements.op2'),  # nonlinear
+            os.path.join(MODEL_PATH, 'other', 'api3.op2'),  # complex; mag/phase
+            os.path.join(MODEL_PATH, 'other', 'ofprand1.op2'),  # random; SORT2 CBEAM
+            os.path.join(MODEL_PATH, 'other', 'tr1091x.op2'),  # real; SORT2
+        ]
+        words = ('ctetra', 'cpenta', 'chexa', 'cbeam')
+        for op2_filename in op2_filenames:
+            models = []
+            for use_vector in [True, False]:
+                model = OP2(debug=False, log=log)
+                model.use_vector = use_vector
+                model.include_exclude_results(include_results=['stress', 'strain'])
+                model.read_op2(op2_filename, build_dataframe=False)
+                models.append(model)
+            op2, op2_scalar = models
+
+            nresults = 0
+            for result_name in op2.get_table_types():
+                if 'force' in result_name or not any(word in result_name for word in words):
+                    continue
+                results = op2.get_result(result_name)
+                results_scalar = op2_scalar.get_result(result_name)
+                assert list(results) == list(results_scalar), result_name
+                for key, result in results.items():
+                    result_scalar = results_scalar[key]
+                    for name in ['_times', 'element_node', 'element_cid', 'data']:
+                        if not hasattr(result, name):
+                            continue
+                        array = getattr(result, name)
+                        array_scalar = getattr(result_scalar, name)
+                        assert array.dtype == array_scalar.dtype, (result_name, name)
+                        assert array.tobytes() == array_scalar.tobytes(), (result_name, name)
+                    nresults += 1
+            assert nresults > 0, op2_filename
+
+    def test_op2_iter_results(self):
+        """tests iterating over the results one time step at a time"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'transient_solid_shell_bar.op2')
+        model = read_op2(op2_filename, log=log, build_dataframe=False)
+        displacements = model.displacements[1]
+        stress = model.ctetra_stress[1]
+
+        idisp = 0
+        result_names = set()
+        for subcase, result_name, time_step, result in iter_op2_results(
+                op2_filename, result_types=['displacements', 'stress'], log=log):
+            assert subcase == 1, subcase
+            assert result.ntimes == 1, result_name
+            assert result.data.shape[0] == 1, result_name
+            result_names.add(result_name)
+            if result_name == 'displacements':
+                assert time_step == displacements._times[idisp]
+                assert np.array_equal(result.data[0], displacements.data[idisp])
+                assert np.array_equal(result.node_gridtype, displacements.node_gridtype)
+                idisp += 1
+            elif result_name == 'stress.ctetra_stress':
+                itime = np.searchsorted(stress._times, time_step)
+                assert np.array_equal(result.data[0], stress.data[itime])
+        assert idisp == displacements.ntimes, idisp
+        assert 'stress.ctetra_stress' in result_names, result_names
+        assert not any(name.startswith('strain') for name in result_names), result_names
+
+        # the records are copied instead of memory mapped
+        idisp = 0
+        for unused_subcase, unused_result_name, unused_time_step, result in iter_op2_results(
+                op2_filename, result_types=['displacements'], log=log, mmap=False):
+            assert np.array_equal(result.data[0], displacements.data[idisp])
+            idisp += 1
+        assert idisp == displacements.ntimes, idisp
+
+        # the nodes are yielded chunk_size at a time
+        nnodes = 0
+        for unused_subcase, unused_result_name, time_step, result in iter_op2_results(
+                op2_filename, result_types=['displacements'], log=log, chunk_size=10):
+            assert result.data.shape[1] <= 10, result.data.shape
+            itime = np.searchsorted(displacements._times, time_step)
+            inode = np.searchsorted(displacements.node_gridtype[:, 0], result.node_gridtype[:, 0])
+            assert np.array_equal(result.data[0], displacements.data[itime, inode])
+            nnodes += result.data.shape[1]
+        assert nnodes == displacements.data.shape[0] * displacements.data.shape[1], nnodes
+
+        # SORT2 random results are read chunk_size nodes at a time
+        op2_filename = os.path.join(MODEL_PATH, 'other', 'ofprand1.op2')
+        model = read_op2(op2_filename, log=log, build_dataframe=False, combine=False)
+        ato = list(model.op2_results.ato.displacements.values())[0]
+        nnodes = 0
+        for unused_subcase, unused_result_name, time_step, result in iter_op2_results(
+                op2_filename, result_types=['ato.displacements'], log=log, chunk_size=2):
+            assert result.data.shape[1] <= 2, result.data.shape
+            itime = np.searchsorted(ato._times, time_step)
+            inode = np.searchsorted(ato.node_gridtype[:, 0], result.node_gridtype[:, 0])
+            assert np.array_equal(result.data[0], ato.data[itime, inode])
+            nnodes += result.data.shape[1]
+        assert nnodes == ato.data.shape[0] * ato.data.shape[1], nnodes
+
+        # the other results of the tables that are read aren't yielded
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'time_elements.op2')
+        result_names = {
+            result_name for unused_subcase, result_name, unused_time_step, unused_result
+            in iter_op2_results(op2_filename, log=log,
+                                result_types=['strain_energy.ctria3_strain_energy'])}
+        assert result_names == {'strain_energy.ctria3_strain_energy'}, result_names
+
+    @unittest.skipIf(not IS_H5PY, "No h5py")
+    def test_op2_hdf5_chunked_lazy(self):
+        """tests the chunked/compressed HDF5 export and lazy loading"""
+        log = get_logger(level='warning')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        op2_filename = os.path.join(folder, 'transient_solid_shell_bar.op2')
+        hdf5_filename = os.path.join(folder, 'transient_solid_shell_bar.chunked.h5')
+        model = read_op2(op2_filename, log=log, build_dataframe=False)
+        displacements = model.displacements[1]
+        stress = model.ctetra_stress[1]
+
+        with self.assertRaises(ValueError):
+            model.export_hdf5_filename(hdf5_filename, compression='cat')
+        model.export_hdf5_filename(hdf5_filename, compression='gzip')
+
+        model2 = OP2(debug=False, log=log)
+        model2.load_hdf5_filename(hdf5_filename, combine=True, lazy=True)
+        displacements2 = model2.displacements[1]
+        stress2 = model2.ctetra_stress[1]
+        assert isinstance(displacements2.data, h5py.Dataset)
+        assert displacements2.data.compression == 'gzip'
+        assert displacements2.data.chunks == (1, 25, 6), displacements2.data.chunks
+        assert displacements2.ntimes == displacements.ntimes
+        assert np.array_equal(displacements2.data[3, :, :], displacements.data[3, :, :])
+        assert np.array_equal(stress2.data[-1], stress.data[-1])
+        model2.h5_file.close()
+
+        model3 = OP2(debug=False, log=log)
+        model3.load_hdf5_filename(hdf5_filename, combine=True)
+        assert isinstance(model3.displacements[1].data, np.ndarray)
+        assert np.array_equal(model3.displacements[1].data, displacements.data)
+        os.remove(hdf5_filename)
+
+    @unittest.skipIf(not IS_H5PY, "No h5py")
+    def test_op2_load_as_h5(self):
+        """tests reading an OP2 out-of-core"""
+        log = get_logger(level='warning')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        op2_filename = os.path.join(folder, 'transient_solid_shell_bar.op2')
+        hdf5_filename = os.path.join(folder, 'transient_solid_shell_bar.h5')
+        model = read_op2(op2_filename, log=log, build_dataframe=False)
+        model2 = read_op2(op2_filename, log=log, build_dataframe=False, load_as_h5=True)
+
+        for result_name in ['displacements', 'ctetra_stress', 'cquad4_stress',
+                            'cbeam_stress', 'cbar_force']:
+            obj = model.get_result(result_name)[1]
+            obj2 = model2.get_result(result_name)[1]
+            assert isinstance(obj2.data, h5py.Dataset), result_name
+            assert obj2.data.shape == obj.data.shape, result_name
+            assert np.array_equal(obj2.data[()], obj.data), result_name
+        cbeam_stress = model2.cbeam_stress[1]
+        assert isinstance(cbeam_stress.element_node, h5py.Dataset)
+        assert np.array_equal(cbeam_stress.element_node[()], model.cbeam_stress[1].element_node)
+        assert model2 == model
+        model2.h5_file.close()
+
+        # the single pass/parallel readers fall back to the two pass reader
+        model3 = read_op2(op2_filename, log=log, build_dataframe=False, load_as_h5=True,
+                          single_pass=True, nworkers=2)
+        assert isinstance(model3.displacements[1].data, h5py.Dataset)
+        assert model3 == model
+        model3.h5_file.close()
+        os.remove(hdf5_filename)
+
+    def test_op2_benchmark(self):
+        """tests the per table OP2 benchmark"""
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        op2_filename = os.path.join(folder, 'static_solid_shell_bar.op2')
+        synthetic_filename = os.path.join(folder, 'synthetic.op2')
+        json_filename = os.path.join(folder, 'benchmark.json')
+        make_synthetic_op2(synthetic_filename, nrepeat=2)
+
+        model = read_op2(synthetic_filename, debug=False, build_dataframe=False)
+        assert model.displacements[1].data.shape == (84, 25, 6), model.displacements[1].data.shape
+
+        report = run_benchmark([op2_filename, synthetic_filename], nrepeat=1,
+                               trace_memory=True, isolate=False,
+                               json_filename=json_filename)
+        stats = report['files']['sol_101_elements/static_solid_shell_bar.op2']
+        assert stats['nbytes'] == os.path.getsize(op2_filename)
+        oes = stats['tables']['OES1X1']
+        assert oes['nbytes'] > 0 and oes['time'] > 0.
+        assert oes['peak_traced_mb'] > 0., oes
+        assert 'process_peak_rss_mb' in oes, oes
+        assert 'CHEXA' in oes['elements'], list(oes['elements'])
+        assert 'sol_101_elements/synthetic.op2' in report['files']
+        assert os.path.exists(json_filename)
+
+        assert compare_benchmarks(report, report) == []
+        report2 = copy.deepcopy(report)
+        report2['files']['sol_101_elements/synthetic.op2']['time'] = 100.
+        regressions = compare_benchmarks(report, report2)
+        assert len(regressions) == 1, regressions
+
+        oes2 = report2['files']['sol_101_elements/static_solid_shell_bar.op2']['tables']['OES1X1']
+        oes2['peak_traced_mb'] *= 2.
+        regressions = compare_benchmarks(report, report2)
+        assert len(regressions) == 2, regressions
+        assert 'OES1X1: peak_traced' in regressions[0], regressions
+
+        # the single pass reader is compared to the two pass reader and
+        # the records that are filled after the tables are read are timed
+        report_single = run_benchmark([synthetic_filename], nrepeat=1, single_pass=True,
+                                      isolate=False)
+        stats_single = report_single['files']['sol_101_elements/synthetic.op2']
+        assert stats_single['two_pass_time'] > 0., stats_single
+        assert stats_single['speedup'] > 0., stats_single
+        oes_single = stats_single['tables']['OES1X1']
+        assert oes_single['elements']['CHEXA']['time'] > 0., oes_single
+        os.remove(synthetic_filename)
+        os.remove(json_filename)
+
     def test_bdf_op2_elements_01(self):
         """tests a large number of elements and results in SOL 101"""
         log = get_logger(level='warning')
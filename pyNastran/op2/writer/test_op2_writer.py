@@ -1,5 +1,10 @@
 import unittest
+from unittest import mock
 import os
+from io import BytesIO, StringIO
+from struct import unpack
+
+import numpy as np
 from cpylog import get_logger
 
 import pyNastran
@@ -8,6 +13,8 @@ import pyNastran
 #from pyNastran.op2.op2_interface.op2_common import get_scode_word
 from pyNastran.op2.op2_geom import read_op2_geom#, OP2Geom,
 from pyNastran.op2.op2 import read_op2
+from pyNastran.op2.op2_interface import write_utils
+from pyNastran.op2.op2_interface.write_utils import get_record_dtype, write_record
 #from pyNastran.op2.test.test_op2 import run_op2
 #from pyNastran.op2.writer.op2_writer import OP2Writer
 
@@ -266,6 +273,176 @@ class TestOP2Writer(unittest.TestCase):
                              skip_results=['params', ],
                              stop_on_failure=True, debug=False)
 
+    def test_write_element_families(self):
+        """
+        round trips the vectorized OES/OEF writers, so each family
+        (e.g., the ComplexBarArray for the cbar stress/strain) is
+        written and read back
+        """
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        # {model : [(result_name, family), ...]}
+        #
+        # not tested:
+        #  - RealNonlinearBushArray: no model
+        #  - RealNonlinearRodArray: the OESNLXR writer is broken
+        results_map = {
+            os.path.join('other', 'api3.op2'): [
+                ('cbeam_stress', 'ComplexBeamArray'),
+                ('force.cbar_force', 'ComplexCBarWeldForceArray'),
+                ('force.cbeam_force', 'ComplexCBeamForceArray'),
+                ('force.cquad8_force', 'ComplexPlate2ForceArray'),
+                ('ctria3_stress', 'ComplexPlateArray'),
+                ('force.ctria3_force', 'ComplexPlateForceArray'),
+                ('stress.cpenta_stress', 'ComplexSolidArray'),
+            ],
+            os.path.join('other', 'dbxdra2.op2'): [
+                ('cbar_stress', 'ComplexBarArray'),
+                ('crod_stress', 'ComplexRodArray'),
+                ('force.crod_force', 'ComplexRodForceArray'),
+                ('stress.celas1_stress', 'ComplexSpringDamperArray'),
+                ('force.celas1_force', 'ComplexSpringDamperForceArray'),
+            ],
+            os.path.join('other', 'sdbush01.op2'): [
+                ('cbush_stress', 'ComplexCBushArray'),
+            ],
+            os.path.join('other', 'sdbush10.op2'): [
+                ('force.cbush_force', 'ComplexForceMomentArray'),
+            ],
+            os.path.join('other', 'ac10707a.op2'): [
+                ('force.chexa_pressure_force', 'ComplexSolidPressureForceArray'),
+            ],
+            os.path.join('sol_101_elements', 'static_solid_shell_bar_xyz.op2'): [
+                ('cbar_stress', 'RealBarArray'),
+                ('cbeam_stress', 'RealBeamArray'),
+                ('force.cbar_force', 'RealCBarFastForceArray'),
+                ('force.cbeam_force', 'RealCBeamForceArray'),
+                ('cquad4_composite_stress', 'RealCompositePlateArray'),
+                ('cquad4_stress', 'RealPlateArray'),
+                ('force.cquad4_force', 'RealPlateBilinearForceArray'),
+                ('force.ctria3_force', 'RealPlateForceArray'),
+                ('crod_stress', 'RealRodArray'),
+                ('force.crod_force', 'RealRodForceArray'),
+                ('stress.ctetra_stress', 'RealSolidArray'),
+            ],
+            os.path.join('unit', 'cbush', 'cbush.op2'): [
+                ('cbush_stress', 'RealBushArray'),
+                ('force.cbush_force', 'RealForceMomentArray'),
+            ],
+            os.path.join('unit', 'bars', 'pbarl_bar_100.op2'): [
+                ('force.cbar_force', 'RealCBar100ForceArray'),
+            ],
+            os.path.join('elements', 'static_elements.op2'): [
+                ('force.cshear_force', 'RealCShearForceArray'),
+                ('cshear_stress', 'RealShearArray'),
+                ('stress.celas1_stress', 'RealSpringArray'),
+                ('force.celas1_force', 'RealSpringDamperForceArray'),
+            ],
+        }
+        for base_filename, results in results_map.items():
+            op2_filename = os.path.join(MODEL_PATH, base_filename)
+            op2_filename_out = os.path.splitext(op2_filename)[0] + '_families_out.op2'
+            include_results = [result_name for result_name, unused_family in results]
+            op2 = read_op2(op2_filename, debug=False, log=log,
+                           include_results=include_results)
+            for result_name, family in results:
+                result = op2.get_result(result_name)
+                assert len(result), (base_filename, result_name)
+                for obj in result.values():
+                    class_names = [cls.__name__ for cls in type(obj).__mro__]
+                    assert family in class_names, (base_filename, result_name, class_names)
+
+            op2.write_op2(op2_filename_out)
+            op2b = read_op2(op2_filename_out, debug=False, log=log)
+            for result_name, unused_family in results:
+                result = op2.get_result(result_name)
+                resultb = op2b.get_result(result_name)
+                assert len(result) == len(resultb), (base_filename, result_name)
+                for key, obj in result.items():
+                    assert obj == resultb[key], (base_filename, result_name, key)
+
+    def test_write_record(self):
+        """tests a record is split into Fortran blocks"""
+        dtype = get_record_dtype([('node_device', 'i4'), ('gridtype', 'i4'),
+                                  ('data', 'f4', 6)], b'<')
+        record = np.zeros(5, dtype=dtype)
+        record['node_device'] = np.arange(1, 6) * 10 + 1
+        record['gridtype'] = 1
+        record['data'] = np.arange(30, dtype='float32').reshape(5, 6)
+
+        op2_file = BytesIO()
+        nwords = write_record(op2_file, StringIO(), record, b'<', nwords_block=16)
+        assert nwords == 40, nwords
+
+        # 40 words -> [16, 16, 8]
+        data = op2_file.getvalue()
+        blocks = []
+        i = 0
+        while i < len(data):
+            marker, nwordsi, marker2, nbytes = unpack('<4i', data[i:i+16])
+            assert (marker, marker2, nbytes) == (4, 4, 4 * nwordsi)
+            blocks.append(data[i+16:i+16+nbytes])
+            i += 16 + nbytes
+            assert unpack('<i', data[i:i+4])[0] == nbytes
+            i += 4
+        assert [len(block) // 4 for block in blocks] == [16, 16, 8]
+        assert b''.join(blocks) == record.tobytes()
+
+        # big endian
+        op2_file = BytesIO()
+        write_record(op2_file, StringIO(), record.astype(get_record_dtype(dtype.descr, '>')), '>')
+        data = op2_file.getvalue()
+        assert unpack('>4i', data[:16]) == (4, 40, 4, 160)
+        assert unpack('>2i', data[16:24]) == (11, 1)
+
+    def test_cbeam_station_index(self):
+        """tests the rows of a CBEAM result are mapped to the 11 stations"""
+        eids = np.array([1, 1, 2, 2, 2, 2, 3, 3])
+        istart, iend, imiddle, imiddle_element, imiddle_station = (
+            write_utils.get_cbeam_station_index(eids))
+        assert np.array_equal(istart, [0, 2, 6]), istart
+        assert np.array_equal(iend, [1, 5, 7]), iend
+        assert np.array_equal(imiddle, [3, 4]), imiddle
+        assert np.array_equal(imiddle_element, [1, 1]), imiddle_element
+        assert np.array_equal(imiddle_station, [1, 2]), imiddle_station
+
+    def test_write_cbeam_stations(self):
+        """tests CBEAM results with intermediate stations"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        for op2_filename, result_names in [('tr1091x.op2', ['force.cbeam_force']),
+                                           ('api3.op2', ['force.cbeam_force', 'cbeam_stress'])]:
+            op2_filename = os.path.join(MODEL_PATH, 'other', op2_filename)
+            op2_filename_out = os.path.join(MODEL_PATH, 'other', 'cbeam_stations_out.op2')
+            op2 = read_op2(op2_filename, debug=False, log=log, build_dataframe=False,
+                           include_results=result_names)
+            op2.write_op2(op2_filename_out, post=-1, endian=b'<',
+                          skips=['GEOM1', 'GEOM2', 'GEOM3', 'GEOM4', 'EPT', 'MPT', 'EDT', 'EDOM'])
+            op2b = read_op2(op2_filename_out, debug=False, log=log, build_dataframe=False)
+            os.remove(op2_filename_out)
+            for result_name in result_names:
+                results = op2.get_result(result_name)
+                resultsb = op2b.get_result(result_name)
+                assert len(results) == len(resultsb) > 0, result_name
+                for case, caseb in zip(results.values(), resultsb.values()):
+                    assert np.array_equal(case.element_node, caseb.element_node)
+                    assert np.array_equal(case.data, caseb.data)
+
+    def test_write_split_records(self):
+        """tests a model with records that are split into multiple blocks"""
+        log = get_logger(log=None, level='warning', encoding='utf-8')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        op2_filename = os.path.join(folder, 'static_solid_shell_bar.op2')
+        op2_filename_out = os.path.join(folder, 'static_solid_shell_bar_out.op2')
+
+        op2 = read_op2(op2_filename, debug=False, log=log,
+                       include_results=['displacements', 'spc_forces', 'grid_point_forces'])
+        with mock.patch.object(write_utils, 'OP2_BLOCK_NWORDS', 7):
+            op2.write_op2(op2_filename_out)
+        assert write_utils.OP2_BLOCK_NWORDS != 7
+        op2b = read_op2(op2_filename_out, debug=False, log=log)
+        assert len(op2.grid_point_forces) == 1
+        op2.assert_op2_equal(op2b, skip_results=['params', ],
+                             stop_on_failure=True, debug=False)
+
     def test_thermal_1(self):
         """tests basic op2 thermal writing"""
         log = get_logger(log=None, level='info', encoding='utf-8')
@@ -0,0 +1,118 @@
+"""
+Defines the memory helpers and the report comparison that are shared by the
+benchmarks (``benchmark_bdf`` and ``benchmark_op2``)
+
+The resident set size (RSS) from ``getrusage`` is the high water mark of the
+process, so it's only the peak of a file when the file is read in a new
+process.  It can't be used for a phase or table, which are measured with
+``tracemalloc`` instead (``peak_traced_mb``).  tracemalloc only sees the
+memory that's allocated by python (e.g., numpy arrays), but it's what the
+reader allocates.
+
+"""
+import sys
+import tracemalloc
+from typing import List, Dict, Optional, Any
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    # windows
+    resource = None
+
+MB = 1024 ** 2
+
+
+def get_process_peak_rss_mb() -> Optional[float]:
+    """
+    Gets the peak resident set size of the process in MB, which never
+    decreases, so it's the peak of everything the process has done
+    """
+    if resource is None:  # pragma: no cover
+        return None
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':  # pragma: no cover
+        # bytes
+        return maxrss / MB
+    # KB
+    return maxrss / 1024
+
+
+def reset_traced_peak() -> None:
+    """
+    Resets the peak traced memory at the start of a phase, so
+    ``get_traced_peak_mb`` is the peak of that phase
+    """
+    if tracemalloc.is_tracing() and hasattr(tracemalloc, 'reset_peak'):
+        # python 3.9+; otherwise, it's the peak since tracing started
+        tracemalloc.reset_peak()
+
+
+def get_traced_peak_mb() -> Optional[float]:
+    """gets the peak traced memory in MB (None if tracemalloc isn't tracing)"""
+    if not tracemalloc.is_tracing():
+        return None
+    return tracemalloc.get_traced_memory()[1] / MB
+
+
+def fmt_mb(value: Optional[float]) -> str:
+    """formats a memory size"""
+    return 'N/A' if value is None else '%.1f' % value
+
+
+def compare_benchmarks(report_old: Dict[str, Any], report_new: Dict[str, Any],
+                       items_key: str, tol: float=0.2,
+                       min_time: float=0.01) -> List[str]:
+    """
+    Compares two benchmarks and finds the files and items (e.g., the
+    tables of an OP2 or the phases of a BDF) that got slower or used
+    more memory
+
+    Parameters
+    ----------
+    report_old / report_new : Dict[str, Any]
+        the reports from ``run_benchmark`` (or the loaded json files)
+        {files : {filename : {time, peak_rss_mb, items_key : {name : stats}}}}
+    items_key : str
+        the key of the items of a file (e.g., 'tables', 'phases')
+    tol : float; default=0.2
+        the allowable increase in the time/memory (0.2 is 20%)
+    min_time : float; default=0.01
+        items that are faster than this are too noisy to compare
+
+    Returns
+    -------
+    regressions : List[str]
+        a message for each file/item that got slower or
+        used more memory
+
+    """
+    regressions = []
+    files_old = report_old['files']
+    for key, stats_new in report_new['files'].items():
+        if key not in files_old:
+            continue
+        stats_old = files_old[key]
+        if stats_new['time'] > stats_old['time'] * (1. + tol) and stats_new['time'] > min_time:
+            regressions.append('%s: time=%.3fs -> %.3fs' % (
+                key, stats_old['time'], stats_new['time']))
+        rss_old = stats_old.get('peak_rss_mb')
+        rss_new = stats_new.get('peak_rss_mb')
+        if rss_old and rss_new and rss_new > rss_old * (1. + tol):
+            regressions.append('%s: peak_rss=%.1f MB -> %.1f MB' % (key, rss_old, rss_new))
+
+        items_old = stats_old[items_key]
+        for name, item_new in stats_new[items_key].items():
+            if name not in items_old:
+                continue
+            item_old = items_old[name]
+            time_old = item_old['time']
+            time_new = item_new['time']
+            if time_new > time_old * (1. + tol) and time_new > min_time:
+                regressions.append('%s %s: time=%.3fs -> %.3fs' % (
+                    key, name, time_old, time_new))
+            traced_old = item_old.get('peak_traced_mb')
+            traced_new = item_new.get('peak_traced_mb')
+            if traced_old and traced_new and traced_new > traced_old * (1. + tol):
+                regressions.append('%s %s: peak_traced=%.1f MB -> %.1f MB' % (
+                    key, name, traced_old, traced_new))
+    return regressions
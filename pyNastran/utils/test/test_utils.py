@@ -3,6 +3,7 @@
 import os
 #import sys
 import unittest
+import tracemalloc
 
 import numpy as np
 
@@ -13,6 +14,7 @@ from pyNastran.utils.mathematics import (
     get_abs_max, get_max_index, get_min_index, get_abs_index,
     is_list_ranged, gauss)
 from pyNastran.utils.dev import get_files_of_type
+from pyNastran.utils.benchmark import reset_traced_peak, get_traced_peak_mb
 
 
 PKG_PATH = pyNastran.__path__[0]
@@ -133,6 +135,20 @@ class TestUtils(unittest.TestCase):
         self.assertTrue(is_binary_file(op2_filename))
         self.assertFalse(is_binary_file(bdf_filename))
 
+    def test_traced_peak(self):
+        """tests the peak memory of a benchmark phase is reset"""
+        assert get_traced_peak_mb() is None
+        tracemalloc.start()
+        try:
+            array = np.ones(2 * 1024 ** 2, dtype='int8')
+            del array
+            assert get_traced_peak_mb() > 1.9
+            reset_traced_peak()
+            if hasattr(tracemalloc, 'reset_peak'):
+                assert get_traced_peak_mb() < 1.
+        finally:
+            tracemalloc.stop()
+
     def test_list_print(self):
         #self.b = B(7)
         """tests the list_print method, which is a nice way to write a 2d array"""
@@ -73,6 +73,8 @@ setup(
             #'run_nastran_double_precision = pyNastran.bdf.test.run_nastran_double_precision:cmd_line',
             'test_bdf  = pyNastran.bdf.test.test_bdf:main',
             'test_op2  = pyNastran.op2.test.test_op2:main',
+            'benchmark_bdf = pyNastran.bdf.test.benchmark:main',
+            'benchmark_op2 = pyNastran.op2.test.benchmark:main',
             'test_op4  = pyNastran.op4.test.test_op4:main',
             #'test_abaqus = pyNastran.converters.abaqus.test_abaqus:main',
             'test_pynastrangui = pyNastran.gui.test.test_gui:main',